@@ -1,8 +1,16 @@
+import json
 import os
+import click
 from flask import Flask
 from flask_wtf.csrf import CSRFProtect
+from sqlalchemy import inspect
 
-from models import db
+from models import db, ChampionshipYear, Goal, Penalty
+from constants import PIM_MAP
+from app.repositories.core import PenaltyTypePimRepository
+from app.services.core import DataAuditService, GameBoxscoreService
+from app.services.utils.cache_manager import configure_cache
+from utils.fixture_registry import get_fixture_registry
 
 # Import blueprints
 from routes.blueprints import main_bp
@@ -13,15 +21,33 @@ from routes.records import record_bp
 # --- Configuration ---
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 UPLOAD_FOLDER = os.path.join(BASE_DIR, 'data', 'fixtures')
+MIGRATIONS_DIR = os.path.join(BASE_DIR, 'database', 'migrations')
+CACHE_PATH = os.path.join(BASE_DIR, 'data', 'cache.sqlite3')
 
-def create_app():
+def create_app(config=None):
+    """
+    Creates the Flask app.
+
+    Args:
+        config: Optional settings applied on top of the defaults before the database is
+            initialised, e.g. {'SQLALCHEMY_DATABASE_URI': ...} for a copy of the database
+    """
     app = Flask(__name__)
     app.jinja_env.add_extension('jinja2.ext.do')
     app.config['SECRET_KEY'] = 'your_secret_key_please_change_this' # TODO: Make this configurable
-    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{os.path.join(BASE_DIR, "data", "iihf_data.db")}'
+    # Tests und Benchmarks setzen IIHF_DATABASE_URI, damit das Modul-App-Objekt die mitgelieferte Datenbank nicht migriert
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get(
+        'IIHF_DATABASE_URI', f'sqlite:///{os.path.join(BASE_DIR, "data", "iihf_data.db")}')
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
     app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
     app.config['BASE_DIR'] = BASE_DIR # Make BASE_DIR available in app.config for blueprints
+    # 'memory': Service-Caches gelten nur pro Request, 'sqlite': geteilt zwischen Requests und Worker-Prozessen (z.B. gunicorn)
+    app.config['CACHE_BACKEND'] = os.environ.get('IIHF_CACHE_BACKEND', 'memory')
+    app.config['CACHE_PATH'] = os.environ.get('IIHF_CACHE_PATH', CACHE_PATH)
+    if config:
+        app.config.update(config)
+
+    configure_cache(app.config['CACHE_BACKEND'], app.config['CACHE_PATH'])
 
     # Initialize CSRF protection
     csrf = CSRFProtect(app)
@@ -46,8 +72,37 @@ def create_app():
         # Initialize database tables
         with app.app_context(): # Ensure operations are within app context
             _init_db_tables() # Call helper to create tables
+            _migrate_db()
         print("Initialized the database tables.")
 
+    @app.cli.command("migrate")
+    def migrate_command():
+        """Brings an existing database up to the current schema."""
+        _migrate_db()
+        print("Database migrated.")
+
+    @app.cli.command("audit-data")
+    @click.option('--year', type=int, default=None, help='Only audit tournaments of this year, e.g. 2024.')
+    @click.option('--force', is_flag=True, help='Re-check unchanged games as well.')
+    @click.option('--report', 'report_path', type=click.Path(dir_okay=False), default=None,
+                  help='Write the JSON report to this file.')
+    def audit_data_command(year, force, report_path):
+        """Checks the data consistency of all games and stores the findings."""
+        year_audits = DataAuditService().audit_all(year=year, force=force)
+        if not year_audits:
+            print(f"No tournaments found{f' for {year}' if year else ''}.")
+            return
+        for year_audit in year_audits:
+            print(f"{year_audit.year} {year_audit.name}: {year_audit.games} games, {year_audit.checked} checked, "
+                  f"{year_audit.skipped} unchanged, {len(year_audit.findings)} with warnings")
+            for finding in year_audit.findings:
+                for warning in finding['warnings']:
+                    print(f"  {warning}")
+        if report_path:
+            with open(report_path, 'w', encoding='utf-8') as f:
+                json.dump(DataAuditService.build_report(year_audits), f, ensure_ascii=False, indent=2)
+            print(f"Report written to {report_path}")
+
     def _init_db_tables():
         """Helper function to create database tables and directories."""
         # Create database directory if it doesn't exist
@@ -59,13 +114,45 @@ def create_app():
         db.create_all()
         print("Database tables created.")
 
-    # Initialize DB and UPLOAD_FOLDER on app creation as well for convenience during development
-    # For production, `flask init-db` is preferred before first run.
+    def _migrate_db():
+        """Applies schema migrations and data backfills; idempotent, runs on every app start."""
+        # Neue Tabellen (z.B. nach einem Update) anlegen, bestehende bleiben unverändert
+        db.create_all()
+        # create_all ergänzt keine Spalten in bestehenden Tabellen; time_seconds per Migration nachziehen
+        if 'time_seconds' not in {column['name'] for column in inspect(db.engine).get_columns('goal')}:
+            _run_sql_migration('add_time_seconds_columns.sql')
+        # create_all legt Indizes nur mit neuen Tabellen an; bestehende Datenbanken nachziehen
+        for index in list(Goal.__table__.indexes) + list(Penalty.__table__.indexes):
+            index.create(db.engine, checkfirst=True)
+        boxscore_service = GameBoxscoreService()
+        # Geänderte Strafminuten pro Straftyp betreffen alle Box-Scores
+        if PenaltyTypePimRepository().sync(PIM_MAP):
+            boxscore_service.rebuild_all()
+            db.session.commit()
+        # Box-Scores für Spiele aus der Zeit vor game_team_boxscore nachziehen
+        if boxscore_service.backfill():
+            db.session.commit()
+
+    def _run_sql_migration(filename):
+        """Executes a SQL script from database/migrations against the app database."""
+        with open(os.path.join(MIGRATIONS_DIR, filename), encoding='utf-8') as f:
+            script = f.read()
+        connection = db.engine.raw_connection()
+        try:
+            connection.cursor().executescript(script)
+        finally:
+            connection.close()
+        print(f"Applied migration: {filename}")
+
+    # Wie bisher db.create_all() beim Start: neue Tabellen, Spalten und Backfills für bestehende
+    # Datenbanken nachziehen. Bereits migrierte Datenbanken bleiben unverändert.
     with app.app_context():
-        _init_db_tables() 
         if not os.path.exists(app.config['UPLOAD_FOLDER']):
             os.makedirs(app.config['UPLOAD_FOLDER'])
             print(f"Created fixture upload directory (on app start): {app.config['UPLOAD_FOLDER']}")
+        _migrate_db()
+        # Fixtures einmal beim Start parsen, Requests lesen nur noch den Index
+        get_fixture_registry().preload(ChampionshipYear.query.all())
 
     return app
 
@@ -20,8 +20,11 @@ try:
     app_main = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(app_main)
     create_app = app_main.create_app
+    # WSGI-Einstiegspunkt, z.B. `gunicorn app:app` (das Paket app verdeckt app.py)
+    app = app_main.app
 except ImportError:
     # Last resort fallback
     create_app = None
+    app = None
 
-__all__ = ['create_app']
\ No newline at end of file
+__all__ = ['create_app', 'app']
\ No newline at end of file
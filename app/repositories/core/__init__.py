@@ -8,5 +8,11 @@ from .player_repository import PlayerRepository
 from .standings_repository import StandingsRepository
 from .team_repository import TeamRepository
 from .records_repository import RecordsRepository
+from .tournament_snapshot_repository import TournamentSnapshotRepository
+from .team_matchup_repository import TeamMatchupRepository
+from .streak_record_state_repository import StreakRecordStateRepository
+from .penalty_type_pim_repository import PenaltyTypePimRepository
+from .game_boxscore_repository import GameBoxscoreRepository
+from .game_data_audit_repository import GameDataAuditRepository
 
-__all__ = ['GameRepository', 'TournamentRepository', 'PlayerRepository', 'StandingsRepository', 'TeamRepository', 'RecordsRepository']
\ No newline at end of file
+__all__ = ['GameRepository', 'TournamentRepository', 'PlayerRepository', 'StandingsRepository', 'TeamRepository', 'RecordsRepository', 'TournamentSnapshotRepository', 'TeamMatchupRepository', 'StreakRecordStateRepository', 'PenaltyTypePimRepository', 'GameBoxscoreRepository', 'GameDataAuditRepository']
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""
+Game Boxscore Repository
+Datenzugriff auf die Box-Scores pro Spiel und Team (game_team_boxscore)
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import case, func, or_
+from models import Game, GameTeamBoxscore, Goal, Penalty, PenaltyTypePim, ShotsOnGoal
+from constants import POWERPLAY_PENALTY_TYPES
+from app.repositories.base import BaseRepository
+
+BOXSCORE_COUNTERS = ('goals', 'ppg', 'shg', 'eng', 'sog', 'pim', 'penalties', 'pp_penalties')
+
+
+class GameBoxscoreRepository(BaseRepository[GameTeamBoxscore]):
+    """
+    Repository für GameTeamBoxscore-Einträge
+
+    Die Einträge eines Spiels werden immer vollständig aus Toren, Strafen und
+    Torschüssen neu berechnet und ersetzt, nie einzeln hoch- oder runtergezählt.
+    """
+
+    def __init__(self):
+        super().__init__(GameTeamBoxscore)
+
+    def compute_rows(self, game_ids: Optional[Sequence[int]] = None) -> List[Dict[str, Any]]:
+        """
+        Compute box score rows from the event tables with three grouped queries
+
+        Args:
+            game_ids: Restrict to these games (None = all games)
+
+        Returns:
+            List of dictionaries (game_id, team_code and BOXSCORE_COUNTERS)
+        """
+        goal_query = self.db.session.query(
+            Goal.game_id, Goal.team_code,
+            func.count(Goal.id).label('goals'),
+            func.sum(case((Goal.goal_type == 'PP', 1), else_=0)).label('ppg'),
+            func.sum(case((Goal.goal_type == 'SH', 1), else_=0)).label('shg'),
+            func.sum(case((Goal.is_empty_net.is_(True), 1), else_=0)).label('eng')
+        ).group_by(Goal.game_id, Goal.team_code)
+        penalty_query = self.db.session.query(
+            Penalty.game_id, Penalty.team_code,
+            func.sum(PenaltyTypePim.minutes()).label('pim'),
+            func.count(Penalty.id).label('penalties'),
+            func.sum(case((Penalty.penalty_type.in_(POWERPLAY_PENALTY_TYPES), 1), else_=0)).label('pp_penalties')
+        ).outerjoin(
+            PenaltyTypePim, PenaltyTypePim.penalty_type == Penalty.penalty_type
+        ).group_by(Penalty.game_id, Penalty.team_code)
+        sog_query = self.db.session.query(
+            ShotsOnGoal.game_id, ShotsOnGoal.team_code,
+            func.sum(ShotsOnGoal.shots).label('sog')
+        ).group_by(ShotsOnGoal.game_id, ShotsOnGoal.team_code)
+
+        if game_ids is not None:
+            goal_query = goal_query.filter(Goal.game_id.in_(game_ids))
+            penalty_query = penalty_query.filter(Penalty.game_id.in_(game_ids))
+            sog_query = sog_query.filter(ShotsOnGoal.game_id.in_(game_ids))
+
+        rows: Dict[Tuple[int, str], Dict[str, Any]] = {}
+        for query in (goal_query, penalty_query, sog_query):
+            for result in query.all():
+                values = result._asdict()
+                row = rows.get((result.game_id, result.team_code))
+                if row is None:
+                    row = dict.fromkeys(BOXSCORE_COUNTERS, 0)
+                    rows[(result.game_id, result.team_code)] = row
+                row.update({key: value or 0 for key, value in values.items()})
+        return [row for _, row in sorted(rows.items())]
+
+    def replace_games(self, game_ids: Sequence[int], rows: List[Dict[str, Any]]) -> None:
+        """
+        Replace the box scores of the given games (without commit)
+
+        Args:
+            game_ids: Games whose box scores are replaced
+            rows: New rows from compute_rows()
+        """
+        if not game_ids:
+            return
+        self.get_query().filter(GameTeamBoxscore.game_id.in_(game_ids)).delete(synchronize_session='fetch')
+        self.db.session.add_all([GameTeamBoxscore(**row) for row in rows])
+        self.db.session.flush()
+
+    def replace_all(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Replace all box scores (without commit)
+
+        Args:
+            rows: New rows from compute_rows()
+        """
+        self.get_query().delete(synchronize_session='fetch')
+        self.db.session.add_all([GameTeamBoxscore(**row) for row in rows])
+        self.db.session.flush()
+
+    def get_games_without_boxscore(self) -> List[int]:
+        """
+        Get IDs of games with goals, penalties or shots on goal but no box score rows
+
+        Returns:
+            List of game IDs
+        """
+        has_events = or_(
+            Game.goals.any(),
+            Game.penalties.any(),
+            Game.sog_entries.any()
+        )
+        rows = self.db.session.query(Game.id).filter(
+            has_events, ~Game.boxscores.any()
+        ).all()
+        return [row.id for row in rows]
+
+    def get_by_games(self, game_ids: Sequence[int]) -> Dict[int, Dict[str, GameTeamBoxscore]]:
+        """
+        Get the box scores of the given games
+
+        Args:
+            game_ids: List of game IDs
+
+        Returns:
+            Dictionary {game_id: {team_code: GameTeamBoxscore}}
+        """
+        if not game_ids:
+            return {}
+        entries = self.get_query().filter(GameTeamBoxscore.game_id.in_(game_ids)).all()
+        return self._by_game(entries)
+
+    def get_by_year(self, year_id: int) -> Dict[int, Dict[str, GameTeamBoxscore]]:
+        """
+        Get the box scores of all games of a tournament year
+
+        Args:
+            year_id: The championship year ID
+
+        Returns:
+            Dictionary {game_id: {team_code: GameTeamBoxscore}}
+        """
+        entries = self.get_query().join(Game, Game.id == GameTeamBoxscore.game_id) \
+            .filter(Game.year_id == year_id).all()
+        return self._by_game(entries)
+
+    @staticmethod
+    def _by_game(entries: List[GameTeamBoxscore]) -> Dict[int, Dict[str, GameTeamBoxscore]]:
+        by_game: Dict[int, Dict[str, GameTeamBoxscore]] = {}
+        for entry in entries:
+            by_game.setdefault(entry.game_id, {})[entry.team_code] = entry
+        return by_game
@@ -0,0 +1,77 @@
+"""
+Game Data Audit Repository
+Datenzugriff auf die gespeicherten Befunde der Datenkonsistenz-Prüfung (game_data_audit)
+"""
+
+from typing import Dict, List, Sequence
+from models import GameDataAudit
+from app.repositories.base import BaseRepository
+
+
+class GameDataAuditRepository(BaseRepository[GameDataAudit]):
+    """
+    Repository für GameDataAudit-Einträge
+
+    Ein Eintrag pro Spiel, über den eindeutigen Index auf game_id.
+    """
+
+    def __init__(self):
+        super().__init__(GameDataAudit)
+
+    def get_by_year(self, year_id: int) -> Dict[int, GameDataAudit]:
+        """
+        Get the stored audits of all games of a tournament year
+
+        Args:
+            year_id: The championship year ID
+
+        Returns:
+            Dictionary {game_id: GameDataAudit}
+        """
+        audits = self.get_query().filter(GameDataAudit.year_id == year_id).all()
+        return {audit.game_id: audit for audit in audits}
+
+    def save(self, existing: Dict[int, GameDataAudit], game_id: int, year_id: int, data_hash: str,
+             scores_fully_match_data: bool, warnings: str) -> GameDataAudit:
+        """
+        Create or replace the audit of a game (without flush or commit)
+
+        Args:
+            existing: Already loaded audits {game_id: GameDataAudit}, e.g. from get_by_year()
+            game_id: The game ID
+            year_id: The championship year ID
+            data_hash: Hash of the checked game data
+            scores_fully_match_data: Result of the consistency check
+            warnings: Serialized warnings (JSON list)
+
+        Returns:
+            The stored audit
+        """
+        audit = existing.get(game_id)
+        if audit is None:
+            audit = GameDataAudit(game_id=game_id)
+            self.db.session.add(audit)
+            existing[game_id] = audit
+        audit.year_id = year_id
+        audit.data_hash = data_hash
+        audit.scores_fully_match_data = scores_fully_match_data
+        audit.warnings = warnings
+        return audit
+
+    def delete_other_games(self, year_id: int, game_ids: Sequence[int]) -> int:
+        """
+        Delete audits of a tournament year whose game is not in game_ids (without commit)
+
+        Args:
+            year_id: The championship year ID
+            game_ids: IDs of the current games of the year
+
+        Returns:
+            Number of deleted audits
+        """
+        query = self.get_query().filter(GameDataAudit.year_id == year_id)
+        if game_ids:
+            query = query.filter(GameDataAudit.game_id.notin_(list(game_ids)))
+        count = query.delete(synchronize_session='fetch')
+        self.db.session.flush()
+        return count
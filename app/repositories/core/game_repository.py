@@ -5,7 +5,7 @@ Handles game-specific data access patterns
 
 from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy import and_, or_, func
-from models import Game, ChampionshipYear, ShotsOnGoal, GameOverrule
+from models import Game, ChampionshipYear, Goal, Penalty, ShotsOnGoal, GameOverrule
 from app.repositories.base import BaseRepository
 import logging
 
@@ -330,4 +330,42 @@ class GameRepository(BaseRepository[Game]):
             func.max(Game.game_number)
         ).filter(Game.year_id == year_id).scalar()
         
-        return result or 0
\ No newline at end of file
+        return result or 0
+    
+    def get_timeline_rows(self, game_ids: List[int]) -> Tuple[List[tuple], List[tuple], List[tuple]]:
+        """
+        Get goals, penalties and shots on goal of multiple games as compact column tuples
+        
+        One query per table; goals and penalties are ordered by game time, team code and ID.
+        Events at the same game time thus keep the order the former per-game queries
+        returned through the (game_id, team_code) indexes.
+        
+        Args:
+            game_ids: List of game IDs
+            
+        Returns:
+            Tuple (goal_rows, penalty_rows, sog_rows), each row starting with the game ID:
+            (game_id, time_seconds, id, team_code, minute, goal_type, is_empty_net, scorer_id, assist1_id, assist2_id),
+            (game_id, time_seconds, id, team_code, minute_of_game, penalty_type, reason, player_id),
+            (game_id, team_code, period, shots)
+        """
+        if not game_ids:
+            return [], [], []
+        
+        goal_rows = self.db.session.query(
+            Goal.game_id, Goal.time_seconds, Goal.id, Goal.team_code, Goal.minute, Goal.goal_type,
+            Goal.is_empty_net, Goal.scorer_id, Goal.assist1_id, Goal.assist2_id
+        ).filter(Goal.game_id.in_(game_ids)) \
+        .order_by(Goal.game_id, Goal.time_seconds, Goal.team_code, Goal.id).all()
+        
+        penalty_rows = self.db.session.query(
+            Penalty.game_id, Penalty.time_seconds, Penalty.id, Penalty.team_code, Penalty.minute_of_game,
+            Penalty.penalty_type, Penalty.reason, Penalty.player_id
+        ).filter(Penalty.game_id.in_(game_ids)) \
+        .order_by(Penalty.game_id, Penalty.time_seconds, Penalty.team_code, Penalty.id).all()
+        
+        sog_rows = self.db.session.query(
+            ShotsOnGoal.game_id, ShotsOnGoal.team_code, ShotsOnGoal.period, ShotsOnGoal.shots
+        ).filter(ShotsOnGoal.game_id.in_(game_ids)).all()
+        
+        return goal_rows, penalty_rows, sog_rows
\ No newline at end of file
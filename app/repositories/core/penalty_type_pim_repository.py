@@ -0,0 +1,55 @@
+"""
+Penalty Type PIM Repository
+Datenzugriff auf die Referenztabelle der Strafminuten pro Straftyp
+"""
+
+from typing import Dict
+from models import PenaltyTypePim
+from app.repositories.base import BaseRepository
+
+
+class PenaltyTypePimRepository(BaseRepository[PenaltyTypePim]):
+    """
+    Repository für PenaltyTypePim-Einträge
+
+    Die Tabelle wird beim Anlegen aus PIM_MAP befüllt; sync() gleicht eine
+    bestehende Datenbank nach Änderungen an PIM_MAP ab.
+    """
+
+    def __init__(self):
+        super().__init__(PenaltyTypePim)
+
+    def get_map(self) -> Dict[str, int]:
+        """
+        Get the stored penalty minutes per penalty type
+
+        Returns:
+            Dictionary {penalty_type: pim}
+        """
+        return {entry.penalty_type: entry.pim for entry in self.get_query().all()}
+
+    def sync(self, pim_map: Dict[str, int]) -> int:
+        """
+        Make the table match a penalty minutes mapping (without commit)
+
+        Args:
+            pim_map: Dictionary {penalty_type: pim}, usually PIM_MAP
+
+        Returns:
+            Number of inserted, updated or deleted penalty types
+        """
+        stored = {entry.penalty_type: entry for entry in self.get_query().all()}
+        changes = 0
+        for penalty_type, pim in pim_map.items():
+            entry = stored.pop(penalty_type, None)
+            if entry is None:
+                self.db.session.add(PenaltyTypePim(penalty_type=penalty_type, pim=pim))
+                changes += 1
+            elif entry.pim != pim:
+                entry.pim = pim
+                changes += 1
+        for entry in stored.values():
+            self.db.session.delete(entry)
+            changes += 1
+        self.db.session.flush()
+        return changes
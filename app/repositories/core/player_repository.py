@@ -4,8 +4,8 @@ Handles player-specific data access patterns
 """
 
 from typing import List, Optional, Dict, Any, Tuple
-from sqlalchemy import and_, or_, func
-from models import Player, Goal, Penalty, db
+from sqlalchemy import and_, or_, func, literal, select, union_all
+from models import Player, Goal, Penalty, PenaltyTypePim, Game, db
 from app.repositories.base import BaseRepository
 import logging
 
@@ -461,4 +461,92 @@ class PlayerRepository(BaseRepository[Player]):
         return self.db.session.query(
             Player.team_code, 
             func.count(Player.id).label('player_count')
-        ).group_by(Player.team_code).order_by(Player.team_code).all()
\ No newline at end of file
+        ).group_by(Player.team_code).order_by(Player.team_code).all()
+    
+    def get_year_scoring_totals(self, year_id: int, team_code: Optional[str] = None,
+                                game_ids: Optional[List[int]] = None) -> List[Tuple[Player, int, int]]:
+        """
+        Get goals and assists per player for one championship year in a single query
+        
+        Args:
+            year_id: Championship year ID
+            team_code: Only count goals where scorer or an assistant belongs to this team
+            game_ids: Optional list of game IDs to restrict the goals to
+            
+        Returns:
+            List of tuples (player, goals, assists)
+        """
+        goals = self.db.session.query(
+            Goal.scorer_id, Goal.assist1_id, Goal.assist2_id
+        ).join(Game, Goal.game_id == Game.id).filter(Game.year_id == year_id)
+        
+        if game_ids:
+            goals = goals.filter(Goal.game_id.in_(game_ids))
+        
+        if team_code:
+            team_player_ids = self.db.session.query(Player.id).filter(
+                Player.team_code == team_code
+            )
+            goals = goals.filter(or_(
+                Goal.scorer_id.in_(team_player_ids),
+                Goal.assist1_id.in_(team_player_ids),
+                Goal.assist2_id.in_(team_player_ids)
+            ))
+        
+        goals_sq = goals.subquery()
+        
+        # One row per credited player: (player_id, goal, assist)
+        credits = union_all(
+            select(goals_sq.c.scorer_id.label('player_id'),
+                   literal(1).label('goal'), literal(0).label('assist')),
+            select(goals_sq.c.assist1_id, literal(0), literal(1)),
+            select(goals_sq.c.assist2_id, literal(0), literal(1))
+        ).subquery()
+        
+        return self.db.session.query(
+            Player,
+            func.sum(credits.c.goal).label('goals'),
+            func.sum(credits.c.assist).label('assists')
+        ).join(credits, credits.c.player_id == Player.id) \
+        .group_by(Player.id).all()
+    
+    def get_year_penalty_minutes(self, year_id: int,
+                                 team_code: Optional[str] = None) -> List[Tuple[Player, int]]:
+        """
+        Get penalty minutes per player for one championship year in a single query
+        
+        Args:
+            year_id: Championship year ID
+            team_code: Optional team code of the penalized player
+            
+        Returns:
+            List of tuples (player, penalty_minutes)
+        """
+        query = self.db.session.query(
+            Player,
+            func.sum(PenaltyTypePim.minutes()).label('pim')
+        ).join(Penalty, Penalty.player_id == Player.id) \
+        .join(Game, Penalty.game_id == Game.id) \
+        .outerjoin(PenaltyTypePim, PenaltyTypePim.penalty_type == Penalty.penalty_type) \
+        .filter(Game.year_id == year_id)
+        
+        if team_code:
+            query = query.filter(Player.team_code == team_code)
+        
+        return query.group_by(Player.id).all()
+    
+    def get_name_rows(self, player_ids: List[int]) -> List[Tuple[int, str, str, str, Optional[int]]]:
+        """
+        Get name, team and jersey number of the given players in a single IN query
+        
+        Args:
+            player_ids: Player IDs
+            
+        Returns:
+            List of tuples (id, first_name, last_name, team_code, jersey_number)
+        """
+        if not player_ids:
+            return []
+        return self.db.session.query(
+            Player.id, Player.first_name, Player.last_name, Player.team_code, Player.jersey_number
+        ).filter(Player.id.in_(player_ids)).all()
\ No newline at end of file
@@ -0,0 +1,131 @@
+"""
+Streak Record State Repository
+Datenzugriff auf den gespeicherten Zustand der Serien-Rekorde und die
+chronologisch sortierten abgeschlossenen Spiele, die darin eingespielt werden
+"""
+
+from typing import List, Optional, Sequence, Tuple
+from sqlalchemy import func, tuple_
+from models import ChampionshipYear, Game, StreakRecordState
+from app.repositories.base import BaseRepository
+
+GameOrderKey = Tuple[int, str, int, str, int]
+
+
+class StreakRecordStateRepository(BaseRepository[StreakRecordState]):
+    """
+    Repository für den StreakRecordState (ein einziger Eintrag)
+
+    Die Spielreihenfolge entspricht der Auswertung der Serien: Jahr, Datum,
+    Spielnummer, danach Anstoßzeit und ID als eindeutiger Tiebreaker.
+    """
+
+    def __init__(self):
+        super().__init__(StreakRecordState)
+
+    @staticmethod
+    def _order_columns():
+        return (
+            ChampionshipYear.year,
+            func.coalesce(func.nullif(Game.date, ''), '1900-01-01'),
+            func.coalesce(Game.game_number, 0),
+            func.coalesce(Game.start_time, ''),
+            Game.id,
+        )
+
+    @staticmethod
+    def game_order_key(game: Game, year_obj: ChampionshipYear) -> GameOrderKey:
+        """
+        Sortierschlüssel eines Spiels (identisch zur Sortierung der Queries)
+
+        Args:
+            game: Game-Objekt
+            year_obj: ChampionshipYear des Spiels
+
+        Returns:
+            Tupel (Jahr, Datum, Spielnummer, Anstoßzeit, ID)
+        """
+        return (year_obj.year, game.date or '1900-01-01', game.game_number or 0,
+                game.start_time or '', game.id)
+
+    def get_state(self) -> Optional[StreakRecordState]:
+        """
+        Get the stored tracker state
+
+        Returns:
+            State if found, None otherwise
+        """
+        return self.get_query().order_by(StreakRecordState.id).first()
+
+    def save(self, version: int, games_processed: int, last_game_key: Optional[str],
+             payload: str) -> StreakRecordState:
+        """
+        Create or replace the stored tracker state (without commit)
+
+        Args:
+            version: Payload format version
+            games_processed: Number of games contained in the state
+            last_game_key: Order key of the last processed game (JSON)
+            payload: Serialized tracker (JSON)
+
+        Returns:
+            The stored state
+        """
+        state = self.get_state()
+        if state is None:
+            state = StreakRecordState()
+            self.db.session.add(state)
+        state.version = version
+        state.games_processed = games_processed
+        state.last_game_key = last_game_key
+        state.payload = payload
+        self.db.session.flush()
+        return state
+
+    def clear(self) -> int:
+        """
+        Delete the stored tracker state (without commit)
+
+        Returns:
+            Number of deleted rows
+        """
+        count = self.get_query().delete(synchronize_session='fetch')
+        self.db.session.flush()
+        return count
+
+    def get_completed_games(self, after: Optional[Sequence] = None) -> List[Tuple[Game, ChampionshipYear]]:
+        """
+        Get all completed games in chronological order
+
+        Args:
+            after: Only games sorting after this order key (optional)
+
+        Returns:
+            List of (game, championship year) tuples
+        """
+        order_columns = self._order_columns()
+        query = self._completed_games_query(self.db.session.query(Game, ChampionshipYear))
+        if after is not None:
+            query = query.filter(tuple_(*order_columns) > tuple_(*after))
+        return [(game, year_obj) for game, year_obj in query.order_by(*order_columns).all()]
+
+    def count_completed_games(self, until: Optional[Sequence] = None) -> int:
+        """
+        Count completed games up to and including an order key
+
+        Args:
+            until: Order key of the last game to count (None counts nothing)
+
+        Returns:
+            Number of completed games
+        """
+        if until is None:
+            return 0
+        query = self._completed_games_query(self.db.session.query(func.count(Game.id)))
+        return query.filter(tuple_(*self._order_columns()) <= tuple_(*until)).scalar()
+
+    @staticmethod
+    def _completed_games_query(query):
+        return query.select_from(Game).join(ChampionshipYear, Game.year_id == ChampionshipYear.id).filter(
+            Game.team1_score.isnot(None), Game.team2_score.isnot(None)
+        )
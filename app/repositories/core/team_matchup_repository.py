@@ -0,0 +1,102 @@
+"""
+Team Matchup Repository
+Datenzugriff auf den jahresübergreifenden Paarungs-Index (Spiele pro Team-Paarung und Jahr)
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy.orm import Session
+from models import ChampionshipYear, TeamMatchup, TournamentSnapshot
+from app.repositories.base import BaseRepository
+
+
+class TeamMatchupRepository(BaseRepository[TeamMatchup]):
+    """
+    Repository für TeamMatchup-Einträge
+
+    Die Einträge eines Jahres werden immer vollständig ersetzt, nie einzeln geändert.
+    """
+
+    def __init__(self):
+        super().__init__(TeamMatchup)
+
+    def get_pairs(self) -> Set[Tuple[str, str]]:
+        """
+        Get all team pairs that played at least once, across all years
+
+        Returns:
+            Set of (team_a, team_b) tuples with team_a < team_b
+        """
+        rows = self.db.session.query(TeamMatchup.team_a, TeamMatchup.team_b).distinct().all()
+        return {(row.team_a, row.team_b) for row in rows}
+
+    def get_games_per_year(self, team_a: str, team_b: str) -> Dict[int, int]:
+        """
+        Get the number of games between two teams per year
+
+        Args:
+            team_a: First team code
+            team_b: Second team code
+
+        Returns:
+            Dictionary {year_id: games}
+        """
+        team_a, team_b = sorted((team_a, team_b))
+        rows = self.get_query().filter(
+            TeamMatchup.team_a == team_a,
+            TeamMatchup.team_b == team_b
+        ).all()
+        return {row.year_id: row.games for row in rows}
+
+    def get_unindexed_years(self, snapshot_version: int) -> List[ChampionshipYear]:
+        """
+        Get years whose matchups are missing, i.e. without a current tournament snapshot
+
+        Der Index eines Jahres wird zusammen mit dessen Snapshot geschrieben und
+        verworfen, ein fehlender oder veralteter Snapshot markiert also auch den Index.
+
+        Args:
+            snapshot_version: Current snapshot payload version
+
+        Returns:
+            List of ChampionshipYear objects
+        """
+        return ChampionshipYear.query.outerjoin(
+            TournamentSnapshot, TournamentSnapshot.year_id == ChampionshipYear.id
+        ).filter(
+            (TournamentSnapshot.id.is_(None)) | (TournamentSnapshot.version != snapshot_version)
+        ).all()
+
+    def replace_year(self, year_id: int, counts: Dict[Tuple[str, str], int],
+                     session: Optional[Session] = None) -> None:
+        """
+        Replace all matchups of a tournament year (without commit)
+
+        Args:
+            year_id: The championship year ID
+            counts: Dictionary {(team_a, team_b): games}
+            session: Optional database session
+        """
+        session = session or self.db.session
+        self.delete_by_year(year_id, session=session)
+        session.add_all([
+            TeamMatchup(year_id=year_id, team_a=team_a, team_b=team_b, games=games)
+            for (team_a, team_b), games in counts.items()
+        ])
+        session.flush()
+
+    def delete_by_year(self, year_id: int, session: Optional[Session] = None) -> int:
+        """
+        Delete all matchups of a tournament year (without commit)
+
+        Args:
+            year_id: The championship year ID
+            session: Optional database session
+
+        Returns:
+            Number of deleted rows
+        """
+        session = session or self.db.session
+        count = session.query(TeamMatchup).filter(TeamMatchup.year_id == year_id).delete(
+            synchronize_session='fetch')
+        session.flush()
+        return count
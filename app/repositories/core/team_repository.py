@@ -3,11 +3,11 @@ Team Repository for IIHF World Championship Statistics
 Handles team-specific data access patterns and aggregations
 """
 
-from typing import List, Optional, Dict, Any, Set
+from typing import List, Optional, Dict, Any, Set, Tuple
 from sqlalchemy import and_, or_, func, distinct
-from models import Game, Player, Goal, Penalty, ShotsOnGoal, TeamStats, AllTimeTeamStats, db
+from models import Game, GameTeamBoxscore, Player, Goal, TeamStats, AllTimeTeamStats, db
 from app.repositories.base import BaseRepository
-from constants import TEAM_ISO_CODES, PIM_MAP, POWERPLAY_PENALTY_TYPES
+from constants import TEAM_ISO_CODES
 import logging
 
 logger = logging.getLogger(__name__)
@@ -163,16 +163,96 @@ class TeamRepository(BaseRepository[Game]):
             round_filter: Optional round filter
             
         Returns:
-            Dictionary with team statistics
+            Dictionary with team statistics (see get_year_team_stats)
         """
-        # Get games
-        games = self.get_team_games(team_code, year_id)
+        return self.get_year_team_stats(year_id, [team_code], round_filter)[team_code]
+    
+    def get_year_team_stats(self, year_id: int, team_codes: Optional[List[str]] = None,
+                            round_filter: Optional[str] = None,
+                            resolved_codes: Optional[Dict[int, Tuple[str, str]]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get comprehensive statistics for all teams of a year from two queries
+        
+        One query loads the games of the year, one the per-game box scores
+        (game_team_boxscore); both are folded into per-team totals in a single
+        pass. For/against values (SOG, PP goals, PP opportunities) come from the
+        opponent's box score of the same game.
         
+        Args:
+            year_id: Championship year ID
+            team_codes: Optional subset of team codes (default: all teams of the year
+                with a definitive team code)
+            round_filter: Optional round filter
+            resolved_codes: Optional map game ID -> (team1, team2) with resolved
+                playoff placeholders; games not in the map use their raw codes
+            
+        Returns:
+            Dictionary team code -> statistics dictionary
+        """
+        games_query = self.db.session.query(
+            Game.id, Game.team1_code, Game.team2_code, Game.team1_score, Game.team2_score,
+            Game.result_type, Game.team1_points, Game.team2_points
+        ).filter(Game.year_id == year_id)
+        boxscore_query = GameTeamBoxscore.query.join(Game, Game.id == GameTeamBoxscore.game_id) \
+            .filter(Game.year_id == year_id)
         if round_filter:
-            games = [g for g in games if g.round == round_filter]
+            games_query = games_query.filter(Game.round == round_filter)
+            boxscore_query = boxscore_query.filter(Game.round == round_filter)
+        
+        boxscores: Dict[int, Dict[str, GameTeamBoxscore]] = {}
+        for row in boxscore_query.all():
+            boxscores.setdefault(row.game_id, {})[row.team_code] = row
+        
+        resolved_codes = resolved_codes or {}
+        stats_by_team: Dict[str, Dict[str, Any]] = {
+            code: self._empty_team_stats(code) for code in (team_codes or [])
+        }
+        
+        for game in games_query.all():
+            codes = resolved_codes.get(game.id, (game.team1_code, game.team2_code))
+            played = game.team1_score is not None and game.team2_score is not None
+            sides = ((codes[0], codes[1], game.team1_score, game.team2_score, game.team1_points),
+                     (codes[1], codes[0], game.team2_score, game.team1_score, game.team2_points))
+            game_boxscores = boxscores.get(game.id, {})
+            
+            for code, opponent_code, team_score, opponent_score, team_points in sides:
+                stats = stats_by_team.get(code)
+                if stats is None:
+                    if team_codes is not None or not self._is_final_team_code(code):
+                        continue
+                    stats = stats_by_team[code] = self._empty_team_stats(code)
+                
+                if played:
+                    self._add_game_result(stats, team_score, opponent_score, team_points or 0, game.result_type)
+                
+                own_boxscore = game_boxscores.get(code)
+                opponent_boxscore = game_boxscores.get(opponent_code)
+                if own_boxscore:
+                    stats['shots_for'] += own_boxscore.sog
+                    stats['powerplay_goals'] += own_boxscore.ppg
+                    stats['empty_net_goals'] += own_boxscore.eng
+                    stats['penalty_minutes'] += own_boxscore.pim
+                    stats['times_shorthanded'] += own_boxscore.pp_penalties
+                if opponent_boxscore:
+                    stats['shots_against'] += opponent_boxscore.sog
+                    stats['powerplay_goals_against'] += opponent_boxscore.ppg
+                    # Opponent penalty gives us a powerplay opportunity
+                    stats['powerplay_opportunities'] += opponent_boxscore.pp_penalties
+        
+        for stats in stats_by_team.values():
+            # Calculate derived stats
+            stats['goal_differential'] = stats['goals_for'] - stats['goals_against']
+            if stats['powerplay_opportunities'] > 0:
+                stats['powerplay_percentage'] = (
+                    stats['powerplay_goals'] / stats['powerplay_opportunities'] * 100
+                )
+            else:
+                stats['powerplay_percentage'] = 0.0
         
-        # Initialize stats
-        stats = {
+        return stats_by_team
+    
+    def _empty_team_stats(self, team_code: str) -> Dict[str, Any]:
+        return {
             'team_code': team_code,
             'team_iso': TEAM_ISO_CODES.get(team_code, ""),
             'games_played': 0,
@@ -188,123 +268,29 @@ class TeamRepository(BaseRepository[Game]):
             'shots_for': 0,
             'shots_against': 0,
             'powerplay_goals': 0,
+            'powerplay_goals_against': 0,
             'powerplay_opportunities': 0,
+            'times_shorthanded': 0,
             'penalty_minutes': 0,
             'empty_net_goals': 0,
             'shutouts': 0
         }
-        
-        for game in games:
-            if game.team1_score is None or game.team2_score is None:
-                continue
-            
-            stats['games_played'] += 1
-            
-            # Determine if team is team1 or team2
-            is_team1 = game.team1_code == team_code
-            
-            if is_team1:
-                team_score = game.team1_score
-                opponent_score = game.team2_score
-                team_points = game.team1_points
-            else:
-                team_score = game.team2_score
-                opponent_score = game.team1_score
-                team_points = game.team2_points
-            
-            # Update goal stats
-            stats['goals_for'] += team_score
-            stats['goals_against'] += opponent_score
-            stats['points'] += team_points
-            
-            # Win/loss tracking
-            if team_score > opponent_score:
-                if game.result_type == 'REG':
-                    stats['wins'] += 1
-                elif game.result_type == 'OT':
-                    stats['ot_wins'] += 1
-                elif game.result_type == 'SO':
-                    stats['so_wins'] += 1
-            else:
-                if game.result_type == 'REG':
-                    stats['losses'] += 1
-                elif game.result_type == 'OT':
-                    stats['ot_losses'] += 1
-                elif game.result_type == 'SO':
-                    stats['so_losses'] += 1
-            
-            # Check for shutouts
-            if opponent_score == 0:
-                stats['shutouts'] += 1
-            
-            # Get additional stats for this game
-            game_stats = self._get_game_team_stats(game.id, team_code)
-            stats['shots_for'] += game_stats['shots_for']
-            stats['shots_against'] += game_stats['shots_against']
-            stats['powerplay_goals'] += game_stats['pp_goals']
-            stats['powerplay_opportunities'] += game_stats['pp_opportunities']
-            stats['penalty_minutes'] += game_stats['pim']
-            stats['empty_net_goals'] += game_stats['eng']
-        
-        # Calculate derived stats
-        stats['goal_differential'] = stats['goals_for'] - stats['goals_against']
-        
-        if stats['powerplay_opportunities'] > 0:
-            stats['powerplay_percentage'] = (
-                stats['powerplay_goals'] / stats['powerplay_opportunities'] * 100
-            )
-        else:
-            stats['powerplay_percentage'] = 0.0
-        
-        return stats
     
-    def _get_game_team_stats(self, game_id: int, team_code: str) -> Dict[str, Any]:
-        """
-        Get team-specific stats for a single game
-        """
-        stats = {
-            'shots_for': 0,
-            'shots_against': 0,
-            'pp_goals': 0,
-            'pp_opportunities': 0,
-            'pim': 0,
-            'eng': 0
-        }
-        
-        # Get game to determine opponent
-        game = Game.query.get(game_id)
-        if not game:
-            return stats
-        
-        opponent_code = game.team2_code if game.team1_code == team_code else game.team1_code
-        
-        # Shots on goal
-        sog_entries = ShotsOnGoal.query.filter_by(game_id=game_id).all()
-        for sog in sog_entries:
-            if sog.team_code == team_code:
-                stats['shots_for'] += sog.shots
-            elif sog.team_code == opponent_code:
-                stats['shots_against'] += sog.shots
-        
-        # Goals
-        goals = Goal.query.filter_by(game_id=game_id).all()
-        for goal in goals:
-            if goal.team_code == team_code:
-                if goal.goal_type == "PP":
-                    stats['pp_goals'] += 1
-                if goal.is_empty_net:
-                    stats['eng'] += 1
-        
-        # Penalties
-        penalties = Penalty.query.filter_by(game_id=game_id).all()
-        for penalty in penalties:
-            if penalty.team_code == team_code:
-                stats['pim'] += PIM_MAP.get(penalty.penalty_type, 0)
-            elif penalty.team_code == opponent_code and penalty.penalty_type in POWERPLAY_PENALTY_TYPES:
-                # Opponent penalty gives us a powerplay opportunity
-                stats['pp_opportunities'] += 1
-        
-        return stats
+    def _add_game_result(self, stats: Dict[str, Any], team_score: int, opponent_score: int,
+                         team_points: int, result_type: Optional[str]) -> None:
+        stats['games_played'] += 1
+        stats['goals_for'] += team_score
+        stats['goals_against'] += opponent_score
+        stats['points'] += team_points
+        
+        # Win/loss tracking
+        suffix = {'REG': '', 'OT': 'ot_', 'SO': 'so_'}.get(result_type)
+        if suffix is not None:
+            stats[f"{suffix}{'wins' if team_score > opponent_score else 'losses'}"] += 1
+        
+        # Check for shutouts
+        if opponent_score == 0 and team_score > 0:
+            stats['shutouts'] += 1
     
     def get_team_standings(self, year_id: int, group: Optional[str] = None) -> List[TeamStats]:
         """
@@ -583,6 +569,10 @@ class TeamRepository(BaseRepository[Game]):
         
         return performance
     
+    def _is_final_team_code(self, team_code: Optional[str]) -> bool:
+        """Check if team code is a definitive 3-letter country code (e.g. not 'A1' or 'W(SF1)')"""
+        return bool(team_code) and len(team_code) == 3 and team_code.isalpha() and team_code.isupper()
+    
     def _is_placeholder_team(self, team_code: str) -> bool:
         """Check if team code is a placeholder"""
         if not team_code:
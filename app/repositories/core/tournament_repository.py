@@ -4,8 +4,8 @@ Handles tournament-specific data access patterns
 """
 
 from typing import List, Optional, Dict, Any, Tuple
-from sqlalchemy import and_, or_, func, desc
-from models import ChampionshipYear, Game, db
+from sqlalchemy import and_, or_, func, desc, case, select
+from models import ChampionshipYear, Game, Goal, Penalty, PenaltyTypePim, db
 from app.repositories.base import BaseRepository
 import logging
 
@@ -298,6 +298,60 @@ class TournamentRepository(BaseRepository[ChampionshipYear]):
         
         return query.order_by(Game.game_number).all()
     
+    def get_year_aggregates(self, year_ids: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+        """
+        Get per-year totals for all tournaments with a single grouped query
+
+        Goals, penalty minutes and penalty counts only include completed games.
+        Penalty minutes come from penalty_type_pim (unknown types count 0).
+
+        Args:
+            year_ids: Restrict to these tournament IDs (optional)
+
+        Returns:
+            List of dictionaries with year_id, total_games, completed_games, goals
+            (sum of scores), goal_entries (recorded goals), penalty_minutes, penalty_count
+        """
+        goal_totals = select(
+            Goal.game_id.label('game_id'),
+            func.count(Goal.id).label('goal_entries')
+        ).group_by(Goal.game_id).subquery()
+
+        penalty_totals = select(
+            Penalty.game_id.label('game_id'),
+            func.sum(PenaltyTypePim.minutes()).label('penalty_minutes'),
+            func.count(Penalty.id).label('penalty_count')
+        ).outerjoin(
+            PenaltyTypePim, PenaltyTypePim.penalty_type == Penalty.penalty_type
+        ).group_by(Penalty.game_id).subquery()
+
+        completed = and_(Game.team1_score.isnot(None), Game.team2_score.isnot(None))
+
+        def completed_sum(value):
+            return func.coalesce(func.sum(case((completed, value), else_=0)), 0)
+
+        query = self.db.session.query(
+            ChampionshipYear.id.label('year_id'),
+            func.count(Game.id).label('total_games'),
+            completed_sum(1).label('completed_games'),
+            completed_sum(Game.team1_score + Game.team2_score).label('goals'),
+            completed_sum(func.coalesce(goal_totals.c.goal_entries, 0)).label('goal_entries'),
+            completed_sum(func.coalesce(penalty_totals.c.penalty_minutes, 0)).label('penalty_minutes'),
+            completed_sum(func.coalesce(penalty_totals.c.penalty_count, 0)).label('penalty_count')
+        ).outerjoin(
+            Game, Game.year_id == ChampionshipYear.id
+        ).outerjoin(
+            goal_totals, goal_totals.c.game_id == Game.id
+        ).outerjoin(
+            penalty_totals, penalty_totals.c.game_id == Game.id
+        )
+
+        if year_ids is not None:
+            query = query.filter(ChampionshipYear.id.in_(year_ids))
+
+        rows = query.group_by(ChampionshipYear.id).order_by(ChampionshipYear.id).all()
+        return [dict(row._mapping) for row in rows]
+
     def count_tournaments(self) -> int:
         """
         Count total number of tournaments
@@ -0,0 +1,91 @@
+"""
+Tournament Snapshot Repository
+Datenzugriff auf die materialisierten Turnier-Snapshots (ein Eintrag pro Jahr)
+"""
+
+from typing import Dict, List, Optional
+from sqlalchemy.orm import Session
+from models import TournamentSnapshot
+from app.repositories.base import BaseRepository
+
+
+class TournamentSnapshotRepository(BaseRepository[TournamentSnapshot]):
+    """
+    Repository für TournamentSnapshot-Einträge
+
+    Alle Lesezugriffe laufen über den eindeutigen Index auf year_id.
+    """
+
+    def __init__(self):
+        super().__init__(TournamentSnapshot)
+
+    def get_by_year(self, year_id: int, session: Optional[Session] = None) -> Optional[TournamentSnapshot]:
+        """
+        Get snapshot for a tournament year
+
+        Args:
+            year_id: The championship year ID
+            session: Optional database session
+
+        Returns:
+            Snapshot if found, None otherwise
+        """
+        return self.find_one(session=session, year_id=year_id)
+
+    def get_by_years(self, year_ids: List[int]) -> Dict[int, TournamentSnapshot]:
+        """
+        Get snapshots for several tournament years with a single query
+
+        Args:
+            year_ids: List of championship year IDs
+
+        Returns:
+            Dictionary {year_id: snapshot} for all existing snapshots
+        """
+        if not year_ids:
+            return {}
+        snapshots = self.get_query().filter(TournamentSnapshot.year_id.in_(year_ids)).all()
+        return {snapshot.year_id: snapshot for snapshot in snapshots}
+
+    def save(self, year_id: int, version: int, fixture_path: Optional[str],
+             fixture_mtime: Optional[float], payload: str,
+             session: Optional[Session] = None) -> TournamentSnapshot:
+        """
+        Create or replace the snapshot of a tournament year (without commit)
+
+        Args:
+            year_id: The championship year ID
+            version: Payload format version
+            fixture_path: Fixture path of the year at build time
+            fixture_mtime: Modification time of the fixture file at build time
+            payload: Serialized snapshot (JSON)
+            session: Optional database session
+
+        Returns:
+            The stored snapshot
+        """
+        session = session or self.db.session
+        snapshot = self.get_by_year(year_id, session=session)
+        if snapshot is None:
+            snapshot = TournamentSnapshot(year_id=year_id)
+            session.add(snapshot)
+        snapshot.version = version
+        snapshot.fixture_path = fixture_path
+        snapshot.fixture_mtime = fixture_mtime
+        snapshot.payload = payload
+        session.flush()
+        return snapshot
+
+    def delete_by_year(self, year_id: int) -> int:
+        """
+        Delete the snapshot of a tournament year (without commit)
+
+        Args:
+            year_id: The championship year ID
+
+        Returns:
+            Number of deleted snapshots
+        """
+        count = self.get_query().filter(TournamentSnapshot.year_id == year_id).delete(synchronize_session='fetch')
+        self.db.session.flush()
+        return count
@@ -9,6 +9,14 @@ from .standings_service import StandingsService
 from .team_service import TeamService
 from .records_service import RecordsService
 from .standings_service_optimized import StandingsServiceOptimized
+from .all_time_standings_service import AllTimeStandingsService
+from .tournament_snapshot_service import TournamentSnapshotService
+from .matchup_index_service import MatchupIndexService
+from .streak_record_service import StreakRecordService
+from .tournament_aggregates_service import TournamentAggregatesService
+from .game_boxscore_service import GameBoxscoreService
+from .player_name_service import PlayerNameService
+from .data_audit_service import DataAuditService
 
 __all__ = [
     'GameService', 
@@ -17,5 +25,13 @@ __all__ = [
     'StandingsService', 
     'StandingsServiceOptimized',
     'TeamService',
-    'RecordsService'
+    'RecordsService',
+    'AllTimeStandingsService',
+    'TournamentSnapshotService',
+    'MatchupIndexService',
+    'StreakRecordService',
+    'TournamentAggregatesService',
+    'GameBoxscoreService',
+    'PlayerNameService',
+    'DataAuditService'
 ]
\ No newline at end of file
@@ -0,0 +1,208 @@
+"""
+All-Time Standings Service
+Berechnet die ewige Tabelle aller Teams in einem einzigen Durchlauf über alle Spiele
+"""
+
+from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
+import logging
+
+from models import AllTimeTeamStats, ChampionshipYear, Game
+from app.services.base import BaseService
+from app.services.utils.cache_manager import CacheableService, cached
+from app.repositories.core import GameRepository
+from app.services.core.tournament_snapshot_service import TournamentSnapshotService
+from app.exceptions import ServiceError
+from constants import PRELIM_ROUNDS, PLAYOFF_ROUNDS
+from utils import is_code_final
+
+logger = logging.getLogger(__name__)
+
+GAME_TYPE_FILTERS = ('all', 'preliminary', 'playoffs')
+PLAYOFF_ROUND_INDICATORS = ('Quarter', 'Semi', 'Final', 'Bronze', 'Gold', 'Playoff')
+
+
+class AllTimeStandingsService(CacheableService, BaseService[Game]):
+    """
+    Service für die All-Time Standings
+
+    Lädt alle Jahre und Spiele genau einmal, übernimmt die aufgelösten
+    Playoff-Platzhalter aus den Turnier-Snapshots (wie year_view) und baut die AllTimeTeamStats für alle Teams
+    und alle Spieltyp-Filter ('all', 'preliminary', 'playoffs') im selben Durchlauf.
+    """
+
+    def __init__(self, repository: Optional[GameRepository] = None):
+        """
+        Initialize service with repository and cache
+
+        Args:
+            repository: GameRepository instance (optional, will create if not provided)
+        """
+        if repository is None:
+            repository = GameRepository()
+        super().__init__(repository)
+        self.repository: GameRepository = repository
+
+    def calculate_all_time_standings(self, game_type: str = 'all') -> List[AllTimeTeamStats]:
+        """
+        Liefert die All-Time Standings für einen Spieltyp-Filter
+
+        Args:
+            game_type: 'all', 'preliminary' oder 'playoffs' (ungültige Werte -> 'all')
+
+        Returns:
+            Nach (pts, gd, gf) absteigend sortierte Liste von AllTimeTeamStats
+        """
+        if game_type not in GAME_TYPE_FILTERS:
+            game_type = 'all'
+        return self.calculate_all_filters()[game_type]
+
+    @cached(ttl=300, key_prefix="all_time_standings")
+    def calculate_all_filters(self) -> Dict[str, List[AllTimeTeamStats]]:
+        """
+        Berechnet die All-Time Standings für alle Spieltyp-Filter in einem Durchlauf
+
+        Returns:
+            Dictionary {game_type: sortierte Liste von AllTimeTeamStats}
+        """
+        try:
+            years = ChampionshipYear.query.all()
+            games_by_year: Dict[int, List[Game]] = defaultdict(list)
+            for game in self.repository.find_all():
+                games_by_year[game.year_id].append(game)
+
+            # Nur echte Teams (3-Buchstaben-Codes) aus den Spielen, keine Platzhalter
+            team_codes = {
+                code
+                for games in games_by_year.values() for game in games
+                for code in (game.team1_code, game.team2_code)
+                if is_code_final(code)
+            }
+
+            stats_by_filter: Dict[str, Dict[str, AllTimeTeamStats]] = {
+                game_type: {} for game_type in GAME_TYPE_FILTERS
+            }
+
+            resolved_tournaments = TournamentSnapshotService().get_resolved_tournaments(years, games_by_year)
+
+            for year_obj in years:
+                games = games_by_year.get(year_obj.id)
+                if not games:
+                    continue
+
+                resolution = resolved_tournaments[year_obj.id]
+                for game in games:
+                    if game.team1_score is None or game.team2_score is None:
+                        continue
+                    resolved_t1, resolved_t2 = resolution.get_resolved(game)
+                    self._accumulate_game(stats_by_filter, team_codes, year_obj.year,
+                                          game, resolved_t1, resolved_t2)
+
+            standings = {}
+            for game_type, team_stats in stats_by_filter.items():
+                # Sortierung nach Team-Code zuerst, damit Gleichstände stabil bleiben
+                ordered = [team_stats[code] for code in sorted(team_stats) if team_stats[code].gp > 0]
+                ordered.sort(key=lambda x: (x.pts, x.gd, x.gf), reverse=True)
+                standings[game_type] = ordered
+
+            logger.info(f"All-Time Standings berechnet für {len(standings['all'])} Teams "
+                        f"aus {sum(len(g) for g in games_by_year.values())} Spielen")
+            return standings
+
+        except Exception as e:
+            logger.error(f"Error calculating all-time standings: {str(e)}")
+            raise ServiceError(f"Failed to calculate all-time standings: {str(e)}")
+
+    def _accumulate_game(self, stats_by_filter: Dict[str, Dict[str, AllTimeTeamStats]],
+                         team_codes: set, year: int, game: Game,
+                         resolved_t1: str, resolved_t2: str) -> None:
+        """
+        Bucht ein abgeschlossenes Spiel für beide beteiligten Teams in alle passenden Filter
+
+        Args:
+            stats_by_filter: Akkumulatoren pro Filter und Team
+            team_codes: Menge aller bekannten Team-Codes
+            year: Turnierjahr
+            game: Das Spiel (Rohdaten)
+            resolved_t1: Aufgelöster Code von Team 1
+            resolved_t2: Aufgelöster Code von Team 2
+        """
+        is_playoff_game = self._is_playoff_game(game)
+        is_prelim_game = game.round in PRELIM_ROUNDS
+        resolved_codes = ((resolved_t1 or '').upper(), (resolved_t2 or '').upper())
+
+        candidates = {(code or '').upper() for code in
+                      (game.team1_code, game.team2_code, resolved_t1, resolved_t2)}
+        for team_code in candidates & team_codes:
+            is_team1 = self._team_side(game, resolved_codes, team_code)
+            if is_team1 is None:
+                continue
+
+            in_resolved_game = team_code in resolved_codes
+            included = {
+                'all': in_resolved_game if is_playoff_game else True,
+                'preliminary': is_prelim_game,
+                'playoffs': is_playoff_game and in_resolved_game,
+            }
+            for game_type, include in included.items():
+                if include:
+                    team_stats = stats_by_filter[game_type].setdefault(
+                        team_code, AllTimeTeamStats(team_code=team_code))
+                    self._add_game_to_stats(team_stats, game, is_team1, year)
+
+    @staticmethod
+    def _team_side(game: Game, resolved_codes: Tuple[str, str], team_code: str) -> Optional[bool]:
+        """
+        Ermittelt, ob das Team als Team 1 (True) oder Team 2 (False) gespielt hat
+
+        Rohdaten haben Vorrang vor aufgelösten Codes (Platzhalter in Playoff-Spielen).
+
+        Returns:
+            True/False für die Seite oder None, wenn das Team nicht beteiligt war
+        """
+        if game.team1_code and game.team1_code.upper() == team_code:
+            return True
+        if game.team2_code and game.team2_code.upper() == team_code:
+            return False
+        if resolved_codes[0] == team_code:
+            return True
+        if resolved_codes[1] == team_code:
+            return False
+        return None
+
+    @staticmethod
+    def _is_playoff_game(game: Game) -> bool:
+        """Prüft, ob ein Spiel zu einer Playoff-Runde gehört"""
+        round_name = game.round or ''
+        return (round_name in PLAYOFF_ROUNDS or
+                any(indicator in round_name for indicator in PLAYOFF_ROUND_INDICATORS))
+
+    @staticmethod
+    def _add_game_to_stats(team_stats: AllTimeTeamStats, game: Game, is_team1: bool, year: int) -> None:
+        """Addiert ein Spielergebnis zu den All-Time Stats eines Teams"""
+        team_score = game.team1_score if is_team1 else game.team2_score
+        opponent_score = game.team2_score if is_team1 else game.team1_score
+        team_points = game.team1_points if is_team1 else game.team2_points
+
+        team_stats.years_participated.add(year)
+        team_stats.gp += 1
+        team_stats.gf += team_score
+        team_stats.ga += opponent_score
+        team_stats.pts += team_points or 0
+
+        won = team_score > opponent_score
+        if game.result_type == 'REG':
+            if won:
+                team_stats.w += 1
+            else:
+                team_stats.l += 1
+        elif game.result_type == 'OT':
+            if won:
+                team_stats.otw += 1
+            else:
+                team_stats.otl += 1
+        elif game.result_type == 'SO':
+            if won:
+                team_stats.sow += 1
+            else:
+                team_stats.sol += 1
@@ -0,0 +1,327 @@
+"""
+Data Audit Service
+Datenkonsistenz-Prüfung ganzer Turniere als Batch-Lauf (flask audit-data) mit
+gespeicherten Befunden pro Spiel in der Tabelle game_data_audit
+"""
+
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+import hashlib
+import json
+import logging
+
+from models import ChampionshipYear, GameDataAudit, GameDisplay
+from app.services.base import BaseService
+from app.repositories.core import GameDataAuditRepository, GameRepository, TournamentRepository
+from app.services.core.game_service import GameService
+from app.services.core.tournament_snapshot_service import TournamentSnapshotService
+from utils.data_validation import check_game_data_consistency
+from utils.game_timeline import GameTimeline
+
+logger = logging.getLogger(__name__)
+
+# Bei Änderungen an den Prüfregeln erhöhen, alle Spiele werden dann erneut geprüft
+AUDIT_VERSION = 1
+
+
+class AuditFinding(NamedTuple):
+    """Ergebnis der Konsistenz-Prüfung eines Spiels"""
+    scores_fully_match_data: bool
+    warnings: List[str]
+
+
+@dataclass
+class YearAudit:
+    """Zusammenfassung eines Prüflaufs für ein Turnier; findings enthält nur Spiele mit Warnungen"""
+    year_id: int
+    name: str
+    year: int
+    games: int = 0
+    checked: int = 0  # in diesem Lauf geprüfte (neue oder geänderte) Spiele
+    unaudited: int = 0  # Spiele ohne gespeicherten Befund (nur bei get_stored_audit)
+    findings: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def skipped(self) -> int:
+        return self.games - self.checked
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data['skipped'] = self.skipped
+        return data
+
+
+def compute_data_hash(game_display: GameDisplay, timeline: GameTimeline) -> str:
+    """
+    Hash aller Daten, die check_game_data_consistency für ein Spiel auswertet
+
+    Args:
+        game_display: GameDisplay mit aufgelösten Team-Codes
+        timeline: GameTimeline des Spiels
+
+    Returns:
+        SHA-1 als Hex-String
+    """
+    payload = [
+        AUDIT_VERSION,
+        game_display.team1_code, game_display.team2_code,
+        game_display.team1_score, game_display.team2_score, game_display.result_type,
+        game_display.team1_points, game_display.team2_points,
+        [(goal.time_seconds, goal.id, goal.team_code, goal.minute, goal.goal_type) for goal in timeline.goals],
+        [(penalty.time_seconds, penalty.id, penalty.team_code, penalty.minute_of_game, penalty.penalty_type)
+         for penalty in timeline.penalties],
+        sorted((team_code, sorted(periods.items())) for team_code, periods in timeline.sog_recorded.items()),
+    ]
+    return hashlib.sha1(json.dumps(payload, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+
+def consistency_events(timeline: GameTimeline) -> List[Dict[str, Any]]:
+    """
+    Ereignisliste (sorted_events) mit den Feldern, die die Konsistenz-Prüfung liest
+
+    Args:
+        timeline: GameTimeline des Spiels
+
+    Returns:
+        Liste von Ereignis-Dictionaries in Spielzeit-Reihenfolge
+    """
+    events = []
+    for event in timeline.events:
+        if event.kind == 'goal':
+            data = {'id': event.id, 'team_code': event.team_code, 'minute': event.minute,
+                    'goal_type_display': event.goal_type}
+            events.append({'type': 'goal', 'time_str': event.minute, 'time_for_sort': event.time_seconds, 'data': data})
+        else:
+            data = {'id': event.id, 'team_code': event.team_code, 'minute_of_game': event.minute_of_game,
+                    'penalty_type': event.penalty_type}
+            events.append({'type': 'penalty', 'time_str': event.minute_of_game, 'time_for_sort': event.time_seconds,
+                           'data': data})
+    return events
+
+
+class DataAuditService(BaseService[GameDataAudit]):
+    """
+    Service für die gespeicherten Konsistenz-Befunde (game_data_audit)
+
+    Jeder Befund speichert den Hash der geprüften Spieldaten: aufgelöste Team-Codes,
+    Ergebnis, Tore, Strafen, Torschüsse und AUDIT_VERSION. Ein Spiel wird nur
+    erneut geprüft, wenn sich dieser Hash geändert hat. Damit liest die
+    Jahresansicht für unveränderte Spiele nur die gespeicherten Befunde, und der
+    Batch-Lauf über alle Turniere überspringt bereits geprüfte Spiele.
+
+    Nur audit_year()/audit_all() (flask audit-data) schreiben Befunde; get_findings()
+    und get_stored_audit() lesen nur.
+    """
+
+    def __init__(self, repository: Optional[GameDataAuditRepository] = None,
+                 game_repository: Optional[GameRepository] = None,
+                 tournament_repository: Optional[TournamentRepository] = None):
+        """
+        Initialize service with repositories
+
+        Args:
+            repository: GameDataAuditRepository instance (optional, will create if not provided)
+            game_repository: GameRepository instance (optional, will create if not provided)
+            tournament_repository: TournamentRepository instance (optional, will create if not provided)
+        """
+        if repository is None:
+            repository = GameDataAuditRepository()
+        super().__init__(repository)
+        self.repository: GameDataAuditRepository = repository
+        self.game_repository = game_repository or GameRepository()
+        self.tournament_repository = tournament_repository or TournamentRepository()
+
+    def get_findings(self, year_id: int, game_displays: Sequence[GameDisplay],
+                     force: bool = False) -> Dict[int, AuditFinding]:
+        """
+        Befunde der angegebenen Spiele eines Turniers (ohne Schreibzugriff)
+
+        Unveränderte Spiele liefern den gespeicherten Befund, neue oder geänderte
+        Spiele werden geprüft, aber nicht gespeichert; das übernimmt flask audit-data.
+
+        Args:
+            year_id: The championship year ID
+            game_displays: GameDisplay-Objekte mit aufgelösten Team-Codes, timeline und sorted_events
+            force: Auch unveränderte Spiele erneut prüfen
+
+        Returns:
+            Dictionary {game_id: AuditFinding}
+        """
+        findings, _ = self._check(self.repository.get_by_year(year_id), game_displays, force)
+        return findings
+
+    def audit_year(self, year_obj: ChampionshipYear, force: bool = False) -> YearAudit:
+        """
+        Prüft alle Spiele eines Turniers und speichert die Befunde
+
+        Schlägt das Speichern fehl, werden die frisch berechneten Befunde trotzdem
+        zurückgegeben.
+
+        Args:
+            year_obj: ChampionshipYear-Objekt
+            force: Auch unveränderte Spiele erneut prüfen
+
+        Returns:
+            YearAudit mit den Spielen, für die Warnungen vorliegen
+        """
+        games = self.game_repository.get_games_by_year(year_obj.id)
+        resolved_tournament = TournamentSnapshotService().get_resolved_tournament(year_obj, games)
+
+        displays = []
+        for game in games:
+            team1_code, team2_code = resolved_tournament.get_resolved(game)
+            displays.append(GameDisplay(
+                id=game.id, year_id=game.year_id, date=game.date, start_time=game.start_time, round=game.round,
+                group=game.group, game_number=game.game_number, location=game.location, venue=game.venue,
+                team1_code=team1_code, team2_code=team2_code,
+                original_team1_code=game.team1_code, original_team2_code=game.team2_code,
+                team1_score=game.team1_score, team2_score=game.team2_score, result_type=game.result_type,
+                team1_points=game.team1_points, team2_points=game.team2_points))
+
+        timelines = GameService().get_timelines([(display.id, display.team1_code, display.team2_code)
+                                                 for display in displays])
+        for display in displays:
+            display.timeline = timelines[display.id]
+            display.sorted_events = consistency_events(display.timeline)
+
+        stored = self.repository.get_by_year(year_obj.id)
+        findings, changed = self._check(stored, displays, force)
+        self._store(year_obj.id, stored, findings, changed, [display.id for display in displays])
+
+        year_audit = YearAudit(year_id=year_obj.id, name=year_obj.name, year=year_obj.year,
+                               games=len(displays), checked=len(changed))
+        for display in sorted(displays, key=self._game_order):
+            self._add_finding(year_audit, display, display.team1_code, display.team2_code, findings[display.id])
+        logger.info(f"Data audit year {year_obj.id}: {year_audit.checked} of {len(displays)} games checked, "
+                    f"{len(year_audit.findings)} with warnings")
+        return year_audit
+
+    def get_stored_audit(self, year_obj: ChampionshipYear) -> YearAudit:
+        """
+        Gespeicherte Befunde eines Turniers aus dem letzten Prüflauf (ohne Schreibzugriff)
+
+        Spiele ohne gespeicherten Befund zählen als unaudited; ob sich Spiele seit dem
+        letzten Lauf geändert haben, prüft erst flask audit-data.
+
+        Args:
+            year_obj: ChampionshipYear-Objekt
+
+        Returns:
+            YearAudit mit den Spielen, für die Warnungen gespeichert sind
+        """
+        games = self.game_repository.get_games_by_year(year_obj.id)
+        resolved_tournament = TournamentSnapshotService().get_resolved_tournament(year_obj, games)
+        stored = self.repository.get_by_year(year_obj.id)
+
+        year_audit = YearAudit(year_id=year_obj.id, name=year_obj.name, year=year_obj.year, games=len(games),
+                               unaudited=sum(1 for game in games if game.id not in stored))
+        for game in sorted(games, key=self._game_order):
+            audit = stored.get(game.id)
+            if audit is not None:
+                team1_code, team2_code = resolved_tournament.get_resolved(game)
+                self._add_finding(year_audit, game, team1_code, team2_code,
+                                  AuditFinding(audit.scores_fully_match_data, json.loads(audit.warnings)))
+        return year_audit
+
+    def audit_all(self, year: Optional[int] = None, force: bool = False) -> List[YearAudit]:
+        """
+        Prüft alle Turniere (oder die Turniere eines Jahres)
+
+        Args:
+            year: Optional - nur Turniere dieses Jahres (z.B. 2024)
+            force: Auch unveränderte Spiele erneut prüfen
+
+        Returns:
+            Liste der YearAudit-Ergebnisse, nach Jahr sortiert
+        """
+        query = self.tournament_repository.get_query()
+        if year is not None:
+            query = query.filter(ChampionshipYear.year == year)
+        return [self.audit_year(year_obj, force)
+                for year_obj in query.order_by(ChampionshipYear.year, ChampionshipYear.id).all()]
+
+    @staticmethod
+    def build_report(year_audits: Sequence[YearAudit]) -> Dict[str, Any]:
+        """
+        JSON-Bericht für die Datenerfassung
+
+        Args:
+            year_audits: Ergebnisse von audit_year() / audit_all()
+
+        Returns:
+            JSON-serialisierbares Dictionary
+        """
+        return {
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'audit_version': AUDIT_VERSION,
+            'games': sum(year_audit.games for year_audit in year_audits),
+            'games_with_warnings': sum(len(year_audit.findings) for year_audit in year_audits),
+            'years': [year_audit.to_dict() for year_audit in year_audits],
+        }
+
+    @staticmethod
+    def _game_order(game) -> Tuple[bool, int, int]:
+        """Sortierung der Befunde nach Spielnummer (Spiele ohne Nummer zuletzt)"""
+        return game.game_number is None, game.game_number or 0, game.id
+
+    @staticmethod
+    def _add_finding(year_audit: YearAudit, game, team1_code: str, team2_code: str,
+                     finding: AuditFinding) -> None:
+        """Übernimmt den Befund eines Spiels in den Bericht, falls er Warnungen enthält"""
+        if finding.warnings:
+            year_audit.findings.append({
+                'game_id': game.id, 'game_number': game.game_number, 'date': game.date,
+                'round': game.round, 'team1_code': team1_code, 'team2_code': team2_code,
+                'scores_fully_match_data': finding.scores_fully_match_data, 'warnings': finding.warnings,
+            })
+
+    @staticmethod
+    def _check(stored: Dict[int, GameDataAudit], game_displays: Sequence[GameDisplay],
+               force: bool) -> Tuple[Dict[int, AuditFinding], List[Tuple[int, str]]]:
+        """
+        Prüft neue und geänderte Spiele, unveränderte liefern den gespeicherten Befund
+
+        Args:
+            stored: Gespeicherte Befunde des Jahres {game_id: GameDataAudit}
+            game_displays: Vorbereitete GameDisplay-Objekte
+            force: Auch unveränderte Spiele erneut prüfen
+
+        Returns:
+            Tuple (Befunde {game_id: AuditFinding}, geprüfte Spiele [(game_id, data_hash)])
+        """
+        findings: Dict[int, AuditFinding] = {}
+        changed = []
+        for display in game_displays:
+            data_hash = compute_data_hash(display, display.timeline)
+            audit = stored.get(display.id)
+            if not force and audit is not None and audit.data_hash == data_hash:
+                findings[display.id] = AuditFinding(audit.scores_fully_match_data, json.loads(audit.warnings))
+                continue
+            result = check_game_data_consistency(display, display.timeline.sog_recorded)
+            findings[display.id] = AuditFinding(result['scores_fully_match_data'], result['warnings'])
+            changed.append((display.id, data_hash))
+        return findings, changed
+
+    def _store(self, year_id: int, stored: Dict[int, GameDataAudit], findings: Dict[int, AuditFinding],
+               changed: List[Tuple[int, str]], game_ids: List[int]) -> None:
+        """
+        Speichert die Befunde geprüfter Spiele und löscht Befunde entfernter Spiele
+
+        Args:
+            year_id: The championship year ID
+            stored: Gespeicherte Befunde des Jahres {game_id: GameDataAudit}
+            findings: Befunde {game_id: AuditFinding}
+            changed: Geprüfte Spiele [(game_id, data_hash)]
+            game_ids: IDs aller aktuellen Spiele des Jahres
+        """
+        try:
+            for game_id, data_hash in changed:
+                finding = findings[game_id]
+                self.repository.save(stored, game_id, year_id, data_hash,
+                                     finding.scores_fully_match_data, json.dumps(finding.warnings))
+            self.repository.delete_other_games(year_id, game_ids)
+            self.commit()
+        except Exception as e:
+            self.rollback()
+            logger.warning(f"Could not store data audit for year {year_id}: {str(e)}")
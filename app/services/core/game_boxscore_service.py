@@ -0,0 +1,122 @@
+"""
+Game Boxscore Service
+Box-Scores pro Spiel und Team (Tore, PP-/SH-/EN-Tore, Torschüsse, Strafminuten, Strafen),
+beim Schreiben von Toren, Strafen und Torschüssen gepflegt
+"""
+
+from typing import Dict, List, Optional, Sequence
+import logging
+
+from app.services.base import BaseService
+from app.services.utils.event_bus import (
+    DomainEvent, GoalAdded, GoalDeleted, PenaltyAdded, PenaltyDeleted, ShotsOnGoalChanged, get_event_bus
+)
+from app.repositories.core import GameBoxscoreRepository
+from models import GameTeamBoxscore
+
+logger = logging.getLogger(__name__)
+
+
+class GameBoxscoreService(BaseService[GameTeamBoxscore]):
+    """
+    Service für die Tabelle game_team_boxscore
+
+    Jede Erfassung oder Löschung eines Tors oder einer Strafe und jede Änderung
+    der Torschüsse publiziert ein Domain-Event vor dem Commit; der Handler dieses
+    Moduls berechnet daraufhin die Zeilen des betroffenen Spiels neu. Box-Score
+    und Ereignisse werden so in derselben Transaktion geschrieben. Leser summieren
+    die kompakten Zeilen statt Tore, Strafen und Torschüsse zu laden.
+
+    Die Zeilen sind nach dem team_code der Ereignisse geschlüsselt. Gegen-Werte
+    (Torschüsse gegen, PP-Gelegenheiten) ergeben sich aus der Zeile des Gegners:
+    dessen pp_penalties sind die PP-Gelegenheiten des Teams.
+    """
+
+    def __init__(self, repository: Optional[GameBoxscoreRepository] = None):
+        """
+        Initialize service with repository
+
+        Args:
+            repository: GameBoxscoreRepository instance (optional, will create if not provided)
+        """
+        if repository is None:
+            repository = GameBoxscoreRepository()
+        super().__init__(repository)
+        self.repository: GameBoxscoreRepository = repository
+
+    def get_by_games(self, game_ids: Sequence[int]) -> Dict[int, Dict[str, GameTeamBoxscore]]:
+        """
+        Box-Scores mehrerer Spiele
+
+        Args:
+            game_ids: List of game IDs
+
+        Returns:
+            Dictionary {game_id: {team_code: GameTeamBoxscore}}
+        """
+        return self.repository.get_by_games(list(game_ids))
+
+    def get_by_year(self, year_id: int) -> Dict[int, Dict[str, GameTeamBoxscore]]:
+        """
+        Box-Scores aller Spiele eines Turniers
+
+        Args:
+            year_id: The championship year ID
+
+        Returns:
+            Dictionary {game_id: {team_code: GameTeamBoxscore}}
+        """
+        return self.repository.get_by_year(year_id)
+
+    def refresh_games(self, game_ids: Sequence[int]) -> None:
+        """
+        Berechnet die Box-Scores der angegebenen Spiele neu (ohne Commit)
+
+        Args:
+            game_ids: List of game IDs
+        """
+        game_ids = list(game_ids)
+        self.repository.replace_games(game_ids, self.repository.compute_rows(game_ids))
+        logger.debug(f"Box scores refreshed for games {game_ids}")
+
+    def rebuild_all(self) -> int:
+        """
+        Berechnet alle Box-Scores neu (ohne Commit), z.B. nach geänderten Strafminuten pro Straftyp
+
+        Returns:
+            Number of box score rows
+        """
+        rows = self.repository.compute_rows()
+        self.repository.replace_all(rows)
+        logger.info(f"Rebuilt {len(rows)} box score rows")
+        return len(rows)
+
+    def backfill(self) -> int:
+        """
+        Legt die Box-Scores von Spielen mit Ereignissen, aber ohne Box-Score an (ohne Commit)
+
+        Betrifft Datenbanken aus der Zeit vor der Tabelle game_team_boxscore.
+
+        Returns:
+            Number of backfilled games
+        """
+        game_ids = self.repository.get_games_without_boxscore()
+        if game_ids:
+            self.refresh_games(game_ids)
+            logger.info(f"Backfilled box scores for {len(game_ids)} games")
+        return len(game_ids)
+
+
+def refresh_boxscore_for_event(event: DomainEvent) -> None:
+    """
+    Event-Handler: berechnet den Box-Score des betroffenen Spiels neu
+
+    Args:
+        event: Das publizierte Domain-Event
+    """
+    if event.game_id is not None:
+        GameBoxscoreService().refresh_games([event.game_id])
+
+
+get_event_bus().subscribe((GoalAdded, GoalDeleted, PenaltyAdded, PenaltyDeleted, ShotsOnGoalChanged),
+                          refresh_boxscore_for_event)
@@ -8,9 +8,11 @@ from models import Game, ChampionshipYear, TeamStats, ShotsOnGoal, GameOverrule,
 from app.services.base import BaseService
 from app.services.utils.cache_manager import CacheableService, cached
 from app.repositories.core import GameRepository
+from app.services.utils.event_bus import GameScoreChanged, ShotsOnGoalChanged, publish
 from app.exceptions import ServiceError, ValidationError, NotFoundError, BusinessRuleError
 from utils.playoff_resolver import PlayoffResolver
 from utils import check_game_data_consistency, is_code_final
+from utils.game_timeline import GameTimeline, count_powerplay_opportunities
 from constants import PIM_MAP, POWERPLAY_PENALTY_TYPES, TEAM_ISO_CODES
 import logging
 import os
@@ -97,13 +99,11 @@ class GameService(CacheableService, BaseService[Game]):
             
             # Use repository for update
             self.flush()  # Ensure changes are flushed
+            # Snapshot und Caches über den Event-Bus in derselben Transaktion verwerfen
+            publish(GameScoreChanged(year_id=game.year_id, game_id=game.id,
+                                     team_codes=(game.team1_code, game.team2_code)))
             self.commit()
             
-            # Invalidiere Cache für dieses Spiel und Jahr
-            self.invalidate_cache(f"game:with_stats:{game_id}")
-            self.invalidate_cache(f"game:by_year:{game.year_id}")
-            self.invalidate_cache(f"game:by_year_details:{game.year_id}")
-            
             logger.info(f"Updated game {game_id} score: {team1_score}-{team2_score} ({result_type})")
             return game
             
@@ -210,6 +210,8 @@ class GameService(CacheableService, BaseService[Game]):
                         made_changes = True
             
             if made_changes:
+                publish(ShotsOnGoalChanged(year_id=game.year_id, game_id=game.id,
+                                           team_codes=(team1_resolved, team2_resolved)))
                 self.commit()
                 logger.info(f"Updated SOG for game {game_id}")
             
@@ -368,44 +370,8 @@ class GameService(CacheableService, BaseService[Game]):
     
     def _calculate_powerplay_opportunities(self, penalties: List[Penalty], 
                                          team1: str, team2: str) -> Dict[str, int]:
-        """Calculate powerplay opportunities from penalties"""
-        potential_pp_slots = []
-        
-        for penalty in penalties:
-            if penalty.penalty_type in POWERPLAY_PENALTY_TYPES:
-                # Each penalty gives exactly one powerplay opportunity
-                beneficiary = None
-                if penalty.team_code == team1:
-                    beneficiary = team2
-                elif penalty.team_code == team2:
-                    beneficiary = team1
-                
-                if beneficiary:
-                    potential_pp_slots.append({
-                        'time': penalty.minute_of_game,
-                        'beneficiary': beneficiary
-                    })
-        
-        # Group by time to handle coincidental penalties
-        grouped_slots = {}
-        for slot in potential_pp_slots:
-            time = slot['time']
-            if time not in grouped_slots:
-                grouped_slots[time] = []
-            grouped_slots[time].append(slot)
-        
-        # Calculate final opportunities
-        pp_opportunities = {team1: 0, team2: 0}
-        for time, slots in grouped_slots.items():
-            opp_team1 = sum(1 for s in slots if s['beneficiary'] == team1)
-            opp_team2 = sum(1 for s in slots if s['beneficiary'] == team2)
-            
-            # Cancel out coincidental penalties
-            cancelled = min(opp_team1, opp_team2)
-            pp_opportunities[team1] += (opp_team1 - cancelled)
-            pp_opportunities[team2] += (opp_team2 - cancelled)
-        
-        return pp_opportunities
+        """Calculate powerplay opportunities from penalties (coincidental penalties cancel out)"""
+        return count_powerplay_opportunities(penalties, team1, team2)
     
     def add_overrule(self, game_id: int, reason: str) -> GameOverrule:
         """
@@ -571,9 +537,10 @@ class GameService(CacheableService, BaseService[Game]):
             game_ids: List of game IDs
             
         Returns:
-            Dictionary with game_id as key and list of goals as value
+            Dictionary with game_id as key and list of goals (ordered by game time) as value
         """
-        goals = Goal.query.filter(Goal.game_id.in_(game_ids)).all()
+        goals = Goal.query.filter(Goal.game_id.in_(game_ids)) \
+            .order_by(Goal.game_id, Goal.time_seconds, Goal.id).all()
         
         goals_by_game = {}
         for goal in goals:
@@ -591,9 +558,10 @@ class GameService(CacheableService, BaseService[Game]):
             game_ids: List of game IDs
             
         Returns:
-            Dictionary with game_id as key and list of penalties as value
+            Dictionary with game_id as key and list of penalties (ordered by game time) as value
         """
-        penalties = Penalty.query.filter(Penalty.game_id.in_(game_ids)).all()
+        penalties = Penalty.query.filter(Penalty.game_id.in_(game_ids)) \
+            .order_by(Penalty.game_id, Penalty.time_seconds, Penalty.id).all()
         
         penalties_by_game = {}
         for penalty in penalties:
@@ -603,6 +571,28 @@ class GameService(CacheableService, BaseService[Game]):
         
         return penalties_by_game
     
+    def get_timelines(self, games: List[Tuple[int, str, str]]) -> Dict[int, GameTimeline]:
+        """
+        Build the event timelines of multiple games from three batched queries
+        
+        Args:
+            games: List of tuples (game_id, resolved team1 code, resolved team2 code)
+            
+        Returns:
+            Dictionary with game_id as key and GameTimeline as value
+        """
+        goal_rows, penalty_rows, sog_rows = self.repository.get_timeline_rows([game[0] for game in games])
+        
+        rows_by_game: Dict[int, Tuple[list, list, list]] = {game[0]: ([], [], []) for game in games}
+        for index, rows in enumerate((goal_rows, penalty_rows, sog_rows)):
+            for row in rows:
+                rows_by_game[row[0]][index].append(row[1:])
+        
+        return {
+            game_id: GameTimeline.build(game_id, team1_code, team2_code, *rows_by_game[game_id])
+            for game_id, team1_code, team2_code in games
+        }
+    
     def get_overrules_by_year(self, year_id: int) -> Dict[int, GameOverrule]:
         """
         Get all game overrules for a championship year
@@ -737,41 +727,25 @@ class GameService(CacheableService, BaseService[Game]):
         default_bronze = 63
         default_gold = 64
         
-        # Versuche Fixture-Datei zu lesen
-        from utils.fixture_helpers import resolve_fixture_path
-        fixture_path = resolve_fixture_path(year_obj.fixture_path) if year_obj.fixture_path else None
-        
-        if fixture_path and os.path.exists(fixture_path):
-            try:
-                with open(fixture_path, 'r', encoding='utf-8') as f:
-                    loaded_fixture_data = json.load(f)
-                
-                fixture_info['hosts'] = loaded_fixture_data.get("hosts", [])
-                
-                schedule_data = loaded_fixture_data.get("schedule", [])
-                for game_data in schedule_data:
-                    round_name = game_data.get("round", "").lower()
-                    game_num = game_data.get("gameNumber")
-                    
-                    if "quarterfinal" in round_name:
-                        fixture_info['quarterfinal_games'].append(game_num)
-                    elif "semifinal" in round_name:
-                        fixture_info['semifinal_games'].append(game_num)
-                    elif "bronze medal game" in round_name or "bronze" in round_name or "3rd place" in round_name:
-                        fixture_info['bronze_game_number'] = game_num
-                    elif "gold medal game" in round_name or "final" in round_name or "gold" in round_name:
-                        fixture_info['gold_game_number'] = game_num
-                
-                # Sortiere Semifinal-Spiele
-                fixture_info['semifinal_games'].sort()
-                
-            except Exception as e:
-                logger.warning(f"Fehler beim Lesen der Fixture-Datei: {str(e)}")
-                # Use defaults
-                fixture_info['quarterfinal_games'] = default_qf
-                fixture_info['semifinal_games'] = default_sf
-                fixture_info['bronze_game_number'] = default_bronze
-                fixture_info['gold_game_number'] = default_gold
+        # Fixture-Index aus der FixtureRegistry (Datei wird nur einmal geparst)
+        from utils.fixture_registry import get_fixture_index
+        try:
+            fixture_index = get_fixture_index(year_obj)
+        except Exception as e:
+            logger.warning(f"Fehler beim Lesen der Fixture-Datei: {str(e)}")
+            # Use defaults
+            fixture_info['quarterfinal_games'] = default_qf
+            fixture_info['semifinal_games'] = default_sf
+            fixture_info['bronze_game_number'] = default_bronze
+            fixture_info['gold_game_number'] = default_gold
+            return fixture_info
+        
+        if fixture_index is not None:
+            fixture_info['hosts'] = fixture_index.hosts
+            fixture_info['quarterfinal_games'] = list(fixture_index.qf_game_numbers)
+            fixture_info['semifinal_games'] = list(fixture_index.sf_game_numbers)
+            fixture_info['bronze_game_number'] = fixture_index.bronze_game_number
+            fixture_info['gold_game_number'] = fixture_index.gold_game_number
         else:
             # Use defaults
             fixture_info['quarterfinal_games'] = default_qf
@@ -841,43 +815,17 @@ class GameService(CacheableService, BaseService[Game]):
             # Resolve team names for this game
             team1_resolved, team2_resolved = self.resolve_team_names(game.year_id, game_id)
             
-            # Initialize team stats structure
+            # Shots, powerplay goals and opportunities from the game timeline
+            timeline = self.get_timelines([(game_id, team1_resolved, team2_resolved)])[game_id]
             team_stats = {
-                team1_resolved: {
-                    'shots': 0,
-                    'powerplay_goals': 0,
-                    'powerplay_opportunities': 0
-                },
-                team2_resolved: {
-                    'shots': 0,
-                    'powerplay_goals': 0,
-                    'powerplay_opportunities': 0
+                team_code: {
+                    'shots': timeline.sog_totals[team_code],
+                    'powerplay_goals': timeline.pp_goals[team_code],
+                    'powerplay_opportunities': timeline.pp_opportunities[team_code]
                 }
+                for team_code in (team1_resolved, team2_resolved)
             }
             
-            # Get shots on goal data
-            sog_data = self._get_current_sog_data(game_id)
-            for team_code, periods in sog_data.items():
-                if team_code in team_stats:
-                    team_stats[team_code]['shots'] = sum(periods.values())
-            
-            # Get goals for powerplay stats
-            goals = Goal.query.filter_by(game_id=game_id).all()
-            for goal in goals:
-                if goal.goal_type == "PP" and goal.team_code in team_stats:
-                    team_stats[goal.team_code]['powerplay_goals'] += 1
-            
-            # Get penalties for powerplay opportunities
-            penalties = Penalty.query.filter_by(game_id=game_id).all()
-            pp_opportunities = self._calculate_powerplay_opportunities(
-                penalties, team1_resolved, team2_resolved
-            )
-            
-            # Update powerplay opportunities
-            for team_code in [team1_resolved, team2_resolved]:
-                if team_code in pp_opportunities:
-                    team_stats[team_code]['powerplay_opportunities'] = pp_opportunities[team_code]
-            
             return {
                 'team_stats': team_stats
             }
@@ -0,0 +1,83 @@
+"""
+Matchup Index Service
+Jahresübergreifender Index der gespielten Team-Paarungen (VS-Buttons der Jahresansicht)
+"""
+
+from typing import Dict, Optional
+import logging
+
+from app.services.base import BaseService
+from app.repositories.core import TeamMatchupRepository
+from app.exceptions import ServiceError
+from app.services.core.tournament_snapshot_service import SNAPSHOT_VERSION, TournamentSnapshotService
+from models import TeamMatchup
+
+logger = logging.getLogger(__name__)
+
+
+class MatchupIndexService(BaseService[TeamMatchup]):
+    """
+    Service für den Paarungs-Index
+
+    Die Einträge eines Jahres schreibt der TournamentSnapshotService beim Neuaufbau
+    des Snapshots und verwirft sie bei dessen Invalidierung (Ergebnis, Seeding,
+    Fixture-Import). Eine Ergebnisänderung betrifft so nur das eigene Jahr; der
+    Lesezugriff ist eine Query über die Tabelle team_matchup.
+    """
+
+    def __init__(self, repository: Optional[TeamMatchupRepository] = None,
+                 snapshot_service: Optional[TournamentSnapshotService] = None):
+        """
+        Initialize service with repository
+
+        Args:
+            repository: TeamMatchupRepository instance (optional, will create if not provided)
+            snapshot_service: TournamentSnapshotService for rebuilding missing years (optional)
+        """
+        if repository is None:
+            repository = TeamMatchupRepository()
+        super().__init__(repository)
+        self.repository: TeamMatchupRepository = repository
+        self.snapshot_service = snapshot_service or TournamentSnapshotService(matchup_repository=repository)
+
+    def get_team_combinations(self) -> Dict[str, bool]:
+        """
+        Liefert alle Paarungen, die mindestens ein Spiel bestritten haben
+
+        Returns:
+            Dictionary {"TEAM1_vs_TEAM2": True} mit alphabetisch sortierten Team-Codes
+        """
+        self.ensure_index()
+        return {f"{team_a}_vs_{team_b}": True for team_a, team_b in sorted(self.repository.get_pairs())}
+
+    def get_games_per_year(self, team_a: str, team_b: str) -> Dict[int, int]:
+        """
+        Liefert die Anzahl der Spiele zweier Teams pro Jahr
+
+        Args:
+            team_a: First team code
+            team_b: Second team code
+
+        Returns:
+            Dictionary {year_id: games}
+        """
+        self.ensure_index()
+        return self.repository.get_games_per_year(team_a, team_b)
+
+    def ensure_index(self) -> int:
+        """
+        Baut die Paarungen aller Jahre ohne aktuellen Snapshot auf
+
+        Fehler einzelner Jahre werden protokolliert, die übrigen Jahre bleiben nutzbar.
+
+        Returns:
+            Number of rebuilt years
+        """
+        rebuilt = 0
+        for year_obj in self.repository.get_unindexed_years(SNAPSHOT_VERSION):
+            try:
+                self.snapshot_service.rebuild(year_obj)
+                rebuilt += 1
+            except ServiceError as e:
+                logger.warning(f"Could not index matchups for year {year_obj.id}: {str(e)}")
+        return rebuilt
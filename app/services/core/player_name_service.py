@@ -0,0 +1,140 @@
+"""
+Player Name Service
+Auflösung von Spieler-IDs zu Name, Team und Trikotnummer für Spielereignisse,
+über den globalen Service-Cache statt der kompletten Spielertabelle pro Request
+"""
+
+from typing import Dict, Iterable, NamedTuple, Optional, Sequence
+import logging
+
+from app.services.base import BaseService
+from app.services.utils.cache_backends import MISSING
+from app.services.utils.cache_manager import get_global_cache
+from app.services.utils.event_bus import DomainEvent, PlayerChanged, get_event_bus
+from app.repositories.core import PlayerRepository
+from models import Player
+
+logger = logging.getLogger(__name__)
+
+# Namen ändern sich selten und werden nach dem Commit per PlayerChanged invalidiert
+NAME_CACHE_TTL = 3600
+
+
+class PlayerName(NamedTuple):
+    """Name, Team und Trikotnummer eines Spielers (Eintrag des Namens-Caches)"""
+    first_name: str
+    last_name: str
+    team_code: Optional[str]
+    jersey_number: Optional[int]
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.first_name} {self.last_name}"
+
+
+# Cache id -> PlayerName im globalen Cache: mit dem Backend 'sqlite' teilen alle Worker
+# die Einträge und deren Invalidierung
+_name_cache = get_global_cache()
+
+
+def _cache_key(player_id: int) -> str:
+    return f"player_name:{player_id}"
+
+
+class PlayerNameService(BaseService[Player]):
+    """
+    Service für die Namensauflösung von Torschützen, Assists und bestraften Spielern
+
+    Seiten mit Spielereignissen benötigen nur die Spieler der angezeigten Tore und
+    Strafen. resolve() liefert diese aus dem Cache und lädt fehlende IDs mit einer
+    einzigen IN-Abfrage nach. PlayerService publiziert PlayerChanged bei Namens-,
+    Team- und Trikotänderungen sowie beim Zusammenführen; der Handler dieses Moduls
+    verwirft daraufhin die betroffenen Einträge.
+    """
+
+    def __init__(self, repository: Optional[PlayerRepository] = None):
+        """
+        Initialize service with repository
+
+        Args:
+            repository: PlayerRepository instance (optional, will create if not provided)
+        """
+        if repository is None:
+            repository = PlayerRepository()
+        super().__init__(repository)
+        self.repository: PlayerRepository = repository
+
+    def resolve(self, player_ids: Iterable[Optional[int]]) -> Dict[int, PlayerName]:
+        """
+        Name, Team und Trikotnummer der angegebenen Spieler
+
+        Args:
+            player_ids: Spieler-IDs (None-Werte, z.B. fehlende Assists, werden ignoriert)
+
+        Returns:
+            Dictionary {player_id: PlayerName}; unbekannte IDs fehlen
+        """
+        names: Dict[int, PlayerName] = {}
+        missing = []
+        for player_id in {player_id for player_id in player_ids if player_id is not None}:
+            name = _name_cache.get(_cache_key(player_id), MISSING)
+            if name is MISSING:
+                missing.append(player_id)
+            else:
+                names[player_id] = name
+
+        if missing:
+            for player_id, first_name, last_name, team_code, jersey_number in \
+                    self.repository.get_name_rows(sorted(missing)):
+                name = PlayerName(first_name, last_name, team_code, jersey_number)
+                _name_cache.set(_cache_key(player_id), name, ttl=NAME_CACHE_TTL, tags=(f"player:{player_id}",))
+                names[player_id] = name
+        return names
+
+    def resolve_for_events(self, goals: Sequence = (), penalties: Sequence = ()) -> Dict[int, PlayerName]:
+        """
+        Alle Spieler, die in den Toren (Schütze, Assists) und Strafen referenziert sind
+
+        Args:
+            goals: Goal-Objekte
+            penalties: Penalty-Objekte
+
+        Returns:
+            Dictionary {player_id: PlayerName}
+        """
+        player_ids = [player_id for goal in goals
+                      for player_id in (goal.scorer_id, goal.assist1_id, goal.assist2_id)]
+        player_ids.extend(penalty.player_id for penalty in penalties)
+        return self.resolve(player_ids)
+
+    @staticmethod
+    def invalidate(player_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        Verwirft Cache-Einträge
+
+        Args:
+            player_ids: Optional - nur diese Spieler (Standard: alle)
+
+        Returns:
+            Anzahl verworfener Einträge
+        """
+        if player_ids is None:
+            before = _name_cache.invalidation_count
+            _name_cache.invalidate("player_name:")
+            return _name_cache.invalidation_count - before
+        tags = [f"player:{player_id}" for player_id in player_ids]
+        return _name_cache.invalidate_tags(*tags) if tags else 0
+
+
+def invalidate_player_names_for_event(event: DomainEvent) -> None:
+    """
+    Event-Handler (nach dem Commit): verwirft die Namen der geänderten Spieler
+
+    Args:
+        event: Das publizierte PlayerChanged-Event (ohne player_ids: alle Spieler)
+    """
+    count = PlayerNameService.invalidate(event.player_ids or None)
+    logger.debug(f"Invalidated {count} player name cache entries")
+
+
+get_event_bus().subscribe(PlayerChanged, invalidate_player_names_for_event, after_commit=True)
@@ -4,13 +4,14 @@ Handles all business logic related to players and player statistics
 """
 
 from typing import Dict, List, Optional, Tuple, Any
-from sqlalchemy import or_, func, case
-from models import Player, Goal, Penalty, Game, ChampionshipYear, db
+from sqlalchemy import or_, func
+from models import Player, Goal, Penalty, PenaltyTypePim, Game, ChampionshipYear, db
 from app.services.base import BaseService
-from app.services.utils.cache_manager import CacheableService, cached
+from app.services.utils.cache_manager import PLAYER_NAMES_TAG, CacheableService, cached
+from app.services.utils.event_bus import PlayerChanged, publish
 from app.repositories.core import PlayerRepository
 from app.exceptions import ServiceError, ValidationError, NotFoundError, DuplicateError
-from constants import PIM_MAP, POWERPLAY_PENALTY_TYPES
+from constants import POWERPLAY_PENALTY_TYPES
 from flask import current_app
 import logging
 
@@ -99,8 +100,8 @@ class PlayerService(CacheableService, BaseService[Player]):
                 jersey_number=jersey_number
             )
             
-            # Invalidate team cache
-            self.invalidate_cache(f"team_roster_{team_code}")
+            # Invalidate team and player list caches (after commit)
+            publish(PlayerChanged(team_codes=(player.team_code,), player_ids=(player.id,)))
             
             return player
             
@@ -235,9 +236,9 @@ class PlayerService(CacheableService, BaseService[Player]):
                     except NotFoundError:
                         result['errors'].append(f"Player {player_id} not found")
             
-            # Invalidate team cache
-            self.invalidate_cache(f"team_roster_{team_code}")
-            self.invalidate_cache(f"team_stats_{team_code}")
+            changed_ids = tuple(entry['id'] for entry in result['removed'] + result['added'])
+            if changed_ids:
+                publish(PlayerChanged(team_codes=(team_code,), player_ids=changed_ids))
             
             return result
             
@@ -297,7 +298,7 @@ class PlayerService(CacheableService, BaseService[Player]):
         
         return self.repository.search_players(search_term, team_code)
     
-    @cached(ttl=600, key_prefix="player:tournament_leaders")
+    @cached(ttl=600, key_prefix="player:tournament_leaders", tags=(PLAYER_NAMES_TAG,))
     def get_tournament_scoring_leaders(self, year_id: int, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get tournament scoring leaders
@@ -370,11 +371,9 @@ class PlayerService(CacheableService, BaseService[Player]):
                 
                 # Delete merged player
                 self.repository.delete(merge_player_id)
-            
-            # Invalidate all caches
-            self.invalidate_cache(f"player_{keep_player_id}")
-            self.invalidate_cache(f"player_{merge_player_id}")
-            self.invalidate_cache(f"team_roster_{keep_player.team_code}")
+                
+                publish(PlayerChanged(team_codes=(keep_player.team_code,),
+                                      player_ids=(keep_player_id, merge_player_id)))
             
             return keep_player
             
@@ -759,68 +758,17 @@ class PlayerService(CacheableService, BaseService[Player]):
             ServiceError: If database query fails
         """
         try:
-            from models import Goal, Game
-            
-            # Build base query for goals
-            goals_query = Goal.query.join(Game).filter(Game.year_id == year_id)
-            
-            # Apply game filter if provided
-            if game_ids:
-                goals_query = goals_query.filter(Goal.game_id.in_(game_ids))
-            
-            goals = goals_query.all()
-            
-            # Collect all player IDs and initialize stats
-            player_stats = {}
-            player_objects = {}
-            
-            # Process goals for scoring statistics
-            for goal in goals:
-                # Apply team filter if specified
-                if team_filter:
-                    # Check if any involved player is from the filtered team
-                    players_to_check = [
-                        goal.scorer_id,
-                        goal.assist1_id, 
-                        goal.assist2_id
-                    ]
-                    
-                    team_match = False
-                    for pid in players_to_check:
-                        if pid:
-                            player = Player.query.get(pid)
-                            if player and player.team_code == team_filter:
-                                team_match = True
-                                break
-                    
-                    if not team_match:
-                        continue
-                
-                # Track scorer
-                if goal.scorer_id:
-                    if goal.scorer_id not in player_stats:
-                        player_stats[goal.scorer_id] = {'g': 0, 'a': 0, 'p': 0}
-                        player_objects[goal.scorer_id] = Player.query.get(goal.scorer_id)
-                    player_stats[goal.scorer_id]['g'] += 1
-                    player_stats[goal.scorer_id]['p'] += 1
-                
-                # Track assists
-                for assist_id in [goal.assist1_id, goal.assist2_id]:
-                    if assist_id:
-                        if assist_id not in player_stats:
-                            player_stats[assist_id] = {'g': 0, 'a': 0, 'p': 0}
-                            player_objects[assist_id] = Player.query.get(assist_id)
-                        player_stats[assist_id]['a'] += 1
-                        player_stats[assist_id]['p'] += 1
-            
-            # Add player objects to stats
+            # Goals and assists are aggregated in SQL; the team filter is part of the query
+            rows = self.repository.get_year_scoring_totals(year_id, team_filter, game_ids)
+            
             result = {}
-            for player_id, stats in player_stats.items():
-                result[player_id] = {
-                    'g': stats['g'],
-                    'a': stats['a'], 
-                    'p': stats['p'],
-                    'obj': player_objects[player_id]
+            for player, goals, assists in rows:
+                goals, assists = int(goals or 0), int(assists or 0)
+                result[player.id] = {
+                    'g': goals,
+                    'a': assists,
+                    'p': goals + assists,
+                    'obj': player
                 }
             
             logger.info(f"Retrieved stats for {len(result)} players in year {year_id}")
@@ -846,42 +794,13 @@ class PlayerService(CacheableService, BaseService[Player]):
             ServiceError: If database query fails
         """
         try:
-            from models import Penalty, Game
-            
-            # Build base query for penalties
-            penalties_query = Penalty.query.join(Game).filter(Game.year_id == year_id)
-            penalties = penalties_query.all()
-            
-            # Collect player penalty statistics
-            player_penalties = {}
-            player_objects = {}
-            
-            for penalty in penalties:
-                if penalty.player_id:
-                    # Get player object
-                    if penalty.player_id not in player_objects:
-                        player_objects[penalty.player_id] = Player.query.get(penalty.player_id)
-                    
-                    player = player_objects[penalty.player_id]
-                    
-                    # Apply team filter if specified
-                    if team_filter and player and player.team_code != team_filter:
-                        continue
-                    
-                    # Initialize player stats
-                    if penalty.player_id not in player_penalties:
-                        player_penalties[penalty.player_id] = {'pim': 0}
-                    
-                    # Add penalty minutes
-                    penalty_minutes = PIM_MAP.get(penalty.penalty_type, 0)
-                    player_penalties[penalty.player_id]['pim'] += penalty_minutes
-            
-            # Build final result with player objects
+            rows = self.repository.get_year_penalty_minutes(year_id, team_filter)
+            
             result = {}
-            for player_id, stats in player_penalties.items():
-                result[player_id] = {
-                    'pim': stats['pim'],
-                    'obj': player_objects[player_id]
+            for player, pim in rows:
+                result[player.id] = {
+                    'pim': int(pim or 0),
+                    'obj': player
                 }
             
             logger.info(f"Retrieved penalty stats for {len(result)} players in year {year_id}")
@@ -971,12 +890,9 @@ class PlayerService(CacheableService, BaseService[Player]):
             player.last_name = last_name.strip()
             player.jersey_number = jersey_number
             
+            publish(PlayerChanged(team_codes=(player.team_code,), player_ids=(player_id,)))
             self.repository.update(player)
             
-            # Invalidate cache
-            self.invalidate_cache(f"player_{player_id}")
-            self.invalidate_cache(f"team_players_{player.team_code}")
-            
             return player
             
         except NotFoundError:
@@ -1020,21 +936,12 @@ class PlayerService(CacheableService, BaseService[Player]):
             ).filter(Goal.assist2_id.isnot(None)) \
             .group_by(Goal.assist2_id).subquery()
 
-            # Build penalty minutes case statement
-            pim_when_clauses = []
-            for penalty_type_key, minutes in PIM_MAP.items():
-                pim_when_clauses.append((Penalty.penalty_type == penalty_type_key, minutes))
-            
-            pim_case_statement = case(
-                *pim_when_clauses,
-                else_=0
-            )
-
-            # Build subqueries for penalty minutes
+            # Build subqueries for penalty minutes (minutes per type from penalty_type_pim)
             pims_sq = db.session.query(
                 Penalty.player_id.label("player_id"),
-                func.sum(pim_case_statement).label("total_pims")
-            ).filter(Penalty.player_id.isnot(None)) \
+                func.sum(PenaltyTypePim.minutes()).label("total_pims")
+            ).outerjoin(PenaltyTypePim, PenaltyTypePim.penalty_type == Penalty.penalty_type) \
+            .filter(Penalty.player_id.isnot(None)) \
             .group_by(Penalty.player_id).subquery()
 
             # Build subqueries for goal year ranges
@@ -1098,8 +1005,9 @@ class PlayerService(CacheableService, BaseService[Player]):
                 player_stats_query = player_stats_query.filter(Player.team_code == team_filter)
 
             # Check for unmapped penalty types
-            distinct_db_penalty_types = db.session.query(Penalty.penalty_type).distinct().all()
-            unmapped_types = [pt[0] for pt in distinct_db_penalty_types if pt[0] not in PIM_MAP and pt[0] is not None]
+            unmapped_types = [pt[0] for pt in db.session.query(Penalty.penalty_type).distinct()
+                              .outerjoin(PenaltyTypePim, PenaltyTypePim.penalty_type == Penalty.penalty_type)
+                              .filter(Penalty.penalty_type.isnot(None), PenaltyTypePim.penalty_type.is_(None))]
             if unmapped_types:
                 current_app.logger.warning(f"PlayerStats: Unmapped penalty types found in database, defaulted to 0 PIMs: {unmapped_types}")
 
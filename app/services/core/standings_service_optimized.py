@@ -3,13 +3,15 @@ StandingsService Optimized - Performance-optimierte Version mit Caching
 Berechnet Gruppenstandings, Playoffs-Qualifikation und finale Platzierungen
 """
 
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Dict, List, Optional, Tuple, Set, Union
 from collections import defaultdict
 from models import TeamStats, Game, db
 from app.services.base import BaseService
 from app.services.utils.cache_manager import CacheableService, cached
 from app.repositories.core.standings_repository import StandingsRepository
-from constants import PRELIM_ROUNDS, MAX_PRELIM_GAMES_PER_TEAM
+from constants import PRELIM_ROUNDS
+from utils.head_to_head import HeadToHeadIndex
+from utils.standings import accumulate_standings
 import logging
 
 logger = logging.getLogger(__name__)
@@ -294,91 +296,18 @@ class StandingsServiceOptimized(CacheableService, BaseService[TeamStats]):
     # Fügt nur Caching und Optimierungen hinzu
     
     def _calculate_standings_from_games(self, games: List[Game]) -> Dict[str, TeamStats]:
-        """Optimierte Version mit weniger Objekterstellung"""
-        standings = {}
-        
-        for game in games:
-            if game.team1_score is None or game.team2_score is None:
-                continue
-            
-            # Nutze get() mit Default-Erstellung
-            if game.team1_code not in standings:
-                standings[game.team1_code] = TeamStats(
-                    name=game.team1_code,
-                    group=game.group or "N/A"
-                )
-            if game.team2_code not in standings:
-                standings[game.team2_code] = TeamStats(
-                    name=game.team2_code,
-                    group=game.group or "N/A"
-                )
-            
-            # Direkte Referenzen für bessere Performance
-            team1_stats = standings[game.team1_code]
-            team2_stats = standings[game.team2_code]
-            
-            # Update in einem Durchgang
-            team1_stats.gp += 1
-            team2_stats.gp += 1
-            
-            team1_stats.gf += game.team1_score
-            team1_stats.ga += game.team2_score
-            team2_stats.gf += game.team2_score
-            team2_stats.ga += game.team1_score
-            
-            # Verwende Lookup-Table für Result-Types
-            if game.result_type == 'REG':
-                if game.team1_score > game.team2_score:
-                    team1_stats.w += 1
-                    team1_stats.pts += 3
-                    team2_stats.l += 1
-                else:
-                    team2_stats.w += 1
-                    team2_stats.pts += 3
-                    team1_stats.l += 1
-            elif game.result_type == 'OT':
-                if game.team1_score > game.team2_score:
-                    team1_stats.otw += 1
-                    team1_stats.pts += 2
-                    team2_stats.otl += 1
-                    team2_stats.pts += 1
-                else:
-                    team2_stats.otw += 1
-                    team2_stats.pts += 2
-                    team1_stats.otl += 1
-                    team1_stats.pts += 1
-            elif game.result_type == 'SO':
-                if game.team1_score > game.team2_score:
-                    team1_stats.sow += 1
-                    team1_stats.pts += 2
-                    team2_stats.sol += 1
-                    team2_stats.pts += 1
-                else:
-                    team2_stats.sow += 1
-                    team2_stats.pts += 2
-                    team1_stats.sol += 1
-                    team1_stats.pts += 1
-        
-        return standings
+        """Berechnet TeamStats aus einer Liste von Spielen"""
+        # Ein Durchlauf, TeamStats werden in place aktualisiert (utils.standings.StandingsAccumulator)
+        return accumulate_standings(games)
     
     def _apply_sorting_and_tiebreakers(self, teams: List[TeamStats], 
-                                     all_games: List[Game]) -> List[TeamStats]:
+                                     all_games: Union[HeadToHeadIndex, List[Game]]) -> List[TeamStats]:
         """Sortiert Teams und wendet Tiebreaker an"""
         # Erste Sortierung nach Punkten, Tordifferenz, Tore erzielt
         teams.sort(key=lambda x: (x.pts, x.gd, x.gf), reverse=True)
         
-        # Gruppiere Teams mit gleichen Punkten
-        teams_by_points = defaultdict(list)
-        for team in teams:
-            teams_by_points[team.pts].append(team)
-        
-        # Wende Tiebreaker für jede Punktgruppe an
-        result = []
-        for points in sorted(teams_by_points.keys(), reverse=True):
-            tied_teams = teams_by_points[points]
-            if len(tied_teams) > 1:
-                tied_teams = self.apply_head_to_head_tiebreaker(tied_teams, all_games)
-            result.extend(tied_teams)
+        # Punktgleichheiten über den direkten Vergleich auflösen (utils.head_to_head)
+        result = HeadToHeadIndex.of(all_games, rounds=None).rank(teams)
         
         # Setze rank_in_group
         for i, team in enumerate(result, 1):
@@ -387,7 +316,7 @@ class StandingsServiceOptimized(CacheableService, BaseService[TeamStats]):
         return result
     
     def apply_head_to_head_tiebreaker(self, teams: List[TeamStats], 
-                                    relevant_games: List[Game]) -> List[TeamStats]:
+                                    relevant_games: Union[HeadToHeadIndex, List[Game]]) -> List[TeamStats]:
         """
         Wendet Head-to-Head Tiebreaker-Regeln an
         
@@ -399,92 +328,7 @@ class StandingsServiceOptimized(CacheableService, BaseService[TeamStats]):
         if len(teams) <= 1:
             return teams
         
-        if len(teams) == 2:
-            return self._apply_two_team_tiebreaker(teams, relevant_games)
-        else:
-            return self._apply_multi_team_tiebreaker(teams, relevant_games)
-    
-    def _apply_two_team_tiebreaker(self, teams: List[TeamStats], 
-                                  games: List[Game]) -> List[TeamStats]:
-        """Head-to-Head für genau 2 Teams"""
-        team1, team2 = teams[0], teams[1]
-        
-        # Finde direktes Spiel
-        h2h_game = None
-        for game in games:
-            if ((game.team1_code == team1.name and game.team2_code == team2.name) or
-                (game.team1_code == team2.name and game.team2_code == team1.name)):
-                if game.team1_score is not None and game.team2_score is not None:
-                    h2h_game = game
-                    break
-        
-        if not h2h_game:
-            # Kein direktes Spiel - nutze Gesamtstatistik
-            return sorted(teams, key=lambda x: (x.gd, x.gf), reverse=True)
-        
-        # Bestimme Gewinner des direkten Spiels
-        if h2h_game.team1_code == team1.name:
-            if h2h_game.team1_score > h2h_game.team2_score:
-                return [team1, team2]
-            else:
-                return [team2, team1]
-        else:
-            if h2h_game.team2_score > h2h_game.team1_score:
-                return [team1, team2]
-            else:
-                return [team2, team1]
-    
-    def _apply_multi_team_tiebreaker(self, teams: List[TeamStats], 
-                                    games: List[Game]) -> List[TeamStats]:
-        """Head-to-Head für 3+ Teams"""
-        # Prüfe ob alle Teams alle Spiele gespielt haben
-        if not all(team.gp >= MAX_PRELIM_GAMES_PER_TEAM for team in teams):
-            # Nicht alle Spiele gespielt - nutze Gesamtstatistik
-            return sorted(teams, key=lambda x: (x.gd, x.gf), reverse=True)
-        
-        # Erstelle Mini-Tabelle der direkten Spiele
-        team_names = {team.name for team in teams}
-        h2h_stats = {team.name: {'pts': 0, 'gf': 0, 'ga': 0, 'team': team} 
-                     for team in teams}
-        
-        for game in games:
-            if (game.team1_code in team_names and game.team2_code in team_names and
-                game.team1_score is not None and game.team2_score is not None):
-                
-                t1_stats = h2h_stats[game.team1_code]
-                t2_stats = h2h_stats[game.team2_code]
-                
-                # Tore
-                t1_stats['gf'] += game.team1_score
-                t1_stats['ga'] += game.team2_score
-                t2_stats['gf'] += game.team2_score
-                t2_stats['ga'] += game.team1_score
-                
-                # Punkte
-                if game.result_type == 'REG':
-                    if game.team1_score > game.team2_score:
-                        t1_stats['pts'] += 3
-                    else:
-                        t2_stats['pts'] += 3
-                elif game.result_type in ['OT', 'SO']:
-                    if game.team1_score > game.team2_score:
-                        t1_stats['pts'] += 2
-                        t2_stats['pts'] += 1
-                    else:
-                        t2_stats['pts'] += 2
-                        t1_stats['pts'] += 1
-        
-        # Sortiere nach H2H-Kriterien
-        h2h_list = list(h2h_stats.values())
-        h2h_list.sort(key=lambda x: (
-            x['pts'],                           # H2H Punkte
-            x['gf'] - x['ga'],                  # H2H Tordifferenz
-            x['gf'],                            # H2H Tore erzielt
-            x['team'].gd,                       # Gesamt Tordifferenz
-            x['team'].gf                        # Gesamt Tore erzielt
-        ), reverse=True)
-        
-        return [h2h['team'] for h2h in h2h_list]
+        return HeadToHeadIndex.of(relevant_games, rounds=None).sort_tied(teams)
     
     def _calculate_medal_positions(self, sf_games: List[Game], bronze_game: Optional[Game],
                                  gold_game: Optional[Game], playoff_mapping: Dict[str, str],
@@ -581,14 +425,6 @@ class StandingsServiceOptimized(CacheableService, BaseService[TeamStats]):
         Args:
             year_id: Die ID des Championship-Jahres
         """
-        patterns = [
-            f"standings:group:{year_id}",
-            f"standings:final_ranking:{year_id}",
-            f"standings:qualifiers:{year_id}",
-            f"standings:summary:{year_id}"
-        ]
-        
-        for pattern in patterns:
-            self.invalidate_cache(pattern)
+        self.invalidate_cache_tags(f"year:{year_id}")
         
         logger.info(f"Invalidated all standings cache for year {year_id}")
\ No newline at end of file
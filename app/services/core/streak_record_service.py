@@ -0,0 +1,151 @@
+"""
+Streak Record Service
+Hält die Serien-Rekorde (Siege, Niederlagen, Spiele mit Tor, ohne Gegentor,
+ohne Tor) als gespeicherten StreakTracker-Zustand in der Tabelle
+streak_record_state und spielt nur neu abgeschlossene Spiele ein
+"""
+
+from typing import Dict, List, Optional, Tuple
+import json
+import logging
+
+from models import StreakRecordState
+from app.services.base import BaseService
+from app.repositories.core import GameRepository, StreakRecordStateRepository
+from app.services.core.tournament_snapshot_service import TournamentSnapshotService
+from app.services.utils.event_bus import (
+    DomainEvent, GameScoreChanged, SeedingChanged, FixtureReloaded, get_event_bus
+)
+from utils.streak_tracker import STREAK_KINDS, StreakTracker
+
+logger = logging.getLogger(__name__)
+
+# Bei Änderungen am Payload-Format erhöhen, der Zustand wird dann neu aufgebaut
+STREAK_STATE_VERSION = 1
+
+
+class StreakRecordService(BaseService[StreakRecordState]):
+    """
+    Service für die inkrementell gepflegten Serien-Rekorde
+
+    Der gespeicherte Zustand merkt sich den Sortierschlüssel des zuletzt
+    eingespielten Spiels. Ein Lesezugriff spielt nur Spiele ein, die danach
+    sortieren; alles andere (Änderung eines früheren Ergebnisses, Seeding,
+    Fixture-Import, abweichende Anzahl eingespielter Spiele) führt zu einem
+    vollständigen Neuaufbau.
+    """
+
+    def __init__(self, repository: Optional[StreakRecordStateRepository] = None,
+                 game_repository: Optional[GameRepository] = None,
+                 snapshot_service: Optional[TournamentSnapshotService] = None):
+        """
+        Initialize service with repositories
+
+        Args:
+            repository: StreakRecordStateRepository instance (optional, will create if not provided)
+            game_repository: GameRepository instance for event lookups (optional, will create if not provided)
+            snapshot_service: TournamentSnapshotService for resolved team codes (optional, will create if not provided)
+        """
+        if repository is None:
+            repository = StreakRecordStateRepository()
+        super().__init__(repository)
+        self.repository: StreakRecordStateRepository = repository
+        self.game_repository = game_repository or GameRepository()
+        self.snapshot_service = snapshot_service or TournamentSnapshotService()
+
+    def get_streak_records(self) -> Dict[str, List[Dict]]:
+        """
+        Liefert die Top-Serien aller Arten
+
+        Returns:
+            Dictionary {Serienart: Liste von Serien mit Rang}
+        """
+        tracker = self.refresh()
+        return {kind: tracker.ranked(kind) for kind in STREAK_KINDS}
+
+    def refresh(self) -> StreakTracker:
+        """
+        Bringt den gespeicherten Zustand auf den Stand der Datenbank
+
+        Schlägt das Speichern fehl, wird der berechnete Tracker trotzdem zurückgegeben.
+
+        Returns:
+            Aktueller StreakTracker
+        """
+        tracker, last_key = self._load_state()
+        stored = tracker is not None
+        if not stored:
+            tracker = StreakTracker()
+
+        new_games = self.repository.get_completed_games(after=last_key)
+        if stored and not new_games:
+            return tracker
+
+        years = {year_obj.id: year_obj for _, year_obj in new_games}
+        resolved_tournaments = self.snapshot_service.get_resolved_tournaments(list(years.values()))
+        for game, year_obj in new_games:
+            team1_code, team2_code = resolved_tournaments[year_obj.id].get_resolved(game)
+            tracker.add_game(team1_code, team2_code, game.team1_score, game.team2_score, game.date)
+        if new_games:
+            last_key = self.repository.game_order_key(*new_games[-1])
+
+        try:
+            self.repository.save(
+                version=STREAK_STATE_VERSION,
+                games_processed=tracker.games_processed,
+                last_game_key=json.dumps(last_key) if last_key is not None else None,
+                payload=json.dumps(tracker.to_dict()),
+            )
+            self.commit()
+            logger.info(f"Streak records updated with {len(new_games)} games")
+        except Exception as e:
+            self.rollback()
+            logger.warning(f"Could not store streak record state: {str(e)}")
+        return tracker
+
+    def invalidate(self, game_id: Optional[int] = None) -> None:
+        """
+        Verwirft den gespeicherten Zustand (ohne Commit)
+
+        Ein geändertes Ergebnis eines Spiels, das nach dem zuletzt eingespielten
+        Spiel sortiert, lässt den Zustand stehen: es wird beim nächsten
+        Lesezugriff angehängt.
+
+        Args:
+            game_id: ID des geänderten Spiels (optional)
+        """
+        state = self.repository.get_state()
+        if state is None:
+            return
+        if game_id is not None and state.last_game_key:
+            game = self.game_repository.get_by_id(game_id)
+            if game is not None and \
+                    self.repository.game_order_key(game, game.championship_year) > tuple(json.loads(state.last_game_key)):
+                return
+        self.repository.clear()
+        logger.debug("Streak record state invalidated")
+
+    def _load_state(self) -> Tuple[Optional[StreakTracker], Optional[Tuple]]:
+        """Lädt den gespeicherten Tracker, sofern Version und Anzahl eingespielter Spiele passen"""
+        state = self.repository.get_state()
+        if state is None or state.version != STREAK_STATE_VERSION:
+            return None, None
+        last_key = tuple(json.loads(state.last_game_key)) if state.last_game_key else None
+        if self.repository.count_completed_games(until=last_key) != state.games_processed:
+            logger.info("Completed games changed before the stored streak state, rebuilding")
+            return None, None
+        return StreakTracker.from_dict(json.loads(state.payload)), last_key
+
+
+def invalidate_streaks_for_event(event: DomainEvent) -> None:
+    """
+    Event-Handler: verwirft den Serien-Zustand, wenn sich eingespielte Spiele ändern
+
+    Args:
+        event: Das publizierte Domain-Event
+    """
+    game_id = event.game_id if isinstance(event, GameScoreChanged) else None
+    StreakRecordService().invalidate(game_id)
+
+
+get_event_bus().subscribe((GameScoreChanged, SeedingChanged, FixtureReloaded), invalidate_streaks_for_event)
@@ -4,7 +4,7 @@ Handles all business logic related to teams, players, and team statistics
 """
 
 from typing import Dict, List, Optional, Any, Set
-from models import TeamStats, TeamOverallStats, AllTimeTeamStats, ChampionshipYear, db, Game, Goal, Penalty, ShotsOnGoal
+from models import TeamStats, TeamOverallStats, AllTimeTeamStats, ChampionshipYear, db, Game, Goal, Penalty, Player, ShotsOnGoal
 from app.services.base import BaseService
 from app.services.utils.cache_manager import CacheableService, cached
 from app.repositories.core import TeamRepository
@@ -167,26 +167,7 @@ class TeamService(CacheableService, BaseService[None]):
         Returns:
             TeamOverallStats object
         """
-        stats = self.get_team_stats(team_code, year_id)
-        
-        overall = TeamOverallStats(
-            team_name=team_code,
-            team_iso_code=stats['team_iso'],
-            gp=stats['games_played'],
-            gf=stats['goals_for'],
-            ga=stats['goals_against'],
-            eng=stats['empty_net_goals'],
-            sog=stats['shots_for'],
-            soga=stats['shots_against'],
-            so=stats['shutouts'],
-            ppgf=stats['powerplay_goals'],
-            ppga=0,  # Would need opponent PP goals data
-            ppf=stats['powerplay_opportunities'],
-            ppa=0,  # Would need times shorthanded data
-            pim=stats['penalty_minutes']
-        )
-        
-        return overall
+        return self._to_overall_stats(self.get_team_stats(team_code, year_id))
     
     def get_team_standings(self, year_id: int, group: Optional[str] = None) -> List[TeamStats]:
         """
@@ -587,127 +568,42 @@ class TeamService(CacheableService, BaseService[None]):
         Returns:
             List of TeamOverallStats objects
         """
-        # Hole alle notwendigen Daten auf einmal (vermeidet N+1 Queries)
-        all_games_for_year = Game.query.filter_by(year_id=year_id).all()
-        all_goals_for_year = Goal.query.join(Game).filter(Game.year_id == year_id).all()
-        all_penalties_for_year = Penalty.query.join(Game).filter(Game.year_id == year_id).all()
-        all_sog_for_year = ShotsOnGoal.query.join(Game).filter(Game.year_id == year_id).all()
-        
-        # SOG by game and team
-        sog_by_game_team = {}
-        for sog_entry in all_sog_for_year:
-            game_sog = sog_by_game_team.setdefault(sog_entry.game_id, {})
-            team_total_sog = game_sog.get(sog_entry.team_code, 0)
-            game_sog[sog_entry.team_code] = team_total_sog + sog_entry.shots
-        
-        # Map für aufgelöste Spiele
-        games_processed_map = {g.id: g for g in games_processed}
-        
-        # Hole alle Spieler für Team-Code-Auflösung
-        from models import Player
-        all_players_list = Player.query.all()
-        
-        team_stats_data_list = []
-        
-        for team_code_upper in team_codes:
-            # Finde den tatsächlichen Team-Code (case-sensitive)
-            actual_team_code_from_games = None
-            for g_disp_for_code in games_processed:
-                if g_disp_for_code.team1_code.upper() == team_code_upper:
-                    actual_team_code_from_games = g_disp_for_code.team1_code
-                    break
-                if g_disp_for_code.team2_code.upper() == team_code_upper:
-                    actual_team_code_from_games = g_disp_for_code.team2_code
-                    break
-            
-            if not actual_team_code_from_games:
-                found_in_players = any(p.team_code.upper() == team_code_upper for p in all_players_list)
-                if found_in_players:
-                    player_team_match = next((p.team_code for p in all_players_list if p.team_code.upper() == team_code_upper), team_code_upper)
-                    actual_team_code_from_games = player_team_match
-                else: 
-                    for g_raw_for_code_obj in games_raw_map.values():
-                        if g_raw_for_code_obj.team1_code.upper() == team_code_upper:
-                            actual_team_code_from_games = g_raw_for_code_obj.team1_code
-                            break
-                        if g_raw_for_code_obj.team2_code.upper() == team_code_upper:
-                            actual_team_code_from_games = g_raw_for_code_obj.team2_code
-                            break
-                if not actual_team_code_from_games:
-                    actual_team_code_from_games = team_code_upper 
-
-            current_team_code = actual_team_code_from_games
-            stats = TeamOverallStats(team_name=current_team_code, team_iso_code=TEAM_ISO_CODES.get(current_team_code.upper()))
-
-            # Berechne Spiel-Statistiken
-            for game_id, resolved_game_this_iter in games_processed_map.items():
-                raw_game_obj_this_iter = games_raw_map.get(game_id)
-                if not raw_game_obj_this_iter:
-                    continue
-
-                is_current_team_t1_in_raw_game = False
-
-                if resolved_game_this_iter.team1_code == current_team_code:
-                    is_current_team_t1_in_raw_game = True
-                elif resolved_game_this_iter.team2_code == current_team_code:
-                    is_current_team_t1_in_raw_game = False 
-                else:
-                    continue
-
-                if raw_game_obj_this_iter.team1_score is not None and raw_game_obj_this_iter.team2_score is not None: 
-                    stats.gp += 1
-                    current_team_score = raw_game_obj_this_iter.team1_score if is_current_team_t1_in_raw_game else raw_game_obj_this_iter.team2_score
-                    opponent_score = raw_game_obj_this_iter.team2_score if is_current_team_t1_in_raw_game else raw_game_obj_this_iter.team1_score
-                    stats.gf += current_team_score
-                    stats.ga += opponent_score
-                    if opponent_score == 0 and current_team_score > 0:
-                        stats.so += 1
-                
-                game_sog_info = sog_by_game_team.get(raw_game_obj_this_iter.id, {})
-                if resolved_game_this_iter.team1_code == current_team_code:
-                    stats.sog += game_sog_info.get(current_team_code, 0)
-                    stats.soga += game_sog_info.get(resolved_game_this_iter.team2_code, 0)
-                elif resolved_game_this_iter.team2_code == current_team_code:
-                    stats.sog += game_sog_info.get(current_team_code, 0)
-                    stats.soga += game_sog_info.get(resolved_game_this_iter.team1_code, 0)
-            
-            # Berechne Tor-Statistiken
-            for goal_event in all_goals_for_year:
-                if goal_event.game_id not in games_processed_map:
-                    continue
-                
-                resolved_game_of_goal = games_processed_map.get(goal_event.game_id)
-                if not resolved_game_of_goal:
-                    continue
-
-                if goal_event.team_code == current_team_code:
-                    if goal_event.is_empty_net:
-                        stats.eng += 1
-                    if goal_event.goal_type == 'PP':
-                        stats.ppgf += 1
-                elif (resolved_game_of_goal.team1_code == current_team_code and goal_event.team_code == resolved_game_of_goal.team2_code) or \
-                     (resolved_game_of_goal.team2_code == current_team_code and goal_event.team_code == resolved_game_of_goal.team1_code):
-                    if goal_event.goal_type == 'PP':
-                        stats.ppga += 1
-
-            # Berechne Straf-Statistiken
-            for penalty_event in all_penalties_for_year:
-                if penalty_event.game_id not in games_processed_map:
-                    continue
-
-                resolved_game_of_penalty = games_processed_map.get(penalty_event.game_id)
-                if not resolved_game_of_penalty:
-                    continue
-                
-                if penalty_event.team_code == current_team_code:
-                    stats.pim += PIM_MAP.get(penalty_event.penalty_type, 0)
-                    if penalty_event.penalty_type in POWERPLAY_PENALTY_TYPES:
-                        stats.ppa += 1 
-                elif (resolved_game_of_penalty.team1_code == current_team_code and penalty_event.team_code == resolved_game_of_penalty.team2_code) or \
-                     (resolved_game_of_penalty.team2_code == current_team_code and penalty_event.team_code == resolved_game_of_penalty.team1_code):
-                    if penalty_event.penalty_type in POWERPLAY_PENALTY_TYPES:
-                        stats.ppf += 1
-                        
-            team_stats_data_list.append(stats)
-        
-        return team_stats_data_list
\ No newline at end of file
+        # Tatsächliche (case-sensitive) Team-Codes: zuerst aus den aufgelösten Spielen
+        actual_codes: Dict[str, str] = {}
+        for game in games_processed:
+            for code in (game.team1_code, game.team2_code):
+                if code:
+                    actual_codes.setdefault(code.upper(), code)
+        missing = [code for code in team_codes if code not in actual_codes]
+        if missing:
+            # Danach aus den Spielern, dann aus den Rohspielen, sonst der übergebene Code
+            player_codes = self.db.session.query(Player.team_code) \
+                .filter(func.upper(Player.team_code).in_(missing)).order_by(Player.id).all()
+            raw_codes = [code for game in games_raw_map.values() for code in (game.team1_code, game.team2_code) if code]
+            for code in [row.team_code for row in player_codes] + raw_codes:
+                if code.upper() in missing:
+                    actual_codes.setdefault(code.upper(), code)
+        team_codes_actual = [actual_codes.get(code, code) for code in team_codes]
+        
+        resolved_codes = {g.id: (g.team1_code, g.team2_code) for g in games_processed if g.id in games_raw_map}
+        stats_by_team = self.repository.get_year_team_stats(year_id, team_codes_actual, resolved_codes=resolved_codes)
+        return [self._to_overall_stats(stats_by_team[code]) for code in team_codes_actual]
+    
+    def _to_overall_stats(self, stats: Dict[str, Any]) -> TeamOverallStats:
+        """Converts a statistics dictionary of TeamRepository.get_year_team_stats to TeamOverallStats"""
+        return TeamOverallStats(
+            team_name=stats['team_code'],
+            team_iso_code=TEAM_ISO_CODES.get(stats['team_code'].upper()),
+            gp=stats['games_played'],
+            gf=stats['goals_for'],
+            ga=stats['goals_against'],
+            eng=stats['empty_net_goals'],
+            sog=stats['shots_for'],
+            soga=stats['shots_against'],
+            so=stats['shutouts'],
+            ppgf=stats['powerplay_goals'],
+            ppga=stats['powerplay_goals_against'],
+            ppf=stats['powerplay_opportunities'],
+            ppa=stats['times_shorthanded'],
+            pim=stats['penalty_minutes']
+        )
\ No newline at end of file
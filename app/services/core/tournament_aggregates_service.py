@@ -0,0 +1,124 @@
+"""
+Tournament Aggregates Service
+Turnierübergreifende Kennzahlen (Spiele, abgeschlossene Spiele, Tore, Strafminuten,
+Anzahl Strafen) für alle Jahre aus einer einzigen gruppierten Query
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+import logging
+
+from models import ChampionshipYear
+from app.services.base import BaseService
+from app.repositories.core.tournament_repository import TournamentRepository
+from app.exceptions import ServiceError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TournamentAggregates:
+    """Kennzahlen eines Turniers; Tore und Strafen zählen nur für abgeschlossene Spiele"""
+    year_id: int
+    total_games: int = 0
+    completed_games: int = 0
+    goals: int = 0  # Summe der Spielergebnisse
+    goal_entries: int = 0  # Erfasste Tore (Goal-Einträge)
+    penalty_minutes: int = 0
+    penalty_count: int = 0
+
+    @property
+    def is_completed(self) -> bool:
+        return self.total_games > 0 and self.completed_games == self.total_games
+
+    def _per_game(self, value: int) -> float:
+        return round(value / self.completed_games, 2) if self.completed_games > 0 else 0.0
+
+    @property
+    def avg_goals_per_game(self) -> float:
+        return self._per_game(self.goals)
+
+    @property
+    def avg_penalties_per_game(self) -> float:
+        return self._per_game(self.penalty_minutes)
+
+    @property
+    def avg_penalty_count_per_game(self) -> float:
+        return self._per_game(self.penalty_count)
+
+
+class TournamentAggregatesService(BaseService[ChampionshipYear]):
+    """
+    Service für die Kennzahlen aller Turniere
+
+    Gesamtübersicht, Startseite und Turnier-Rekorde lesen dieselben Werte,
+    statt pro Jahr eigene Spiel-, Tor- und Strafen-Queries auszuführen.
+    """
+
+    def __init__(self, repository: Optional[TournamentRepository] = None):
+        """
+        Initialize service with repository
+
+        Args:
+            repository: TournamentRepository instance (optional, will create if not provided)
+        """
+        if repository is None:
+            repository = TournamentRepository()
+        super().__init__(repository)
+        self.repository: TournamentRepository = repository
+
+    def get_year_aggregates(self, year_ids: Optional[List[int]] = None) -> Dict[int, TournamentAggregates]:
+        """
+        Kennzahlen pro Turnier
+
+        Args:
+            year_ids: Nur diese Turniere (optional, Standard: alle)
+
+        Returns:
+            Dictionary {year_id: TournamentAggregates}
+
+        Raises:
+            ServiceError: Wenn die Abfrage fehlschlägt
+        """
+        try:
+            rows = self.repository.get_year_aggregates(year_ids)
+        except Exception as e:
+            logger.error(f"Error loading tournament aggregates: {str(e)}")
+            raise ServiceError(f"Failed to load tournament aggregates: {str(e)}")
+        return {row['year_id']: TournamentAggregates(**{key: int(value) for key, value in row.items()})
+                for row in rows}
+
+    def get_completed_year_ids(self) -> List[int]:
+        """
+        IDs aller abgeschlossenen Turniere (alle Spiele eingetragen)
+
+        Returns:
+            Liste der year_ids in ID-Reihenfolge
+        """
+        return [year_id for year_id, aggregates in self.get_year_aggregates().items() if aggregates.is_completed]
+
+    def get_overall_summary(self, aggregates_by_year: Optional[Dict[int, TournamentAggregates]] = None) -> Dict[str, Any]:
+        """
+        Gesamtstatistiken aller Turniere
+
+        Args:
+            aggregates_by_year: Bereits geladene Kennzahlen aller Jahre (optional)
+
+        Returns:
+            Dictionary mit total_tournaments, total_games, completed_games, total_goals
+            (erfasste Tore), total_penalties (PIM), total_penalty_count und completion_percentage
+        """
+        if aggregates_by_year is None:
+            aggregates_by_year = self.get_year_aggregates()
+        aggregates = aggregates_by_year.values()
+        total_games = sum(a.total_games for a in aggregates)
+        completed_games = sum(a.completed_games for a in aggregates)
+        return {
+            'total_tournaments': len(aggregates),
+            'total_games': total_games,
+            'completed_games': completed_games,
+            'total_goals': sum(a.goal_entries for a in aggregates),
+            'total_penalties': sum(a.penalty_minutes for a in aggregates),
+            'total_penalty_count': sum(a.penalty_count for a in aggregates),
+            'completion_percentage': round((completed_games / total_games * 100) if total_games > 0 else 0, 1)
+        }
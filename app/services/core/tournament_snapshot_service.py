@@ -0,0 +1,223 @@
+"""
+Tournament Snapshot Service
+Materialisiert das aufgelöste Turnier (Team-Codes pro Spiel, Gruppentabellen,
+Seeds und Endplatzierung) pro ChampionshipYear in der Tabelle tournament_snapshot
+und hält den Paarungs-Index (team_matchup) des Jahres synchron
+"""
+
+from typing import Dict, List, Optional
+import json
+import logging
+import os
+
+from sqlalchemy.orm import Session
+
+from models import ChampionshipYear, Game, TournamentSnapshot
+from app.services.base import BaseService
+from app.repositories.core import GameRepository, TeamMatchupRepository, TournamentSnapshotRepository
+from app.exceptions import ServiceError
+from app.services.utils.event_bus import (
+    DomainEvent, GameScoreChanged, SeedingChanged, FixtureReloaded, get_event_bus
+)
+from utils.fixture_helpers import resolve_fixture_path
+from utils.tournament_resolution import ResolvedTournament, resolve_tournament
+
+logger = logging.getLogger(__name__)
+
+# Bei Änderungen am Payload-Format erhöhen, alte Snapshots werden dann neu aufgebaut
+SNAPSHOT_VERSION = 5
+
+
+class TournamentSnapshotService(BaseService[TournamentSnapshot]):
+    """
+    Service für die materialisierten Turnier-Snapshots
+
+    Lesezugriffe sind ein einzelner Lookup über den eindeutigen Index auf year_id.
+    Der Resolver läuft nur, wenn kein gültiger Snapshot existiert: nach einer
+    Invalidierung (Spielergebnis, Seeding, Fixture-Import), bei geänderter
+    Fixture-Datei oder bei einer neuen Payload-Version.
+
+    Ein Neuaufbau committet nie die Session des Aufrufers: Lesende Aufrufer
+    speichern den Snapshot in einer eigenen Session, schreibende Aufrufer in ihrer
+    offenen Transaktion.
+    """
+
+    def __init__(self, repository: Optional[TournamentSnapshotRepository] = None,
+                 game_repository: Optional[GameRepository] = None,
+                 matchup_repository: Optional[TeamMatchupRepository] = None):
+        """
+        Initialize service with repositories
+
+        Args:
+            repository: TournamentSnapshotRepository instance (optional, will create if not provided)
+            game_repository: GameRepository instance for rebuilds (optional, will create if not provided)
+            matchup_repository: TeamMatchupRepository instance (optional, will create if not provided)
+        """
+        if repository is None:
+            repository = TournamentSnapshotRepository()
+        super().__init__(repository)
+        self.repository: TournamentSnapshotRepository = repository
+        self.game_repository = game_repository or GameRepository()
+        self.matchup_repository = matchup_repository or TeamMatchupRepository()
+
+    def get_resolved_tournament(self, year_obj: ChampionshipYear,
+                                games: Optional[List[Game]] = None) -> ResolvedTournament:
+        """
+        Liefert das aufgelöste Turnier eines Jahres aus dem Snapshot
+
+        Args:
+            year_obj: ChampionshipYear-Objekt
+            games: Bereits geladene Spiele des Jahres (optional, nur für einen Neuaufbau)
+
+        Returns:
+            ResolvedTournament des Jahres
+        """
+        snapshot = self.repository.get_by_year(year_obj.id)
+        if self._is_fresh(snapshot, year_obj):
+            return ResolvedTournament.from_dict(json.loads(snapshot.payload))
+        return self.rebuild(year_obj, games)
+
+    def get_resolved_tournaments(self, years: List[ChampionshipYear],
+                                 games_by_year: Optional[Dict[int, List[Game]]] = None) -> Dict[int, ResolvedTournament]:
+        """
+        Liefert die aufgelösten Turniere mehrerer Jahre mit einer einzigen Snapshot-Query
+
+        Args:
+            years: Liste der ChampionshipYear-Objekte
+            games_by_year: Bereits geladene Spiele pro year_id (optional, nur für Neuaufbauten)
+
+        Returns:
+            Dictionary {year_id: ResolvedTournament}
+        """
+        snapshots = self.repository.get_by_years([year_obj.id for year_obj in years])
+        games_by_year = games_by_year or {}
+
+        resolved = {}
+        for year_obj in years:
+            snapshot = snapshots.get(year_obj.id)
+            if self._is_fresh(snapshot, year_obj):
+                resolved[year_obj.id] = ResolvedTournament.from_dict(json.loads(snapshot.payload))
+            else:
+                resolved[year_obj.id] = self.rebuild(year_obj, games_by_year.get(year_obj.id))
+        return resolved
+
+    def rebuild(self, year_obj: ChampionshipYear, games: Optional[List[Game]] = None) -> ResolvedTournament:
+        """
+        Löst das Turnier neu auf und speichert den Snapshot
+
+        Der Snapshot wird in einer eigenen Session gespeichert und committet, die
+        Session des Aufrufers (und ihre geladenen Objekte) bleibt unverändert. Hat
+        der Aufrufer selbst ungespeicherte Änderungen, landet der Snapshot ohne
+        Commit in dessen Transaktion und wird mit ihr gespeichert oder verworfen.
+        Schlägt das Speichern fehl (z.B. paralleler Neuaufbau), wird die frisch
+        berechnete Auflösung trotzdem zurückgegeben.
+
+        Args:
+            year_obj: ChampionshipYear-Objekt
+            games: Bereits geladene Spiele des Jahres (optional)
+
+        Returns:
+            Neu berechnetes ResolvedTournament
+
+        Raises:
+            ServiceError: Wenn die Auflösung selbst fehlschlägt
+        """
+        if games is None:
+            games = self.game_repository.get_games_by_year(year_obj.id)
+
+        try:
+            resolution = resolve_tournament(year_obj, games)
+        except Exception as e:
+            logger.error(f"Error resolving tournament {year_obj.id}: {str(e)}")
+            raise ServiceError(f"Failed to resolve tournament {year_obj.id}: {str(e)}")
+
+        snapshot = dict(
+            year_id=year_obj.id,
+            version=SNAPSHOT_VERSION,
+            fixture_path=year_obj.fixture_path,
+            fixture_mtime=self._fixture_mtime(year_obj),
+            payload=json.dumps(resolution.to_dict()),
+        )
+        matchup_counts = resolution.matchup_counts(games)
+
+        caller_session = self.repository.db.session()
+        if self._has_uncommitted_writes(caller_session):
+            self.repository.save(**snapshot)
+            self.matchup_repository.replace_year(year_obj.id, matchup_counts)
+            logger.info(f"Tournament snapshot rebuilt for year {year_obj.id} (pending caller commit)")
+            return resolution
+
+        session = Session(bind=caller_session.get_bind())
+        try:
+            self.repository.save(session=session, **snapshot)
+            self.matchup_repository.replace_year(year_obj.id, matchup_counts, session=session)
+            session.commit()
+            logger.info(f"Tournament snapshot rebuilt for year {year_obj.id}")
+        except Exception as e:
+            session.rollback()
+            logger.warning(f"Could not store tournament snapshot for year {year_obj.id}: {str(e)}")
+        finally:
+            session.close()
+        return resolution
+
+    def invalidate(self, year_id: int) -> None:
+        """
+        Verwirft den Snapshot und die Paarungen eines Jahres (ohne Commit)
+
+        Läuft über den Event-Bus in derselben Transaktion wie die auslösende
+        Änderung, der Commit erfolgt durch den Aufrufer.
+
+        Args:
+            year_id: The championship year ID
+        """
+        if self.repository.delete_by_year(year_id):
+            logger.debug(f"Tournament snapshot invalidated for year {year_id}")
+        self.matchup_repository.delete_by_year(year_id)
+
+    @staticmethod
+    def _has_uncommitted_writes(session) -> bool:
+        """
+        Prüft, ob die Session ungespeicherte oder geflushte, nicht committete Änderungen hält
+
+        SQLite sperrt die Datenbank ab dem ersten Schreibzugriff einer Transaktion;
+        eine zweite Session müsste dann bis zum Commit des Aufrufers warten.
+        """
+        if session.new or session.dirty or session.deleted:
+            return True
+        if not session.in_transaction():
+            return False
+        dbapi_connection = session.connection().connection.dbapi_connection
+        return bool(getattr(dbapi_connection, 'in_transaction', False))
+
+    def _is_fresh(self, snapshot: Optional[TournamentSnapshot], year_obj: ChampionshipYear) -> bool:
+        """Prüft, ob ein Snapshot zur aktuellen Version und Fixture-Datei passt"""
+        return (snapshot is not None and
+                snapshot.version == SNAPSHOT_VERSION and
+                snapshot.fixture_path == year_obj.fixture_path and
+                snapshot.fixture_mtime == self._fixture_mtime(year_obj))
+
+    @staticmethod
+    def _fixture_mtime(year_obj: ChampionshipYear) -> Optional[float]:
+        """Änderungszeit der Fixture-Datei eines Jahres (None ohne Datei)"""
+        if not year_obj.fixture_path:
+            return None
+        absolute_fixture_path = resolve_fixture_path(year_obj.fixture_path)
+        if not absolute_fixture_path or not os.path.exists(absolute_fixture_path):
+            return None
+        return os.path.getmtime(absolute_fixture_path)
+
+
+def invalidate_snapshot_for_event(event: DomainEvent) -> None:
+    """
+    Event-Handler: verwirft den Snapshot des betroffenen Jahres
+
+    Nur Ergebnisse, Seeding und Fixtures beeinflussen die Turnier-Auflösung;
+    Tore, Strafen und Torschüsse lassen den Snapshot unverändert.
+
+    Args:
+        event: Das publizierte Domain-Event
+    """
+    TournamentSnapshotService().invalidate(event.year_id)
+
+
+get_event_bus().subscribe((GameScoreChanged, SeedingChanged, FixtureReloaded), invalidate_snapshot_for_event)
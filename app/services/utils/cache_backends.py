@@ -0,0 +1,340 @@
+"""
+Cache Backends - Speicher für den CacheManager
+In-Process LRU-Speicher und prozessübergreifender SQLite-Speicher mit gleicher Schnittstelle
+"""
+
+import copy
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Sentinel für Cache-Misses, damit auch None und andere falsy Werte gecacht werden können
+MISSING = object()
+
+
+def cache_namespace(key: str) -> str:
+    """Namespace eines Keys (erstes Segment vor ':')"""
+    return key.split(':', 1)[0]
+
+
+def _collect_orm_instances(value: Any, memo: Dict[int, Any]) -> None:
+    """Trägt alle SQLAlchemy-Instanzen eines Werts als sich selbst in das deepcopy-Memo ein"""
+    if id(value) in memo or value is None or isinstance(value, (str, bytes, int, float, bool)):
+        return
+    memo[id(value)] = MISSING  # Zyklen: jeder Container wird nur einmal besucht
+    if hasattr(value, '_sa_instance_state'):
+        memo[id(value)] = value
+        return
+    if isinstance(value, dict):
+        for item in value.values():
+            _collect_orm_instances(item, memo)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            _collect_orm_instances(item, memo)
+    elif hasattr(value, '__dict__'):
+        _collect_orm_instances(vars(value), memo)
+
+
+def copy_value(value: Any) -> Any:
+    """
+    Tiefe Kopie eines Cache-Werts, damit Aufrufer den gespeicherten Wert nicht verändern
+
+    ORM-Instanzen werden nicht kopiert, sie gehören zur Session des Requests.
+    """
+    if value is None or isinstance(value, (str, bytes, int, float, bool)):
+        return value
+    memo: Dict[int, Any] = {}
+    _collect_orm_instances(value, memo)
+    memo = {key: instance for key, instance in memo.items() if instance is not MISSING}
+    return copy.deepcopy(value, memo)
+
+
+class CacheBackend:
+    """
+    Schnittstelle der Cache-Speicher
+
+    Backends kümmern sich um Ablage, Ablauf, Budget (LRU-Verdrängung) und Tag-Index.
+    Zähler für Hits/Misses führt der CacheManager.
+    """
+
+    # True, wenn der Speicher von mehreren Requests/Prozessen gesehen wird
+    shared = False
+    # True, wenn alle Worker-Prozesse denselben Speicher (inkl. Invalidierungen) sehen
+    cross_process = False
+
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    def get(self, key: str, now: float) -> Any:
+        """Liefert den Wert oder MISSING (abgelaufene Einträge werden entfernt)"""
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, expires_at: float, size: int, tags: Iterable[str]) -> List[str]:
+        """Speichert einen Eintrag und liefert die dabei verdrängten Keys"""
+        raise NotImplementedError
+
+    def invalidate(self, pattern: Optional[str] = None) -> int:
+        """Löscht Einträge, deren Key pattern enthält (ohne pattern: alle)"""
+        raise NotImplementedError
+
+    def invalidate_tags(self, tags: Iterable[str], namespaces: Optional[Set[str]] = None) -> int:
+        """Löscht Einträge mit mindestens einem der Tags (optional nur in diesen Namespaces)"""
+        raise NotImplementedError
+
+    def sweep(self, now: float) -> int:
+        """Löscht alle abgelaufenen Einträge"""
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, int]:
+        """Anzahl Einträge und belegte Bytes"""
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    In-Process LRU-Speicher (OrderedDict) mit Tag-Index
+
+    Werte werden beim Speichern und beim Lesen kopiert (copy_value), wie beim
+    SQLite-Backend per pickle: Änderungen am Ergebnis verändern nie den Cache.
+    """
+
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 32 * 1024 * 1024, shared: bool = False):
+        super().__init__(max_entries, max_bytes)
+        self.shared = shared
+        self.entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.current_bytes = 0
+        self._tag_index: Dict[str, Set[str]] = defaultdict(set)
+        self._lock = threading.RLock()
+
+    def get(self, key: str, now: float) -> Any:
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return MISSING
+            if entry['expires_at'] <= now:
+                self._remove(key)
+                return MISSING
+            self.entries.move_to_end(key)
+            value = entry['value']
+        return copy_value(value)
+
+    def set(self, key: str, value: Any, expires_at: float, size: int, tags: Iterable[str]) -> List[str]:
+        value = copy_value(value)
+        with self._lock:
+            if key in self.entries:
+                self._remove(key)
+            tags = frozenset(tags)
+            self.entries[key] = {
+                'value': value,
+                'expires_at': expires_at,
+                'created_at': time.time(),
+                'size': size,
+                'tags': tags
+            }
+            self.current_bytes += size
+            for tag in tags:
+                self._tag_index[tag].add(key)
+
+            evicted = []
+            while self.entries and (len(self.entries) > self.max_entries or self.current_bytes > self.max_bytes):
+                oldest_key = next(iter(self.entries))
+                self._remove(oldest_key)
+                evicted.append(oldest_key)
+            return evicted
+
+    def invalidate(self, pattern: Optional[str] = None) -> int:
+        with self._lock:
+            if not pattern:
+                count = len(self.entries)
+                self.entries.clear()
+                self._tag_index.clear()
+                self.current_bytes = 0
+                return count
+            keys_to_delete = [k for k in self.entries if pattern in k]
+            for key in keys_to_delete:
+                self._remove(key)
+            return len(keys_to_delete)
+
+    def invalidate_tags(self, tags: Iterable[str], namespaces: Optional[Set[str]] = None) -> int:
+        count = 0
+        with self._lock:
+            for tag in tags:
+                for key in list(self._tag_index.get(tag, ())):
+                    if namespaces is None or cache_namespace(key) in namespaces:
+                        self._remove(key)
+                        count += 1
+        return count
+
+    def sweep(self, now: float) -> int:
+        with self._lock:
+            expired = [k for k, entry in self.entries.items() if entry['expires_at'] <= now]
+            for key in expired:
+                self._remove(key)
+        return len(expired)
+
+    def stats(self) -> Dict[str, int]:
+        return {'entries': len(self.entries), 'bytes': self.current_bytes}
+
+    def _remove(self, key: str):
+        """Entfernt einen Eintrag inklusive Tag-Index und Größenbuchhaltung"""
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        self.current_bytes -= entry['size']
+        for tag in entry['tags']:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Prozessübergreifender Speicher in einer lokalen SQLite-Datei
+
+    Alle Worker eines Servers teilen sich Einträge und Invalidierungen. Werte
+    werden mit pickle abgelegt; LRU über die letzte Zugriffszeit. Verbindungen
+    werden pro Thread und pro Prozess (nach fork) neu geöffnet.
+    """
+
+    shared = True
+    cross_process = True
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS cache_entry ("
+        " key TEXT PRIMARY KEY, value BLOB NOT NULL, namespace TEXT NOT NULL,"
+        " expires_at REAL NOT NULL, last_access REAL NOT NULL, size INTEGER NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS ix_cache_entry_last_access ON cache_entry (last_access)",
+        "CREATE TABLE IF NOT EXISTS cache_tag ("
+        " tag TEXT NOT NULL, key TEXT NOT NULL REFERENCES cache_entry(key) ON DELETE CASCADE,"
+        " PRIMARY KEY (tag, key))",
+        "CREATE INDEX IF NOT EXISTS ix_cache_tag_key ON cache_tag (key)",
+    )
+
+    def __init__(self, path: str, max_entries: int = 5000, max_bytes: int = 128 * 1024 * 1024,
+                 timeout: float = 5.0):
+        """
+        Args:
+            path: Pfad der SQLite-Datei (Verzeichnis wird bei Bedarf angelegt)
+            max_entries: Maximale Anzahl Einträge
+            max_bytes: Maximale Größe aller abgelegten Werte in Bytes
+            timeout: Wartezeit in Sekunden bei gesperrter Datenbank
+        """
+        super().__init__(max_entries, max_bytes)
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        with self._connection() as conn:
+            for statement in self._SCHEMA:
+                conn.execute(statement)
+
+    def get(self, key: str, now: float) -> Any:
+        conn = self._connection()
+        row = conn.execute("SELECT value, expires_at FROM cache_entry WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return MISSING
+        if row[1] <= now:
+            with conn:
+                conn.execute("DELETE FROM cache_entry WHERE key = ?", (key,))
+            return MISSING
+        try:
+            value = pickle.loads(row[0])
+        except Exception as e:
+            logger.warning(f"Dropping unreadable cache entry {key}: {str(e)}")
+            with conn:
+                conn.execute("DELETE FROM cache_entry WHERE key = ?", (key,))
+            return MISSING
+        with conn:
+            conn.execute("UPDATE cache_entry SET last_access = ? WHERE key = ?", (now, key))
+        return value
+
+    def set(self, key: str, value: Any, expires_at: float, size: int, tags: Iterable[str]) -> List[str]:
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug(f"Cache skip: {key} is not picklable ({str(e)})")
+            return []
+        if len(blob) > self.max_bytes:
+            return []
+
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM cache_entry WHERE key = ?", (key,))
+            conn.execute(
+                "INSERT INTO cache_entry (key, value, namespace, expires_at, last_access, size) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, blob, cache_namespace(key), expires_at, time.time(), len(blob)))
+            conn.executemany("INSERT OR IGNORE INTO cache_tag (tag, key) VALUES (?, ?)",
+                             [(tag, key) for tag in set(tags)])
+            return self._enforce_budget(conn)
+
+    def invalidate(self, pattern: Optional[str] = None) -> int:
+        conn = self._connection()
+        with conn:
+            if not pattern:
+                return conn.execute("DELETE FROM cache_entry").rowcount
+            return conn.execute("DELETE FROM cache_entry WHERE instr(key, ?) > 0", (pattern,)).rowcount
+
+    def invalidate_tags(self, tags: Iterable[str], namespaces: Optional[Set[str]] = None) -> int:
+        tags = list(tags)
+        if not tags or (namespaces is not None and not namespaces):
+            return 0
+        query = (f"DELETE FROM cache_entry WHERE key IN "
+                 f"(SELECT key FROM cache_tag WHERE tag IN ({','.join('?' * len(tags))}))")
+        params = list(tags)
+        if namespaces is not None:
+            query += f" AND namespace IN ({','.join('?' * len(namespaces))})"
+            params.extend(namespaces)
+        conn = self._connection()
+        with conn:
+            return conn.execute(query, params).rowcount
+
+    def sweep(self, now: float) -> int:
+        conn = self._connection()
+        with conn:
+            return conn.execute("DELETE FROM cache_entry WHERE expires_at <= ?", (now,)).rowcount
+
+    def stats(self) -> Dict[str, int]:
+        count, total = self._connection().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entry").fetchone()
+        return {'entries': count, 'bytes': total}
+
+    def _enforce_budget(self, conn: sqlite3.Connection) -> List[str]:
+        """Verdrängt die am längsten nicht genutzten Einträge, bis das Budget eingehalten ist"""
+        count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entry").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return []
+
+        evicted = []
+        for key, size in conn.execute("SELECT key, size FROM cache_entry ORDER BY last_access").fetchall():
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            evicted.append(key)
+            count -= 1
+            total -= size
+        conn.executemany("DELETE FROM cache_entry WHERE key = ?", [(key,) for key in evicted])
+        return evicted
+
+    def _connection(self) -> sqlite3.Connection:
+        """Verbindung des aktuellen Threads (nach fork neu geöffnet)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
@@ -1,103 +1,172 @@
 """
 CacheManager - Zentrales Caching-System für Performance-Optimierung
-Implementiert In-Memory und Redis-basiertes Caching mit TTL-Support
+Begrenzter LRU-Cache mit TTL, Größenbudget und Tag-basierter Invalidierung über austauschbare Backends
 """
 
 import json
+import sys
 import time
-from typing import Any, Dict, Optional, Union, Callable
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Optional, Set, Union, Callable
 from functools import wraps
-from datetime import datetime, timedelta
 import hashlib
+import inspect
 import logging
+import weakref
+
+from models import db
+from app.services.utils.cache_backends import (
+    MISSING, CacheBackend, MemoryCacheBackend, SQLiteCacheBackend, cache_namespace
+)
+from app.services.utils.event_bus import (
+    DomainEvent, GameScoreChanged, ShotsOnGoalChanged, GoalAdded, GoalDeleted,
+    PenaltyAdded, PenaltyDeleted, SeedingChanged, FixtureReloaded, PlayerChanged, get_event_bus
+)
 
 logger = logging.getLogger(__name__)
 
+# Tag für Einträge, die keinem einzelnen Turnierjahr zugeordnet sind (jahresübergreifend)
+ALL_YEARS_TAG = 'all_years'
+
+# Tag für jahresbezogene Einträge mit Spielernamen (z.B. Scorerlisten); PlayerChanged verwirft sie in allen Jahren
+PLAYER_NAMES_TAG = 'player_names'
+
+# Argumentnamen, aus denen der cached-Decorator automatisch Scope-Tags ableitet
+SCOPE_ARGUMENTS = {
+    'year_id': 'year',
+    'tournament_id': 'year',
+    'team_code': 'team',
+    'game_id': 'game',
+    'player_id': 'player',
+}
+
 
 class CacheManager:
     """
     Cache-Manager für Service Layer
     
     Features:
-    - In-Memory Caching mit TTL
-    - Cache-Key-Generierung
-    - Cache-Invalidierung
-    - Performance-Metriken
+    - LRU-Verdrängung mit Budget für Anzahl Einträge und Bytes (im Backend)
+    - TTL mit amortisiertem Sweep abgelaufener Einträge
+    - O(1) Tag-basierte Invalidierung (z.B. 'year:12', 'team:CAN')
+    - Zähler für Hits/Misses/Evictions pro Namespace (erstes Key-Segment)
+    - Austauschbares Backend: privater oder geteilter In-Process-Speicher, SQLite-Datei für mehrere Worker
     """
     
-    def __init__(self, default_ttl: int = 300):
+    def __init__(self, default_ttl: int = 300, max_entries: int = 1000,
+                 max_bytes: int = 32 * 1024 * 1024, sweep_interval: int = 60,
+                 backend: Optional[CacheBackend] = None):
         """
         Initialisiert den Cache-Manager
         
         Args:
             default_ttl: Standard TTL in Sekunden (5 Minuten)
+            max_entries: Maximale Anzahl Einträge (nur ohne eigenes Backend)
+            max_bytes: Maximale geschätzte Größe aller Werte in Bytes (nur ohne eigenes Backend)
+            sweep_interval: Mindestabstand in Sekunden zwischen zwei Sweeps abgelaufener Einträge
+            backend: Speicher-Backend (Standard: privater MemoryCacheBackend)
         """
-        self.cache: Dict[str, Dict[str, Any]] = {}
+        self.backend = backend or MemoryCacheBackend(max_entries, max_bytes)
         self.default_ttl = default_ttl
+        self.sweep_interval = sweep_interval
         self.hit_count = 0
         self.miss_count = 0
+        self.eviction_count = 0
         self.invalidation_count = 0
+        self.namespace_stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {'hits': 0, 'misses': 0, 'evictions': 0})
+        self._last_sweep = time.time()
+        _cache_managers.add(self)
     
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: str, default: Any = None) -> Any:
         """
         Holt einen Wert aus dem Cache
         
         Args:
             key: Cache-Schlüssel
+            default: Rückgabewert bei Miss (MISSING, um gecachte None-Werte zu unterscheiden)
             
         Returns:
-            Gecachter Wert oder None
+            Gecachter Wert oder default
         """
-        if key in self.cache:
-            entry = self.cache[key]
-            if entry['expires_at'] > time.time():
-                self.hit_count += 1
-                logger.debug(f"Cache hit: {key}")
-                return entry['value']
-            else:
-                # Eintrag abgelaufen
-                del self.cache[key]
+        self._maybe_sweep()
+        value = self.backend.get(key, time.time())
+        namespace = cache_namespace(key)
+        if value is not MISSING:
+            self.hit_count += 1
+            self.namespace_stats[namespace]['hits'] += 1
+            logger.debug(f"Cache hit: {key}")
+            return value
         
         self.miss_count += 1
+        self.namespace_stats[namespace]['misses'] += 1
         logger.debug(f"Cache miss: {key}")
-        return None
+        return default
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, tags: Iterable[str] = ()):
         """
         Speichert einen Wert im Cache
         
+        Geteilte Backends überspringen Werte mit ORM-Instanzen, da diese
+        außerhalb ihrer Session (nächster Request, anderer Worker) ungültig sind.
+        
         Args:
             key: Cache-Schlüssel
-            value: Zu cachender Wert
+            value: Zu cachender Wert (auch None)
             ttl: Time-to-Live in Sekunden
+            tags: Tags für die gezielte Invalidierung (ohne Tags: ALL_YEARS_TAG)
         """
+        if self.backend.shared and self._contains_orm_instance(value):
+            logger.debug(f"Cache skip: {key} contains ORM instances")
+            return
         ttl = ttl or self.default_ttl
-        self.cache[key] = {
-            'value': value,
-            'expires_at': time.time() + ttl,
-            'created_at': time.time()
-        }
-        logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
+        size = self._estimate_size(value)
+        if size > self.backend.max_bytes:
+            logger.debug(f"Cache skip: {key} ({size} bytes exceeds budget)")
+            return
+        
+        self._maybe_sweep()
+        evicted = self.backend.set(key, value, time.time() + ttl, size,
+                                   frozenset(tags) or frozenset((ALL_YEARS_TAG,)))
+        for evicted_key in evicted:
+            self.eviction_count += 1
+            self.namespace_stats[cache_namespace(evicted_key)]['evictions'] += 1
+            logger.debug(f"Cache evict: {evicted_key}")
+        logger.debug(f"Cache set: {key} (TTL: {ttl}s, {size} bytes)")
     
     def invalidate(self, pattern: Optional[str] = None):
         """
-        Invalidiert Cache-Einträge
+        Invalidiert Cache-Einträge per Substring-Suche (O(n))
+        
+        Für gezielte Invalidierung invalidate_tags verwenden.
         
         Args:
             pattern: Optional - nur Keys mit diesem Muster löschen
         """
+        count = self.backend.invalidate(pattern)
+        self.invalidation_count += count
         if pattern:
-            keys_to_delete = [k for k in self.cache.keys() if pattern in k]
-            for key in keys_to_delete:
-                del self.cache[key]
-                self.invalidation_count += 1
-            logger.info(f"Invalidated {len(keys_to_delete)} cache entries with pattern: {pattern}")
+            logger.info(f"Invalidated {count} cache entries with pattern: {pattern}")
         else:
-            count = len(self.cache)
-            self.cache.clear()
-            self.invalidation_count += count
             logger.info(f"Invalidated all {count} cache entries")
     
+    def invalidate_tags(self, *tags: str, namespaces: Optional[Iterable[str]] = None) -> int:
+        """
+        Invalidiert alle Einträge mit mindestens einem der Tags
+        
+        Args:
+            tags: Tags wie 'year:12' oder 'team:CAN'
+            namespaces: Optional - nur Einträge dieser Namespaces löschen
+            
+        Returns:
+            Anzahl gelöschter Einträge
+        """
+        count = self.backend.invalidate_tags(tags, set(namespaces) if namespaces is not None else None)
+        self.invalidation_count += count
+        if count:
+            logger.debug(f"Invalidated {count} cache entries with tags: {', '.join(tags)}")
+        return count
+    
     def get_stats(self) -> Dict[str, Any]:
         """
         Gibt Cache-Statistiken zurück
@@ -107,32 +176,91 @@ class CacheManager:
         """
         total_requests = self.hit_count + self.miss_count
         hit_rate = (self.hit_count / total_requests * 100) if total_requests > 0 else 0
+        backend_stats = self.backend.stats()
         
         return {
-            'entries': len(self.cache),
+            'backend': type(self.backend).__name__,
+            'entries': backend_stats['entries'],
             'hits': self.hit_count,
             'misses': self.miss_count,
             'hit_rate': f"{hit_rate:.2f}%",
+            'evictions': self.eviction_count,
             'invalidations': self.invalidation_count,
+            'bytes': backend_stats['bytes'],
+            'max_entries': self.backend.max_entries,
+            'max_bytes': self.backend.max_bytes,
+            'namespaces': {ns: dict(stats) for ns, stats in self.namespace_stats.items()},
             'memory_entries': self._get_memory_stats()
         }
     
     def _get_memory_stats(self) -> Dict[str, int]:
-        """Berechnet Speicher-Statistiken"""
-        stats = {
-            'total_keys': len(self.cache),
+        """Berechnet Speicher-Statistiken (nach einem Sweep sind alle Einträge aktiv)"""
+        self._sweep_expired()
+        entries = self.backend.stats()['entries']
+        return {
+            'total_keys': entries,
             'expired_keys': 0,
-            'active_keys': 0
+            'active_keys': entries
         }
+    
+    def _maybe_sweep(self):
+        """Amortisierter Sweep: höchstens einmal pro sweep_interval"""
+        if time.time() - self._last_sweep >= self.sweep_interval:
+            self._sweep_expired()
+    
+    def _sweep_expired(self):
+        """Entfernt alle abgelaufenen Einträge"""
+        now = time.time()
+        count = self.backend.sweep(now)
+        self._last_sweep = now
+        if count:
+            logger.debug(f"Cache sweep removed {count} expired entries")
+    
+    @staticmethod
+    def _contains_orm_instance(value: Any, _depth: int = 0) -> bool:
+        """Prüft (bis Tiefe 4), ob ein Wert SQLAlchemy-Modellinstanzen enthält"""
+        if isinstance(value, db.Model):
+            return True
+        if _depth >= 4 or isinstance(value, (str, bytes, int, float, bool)) or value is None:
+            return False
+        if isinstance(value, dict):
+            return any(CacheManager._contains_orm_instance(v, _depth + 1) for v in value.values())
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return any(CacheManager._contains_orm_instance(v, _depth + 1) for v in value)
+        if hasattr(value, '__dict__'):
+            return CacheManager._contains_orm_instance(vars(value), _depth + 1)
+        return False
+    
+    @staticmethod
+    def _estimate_size(value: Any, _depth: int = 0, _seen: Optional[Set[int]] = None) -> int:
+        """
+        Schätzt die Größe eines Werts in Bytes (rekursiv bis Tiefe 4)
         
-        current_time = time.time()
-        for entry in self.cache.values():
-            if entry['expires_at'] > current_time:
-                stats['active_keys'] += 1
-            else:
-                stats['expired_keys'] += 1
+        Args:
+            value: Der Wert
+            
+        Returns:
+            Geschätzte Größe in Bytes
+        """
+        if _seen is None:
+            _seen = set()
+        if id(value) in _seen:
+            return 0
+        _seen.add(id(value))
         
-        return stats
+        size = sys.getsizeof(value, 64)
+        if _depth >= 4 or isinstance(value, (str, bytes, int, float, bool)) or value is None:
+            return size
+        
+        estimate = CacheManager._estimate_size
+        if isinstance(value, dict):
+            size += sum(estimate(k, _depth + 1, _seen) + estimate(v, _depth + 1, _seen)
+                        for k, v in value.items())
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            size += sum(estimate(item, _depth + 1, _seen) for item in value)
+        elif hasattr(value, '__dict__'):
+            size += estimate(vars(value), _depth + 1, _seen)
+        return size
     
     @staticmethod
     def generate_key(*args, **kwargs) -> str:
@@ -165,19 +293,50 @@ class CacheManager:
         return hashlib.md5(key_string.encode()).hexdigest()
 
 
-def cached(ttl: Optional[int] = None, key_prefix: Optional[str] = None):
+def _scope_tags(func: Callable, self_obj: Any, args: tuple, kwargs: dict,
+                extra_tags: Iterable[str]) -> Set[str]:
+    """
+    Leitet Scope-Tags aus den Argumenten eines gecachten Aufrufs ab
+    
+    year_id/tournament_id -> 'year:<id>', team_code -> 'team:<code>', game_id -> 'game:<id>',
+    player_id -> 'player:<id>'.
+    Einträge ohne Jahres-Scope erhalten ALL_YEARS_TAG und werden bei jeder Jahres-Invalidierung verworfen.
+    """
+    try:
+        bound = inspect.signature(func).bind(self_obj, *args, **kwargs)
+        arguments = bound.arguments
+    except TypeError:
+        arguments = kwargs
+    
+    tags = set()
+    for name, scope in SCOPE_ARGUMENTS.items():
+        value = arguments.get(name)
+        if value is not None:
+            tags.add(f"{scope}:{value}")
+    tags.update(extra_tags)
+    if not any(tag.startswith('year:') for tag in tags):
+        tags.add(ALL_YEARS_TAG)
+    return tags
+
+
+def cached(ttl: Optional[int] = None, key_prefix: Optional[str] = None, tags: Iterable[str] = ()):
     """
     Decorator für Caching von Funktions-Ergebnissen
     
+    Scope-Tags werden automatisch aus year_id/tournament_id, team_code, game_id und player_id abgeleitet.
+    
     Args:
         ttl: Time-to-Live in Sekunden
         key_prefix: Prefix für Cache-Keys
+        tags: Zusätzliche Tags für alle Einträge dieser Funktion
         
     Example:
         @cached(ttl=600, key_prefix="standings")
         def get_standings(year_id):
             return expensive_calculation()
     """
+    extra_tags = tuple(tags)
+    
     def decorator(func: Callable):
         @wraps(func)
         def wrapper(self, *args, **kwargs):
@@ -187,19 +346,21 @@ def cached(ttl: Optional[int] = None, key_prefix: Optional[str] = None):
                 return func(self, *args, **kwargs)
             
             # Generiere Cache-Key
+            # Klassenname im Hash, da sich Services den geteilten Cache teilen
             prefix = key_prefix or f"{self.__class__.__name__}.{func.__name__}"
-            cache_key = f"{prefix}:{CacheManager.generate_key(*args, **kwargs)}"
+            cache_key = f"{prefix}:{CacheManager.generate_key(self.__class__.__name__, *args, **kwargs)}"
             
             # Prüfe Cache
-            cached_value = self.cache_manager.get(cache_key)
-            if cached_value is not None:
+            cached_value = self.cache_manager.get(cache_key, MISSING)
+            if cached_value is not MISSING:
                 return cached_value
             
             # Führe Funktion aus
             result = func(self, *args, **kwargs)
             
             # Cache Ergebnis
-            self.cache_manager.set(cache_key, result, ttl)
+            self.cache_manager.set(cache_key, result, ttl,
+                                   tags=_scope_tags(func, self, args, kwargs, extra_tags))
             
             return result
         
@@ -210,11 +371,14 @@ def cached(ttl: Optional[int] = None, key_prefix: Optional[str] = None):
 class CacheableService:
     """
     Mixin für Services mit Caching-Support
+    
+    Der Cache kommt von get_service_cache(): mit dem Backend 'sqlite' der geteilte
+    globale Cache, sonst ein eigener Cache pro Service-Instanz (und damit pro Request).
     """
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.cache_manager = CacheManager()
+        self.cache_manager = get_service_cache()
     
     def invalidate_cache(self, pattern: Optional[str] = None):
         """
@@ -226,6 +390,16 @@ class CacheableService:
         if hasattr(self, 'cache_manager'):
             self.cache_manager.invalidate(pattern)
     
+    def invalidate_cache_tags(self, *tags: str):
+        """
+        Invalidiert Service-Cache-Einträge mit einem der Tags
+        
+        Args:
+            tags: Tags wie 'year:12' oder 'team:CAN'
+        """
+        if hasattr(self, 'cache_manager'):
+            self.cache_manager.invalidate_tags(*tags)
+    
     def get_cache_stats(self) -> Dict[str, Any]:
         """
         Gibt Cache-Statistiken zurück
@@ -238,8 +412,13 @@ class CacheableService:
         return {}
 
 
-# Globale Cache-Instanz für gemeinsame Nutzung
-_global_cache = CacheManager(default_ttl=300)
+# Alle lebenden Cache-Instanzen (auch die der einzelnen Services), für Event-basierte Invalidierung
+_cache_managers: "weakref.WeakSet[CacheManager]" = weakref.WeakSet()
+
+# Globale Cache-Instanz für gemeinsame Nutzung (Backend per configure_cache austauschbar)
+_global_cache = CacheManager(default_ttl=300, backend=MemoryCacheBackend(shared=True))
+
+CACHE_BACKENDS = ('memory', 'sqlite')
 
 
 def get_global_cache() -> CacheManager:
@@ -247,6 +426,55 @@ def get_global_cache() -> CacheManager:
     return _global_cache
 
 
+def get_service_cache() -> CacheManager:
+    """
+    Gibt den Cache für eine neue Service-Instanz zurück
+    
+    Nur ein prozessübergreifendes Backend ('sqlite') wird zwischen Requests geteilt:
+    dort sehen alle Worker dieselben Invalidierungen. Ein prozesslokaler Cache würde
+    unter mehreren Workern (z.B. gunicorn) bis zum Ablauf der TTL veraltete
+    Tabellen und Rekorde liefern, daher erhält sonst jede Instanz einen eigenen Cache.
+    """
+    if _global_cache.backend.cross_process:
+        return _global_cache
+    return CacheManager()
+
+
+def configure_cache(backend: str = 'memory', path: Optional[str] = None,
+                    max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> CacheManager:
+    """
+    Wählt das Backend des globalen Caches
+    
+    'memory' (Standard): Services cachen nur innerhalb ihrer Instanz, also pro
+    Request; der globale Cache bleibt prozesslokal. 'sqlite': Services teilen den
+    globalen Cache über eine lokale Datei zwischen Requests und Worker-Prozessen.
+    
+    Args:
+        backend: 'memory' oder 'sqlite'
+        path: Pfad der SQLite-Datei (nur für 'sqlite')
+        max_entries: Optional - maximale Anzahl Einträge
+        max_bytes: Optional - maximale Größe aller Werte in Bytes
+        
+    Returns:
+        Die globale Cache-Instanz
+        
+    Raises:
+        ValueError: Bei unbekanntem Backend oder fehlendem Pfad
+    """
+    limits = {name: value for name, value in (('max_entries', max_entries), ('max_bytes', max_bytes))
+              if value is not None}
+    if backend == 'memory':
+        _global_cache.backend = MemoryCacheBackend(shared=True, **limits)
+    elif backend == 'sqlite':
+        if not path:
+            raise ValueError("SQLite cache backend requires a path")
+        _global_cache.backend = SQLiteCacheBackend(path, **limits)
+    else:
+        raise ValueError(f"Unknown cache backend '{backend}', expected one of {CACHE_BACKENDS}")
+    logger.info(f"Global cache uses {type(_global_cache.backend).__name__}")
+    return _global_cache
+
+
 def invalidate_standings_cache(year_id: Optional[int] = None):
     """
     Invalidiert Standings-bezogene Cache-Einträge
@@ -255,12 +483,11 @@ def invalidate_standings_cache(year_id: Optional[int] = None):
         year_id: Optional - nur für dieses Jahr invalidieren
     """
     if year_id:
-        pattern = f"standings:{year_id}"
+        count = _global_cache.invalidate_tags(f"year:{year_id}", ALL_YEARS_TAG, namespaces=('standings',))
+        logger.info(f"Invalidated {count} standings cache entries for year {year_id}")
     else:
-        pattern = "standings:"
-    
-    _global_cache.invalidate(pattern)
-    logger.info(f"Invalidated standings cache for pattern: {pattern}")
+        _global_cache.invalidate("standings:")
+        logger.info("Invalidated standings cache")
 
 
 def invalidate_team_cache(team_code: Optional[str] = None):
@@ -271,9 +498,78 @@ def invalidate_team_cache(team_code: Optional[str] = None):
         team_code: Optional - nur für dieses Team invalidieren
     """
     if team_code:
-        pattern = f"team:{team_code}"
+        count = _global_cache.invalidate_tags(f"team:{team_code}", namespaces=('team',))
+        logger.info(f"Invalidated {count} team cache entries for team {team_code}")
     else:
-        pattern = "team:"
+        _global_cache.invalidate("team:")
+        logger.info("Invalidated team cache")
+
+
+def invalidate_all_caches(pattern: Optional[str] = None):
+    """
+    Invalidiert Einträge in allen lebenden Cache-Instanzen
     
-    _global_cache.invalidate(pattern)
-    logger.info(f"Invalidated team cache for pattern: {pattern}")
\ No newline at end of file
+    Args:
+        pattern: Optional - nur Keys mit diesem Muster löschen
+    """
+    for cache_manager in list(_cache_managers):
+        cache_manager.invalidate(pattern)
+
+
+def invalidate_all_cache_tags(*tags: str, namespaces: Optional[Iterable[str]] = None) -> int:
+    """
+    Invalidiert getaggte Einträge in allen lebenden Cache-Instanzen
+    
+    Args:
+        tags: Tags wie 'year:12' oder 'team:CAN'
+        namespaces: Optional - nur Einträge dieser Namespaces löschen
+        
+    Returns:
+        Anzahl gelöschter Einträge
+    """
+    return sum(cache_manager.invalidate_tags(*tags, namespaces=namespaces)
+               for cache_manager in list(_cache_managers))
+
+
+# Betroffene Cache-Namespaces pro Domain-Event
+EVENT_CACHE_NAMESPACES: Dict[type, tuple] = {
+    GameScoreChanged: ('game', 'standings', 'tournament', 'team', 'records', 'all_time_standings'),
+    ShotsOnGoalChanged: ('game', 'tournament', 'team', 'records'),
+    GoalAdded: ('game', 'player', 'tournament', 'team', 'records'),
+    GoalDeleted: ('game', 'player', 'tournament', 'team', 'records'),
+    PenaltyAdded: ('game', 'player', 'tournament', 'team', 'records'),
+    PenaltyDeleted: ('game', 'player', 'tournament', 'team', 'records'),
+    SeedingChanged: ('game', 'standings', 'tournament', 'team', 'records', 'all_time_standings'),
+    FixtureReloaded: ('game', 'standings', 'tournament', 'team', 'player', 'records', 'all_time_standings'),
+    PlayerChanged: ('player', 'team', 'records'),
+}
+
+
+def _event_tags(event: DomainEvent) -> list:
+    """Tags der von einem Event betroffenen Einträge (zusätzlich immer ALL_YEARS_TAG)"""
+    if isinstance(event, PlayerChanged):
+        # Spieler gehören zu keinem Jahr: die Einträge der Spieler und Teams sowie alle Spielerlisten
+        return ([f"player:{player_id}" for player_id in event.player_ids]
+                + [f"team:{team_code}" for team_code in event.team_codes]
+                + [PLAYER_NAMES_TAG, ALL_YEARS_TAG])
+    return [f"year:{event.year_id}", ALL_YEARS_TAG]
+
+
+def invalidate_caches_for_event(event: DomainEvent):
+    """
+    Event-Handler (nach dem Commit): verwirft alle Cache-Einträge, die von einem Domain-Event betroffen sind
+    
+    Betroffen sind in den Namespaces des Events die Einträge des Jahres ('year:<id>')
+    und alle jahresübergreifenden Einträge (ALL_YEARS_TAG); bei PlayerChanged die
+    Einträge der Spieler ('player:<id>'), ihrer Teams und alle Spielerlisten.
+    
+    Args:
+        event: Das publizierte Domain-Event
+    """
+    count = invalidate_all_cache_tags(*_event_tags(event),
+                                      namespaces=EVENT_CACHE_NAMESPACES.get(type(event), ()))
+    logger.debug(f"Invalidated {count} cache entries for {type(event).__name__} (year {event.year_id})")
+
+
+# Erst nach dem Commit: sonst kann ein anderer Worker den geteilten Cache mit den alten Zeilen neu befüllen
+get_event_bus().subscribe(tuple(EVENT_CACHE_NAMESPACES), invalidate_caches_for_event, after_commit=True)
\ No newline at end of file
@@ -0,0 +1,230 @@
+"""
+EventBus - Domain-Events für Schreibvorgänge
+Schreibpfade publizieren Events, Caches und materialisierte Snapshots abonnieren sie
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, Type, Union
+import logging
+
+from flask import has_app_context
+from sqlalchemy import event as sa_event
+from sqlalchemy.orm import Session
+
+from models import db
+
+logger = logging.getLogger(__name__)
+
+# Schlüssel in Session.info: Events, deren after_commit-Handler noch ausstehen
+PENDING_EVENTS_KEY = 'pending_domain_events'
+
+
+# --- Domain Events ---
+@dataclass(frozen=True)
+class DomainEvent:
+    """
+    Basis aller Domain-Events
+
+    Der Scope (Jahr, Spiel, Teams) erlaubt Abonnenten eine gezielte Invalidierung.
+    """
+    year_id: int
+    game_id: Optional[int] = None
+    team_codes: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class GameScoreChanged(DomainEvent):
+    """Ergebnis oder Ergebnistyp eines Spiels wurde geändert"""
+
+
+@dataclass(frozen=True)
+class ShotsOnGoalChanged(DomainEvent):
+    """Torschüsse eines Spiels wurden geändert"""
+
+
+@dataclass(frozen=True)
+class GoalAdded(DomainEvent):
+    """Tor wurde erfasst"""
+
+
+@dataclass(frozen=True)
+class GoalDeleted(DomainEvent):
+    """Tor wurde gelöscht"""
+
+
+@dataclass(frozen=True)
+class PenaltyAdded(DomainEvent):
+    """Strafe wurde erfasst"""
+
+
+@dataclass(frozen=True)
+class PenaltyDeleted(DomainEvent):
+    """Strafe wurde gelöscht"""
+
+
+@dataclass(frozen=True)
+class SeedingChanged(DomainEvent):
+    """Benutzerdefiniertes Seeding wurde gespeichert oder zurückgesetzt"""
+    stage: str = 'semifinal'  # 'semifinal' oder 'quarterfinal'
+
+
+@dataclass(frozen=True)
+class FixtureReloaded(DomainEvent):
+    """Spielplan eines Turniers wurde aus der Fixture-Datei neu geladen"""
+
+
+@dataclass(frozen=True)
+class PlayerChanged(DomainEvent):
+    """
+    Name, Team oder Trikotnummer von Spielern wurde geändert oder Spieler wurden zusammengeführt
+
+    Spieler gehören zu keinem Turnierjahr, daher ist year_id hier optional.
+    """
+    year_id: Optional[int] = None
+    player_ids: Tuple[int, ...] = ()
+
+
+EventHandler = Callable[[DomainEvent], None]
+
+
+class EventBus:
+    """
+    Synchroner In-Process Event-Bus
+
+    Events werden innerhalb der Transaktion des Schreibvorgangs (vor dem Commit)
+    publiziert. Handler laufen sofort in Registrierungsreihenfolge; Fehler werden
+    an den Aufrufer weitergereicht, damit dieser die Transaktion zurückrollt und
+    Daten und Caches nicht auseinanderlaufen.
+
+    Handler mit after_commit=True (Invalidierung geteilter Caches) laufen erst nach
+    dem Commit der Session: vorher könnte ein anderer Worker die alten Zeilen lesen
+    und den Cache neu befüllen. Bei einem Rollback werden ihre Events verworfen.
+    """
+
+    def __init__(self):
+        self._handlers: Dict[Type[DomainEvent], List[EventHandler]] = defaultdict(list)
+        self._after_commit_handlers: Dict[Type[DomainEvent], List[EventHandler]] = defaultdict(list)
+        self.published_count = 0
+
+    def subscribe(self, event_types: Union[Type[DomainEvent], Tuple[Type[DomainEvent], ...]],
+                  handler: EventHandler, after_commit: bool = False) -> None:
+        """
+        Registriert einen Handler für einen oder mehrere Event-Typen
+
+        Ein Handler für eine Basisklasse (z.B. DomainEvent) erhält auch alle abgeleiteten Events.
+
+        Args:
+            event_types: Event-Klasse oder Tuple von Event-Klassen
+            handler: Aufrufbares Objekt, das das Event erhält
+            after_commit: Handler erst nach dem Commit der Session aufrufen
+        """
+        if not isinstance(event_types, tuple):
+            event_types = (event_types,)
+        registry = self._after_commit_handlers if after_commit else self._handlers
+        for event_type in event_types:
+            if handler not in registry[event_type]:
+                registry[event_type].append(handler)
+
+    def unsubscribe(self, event_types: Union[Type[DomainEvent], Tuple[Type[DomainEvent], ...]],
+                    handler: EventHandler) -> None:
+        """
+        Entfernt einen Handler für einen oder mehrere Event-Typen
+
+        Args:
+            event_types: Event-Klasse oder Tuple von Event-Klassen
+            handler: Zuvor registrierter Handler
+        """
+        if not isinstance(event_types, tuple):
+            event_types = (event_types,)
+        for registry in (self._handlers, self._after_commit_handlers):
+            for event_type in event_types:
+                if handler in registry.get(event_type, []):
+                    registry[event_type].remove(handler)
+
+    def publish(self, event: DomainEvent, session: Optional[Session] = None) -> None:
+        """
+        Stellt ein Event allen passenden Handlern zu
+
+        after_commit-Handler werden auf der Session vorgemerkt und beim Commit
+        aufgerufen; ohne Session (kein App-Kontext) laufen sie sofort.
+
+        Args:
+            event: Das Domain-Event
+            session: Session des Schreibvorgangs (Standard: db.session im App-Kontext)
+        """
+        self.published_count += 1
+        handlers = self._matching_handlers(self._handlers, event)
+        deferred_handlers = self._matching_handlers(self._after_commit_handlers, event)
+
+        logger.debug(f"Publishing {type(event).__name__} (year {event.year_id}, game {event.game_id}) "
+                     f"to {len(handlers)} handlers, {len(deferred_handlers)} after commit")
+        for handler in handlers:
+            handler(event)
+
+        if not deferred_handlers:
+            return
+        if session is None and has_app_context():
+            session = db.session()
+        if session is None:
+            for handler in deferred_handlers:
+                handler(event)
+        else:
+            # Das Event gehört zur laufenden Transaktion; ohne Transaktion beginnt sie hier,
+            # damit auch ein Rollback vor dem ersten Statement die Vormerkung verwirft
+            if not session.in_transaction():
+                session.begin()
+            session.info.setdefault(PENDING_EVENTS_KEY, []).append((event, deferred_handlers))
+
+    @staticmethod
+    def _matching_handlers(registry: Dict[Type[DomainEvent], List[EventHandler]],
+                           event: DomainEvent) -> List[EventHandler]:
+        handlers = []
+        for event_type in type(event).__mro__:
+            for handler in registry.get(event_type, []):
+                if handler not in handlers:
+                    handlers.append(handler)
+        return handlers
+
+    def clear(self) -> None:
+        """Entfernt alle Handler"""
+        self._handlers.clear()
+        self._after_commit_handlers.clear()
+
+
+@sa_event.listens_for(Session, 'after_commit')
+def _dispatch_pending_events(session: Session) -> None:
+    """Ruft die vorgemerkten after_commit-Handler auf; die Daten sind bereits committet"""
+    for event, handlers in session.info.pop(PENDING_EVENTS_KEY, []):
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception as e:
+                logger.error(f"After-commit handler for {type(event).__name__} failed: {str(e)}")
+
+
+@sa_event.listens_for(Session, 'after_transaction_end')
+def _drop_pending_events(session: Session, transaction) -> None:
+    """Verwirft vorgemerkte Events, wenn die Transaktion ohne Commit endet (Rollback, close)"""
+    if transaction.parent is None:
+        session.info.pop(PENDING_EVENTS_KEY, None)
+
+
+# Globale Event-Bus-Instanz für gemeinsame Nutzung
+_event_bus = EventBus()
+
+
+def get_event_bus() -> EventBus:
+    """Gibt die globale Event-Bus-Instanz zurück"""
+    return _event_bus
+
+
+def publish(event: DomainEvent, session: Optional[Session] = None) -> None:
+    """
+    Publiziert ein Event über den globalen Event-Bus
+
+    Args:
+        event: Das Domain-Event
+        session: Session des Schreibvorgangs (Standard: db.session im App-Kontext)
+    """
+    _event_bus.publish(event, session)
@@ -0,0 +1,187 @@
+"""
+Benchmark: Kosten der Rekorde-Seite (/records)
+
+Vergleicht die frühere Berechnung (23 einzelne Rekordfunktionen, die Spiele, Tore
+und Strafen jeweils selbst laden) mit compute_records_page() der Records-Engine.
+Gemessen werden Laufzeit und Anzahl der SQL-Statements pro Aufruf. Die frühere
+Berechnung läuft mit dem Code einer älteren Git-Revision (--legacy-rev) in einem
+eigenen Prozess, die Engine gegen eine Kopie der Datenbank, die create_app() beim
+Start auf den aktuellen Stand bringt; die Turnier-Snapshots werden vorab einmal
+aufgebaut.
+
+Usage:
+    python benchmarks/bench_records.py [--db data/iihf_data.db] [--repeat 3] [--legacy-rev REV] [--output result.json]
+"""
+
+import argparse
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, BASE_DIR)
+# Das Modul-App-Objekt aus app.py (geladen mit jedem Import von app.*) soll die mitgelieferte
+# Datenbank nicht migrieren; gemessen wird immer gegen eine Kopie
+os.environ.setdefault('IIHF_DATABASE_URI', 'sqlite://')
+
+from sqlalchemy import event  # noqa: E402
+
+from app import create_app  # noqa: E402
+from models import db, ChampionshipYear  # noqa: E402
+from routes.records.engine import compute_records_page  # noqa: E402
+from app.services.core.tournament_snapshot_service import TournamentSnapshotService  # noqa: E402
+
+
+# Frühere records_view (Stand vor der Records-Engine), ausgeführt im Quellbaum dieses Stands
+LEGACY_SCRIPT = """
+import json, sys, time
+from sqlalchemy import event
+from app import create_app
+from models import db
+import routes.records as records
+from routes.records.utils import get_records_data
+
+
+def legacy_records_page():
+    records_data = get_records_data()
+    return {
+        'longest_win_streak': records.get_longest_win_streak(records_data),
+        'longest_loss_streak': records.get_longest_loss_streak(records_data),
+        'longest_scoring_streak': records.get_longest_scoring_streak(records_data),
+        'longest_shutout_streak': records.get_longest_shutout_streak(records_data),
+        'longest_goalless_streak': records.get_longest_goalless_streak(records_data),
+        'highest_victory': records.get_highest_victory(records_data),
+        'most_goals_game': records.get_most_goals_game(records_data),
+        'most_frequent_matchup': records.get_most_frequent_matchup(records_data),
+        'fastest_goal': records.get_fastest_goal(),
+        'fastest_hattrick': records.get_fastest_hattrick(),
+        'most_consecutive_tournament_wins': records.get_most_consecutive_tournament_wins(),
+        'most_final_appearances': records.get_most_final_appearances(),
+        'record_champion': records.get_record_champion(),
+        'tournament_most_goals': records.get_tournament_with_most_goals(),
+        'tournament_least_goals': records.get_tournament_with_least_goals(),
+        'tournament_most_penalty_minutes': records.get_tournament_with_most_penalty_minutes(),
+        'tournament_least_penalty_minutes': records.get_tournament_with_least_penalty_minutes(),
+        'most_goals_team_tournament': records.get_most_goals_team_tournament(),
+        'fewest_goals_against_tournament': records.get_fewest_goals_against_tournament(),
+        'most_shutouts_tournament': records.get_most_shutouts_tournament(),
+        'most_scorers_tournament': records.get_most_scorers_tournament(),
+        'most_goals_player_tournament': records.get_most_goals_player_tournament(),
+        'most_assists_player_tournament': records.get_most_assists_player_tournament(),
+        'most_penalty_minutes_tournament': records.get_most_penalty_minutes_tournament(),
+    }
+
+
+repeat = int(sys.argv[1])
+statements = []
+with create_app().app_context():
+    event.listen(db.engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+    start = time.perf_counter()
+    for _ in range(repeat):
+        legacy_records_page()
+        db.session.expire_all()
+    elapsed = time.perf_counter() - start
+print(json.dumps({'ms': elapsed / repeat * 1000, 'queries': len(statements) // repeat}))
+"""
+
+
+def default_legacy_rev():
+    """Stand vor der Records-Engine: Elternteil des Commits, der routes/records/engine.py anlegt"""
+    added = subprocess.run(
+        ['git', 'log', '--diff-filter=A', '--format=%H', '--', 'routes/records/engine.py'],
+        cwd=BASE_DIR, capture_output=True, text=True, check=True,
+    ).stdout.split()
+    return f'{added[-1]}^'
+
+
+def measure_legacy(rev, db_file, repeat, tmp_dir):
+    """
+    Misst die frühere records_view mit dem Code aus `rev` gegen eine eigene Datenbankkopie
+
+    Der Quellbaum kommt per `git archive` in ein temporäres Verzeichnis; dessen app.py
+    nutzt fest data/iihf_data.db, daher liegt die Kopie dort.
+    """
+    tree = os.path.join(tmp_dir, 'legacy')
+    archive = subprocess.run(['git', 'archive', '--format=tar', rev], cwd=BASE_DIR,
+                             capture_output=True, check=True).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(tree)
+    shutil.copyfile(db_file, os.path.join(tree, 'data', 'iihf_data.db'))
+    env = {key: value for key, value in os.environ.items() if key != 'IIHF_DATABASE_URI'}
+    result = subprocess.run([sys.executable, '-c', LEGACY_SCRIPT, str(repeat)], cwd=tree, env=env,
+                            capture_output=True, text=True, check=True)
+    legacy = json.loads(result.stdout.strip().splitlines()[-1])
+    return legacy['ms'], legacy['queries']
+
+
+def measure(func, repeat):
+    """Mittlere Laufzeit (ms) und SQL-Statements pro Aufruf"""
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', count_statement)
+    try:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+            db.session.expire_all()
+        elapsed = time.perf_counter() - start
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', count_statement)
+    return elapsed / repeat * 1000, len(statements) // repeat
+
+
+def make_app(db_path):
+    """App gegen die Datenbankkopie; create_app() migriert die Kopie beim Start"""
+    return create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{db_path}', 'CACHE_BACKEND': 'memory'})
+
+
+def run(db_file, repeat, legacy_rev):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy_ms, legacy_queries = measure_legacy(legacy_rev, db_file, repeat, tmp_dir)
+
+        db_copy = os.path.join(tmp_dir, 'bench.db')
+        shutil.copyfile(db_file, db_copy)
+        app = make_app(db_copy)
+        with app.app_context():
+            TournamentSnapshotService().get_resolved_tournaments(ChampionshipYear.query.all())
+            engine_ms, engine_queries = measure(compute_records_page, repeat)
+    return {
+        'repeat': repeat,
+        'legacy_rev': legacy_rev,
+        'legacy_ms': legacy_ms,
+        'legacy_queries': legacy_queries,
+        'engine_ms': engine_ms,
+        'engine_queries': engine_queries,
+        'speedup': legacy_ms / engine_ms if engine_ms else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--db', default=os.path.join(BASE_DIR, 'data', 'iihf_data.db'))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--legacy-rev', help='Git-Revision der früheren Rekorde-Seite (Standard: Stand vor routes/records/engine.py)')
+    parser.add_argument('--output', help='Optional: Ergebnis als JSON-Datei schreiben')
+    args = parser.parse_args()
+
+    result = run(args.db, args.repeat, args.legacy_rev or default_legacy_rev())
+    print(f"{'':>8} {'ms':>10} {'queries':>8}")
+    print(f"{'legacy':>8} {result['legacy_ms']:>10.1f} {result['legacy_queries']:>8}  ({result['legacy_rev']})")
+    print(f"{'engine':>8} {result['engine_ms']:>10.1f} {result['engine_queries']:>8}")
+    print(f"speedup: {result['speedup']:.1f}x")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+"""
+Benchmark: Laufzeit, SQL-Statements und Speicherspitze der meistbesuchten Seiten
+
+Startet die App über create_app() gegen eine Kopie der Datenbank (create_app bringt
+die Kopie mit Migrationen und Box-Score-Backfill auf den aktuellen Stand) und ruft
+jede Route über den Test-Client auf: Jahresansicht, Spielstatistik, /records,
+/all-time-standings, /medal-tally, /player-stats/data und
+/api/team-yearly-stats/<team>. Pro Route werden mittlere und minimale Laufzeit,
+SQL-Statements pro Aufruf und die Speicherspitze (tracemalloc, separater Aufruf)
+gemessen. Der Service-Cache wird vor jedem Aufruf
+geleert, damit die Berechnung und nicht der Cache-Treffer gemessen wird
+(--warm-cache misst den Cache-Treffer mit dem zwischen Requests geteilten
+SQLite-Cache-Backend in einer temporären Datei).
+
+Mit --fixtures läuft der Benchmark gegen eine synthetische Datenbank aus
+benchmarks/generate_synthetic_db.py (Verzeichnis der zugehörigen Fixture-Dateien).
+
+Das Ergebnis enthält den Git-Commit und kann per --output gespeichert und per
+--compare gegen ein früheres Ergebnis verglichen werden.
+
+Usage:
+    python benchmarks/bench_routes.py [--db data/iihf_data.db] [--repeat 5] [--year 2025] [--team CAN]
+                                      [--fixtures DIR] [--warm-cache] [--output result.json]
+                                      [--compare baseline.json]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, BASE_DIR)
+# Das Modul-App-Objekt aus app.py (geladen mit jedem Import von app.*) soll die mitgelieferte
+# Datenbank nicht migrieren; gemessen wird immer gegen eine Kopie
+os.environ.setdefault('IIHF_DATABASE_URI', 'sqlite://')
+
+from sqlalchemy import event, func  # noqa: E402
+
+from app import create_app  # noqa: E402
+from app.services.utils.cache_manager import get_global_cache  # noqa: E402
+from models import db, ChampionshipYear, Game, Goal, Penalty  # noqa: E402
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def pick_targets(year, team):
+    """Jahr (Standard: letztes Jahr mit Spielen) und dessen Spiel mit den meisten Ereignissen"""
+    query = ChampionshipYear.query.join(Game, Game.year_id == ChampionshipYear.id)
+    year_obj = (query.filter(ChampionshipYear.year == year).first() if year
+                else query.order_by(ChampionshipYear.year.desc()).first())
+    if year_obj is None:
+        raise SystemExit(f'Kein Turnier mit Spielen gefunden (year={year})')
+
+    events = func.count(func.distinct(Goal.id)) + func.count(func.distinct(Penalty.id))
+    game_id = (db.session.query(Game.id)
+               .outerjoin(Goal, Goal.game_id == Game.id)
+               .outerjoin(Penalty, Penalty.game_id == Game.id)
+               .filter(Game.year_id == year_obj.id)
+               .group_by(Game.id)
+               .order_by(events.desc(), Game.id)
+               .limit(1).scalar())
+    return [
+        ('year_view', f'/year/{year_obj.id}'),
+        ('game_stats_view', f'/year/{year_obj.id}/game/{game_id}/stats'),
+        ('records', '/records'),
+        ('all_time_standings', '/all-time-standings'),
+        ('medal_tally', '/medal-tally'),
+        ('player_stats_data', '/player-stats/data'),
+        ('team_yearly_stats', f'/api/team-yearly-stats/{team}'),
+    ]
+
+
+def measure(app, client, url, repeat, warm_cache):
+    """Mittlere/minimale Laufzeit (ms), SQL-Statements pro Aufruf und Speicherspitze (KB)"""
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    def call():
+        if not warm_cache:
+            get_global_cache().invalidate()
+        response = client.get(url)
+        if response.status_code != 200:
+            raise SystemExit(f'{url} lieferte Status {response.status_code}')
+
+    call()  # Aufwärmen: Importe, Templates, persistierte Snapshots
+
+    with app.app_context():
+        engine = db.engine
+    timings = []
+    event.listen(engine, 'before_cursor_execute', count_statement)
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            call()
+            timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        event.remove(engine, 'before_cursor_execute', count_statement)
+
+    # tracemalloc verlangsamt die Ausführung, daher getrennt von der Zeitmessung
+    tracemalloc.start()
+    try:
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'url': url,
+        'mean_ms': sum(timings) / len(timings),
+        'min_ms': min(timings),
+        'queries': len(statements) // repeat,
+        'peak_kb': peak / 1024,
+    }
+
+
+def run(db_file, repeat, year=None, team='CAN', warm_cache=False, fixtures_dir=None):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_copy = os.path.join(tmp_dir, 'bench.db')
+        shutil.copyfile(db_file, db_copy)
+        config = {
+            'SQLALCHEMY_DATABASE_URI': f'sqlite:///{db_copy}',
+            # Nur das SQLite-Backend cacht über den einzelnen Request hinaus
+            'CACHE_BACKEND': 'sqlite' if warm_cache else 'memory',
+            'CACHE_PATH': os.path.join(tmp_dir, 'cache.sqlite3'),
+            'WTF_CSRF_ENABLED': False,
+        }
+        if fixtures_dir:
+            config['UPLOAD_FOLDER'] = os.path.abspath(fixtures_dir)
+        app = create_app(config)
+        client = app.test_client()
+        with app.app_context():
+            targets = pick_targets(year, team)
+        routes = {name: measure(app, client, url, repeat, warm_cache) for name, url in targets}
+        with app.app_context():
+            db.engine.dispose()
+    return {
+        'commit': git_commit(),
+        'repeat': repeat,
+        'warm_cache': warm_cache,
+        'db': os.path.abspath(db_file),
+        'routes': routes,
+    }
+
+
+def print_result(result, baseline=None):
+    base_routes = (baseline or {}).get('routes', {})
+    header = f"{'route':<20} {'mean ms':>9} {'min ms':>9} {'queries':>8} {'peak KB':>9}"
+    if base_routes:
+        header += f" {'Δ ms':>8} {'Δ queries':>10} {'Δ KB':>8}"
+    print(f"commit: {result['commit']}" + (f"  (vs. {baseline.get('commit')})" if baseline else ''))
+    print(header)
+    for name, row in result['routes'].items():
+        line = (f"{name:<20} {row['mean_ms']:>9.1f} {row['min_ms']:>9.1f} "
+                f"{row['queries']:>8} {row['peak_kb']:>9.0f}")
+        base = base_routes.get(name)
+        if base:
+            line += (f" {row['mean_ms'] - base['mean_ms']:>+8.1f} {row['queries'] - base['queries']:>+10}"
+                     f" {row['peak_kb'] - base['peak_kb']:>+8.0f}")
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--db', default=os.path.join(BASE_DIR, 'data', 'iihf_data.db'))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--year', type=int, help='Turnierjahr für Jahres- und Spielansicht (Standard: letztes)')
+    parser.add_argument('--team', default='CAN', help='Team-Code für /api/team-yearly-stats')
+    parser.add_argument('--fixtures', help='Fixture-Verzeichnis einer synthetischen Datenbank')
+    parser.add_argument('--warm-cache', action='store_true', help='Service-Cache zwischen Aufrufen behalten')
+    parser.add_argument('--output', help='Optional: Ergebnis als JSON-Datei schreiben')
+    parser.add_argument('--compare', help='Optional: früheres Ergebnis (JSON) zum Vergleich')
+    args = parser.parse_args()
+
+    result = run(args.db, args.repeat, args.year, args.team, args.warm_cache, args.fixtures)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_result(result, baseline)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark: Kosten der Vorrunden-Tabellen pro Turnierjahr
+
+Vergleicht die frühere Berechnung (ein StandingsService-Aufruf pro Spiel) mit dem
+StandingsAccumulator und misst _calculate_basic_prelim_standings sowie den Aufbau
+der PlayoffResolver-Map pro Jahr. Läuft gegen eine Kopie der Datenbank.
+
+Usage:
+    python benchmarks/bench_standings.py [--db data/iihf_data.db] [--repeat 50] [--output result.json]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, BASE_DIR)
+# Das Modul-App-Objekt aus app.py (geladen mit jedem Import von app.*) soll die mitgelieferte
+# Datenbank nicht migrieren; gemessen wird immer gegen eine Kopie
+os.environ.setdefault('IIHF_DATABASE_URI', 'sqlite://')
+
+from flask import Flask  # noqa: E402
+
+from models import db, ChampionshipYear, Game, TeamStats  # noqa: E402
+from constants import PRELIM_ROUNDS  # noqa: E402
+from utils import is_code_final  # noqa: E402
+from utils.playoff_resolver import PlayoffResolver  # noqa: E402
+from utils.standings import accumulate_standings, _calculate_basic_prelim_standings  # noqa: E402
+
+
+def legacy_prelim_standings(games):
+    """Frühere Berechnung: neuer StandingsService und Einzelspiel-Berechnung pro Spiel"""
+    from app.services.core.standings_service import StandingsService
+
+    standings = {}
+    for game in games:
+        for code in (game.team1_code, game.team2_code):
+            standings.setdefault(code, TeamStats(name=code, group=game.group or "N/A"))
+        game_standings = StandingsService().calculate_standings_from_games([game])
+        for code, team_stats in game_standings.items():
+            standings[code] = team_stats
+    return standings
+
+
+def time_per_call(func, repeat):
+    """Mittlere Laufzeit eines Aufrufs in Millisekunden"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def make_app(db_path):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config['BASE_DIR'] = BASE_DIR
+    app.config['UPLOAD_FOLDER'] = os.path.join(BASE_DIR, 'data', 'fixtures')
+    db.init_app(app)
+    return app
+
+
+def run(db_file, repeat):
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_copy = os.path.join(tmp_dir, 'bench.db')
+        shutil.copyfile(db_file, db_copy)
+        app = make_app(db_copy)
+        with app.app_context():
+            for year_obj in ChampionshipYear.query.order_by(ChampionshipYear.year).all():
+                games = Game.query.filter_by(year_id=year_obj.id).all()
+                prelim_games = [
+                    g for g in games
+                    if g.round in PRELIM_ROUNDS and is_code_final(g.team1_code) and is_code_final(g.team2_code)
+                    and g.team1_score is not None and g.team2_score is not None
+                ]
+                results.append({
+                    'year': year_obj.year,
+                    'games': len(games),
+                    'prelim_games': len(prelim_games),
+                    'legacy_per_game_ms': time_per_call(lambda: legacy_prelim_standings(prelim_games), repeat),
+                    'accumulator_ms': time_per_call(lambda: accumulate_standings(prelim_games), repeat),
+                    'basic_prelim_standings_ms': time_per_call(
+                        lambda: _calculate_basic_prelim_standings(prelim_games), repeat),
+                    'playoff_resolver_map_ms': time_per_call(
+                        lambda: PlayoffResolver(year_obj, games).get_resolved_code('A1'), repeat),
+                })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--db', default=os.path.join(BASE_DIR, 'data', 'iihf_data.db'))
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--output', help='Optional: Ergebnis als JSON-Datei schreiben')
+    args = parser.parse_args()
+
+    results = run(args.db, args.repeat)
+    print(f"{'Year':>6} {'Games':>6} {'legacy ms':>10} {'accum ms':>9} {'basic ms':>9} {'resolver ms':>12}")
+    for row in results:
+        print(f"{row['year']:>6} {row['games']:>6} {row['legacy_per_game_ms']:>10.3f} "
+              f"{row['accumulator_ms']:>9.3f} {row['basic_prelim_standings_ms']:>9.3f} "
+              f"{row['playoff_resolver_map_ms']:>12.3f}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
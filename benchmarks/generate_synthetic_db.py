@@ -0,0 +1,72 @@
+"""
+Erzeugt eine synthetische Datenbank für Skalierungstests
+
+Schreibt N Turnierjahre (optional mit mehreren Divisionen) mit Spielplan, Ergebnissen,
+Toren, Strafen und Torschüssen in eine neue SQLite-Datei. Die Fixture-Dateien landen
+im Verzeichnis --fixtures (Standard: 'fixtures' neben der Datenbank) und werden von
+der App über UPLOAD_FOLDER gefunden. Gleicher --seed ergibt dieselbe Datenbank.
+
+Die echte Datenbank hat 13 Jahre; --years 130 entspricht etwa der 10-fachen Datenmenge.
+
+Usage:
+    python benchmarks/generate_synthetic_db.py --db /tmp/synthetic/iihf.db [--years 50] [--divisions 1]
+                                               [--seed 0] [--fixtures DIR] [--force]
+    python benchmarks/bench_routes.py --db /tmp/synthetic/iihf.db --fixtures /tmp/synthetic/fixtures
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, BASE_DIR)
+
+from flask import Flask  # noqa: E402
+
+from models import db  # noqa: E402
+from utils.synthetic_data import SyntheticHistoryGenerator  # noqa: E402
+
+
+def make_app(db_path, fixtures_dir):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config['BASE_DIR'] = BASE_DIR
+    app.config['UPLOAD_FOLDER'] = fixtures_dir
+    db.init_app(app)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--db', required=True, help='Neue SQLite-Datei')
+    parser.add_argument('--fixtures', help="Verzeichnis der Fixture-Dateien (Standard: 'fixtures' neben --db)")
+    parser.add_argument('--years', type=int, default=50)
+    parser.add_argument('--last-year', type=int, default=2025)
+    parser.add_argument('--divisions', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--force', action='store_true', help='Bestehende Datenbank überschreiben')
+    args = parser.parse_args()
+
+    db_path = os.path.abspath(args.db)
+    fixtures_dir = os.path.abspath(args.fixtures or os.path.join(os.path.dirname(db_path), 'fixtures'))
+    if os.path.exists(db_path):
+        if not args.force:
+            parser.error(f'{db_path} existiert bereits (--force zum Überschreiben)')
+        os.remove(db_path)
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+    app = make_app(db_path, fixtures_dir)
+    start = time.perf_counter()
+    with app.app_context():
+        db.create_all()
+        counts = SyntheticHistoryGenerator(fixtures_dir, years=args.years, last_year=args.last_year,
+                                           divisions=args.divisions, seed=args.seed).generate()
+    print(json.dumps(counts, indent=2))
+    print(f'{db_path} ({time.perf_counter() - start:.1f}s), fixtures: {fixtures_dir}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+-- =============================================================================
+-- TIME_SECONDS MIGRATION
+-- Persisted game time in seconds for goal.minute and penalty.minute_of_game
+-- =============================================================================
+--
+-- Goal and penalty times are stored as 'MM:SS' strings. This migration adds an
+-- integer column time_seconds to both tables, backfills it from the strings and
+-- adds composite indexes (game_id, time_seconds), so event timelines and
+-- time-based records can sort and range-scan in SQL.
+--
+-- New and changed rows are kept in sync by the models (parse_time_seconds in
+-- models.py); the CASE expressions below follow the same rules:
+--   'MM:SS'  -> minutes * 60 + seconds
+--   'MM'     -> minutes * 60
+--   otherwise NULL
+--
+-- `flask init-db` and `flask migrate` apply this migration when the columns
+-- are missing. Running it twice fails at ALTER TABLE (duplicate column name).
+-- =============================================================================
+
+BEGIN TRANSACTION;
+
+ALTER TABLE goal ADD COLUMN time_seconds INTEGER;
+ALTER TABLE penalty ADD COLUMN time_seconds INTEGER;
+
+-- =============================================================================
+-- BACKFILL
+-- =============================================================================
+
+UPDATE goal SET time_seconds = CASE
+    WHEN minute GLOB '[0-9]*:[0-9]*' AND minute NOT GLOB '*[^0-9:]*' AND minute NOT GLOB '*:*:*'
+        THEN CAST(substr(minute, 1, instr(minute, ':') - 1) AS INTEGER) * 60
+             + CAST(substr(minute, instr(minute, ':') + 1) AS INTEGER)
+    WHEN minute <> '' AND minute NOT GLOB '*[^0-9]*'
+        THEN CAST(minute AS INTEGER) * 60
+END;
+
+UPDATE penalty SET time_seconds = CASE
+    WHEN minute_of_game GLOB '[0-9]*:[0-9]*' AND minute_of_game NOT GLOB '*[^0-9:]*' AND minute_of_game NOT GLOB '*:*:*'
+        THEN CAST(substr(minute_of_game, 1, instr(minute_of_game, ':') - 1) AS INTEGER) * 60
+             + CAST(substr(minute_of_game, instr(minute_of_game, ':') + 1) AS INTEGER)
+    WHEN minute_of_game <> '' AND minute_of_game NOT GLOB '*[^0-9]*'
+        THEN CAST(minute_of_game AS INTEGER) * 60
+END;
+
+-- =============================================================================
+-- INDEXES
+-- =============================================================================
+
+-- Events of one game in chronological order (timelines, power-play analysis)
+CREATE INDEX IF NOT EXISTS ix_goal_game_time
+ON goal(game_id, time_seconds);
+
+CREATE INDEX IF NOT EXISTS ix_penalty_game_time
+ON penalty(game_id, time_seconds);
+
+-- =============================================================================
+-- MIGRATION LOG
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS migration_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    migration_name VARCHAR(100) NOT NULL,
+    executed_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    success BOOLEAN DEFAULT TRUE,
+    notes TEXT
+);
+
+INSERT INTO migration_log (migration_name, notes)
+VALUES ('003_add_time_seconds_columns', 'Added goal.time_seconds and penalty.time_seconds with (game_id, time_seconds) indexes');
+
+COMMIT;
+
+ANALYZE goal;
+ANALYZE penalty;
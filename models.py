@@ -1,6 +1,13 @@
+import re
+from typing import Optional
+
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.orm import validates
 from dataclasses import dataclass, field
 
+from constants import PIM_MAP
+
 db = SQLAlchemy()
 
 # --- Dataclass for Team Statistics ---
@@ -87,11 +94,30 @@ class Player(db.Model):
     jersey_number = db.Column(db.Integer, nullable=True)
     def __repr__(self): return f'<Player {self.first_name} {self.last_name} (#{self.jersey_number} - {self.team_code})>'
 
+_GAME_TIME_PATTERN = re.compile(r'(\d+):(\d+)')
+_GAME_MINUTES_PATTERN = re.compile(r'\d+')
+
+def parse_time_seconds(time_str: Optional[str]) -> Optional[int]:
+    """
+    Spielzeit 'MM:SS' (oder reine Minutenangabe) in Sekunden; None für leere oder ungültige Angaben
+
+    Gleiche Regeln wie das Backfill in database/migrations/add_time_seconds_columns.sql.
+    """
+    if not time_str:
+        return None
+    match = _GAME_TIME_PATTERN.fullmatch(time_str)
+    if match:
+        return int(match.group(1)) * 60 + int(match.group(2))
+    if _GAME_MINUTES_PATTERN.fullmatch(time_str):
+        return int(time_str) * 60
+    return None
+
 class Goal(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     game_id = db.Column(db.Integer, db.ForeignKey('game.id'), nullable=False)
     team_code = db.Column(db.String(3), nullable=False)
     minute = db.Column(db.String(5), nullable=False)
+    time_seconds = db.Column(db.Integer, nullable=True)  # aus minute abgeleitet, siehe parse_time_seconds
     goal_type = db.Column(db.String(10), nullable=False)
     is_empty_net = db.Column(db.Boolean, default=False, nullable=False)
     scorer_id = db.Column(db.Integer, db.ForeignKey('player.id'), nullable=False)
@@ -101,20 +127,53 @@ class Goal(db.Model):
     scorer = db.relationship('Player', foreign_keys=[scorer_id], backref=db.backref('goals_scored', lazy=True))
     assist1 = db.relationship('Player', foreign_keys=[assist1_id], backref=db.backref('assists1', lazy=True))
     assist2 = db.relationship('Player', foreign_keys=[assist2_id], backref=db.backref('assists2', lazy=True))
+    __table_args__ = (db.Index('ix_goal_game_time', 'game_id', 'time_seconds'),)
     def __repr__(self): return f'<Goal by {self.scorer_id} in Game {self.game_id} at {self.minute}>'
 
+    @validates('minute')
+    def _set_time_seconds(self, key, minute):
+        self.time_seconds = parse_time_seconds(minute)
+        return minute
+
 class Penalty(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     game_id = db.Column(db.Integer, db.ForeignKey('game.id'), nullable=False)
     team_code = db.Column(db.String(3), nullable=False)
     player_id = db.Column(db.Integer, db.ForeignKey('player.id'), nullable=True)
     minute_of_game = db.Column(db.String(5), nullable=False)
+    time_seconds = db.Column(db.Integer, nullable=True)  # aus minute_of_game abgeleitet, siehe parse_time_seconds
     penalty_type = db.Column(db.String(10), nullable=False)
     reason = db.Column(db.String(100), nullable=False)
     game = db.relationship('Game', backref=db.backref('penalties', lazy='dynamic', cascade="all, delete-orphan"))
     player = db.relationship('Player', foreign_keys=[player_id], backref=db.backref('penalties_taken', lazy=True))
+    # Decken PIM-Summen pro Spiel bzw. Spieler ab (Join über penalty_type auf penalty_type_pim)
+    __table_args__ = (db.Index('ix_penalty_game_type', 'game_id', 'penalty_type'),
+                      db.Index('ix_penalty_player_type', 'player_id', 'penalty_type'),
+                      db.Index('ix_penalty_game_time', 'game_id', 'time_seconds'))
     def __repr__(self): return f'<Penalty {self.penalty_type} to {self.team_code} in Game {self.game_id} at {self.minute_of_game}>'
 
+    @validates('minute_of_game')
+    def _set_time_seconds(self, key, minute_of_game):
+        self.time_seconds = parse_time_seconds(minute_of_game)
+        return minute_of_game
+
+class PenaltyTypePim(db.Model):
+    """Strafminuten pro Straftyp (Referenztabelle aus PIM_MAP); Strafen unbekannter Typen zählen 0 Minuten"""
+    __tablename__ = 'penalty_type_pim'
+    penalty_type = db.Column(db.String(10), primary_key=True)
+    pim = db.Column(db.Integer, nullable=False)
+    def __repr__(self): return f'<PenaltyTypePim {self.penalty_type}: {self.pim}>'
+
+    @classmethod
+    def minutes(cls):
+        """Strafminuten einer Strafe nach outerjoin(PenaltyTypePim, PenaltyTypePim.penalty_type == Penalty.penalty_type)"""
+        return db.func.coalesce(cls.pim, 0)
+
+@event.listens_for(PenaltyTypePim.__table__, 'after_create')
+def _seed_penalty_type_pim(target, connection, **kw):
+    """Befüllt die Referenztabelle beim Anlegen aus PIM_MAP"""
+    connection.execute(target.insert(), [{'penalty_type': penalty_type, 'pim': pim} for penalty_type, pim in PIM_MAP.items()])
+
 class ShotsOnGoal(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     game_id = db.Column(db.Integer, db.ForeignKey('game.id'), nullable=False)
@@ -133,6 +192,71 @@ class GameOverrule(db.Model):
     game = db.relationship('Game', backref=db.backref('overrule', uselist=False, cascade="all, delete-orphan"))
     def __repr__(self): return f'<GameOverrule for Game {self.game_id}: {self.reason[:50]}...>'
 
+class TournamentSnapshot(db.Model):
+    """Materialisiertes, aufgelöstes Turnier pro ChampionshipYear (JSON-Payload)"""
+    id = db.Column(db.Integer, primary_key=True)
+    year_id = db.Column(db.Integer, db.ForeignKey('championship_year.id'), nullable=False, unique=True, index=True)
+    version = db.Column(db.Integer, nullable=False)  # Format-Version des Payloads
+    fixture_path = db.Column(db.String(300), nullable=True)
+    fixture_mtime = db.Column(db.Float, nullable=True)  # Änderungszeit der Fixture-Datei beim Aufbau
+    payload = db.Column(db.Text, nullable=False)
+    updated_at = db.Column(db.DateTime, default=db.func.current_timestamp(), onupdate=db.func.current_timestamp(), nullable=False)
+    championship_year = db.relationship('ChampionshipYear', backref=db.backref('snapshot', uselist=False, cascade="all, delete-orphan"))
+    def __repr__(self): return f'<TournamentSnapshot Year {self.year_id} v{self.version}>'
+
+class StreakRecordState(db.Model):
+    """Gespeicherter Zustand des StreakTrackers (laufende Serien und Rekorde, JSON-Payload)"""
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False)  # Format-Version des Payloads
+    games_processed = db.Column(db.Integer, default=0, nullable=False)
+    last_game_key = db.Column(db.String(100), nullable=True)  # Sortierschlüssel des zuletzt eingespielten Spiels (JSON)
+    payload = db.Column(db.Text, nullable=False)
+    updated_at = db.Column(db.DateTime, default=db.func.current_timestamp(), onupdate=db.func.current_timestamp(), nullable=False)
+    def __repr__(self): return f'<StreakRecordState v{self.version}: {self.games_processed} games>'
+
+class TeamMatchup(db.Model):
+    """Anzahl gespielter Spiele pro Team-Paarung und Jahr (team_a < team_b, aufgelöste Codes)"""
+    id = db.Column(db.Integer, primary_key=True)
+    year_id = db.Column(db.Integer, db.ForeignKey('championship_year.id'), nullable=False, index=True)
+    team_a = db.Column(db.String(3), nullable=False)
+    team_b = db.Column(db.String(3), nullable=False)
+    games = db.Column(db.Integer, default=0, nullable=False)
+    championship_year = db.relationship('ChampionshipYear', backref=db.backref('matchups', lazy=True, cascade="all, delete-orphan"))
+    __table_args__ = (db.UniqueConstraint('year_id', 'team_a', 'team_b', name='_year_matchup_uc'),
+                      db.Index('ix_team_matchup_pair', 'team_a', 'team_b'))
+    def __repr__(self): return f'<TeamMatchup {self.team_a} vs {self.team_b} Year {self.year_id}: {self.games}>'
+
+class GameTeamBoxscore(db.Model):
+    """Kennzahlen eines Teams in einem Spiel aus Toren, Strafen und Torschüssen (gepflegt vom GameBoxscoreService)"""
+    __tablename__ = 'game_team_boxscore'
+    id = db.Column(db.Integer, primary_key=True)
+    game_id = db.Column(db.Integer, db.ForeignKey('game.id'), nullable=False)
+    team_code = db.Column(db.String(3), nullable=False)  # team_code der Ereignisse (aufgelöster Code)
+    goals = db.Column(db.Integer, default=0, nullable=False)  # erfasste Tore (Goal-Einträge)
+    ppg = db.Column(db.Integer, default=0, nullable=False)
+    shg = db.Column(db.Integer, default=0, nullable=False)
+    eng = db.Column(db.Integer, default=0, nullable=False)
+    sog = db.Column(db.Integer, default=0, nullable=False)
+    pim = db.Column(db.Integer, default=0, nullable=False)
+    penalties = db.Column(db.Integer, default=0, nullable=False)
+    pp_penalties = db.Column(db.Integer, default=0, nullable=False)  # Strafen aus POWERPLAY_PENALTY_TYPES = PP-Gelegenheiten des Gegners
+    game = db.relationship('Game', backref=db.backref('boxscores', lazy='dynamic', cascade="all, delete-orphan"))
+    __table_args__ = (db.UniqueConstraint('game_id', 'team_code', name='_game_team_boxscore_uc'),)
+    def __repr__(self): return f'<GameTeamBoxscore Game {self.game_id} {self.team_code}: {self.goals} G, {self.sog} SOG, {self.pim} PIM>'
+
+class GameDataAudit(db.Model):
+    """Gespeicherte Befunde der Datenkonsistenz-Prüfung pro Spiel (gepflegt vom DataAuditService)"""
+    __tablename__ = 'game_data_audit'
+    id = db.Column(db.Integer, primary_key=True)
+    game_id = db.Column(db.Integer, db.ForeignKey('game.id'), nullable=False, unique=True, index=True)
+    year_id = db.Column(db.Integer, db.ForeignKey('championship_year.id'), nullable=False, index=True)
+    data_hash = db.Column(db.String(40), nullable=False)  # SHA-1 der geprüften Spieldaten und der Prüfversion
+    scores_fully_match_data = db.Column(db.Boolean, nullable=False)
+    warnings = db.Column(db.Text, nullable=False)  # JSON-Liste der Warnungen
+    checked_at = db.Column(db.DateTime, default=db.func.current_timestamp(), onupdate=db.func.current_timestamp(), nullable=False)
+    game = db.relationship('Game', backref=db.backref('data_audit', uselist=False, cascade="all, delete-orphan"))
+    def __repr__(self): return f'<GameDataAudit Game {self.game_id} ({self.data_hash[:8]})>'
+
 # --- Dataclass for Game Display ---
 @dataclass
 class GameDisplay:
@@ -148,4 +272,5 @@ class GameDisplay:
     sorted_events: list = field(default_factory=list)
     sog_data: dict = field(default_factory=dict) # {team_code: {period: shots}}
     scores_fully_match_goals: bool = False # Placeholder 
-    overrule: object = None  # GameOverrule object if exists 
\ No newline at end of file
+    overrule: object = None  # GameOverrule object if exists 
+    timeline: object = None  # GameTimeline (utils.game_timeline) if loaded
\ No newline at end of file
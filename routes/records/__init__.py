@@ -44,6 +44,9 @@ from .player_records import (
     get_most_penalty_minutes_tournament
 )
 
+# Single-pass engine used by the records page
+from .engine import RecordsPage, compute_records_page
+
 # Import utilities for external access
 from .utils import get_all_resolved_games, get_resolved_team_info
 
@@ -53,73 +56,11 @@ record_bp = Blueprint('record_bp', __name__)
 
 @record_bp.route('/records')
 def records_view():
-    """Rekorde-Seite mit verschiedenen Rekordkategorien - Optimized version"""
-    
-    # Get shared records data once instead of calling get_all_resolved_games() 17 times
-    from .utils import get_records_data
-    records_data = get_records_data()
-    
-    # Call record functions with shared data where possible
-    longest_win_streak = get_longest_win_streak(records_data)
-    longest_loss_streak = get_longest_loss_streak(records_data)
-    longest_scoring_streak = get_longest_scoring_streak(records_data)
-    longest_shutout_streak = get_longest_shutout_streak(records_data)
-    longest_goalless_streak = get_longest_goalless_streak(records_data)
-    
-    # Use shared data for game records
-    highest_victory = get_highest_victory(records_data)
-    most_goals_game = get_most_goals_game(records_data)
-    most_frequent_matchup = get_most_frequent_matchup(records_data)
-    
-    # These functions haven't been updated yet, so call them normally
-    # TODO: Update these functions to use shared data for even better performance
-    fastest_goal = get_fastest_goal()
-    fastest_hattrick = get_fastest_hattrick()
-    
-    most_consecutive_tournament_wins = get_most_consecutive_tournament_wins()
-    most_final_appearances = get_most_final_appearances()
-    record_champion = get_record_champion()
-    
-    tournament_most_goals = get_tournament_with_most_goals()
-    tournament_least_goals = get_tournament_with_least_goals()
-    tournament_most_penalty_minutes = get_tournament_with_most_penalty_minutes()
-    tournament_least_penalty_minutes = get_tournament_with_least_penalty_minutes()
-    
-    most_goals_team_tournament = get_most_goals_team_tournament()
-    fewest_goals_against_tournament = get_fewest_goals_against_tournament()
-    most_shutouts_tournament = get_most_shutouts_tournament()
-    
-    most_scorers_tournament = get_most_scorers_tournament()
-    most_goals_player_tournament = get_most_goals_player_tournament()
-    most_assists_player_tournament = get_most_assists_player_tournament()
-    most_penalty_minutes_tournament = get_most_penalty_minutes_tournament()
-    
+    """Rekorde-Seite: alle Rekordkategorien aus einem Durchlauf der Records-Engine"""
+    records_page = compute_records_page()
     return render_template('records.html',
-                           longest_win_streak=longest_win_streak,
-                           longest_loss_streak=longest_loss_streak,
-                           longest_scoring_streak=longest_scoring_streak,
-                           longest_shutout_streak=longest_shutout_streak,
-                           longest_goalless_streak=longest_goalless_streak,
-                           highest_victory=highest_victory,
-                           most_goals_game=most_goals_game,
-                           fastest_goal=fastest_goal,
-                           fastest_hattrick=fastest_hattrick,
-                           most_consecutive_tournament_wins=most_consecutive_tournament_wins,
-                           most_final_appearances=most_final_appearances,
-                           record_champion=record_champion,
-                           tournament_most_goals=tournament_most_goals,
-                           tournament_least_goals=tournament_least_goals,
-                           tournament_most_penalty_minutes=tournament_most_penalty_minutes,
-                           tournament_least_penalty_minutes=tournament_least_penalty_minutes,
-                           most_goals_team_tournament=most_goals_team_tournament,
-                           fewest_goals_against_tournament=fewest_goals_against_tournament,
-                           most_shutouts_tournament=most_shutouts_tournament,
-                           most_scorers_tournament=most_scorers_tournament,
-                           most_goals_player_tournament=most_goals_player_tournament,
-                           most_assists_player_tournament=most_assists_player_tournament,
-                           most_penalty_minutes_tournament=most_penalty_minutes_tournament,
                            team_iso_codes=TEAM_ISO_CODES,
-                           most_frequent_matchup=most_frequent_matchup)
+                           **records_page.to_template_context())
 
 # Export all functions for backwards compatibility
 __all__ = [
@@ -161,6 +102,10 @@ __all__ = [
     'get_most_assists_player_tournament',
     'get_most_penalty_minutes_tournament',
     
+    # Engine
+    'RecordsPage',
+    'compute_records_page',
+    
     # Utilities
     'get_all_resolved_games',
     'get_resolved_team_info'
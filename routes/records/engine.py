@@ -0,0 +1,639 @@
+"""
+Records-Engine: berechnet alle Rekorde der Rekorde-Seite in einem Durchlauf.
+
+Jahre, Spiele, Snapshots, Tore, Strafen, Spieler und die Strafminuten pro
+Straftyp werden mit je einer Query geladen; die Datenbank liefert Spiele, Tore
+und Strafen bereits chronologisch. iter_record_games() ordnet die gestreamten
+Tore und Strafen den Spielen zu und liefert jedes Spiel mit den aufgelösten
+Team-Codes; jedes Spiel wird an alle Akkumulatoren gleichzeitig übergeben. Die Serien-Rekorde kommen aus dem
+gespeicherten Zustand des StreakRecordService, der nur neu abgeschlossene Spiele
+einspielt. Das Ergebnis ist ein RecordsPage-Objekt, dessen Felder die
+Template-Variablen von records.html sind.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field, fields
+from itertools import groupby
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import func
+
+from models import ChampionshipYear, Game, Goal, Penalty, Player
+from constants import TOP_3_DISPLAY
+from utils import is_code_final
+from app.repositories.core.penalty_type_pim_repository import PenaltyTypePimRepository
+from app.services.core.streak_record_service import StreakRecordService
+from app.services.core.tournament_snapshot_service import TournamentSnapshotService
+
+@dataclass
+class RecordGame:
+    """Ein Spiel im chronologischen Strom der Records-Engine"""
+    game: Game
+    year_obj: ChampionshipYear
+    team1_code: str
+    team2_code: str
+    completed: bool
+    goals: List[Goal] = field(default_factory=list)
+    penalties: List[Penalty] = field(default_factory=list)
+
+    @property
+    def year(self) -> Optional[int]:
+        return self.year_obj.year
+
+
+@dataclass
+class RecordsPage:
+    """Alle Rekorde der Rekorde-Seite (Feldnamen = Template-Variablen)"""
+    longest_win_streak: List[Dict] = field(default_factory=list)
+    longest_loss_streak: List[Dict] = field(default_factory=list)
+    longest_scoring_streak: List[Dict] = field(default_factory=list)
+    longest_shutout_streak: List[Dict] = field(default_factory=list)
+    longest_goalless_streak: List[Dict] = field(default_factory=list)
+    highest_victory: List[Dict] = field(default_factory=list)
+    most_goals_game: List[Dict] = field(default_factory=list)
+    most_frequent_matchup: List[Dict] = field(default_factory=list)
+    fastest_goal: List[Dict] = field(default_factory=list)
+    fastest_hattrick: List[Dict] = field(default_factory=list)
+    most_consecutive_tournament_wins: List[Dict] = field(default_factory=list)
+    most_final_appearances: List[Dict] = field(default_factory=list)
+    record_champion: List[Dict] = field(default_factory=list)
+    tournament_most_goals: List[Dict] = field(default_factory=list)
+    tournament_least_goals: List[Dict] = field(default_factory=list)
+    tournament_most_penalty_minutes: List[Dict] = field(default_factory=list)
+    tournament_least_penalty_minutes: List[Dict] = field(default_factory=list)
+    most_goals_team_tournament: List[Dict] = field(default_factory=list)
+    fewest_goals_against_tournament: List[Dict] = field(default_factory=list)
+    most_shutouts_tournament: List[Dict] = field(default_factory=list)
+    most_scorers_tournament: List[Dict] = field(default_factory=list)
+    most_goals_player_tournament: List[Dict] = field(default_factory=list)
+    most_assists_player_tournament: List[Dict] = field(default_factory=list)
+    most_penalty_minutes_tournament: List[Dict] = field(default_factory=list)
+
+    def to_template_context(self) -> Dict[str, List[Dict]]:
+        """Felder als Keyword-Argumente für render_template"""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+# --- Hilfsfunktionen ---
+
+def goal_seconds(goal: Goal) -> int:
+    """Spielzeit eines Tores in Sekunden aus Goal.time_seconds (999 für leere oder ungültige Angaben)"""
+    return 999 if goal.time_seconds is None else goal.time_seconds
+
+
+def format_duration(duration_seconds: int) -> str:
+    """Sekunden im Format Minuten:Sekunden"""
+    return f"{duration_seconds // 60}:{duration_seconds % 60:02d}"
+
+
+def rank_top_3(entries: List[Dict], value_key: str) -> List[Dict]:
+    """
+    Sortiert absteigend und vergibt dichte Ränge; Gleichstände auf Rang 3 bleiben enthalten
+
+    Args:
+        entries: Rekord-Einträge (werden um 'rank' ergänzt)
+        value_key: Schlüssel des Rekordwerts
+
+    Returns:
+        Einträge der Ränge 1-3
+    """
+    entries = sorted(entries, key=lambda x: x[value_key], reverse=True)
+    top_3_results = []
+    current_rank = 1
+    last_value = None
+
+    for entry in entries:
+        if last_value is None or entry[value_key] != last_value:
+            if len(top_3_results) >= 3 or current_rank > 3:
+                break
+            entry['rank'] = current_rank
+            last_value = entry[value_key]
+            current_rank += 1
+        else:
+            entry['rank'] = current_rank - 1
+        top_3_results.append(entry)
+    return top_3_results
+
+
+def rank_fastest(entries: List[Dict], value_key: str, limit: int = 5) -> List[Dict]:
+    """
+    Aufsteigend sortierte Einträge mit dichten Rängen
+
+    Es werden mindestens `limit` Einträge gesammelt; ein begonnener Gleichstand
+    wird immer vollständig übernommen.
+
+    Args:
+        entries: Bereits nach Wert (und Tiebreaker) aufsteigend sortierte Einträge
+        value_key: Schlüssel des Rekordwerts
+        limit: Mindestanzahl an Einträgen
+
+    Returns:
+        Einträge mit 'rank'
+    """
+    results = []
+    current_rank = 1
+    last_value = None
+    for entry in entries:
+        if last_value is None or entry[value_key] != last_value:
+            if len(results) >= limit:
+                break
+            entry['rank'] = current_rank
+            last_value = entry[value_key]
+            current_rank += 1
+        else:
+            entry['rank'] = current_rank - 1
+        results.append(entry)
+    return results
+
+
+def _winner_loser(game: Game, team1_code: str, team2_code: str) -> Tuple[Optional[str], Optional[str]]:
+    if game.team1_score > game.team2_score:
+        return team1_code, team2_code
+    if game.team2_score > game.team1_score:
+        return team2_code, team1_code
+    return None, None
+
+
+# --- Akkumulatoren ---
+
+class RecordAccumulator:
+    """Basis: add() wird für jedes Spiel in chronologischer Reihenfolge aufgerufen"""
+
+    def add(self, record_game: RecordGame) -> None:
+        raise NotImplementedError
+
+    def result(self) -> Dict[str, List[Dict]]:
+        """Liefert {RecordsPage-Feld: Einträge}"""
+        raise NotImplementedError
+
+
+class GameExtremesAccumulator(RecordAccumulator):
+    """Höchste Siege, torreichste Spiele und häufigste Duelle"""
+
+    def __init__(self):
+        self._victories: List[Dict] = []
+        self._totals: List[Dict] = []
+        self._matchup_counts: Dict[str, int] = defaultdict(int)
+        self._matchup_years: Dict[str, List[int]] = defaultdict(list)
+
+    def add(self, record_game: RecordGame) -> None:
+        if not record_game.completed:
+            return
+        game = record_game.game
+        team1, team2 = record_game.team1_code, record_game.team2_code
+        year = record_game.year or 'Unknown'
+        tournament = record_game.year_obj.name
+
+        if game.team1_score > game.team2_score:
+            winner, winner_score, loser, loser_score = team1, game.team1_score, team2, game.team2_score
+        else:
+            winner, winner_score, loser, loser_score = team2, game.team2_score, team1, game.team1_score
+        self._victories.append({
+            'winner': winner, 'winner_score': winner_score,
+            'loser': loser, 'loser_score': loser_score,
+            'difference': abs(game.team1_score - game.team2_score),
+            'year': year, 'tournament': tournament, 'rank': 0
+        })
+        self._totals.append({
+            'team1': team1, 'team1_score': game.team1_score,
+            'team2': team2, 'team2_score': game.team2_score,
+            'total_goals': game.team1_score + game.team2_score,
+            'year': year, 'tournament': tournament, 'rank': 0
+        })
+
+        if is_code_final(team1) and is_code_final(team2) and team1 != team2:
+            teams = sorted([team1, team2])
+            matchup_key = f"{teams[0]} vs {teams[1]}"
+            self._matchup_counts[matchup_key] += 1
+            self._matchup_years[matchup_key].append(record_game.year or 0)
+
+    def result(self) -> Dict[str, List[Dict]]:
+        return {
+            'highest_victory': rank_top_3(self._victories, 'difference'),
+            'most_goals_game': rank_top_3(self._totals, 'total_goals'),
+            'most_frequent_matchup': self._frequent_matchups(),
+        }
+
+    def _frequent_matchups(self) -> List[Dict]:
+        """Alle Duelle derselben Häufigkeit, bis mindestens 3 Duelle erreicht sind"""
+        top_3_results = []
+        last_count = None
+        for matchup, count in sorted(self._matchup_counts.items(), key=lambda x: x[1], reverse=True):
+            if len(top_3_results) >= 3 and count != last_count:
+                break
+            if last_count is None or count != last_count:
+                rank = len(top_3_results) + 1
+                last_count = count
+            else:
+                rank = top_3_results[-1]['rank']
+
+            years = sorted(y for y in self._matchup_years[matchup] if y > 0)
+            if years:
+                timespan = f"{years[0]} - {years[-1]}" if years[0] != years[-1] else str(years[0])
+            else:
+                timespan = "Unbekannt"
+            team1, team2 = matchup.split(' vs ')
+            top_3_results.append({'team1': team1, 'team2': team2, 'count': count,
+                                  'timespan': timespan, 'rank': rank})
+        return top_3_results
+
+
+class GoalTimingAccumulator(RecordAccumulator):
+    """Schnellste Tore und schnellste Hattricks (alle Spiele, auch ohne Ergebnis)"""
+
+    def __init__(self, players: Dict[int, Player]):
+        self.players = players
+        self._goals: List[Tuple[Tuple[int, int], Dict]] = []
+        self._hattricks: List[Tuple[Tuple[int, int, int], Dict]] = []
+
+    def add(self, record_game: RecordGame) -> None:
+        game = record_game.game
+        if record_game.completed:
+            team1, team2 = record_game.team1_code, record_game.team2_code
+        else:
+            team1, team2 = None, None
+
+        goals_by_scorer: Dict[int, List[Goal]] = defaultdict(list)
+        for goal in record_game.goals:
+            scorer = self.players.get(goal.scorer_id)
+            if scorer is None:
+                continue
+            goals_by_scorer[goal.scorer_id].append(goal)
+
+            if team1 is not None:
+                vs_team = team2 if team1 == goal.team_code else team1
+            else:
+                vs_team = game.team2_code if game.team1_code == goal.team_code else game.team1_code
+            time_seconds = goal_seconds(goal)
+            self._goals.append(((time_seconds, goal.id), {
+                'player': f"{scorer.first_name} {scorer.last_name}",
+                'team': goal.team_code,
+                'minute': goal.minute,
+                'time_seconds': time_seconds,
+                'year': record_game.year,
+                'tournament': record_game.year_obj.name,
+                'vs_team': vs_team,
+                'rank': 0
+            }))
+
+        for scorer_id, game_goals in goals_by_scorer.items():
+            if len(game_goals) < 3:
+                continue
+            game_goals.sort(key=lambda g: (goal_seconds(g), g.minute))
+            duration = goal_seconds(game_goals[2]) - goal_seconds(game_goals[0])
+            player_team, vs_team = self._hattrick_teams(game, game_goals[0].team_code, team1, team2)
+            scorer = self.players[scorer_id]
+            self._hattricks.append(((duration, game.id, scorer_id), {
+                'player': f"{scorer.first_name} {scorer.last_name}",
+                'team': player_team,
+                'first_goal': game_goals[0].minute,
+                'second_goal': game_goals[1].minute,
+                'third_goal': game_goals[2].minute,
+                'duration_seconds': duration,
+                'duration_formatted': format_duration(duration),
+                'year': record_game.year,
+                'tournament': record_game.year_obj.name,
+                'vs_team': vs_team,
+                'rank': 0
+            }))
+
+    @staticmethod
+    def _hattrick_teams(game: Game, player_team: str, team1: Optional[str],
+                        team2: Optional[str]) -> Tuple[str, str]:
+        """(angezeigtes Team, Gegner) - aufgelöste Codes, sonst die Codes des Spiels"""
+        if team1 is not None:
+            if player_team == team1:
+                return team1, team2
+            if player_team == team2:
+                return team2, team1
+        if game.team1_code == player_team:
+            return game.team1_code, game.team2_code
+        if game.team2_code == player_team:
+            return game.team2_code, game.team1_code
+        return player_team, 'Unknown'
+
+    def result(self) -> Dict[str, List[Dict]]:
+        self._goals.sort(key=lambda item: item[0])
+        self._hattricks.sort(key=lambda item: item[0])
+        return {
+            'fastest_goal': rank_fastest([entry for _, entry in self._goals], 'time_seconds'),
+            'fastest_hattrick': rank_fastest([entry for _, entry in self._hattricks], 'duration_seconds'),
+        }
+
+
+class TournamentAccumulator(RecordAccumulator):
+    """
+    Rekorde pro Turnier: Finals, Tore/Strafminuten, Team- und Spieler-Bestwerte
+
+    Es wird pro Jahr gesammelt; die jahresübergreifende Auswertung läuft in der
+    Reihenfolge der übergebenen Jahre. Strafminuten kommen aus `pim_map`
+    (Inhalt von penalty_type_pim, einmal pro Seitenaufbau geladen).
+    """
+
+    def __init__(self, years: List[ChampionshipYear], players: Dict[int, Player], pim_map: Dict[str, int]):
+        self.years = years
+        self.players = players
+        self.pim_map = pim_map
+        self._total_games: Dict[int, int] = defaultdict(int)
+        self._completed_games: Dict[int, int] = defaultdict(int)
+        self._goals: Dict[int, int] = defaultdict(int)
+        self._pim: Dict[int, int] = defaultdict(int)
+        self._gold_games: Dict[int, List[Tuple[str, str, Optional[str]]]] = defaultdict(list)
+        self._team_goals_for: Dict[int, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._team_goals_against: Dict[int, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._team_shutouts: Dict[int, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        # (year_id, player_id) -> [Tore, Assists, Strafminuten, erste Ereignis-ID]
+        self._player_goals: Dict[Tuple[int, int], List[int]] = {}
+        self._player_pim: Dict[Tuple[int, int], List[int]] = {}
+
+    def add(self, record_game: RecordGame) -> None:
+        game = record_game.game
+        year_id = record_game.year_obj.id
+        self._total_games[year_id] += 1
+
+        for goal in record_game.goals:
+            for player_id, goals, assists in ((goal.scorer_id, 1, 0), (goal.assist1_id, 0, 1),
+                                              (goal.assist2_id, 0, 1)):
+                if player_id:
+                    entry = self._player_goals.setdefault((year_id, player_id), [0, 0, goal.id])
+                    entry[0] += goals
+                    entry[1] += assists
+                    entry[2] = min(entry[2], goal.id)
+        for penalty in record_game.penalties:
+            if penalty.player_id:
+                entry = self._player_pim.setdefault((year_id, penalty.player_id), [0, penalty.id])
+                entry[0] += self.pim_map.get(penalty.penalty_type, 0)
+                entry[1] = min(entry[1], penalty.id)
+
+        if not record_game.completed:
+            return
+        team1, team2 = record_game.team1_code, record_game.team2_code
+        self._completed_games[year_id] += 1
+        self._goals[year_id] += game.team1_score + game.team2_score
+        # Unbekannte Straftypen zählen wie in penalty_type_pim 0 Minuten
+        self._pim[year_id] += sum(self.pim_map.get(p.penalty_type, 0) for p in record_game.penalties)
+
+        if game.round == 'Gold Medal Game' and is_code_final(team1) and is_code_final(team2) and team1 != team2:
+            winner, _ = _winner_loser(game, team1, team2)
+            self._gold_games[year_id].append((team1, team2, winner))
+
+        if record_game.year and is_code_final(team1) and is_code_final(team2):
+            self._team_goals_for[year_id][team1] += game.team1_score
+            self._team_goals_for[year_id][team2] += game.team2_score
+            self._team_goals_against[year_id][team1] += game.team2_score
+            self._team_goals_against[year_id][team2] += game.team1_score
+            if game.team2_score == 0:
+                self._team_shutouts[year_id][team1] += 1
+            if game.team1_score == 0:
+                self._team_shutouts[year_id][team2] += 1
+
+    def result(self) -> Dict[str, List[Dict]]:
+        completed_years = [y for y in self.years
+                           if self._total_games[y.id] > 0 and self._completed_games[y.id] == self._total_games[y.id]]
+        result = self._final_records()
+        result.update({
+            'tournament_most_goals': self._metric_extremes(completed_years, 'goals', descending=True),
+            'tournament_least_goals': self._metric_extremes(completed_years, 'goals', descending=False),
+            'tournament_most_penalty_minutes': self._metric_extremes(completed_years, 'pim', descending=True),
+            'tournament_least_penalty_minutes': self._metric_extremes(completed_years, 'pim', descending=False),
+            'most_goals_team_tournament': self._team_extremes(self.years, self._team_goals_for, 'goals', True),
+            'fewest_goals_against_tournament': self._team_extremes(
+                completed_years, self._team_goals_against, 'goals_against', False),
+            'most_shutouts_tournament': self._team_extremes(self.years, self._team_shutouts, 'shutouts', True),
+        })
+        result.update(self._player_records())
+        return result
+
+    def _final_records(self) -> Dict[str, List[Dict]]:
+        """Turniersiege in Folge, Finalteilnahmen und Rekordweltmeister"""
+        year_winners = {}
+        final_appearances: Dict[str, int] = defaultdict(int)
+        final_years: Dict[str, List[int]] = defaultdict(list)
+        championships: Dict[str, int] = defaultdict(int)
+        championship_years: Dict[str, List[int]] = defaultdict(list)
+
+        for year_obj in self.years:
+            for team1, team2, winner in self._gold_games.get(year_obj.id, []):
+                for team in (team1, team2):
+                    final_appearances[team] += 1
+                    if year_obj.year:
+                        final_years[team].append(year_obj.year)
+                if winner:
+                    championships[winner] += 1
+                    if year_obj.year:
+                        championship_years[winner].append(year_obj.year)
+                        year_winners[year_obj.year] = winner
+
+        team_current_streak: Dict[str, int] = defaultdict(int)
+        team_current_years: Dict[str, List[int]] = defaultdict(list)
+        team_max_streak: Dict[str, int] = defaultdict(int)
+        team_max_streak_years: Dict[str, List[int]] = defaultdict(list)
+        for year in sorted(year_winners):
+            winner = year_winners[year]
+            for team in team_current_streak:
+                if team != winner:
+                    team_current_streak[team] = 0
+                    team_current_years[team] = []
+            team_current_streak[winner] += 1
+            team_current_years[winner].append(year)
+            if team_current_streak[winner] > team_max_streak[winner]:
+                team_max_streak[winner] = team_current_streak[winner]
+                team_max_streak_years[winner] = team_current_years[winner][:]
+
+        consecutive = []
+        if team_max_streak:
+            max_streak = max(team_max_streak.values())
+            consecutive = [{'team': team, 'streak': streak, 'years': team_max_streak_years[team]}
+                           for team, streak in team_max_streak.items() if streak == max_streak]
+
+        return {
+            'most_consecutive_tournament_wins': consecutive,
+            'most_final_appearances': [
+                {'team': team, 'appearances': appearances, 'years': sorted(set(final_years.get(team, [])))}
+                for team, appearances in sorted(final_appearances.items(), key=lambda x: x[1], reverse=True)[:TOP_3_DISPLAY]
+            ],
+            'record_champion': [
+                {'team': team, 'championships': count, 'years': sorted(championship_years.get(team, []))}
+                for team, count in sorted(championships.items(), key=lambda x: x[1], reverse=True)[:TOP_3_DISPLAY]
+            ],
+        }
+
+    def _metric_extremes(self, completed_years: List[ChampionshipYear], metric: str,
+                         descending: bool) -> List[Dict]:
+        """Turniere mit den meisten/wenigsten Toren bzw. Strafminuten (nur beendete Turniere)"""
+        rows = []
+        for year_obj in completed_years:
+            games = self._completed_games[year_obj.id]
+            if metric == 'goals':
+                total = self._goals[year_obj.id]
+                rows.append({'tournament': year_obj.name, 'year': year_obj.year, 'total_goals': total,
+                             'games': games, 'goals_per_game': round(total / games, 2) if games > 0 else 0})
+            else:
+                total = self._pim[year_obj.id]
+                rows.append({'tournament': year_obj.name, 'year': year_obj.year, 'total_pim': total,
+                             'games': games, 'pim_per_game': round(total / games, 2) if games > 0 else 0})
+        if not rows:
+            return []
+
+        value_key = 'total_goals' if metric == 'goals' else 'total_pim'
+        rows.sort(key=lambda row: row[value_key], reverse=descending)
+        return [row for row in rows if row[value_key] == rows[0][value_key]]
+
+    @staticmethod
+    def _team_extremes(years: List[ChampionshipYear], values_by_year: Dict[int, Dict[str, int]],
+                       value_key: str, maximum: bool) -> List[Dict]:
+        """Team-Bestwert in einem Turnier; Gleichstände werden alle zurückgegeben"""
+        best = 0 if maximum else None
+        results = []
+        for year_obj in years:
+            for team, value in values_by_year.get(year_obj.id, {}).items():
+                entry = {'team': team, value_key: value, 'tournament': year_obj.name, 'year': year_obj.year}
+                if (value > best) if maximum else (best is None or value < best):
+                    best = value
+                    results = [entry]
+                elif value == best:
+                    results.append(entry)
+        return results
+
+    def _player_records(self) -> Dict[str, List[Dict]]:
+        """Spieler-Bestwerte in einem Turnier (Top 3)"""
+        year_order = {year_obj.id: index for index, year_obj in enumerate(self.years)}
+        years_by_id = {year_obj.id: year_obj for year_obj in self.years}
+
+        def performances(totals: Dict[Tuple[int, int], List[int]], value_key: str, value_of,
+                         skip_zero: bool = True) -> List[Dict]:
+            entries = []
+            for (year_id, player_id), values in sorted(
+                    totals.items(), key=lambda item: (year_order.get(item[0][0], 0), item[1][-1])):
+                value = value_of(values)
+                if skip_zero and value <= 0:
+                    continue
+                player = self.players.get(player_id)
+                year_obj = years_by_id[year_id]
+                entries.append({
+                    'player': f"{player.first_name} {player.last_name}" if player else 'Unknown',
+                    'team': player.team_code if player else 'Unknown',
+                    value_key: value,
+                    'tournament': year_obj.name,
+                    'year': year_obj.year
+                })
+            entries.sort(key=lambda x: x[value_key], reverse=True)
+            return entries[:TOP_3_DISPLAY]
+
+        return {
+            'most_scorers_tournament': performances(self._player_goals, 'points', lambda v: v[0] + v[1]),
+            'most_goals_player_tournament': performances(self._player_goals, 'goals', lambda v: v[0]),
+            'most_assists_player_tournament': performances(self._player_goals, 'assists', lambda v: v[1]),
+            'most_penalty_minutes_tournament': performances(self._player_pim, 'pim', lambda v: v[0], skip_zero=False),
+        }
+
+
+# --- Pipeline ---
+
+# Zeilen pro Fetch beim Streamen von Toren und Strafen
+EVENT_BATCH_SIZE = 1000
+
+
+def record_game_order() -> Tuple:
+    """
+    SQL-Sortierung der Spiele im Strom: Jahr, Datum, Spielnummer (Anstoßzeit und ID bei Gleichstand)
+
+    Tore und Strafen werden mit derselben Sortierung (plus eigener ID) geladen, damit
+    iter_record_games() sie ohne Zwischenspeicher den Spielen zuordnen kann.
+    """
+    return (func.coalesce(ChampionshipYear.year, 0),
+            func.coalesce(func.nullif(Game.date, ''), '1900-01-01'),
+            func.coalesce(Game.game_number, 0),
+            Game.start_time,
+            Game.id)
+
+
+def _events_per_game(game_ids: Iterable[int], events: Iterable) -> Iterator[List]:
+    """Teilt einen in Spielreihenfolge sortierten Ereignis-Strom in eine Liste pro Spiel"""
+    groups = groupby(events, key=attrgetter('game_id'))
+    current = next(groups, None)
+    for game_id in game_ids:
+        if current is not None and current[0] == game_id:
+            yield list(current[1])
+            current = next(groups, None)
+        else:
+            yield []
+
+
+def iter_record_games(years: List[ChampionshipYear], games: List[Game],
+                      goals: Iterable[Goal], penalties: Iterable[Penalty]) -> Iterator[RecordGame]:
+    """
+    Liefert alle Spiele chronologisch (Jahr, Datum, Spielnummer) mit Toren und Strafen
+
+    Die Reihenfolge kommt aus der Datenbank (record_game_order()). Spiele liegen
+    vollständig vor, weil die Turnier-Snapshots alle Spiele eines Jahres brauchen;
+    Tore und Strafen werden beim Durchlauf spielweise aus ihren Strömen entnommen.
+    Abgeschlossene Spiele tragen die aufgelösten Team-Codes aus den Turnier-Snapshots,
+    alle anderen die Codes aus der Datenbank.
+
+    Args:
+        years: Alle ChampionshipYear-Objekte
+        games: Alle Spiele, sortiert nach record_game_order()
+        goals: Alle Tore, sortiert nach record_game_order() und Tor-ID
+        penalties: Alle Strafen, sortiert nach record_game_order() und Strafen-ID
+
+    Yields:
+        RecordGame pro Spiel
+    """
+    games_by_year: Dict[int, List[Game]] = defaultdict(list)
+    for game in games:
+        games_by_year[game.year_id].append(game)
+    resolved_tournaments = TournamentSnapshotService().get_resolved_tournaments(years, games_by_year)
+    years_by_id = {year_obj.id: year_obj for year_obj in years}
+
+    game_ids = [game.id for game in games]
+    for game, game_goals, game_penalties in zip(games, _events_per_game(game_ids, goals),
+                                                _events_per_game(game_ids, penalties)):
+        completed = game.team1_score is not None and game.team2_score is not None
+        if completed:
+            team1_code, team2_code = resolved_tournaments[game.year_id].get_resolved(game)
+        else:
+            team1_code, team2_code = game.team1_code, game.team2_code
+        yield RecordGame(game=game, year_obj=years_by_id[game.year_id], team1_code=team1_code,
+                         team2_code=team2_code, completed=completed,
+                         goals=game_goals, penalties=game_penalties)
+
+
+def compute_records_page() -> RecordsPage:
+    """
+    Berechnet alle Rekorde der Rekorde-Seite mit einem Durchlauf über alle Spiele
+
+    Die Serien-Rekorde liefert StreakRecordService aus dem gespeicherten Zustand.
+
+    Returns:
+        RecordsPage
+    """
+    years = ChampionshipYear.query.all()
+    players = {player.id: player for player in Player.query.all()}
+    pim_map = PenaltyTypePimRepository().get_map()
+    order = record_game_order()
+    games = Game.query.join(ChampionshipYear, Game.year_id == ChampionshipYear.id).order_by(*order).all()
+    goals = (Goal.query.join(Game, Goal.game_id == Game.id)
+             .join(ChampionshipYear, Game.year_id == ChampionshipYear.id)
+             .order_by(*order, Goal.id).yield_per(EVENT_BATCH_SIZE))
+    penalties = (Penalty.query.join(Game, Penalty.game_id == Game.id)
+                 .join(ChampionshipYear, Game.year_id == ChampionshipYear.id)
+                 .order_by(*order, Penalty.id).yield_per(EVENT_BATCH_SIZE))
+
+    accumulators: List[RecordAccumulator] = [
+        GameExtremesAccumulator(),
+        GoalTimingAccumulator(players),
+        TournamentAccumulator(years, players, pim_map),
+    ]
+    for record_game in iter_record_games(years, games, goals, penalties):
+        for accumulator in accumulators:
+            accumulator.add(record_game)
+
+    page = RecordsPage()
+    for accumulator in accumulators:
+        for name, entries in accumulator.result().items():
+            setattr(page, name, entries)
+    for kind, streaks in StreakRecordService().get_streak_records().items():
+        setattr(page, f'longest_{kind}_streak', streaks)
+    return page
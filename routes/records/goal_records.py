@@ -1,112 +1,50 @@
-import re
 from collections import defaultdict
 from models import db, Goal, Player, Game, ChampionshipYear
 from .utils import get_all_resolved_games
-from app.services.core.records_service import RecordsService
+from .engine import goal_seconds, rank_fastest
 from app.services.core.tournament_service import TournamentService
 from app.services.core.game_service import GameService
+from app.services.core.tournament_snapshot_service import TournamentSnapshotService
+from app.repositories.core.records_repository import RecordsRepository
 from app.exceptions import ServiceError, NotFoundError
 
 
 def get_fastest_goal():
-    """Findet die TOP 5 schnellsten Tore (basierend auf Minute)"""
-    def parse_minute(minute_str):
-        if not minute_str:
-            return 999
-        match = re.match(r'(\d+):(\d+)', minute_str)
-        if match:
-            minutes = int(match.group(1))
-            seconds = int(match.group(2))
-            return minutes * 60 + seconds
-        try:
-            return int(minute_str) * 60
-        except:
-            return 999
-    
-    goals = db.session.query(Goal).join(Player, Goal.scorer_id == Player.id).all()
-    resolved_games = get_all_resolved_games()
-    
-    # Erstelle ein Mapping von game_id zu aufgelösten Team-Codes
-    game_id_to_resolved = {}
-    for resolved_game in resolved_games:
-        game_id_to_resolved[resolved_game['game'].id] = {
-            'team1_code': resolved_game['team1_code'], 
-            'team2_code': resolved_game['team2_code']
-        }
-    
+    """
+    Findet die TOP 5 schnellsten Tore (basierend auf Minute)
+
+    Sekunden, Spiel und Turnier liefert eine einzige Query; Gegner werden nur für
+    die gelieferten Tore über die Turnier-Snapshots ihrer Jahre aufgelöst.
+    """
+    fastest_goals = RecordsRepository().get_fastest_goals(limit=5)
+    if not fastest_goals:
+        return []
+
+    years = {entry['championship'].id: entry['championship'] for entry in fastest_goals}
+    resolved_tournaments = TournamentSnapshotService().get_resolved_tournaments(list(years.values()))
+
     goal_times = []
-    for goal in goals:
-        time_seconds = parse_minute(goal.minute)
-        try:
-            game_service = GameService()
-            tournament_service = TournamentService()
-            game = game_service.get_by_id(goal.game_id)
-            year = tournament_service.get_by_id(game.year_id)
-        except (NotFoundError, ServiceError):
-            game = None
-            year = None
-        
-        # Verwende aufgelöste Team-Codes falls verfügbar
-        resolved_teams = game_id_to_resolved.get(goal.game_id)
-        if resolved_teams:
-            team1_code = resolved_teams['team1_code']
-            team2_code = resolved_teams['team2_code']
-            vs_team = team2_code if team1_code == goal.team_code else team1_code
+    for entry in fastest_goals:
+        game = entry['game']
+        championship = entry['championship']
+        if game.team1_score is not None and game.team2_score is not None:
+            team1_code, team2_code = resolved_tournaments[championship.id].get_resolved(game)
         else:
-            # Fallback auf ursprüngliche Logik
-            vs_team = game.team2_code if game and game.team1_code == goal.team_code else (game.team1_code if game else 'Unknown')
-        
+            team1_code, team2_code = game.team1_code, game.team2_code
+        vs_team = team2_code if team1_code == entry['team'] else team1_code
+
         goal_times.append({
-            'player': f"{goal.scorer.first_name} {goal.scorer.last_name}",
-            'team': goal.team_code,
-            'minute': goal.minute,
-            'time_seconds': time_seconds,
-            'year': year.year if year else 'Unknown',
-            'tournament': year.name if year else 'Unknown',
+            'player': entry['player'],
+            'team': entry['team'],
+            'minute': entry['minute'],
+            'time_seconds': entry['time_seconds'],
+            'year': championship.year,
+            'tournament': championship.name,
             'vs_team': vs_team,
             'rank': 0
         })
-    
-    goal_times.sort(key=lambda x: x['time_seconds'])
-    
-    # Dynamische Logik: Sammle maximal 5 Einträge, aber stoppe wenn der nächste Rang bereits 5 Einträge hat
-    results = []
-    current_rank = 1
-    last_time = None
-    rank_counts = {}
-    
-    # Erst alle Ränge zählen
-    temp_rank = 1
-    temp_last_time = None
-    for goal_time in goal_times:
-        if temp_last_time is None or goal_time['time_seconds'] != temp_last_time:
-            current_temp_rank = temp_rank
-            temp_last_time = goal_time['time_seconds']
-            temp_rank += 1
-        else:
-            current_temp_rank = temp_rank - 1
-        
-        if current_temp_rank not in rank_counts:
-            rank_counts[current_temp_rank] = 0
-        rank_counts[current_temp_rank] += 1
-    
-    # Jetzt sammle Ergebnisse mit dynamischer Logik
-    for goal_time in goal_times:
-        if last_time is None or goal_time['time_seconds'] != last_time:
-            goal_time['rank'] = current_rank
-            last_time = goal_time['time_seconds']
-            
-            # Prüfe ob wir bereits 5 Einträge haben und der nächste Rang auch Einträge hat
-            if len(results) >= 5 and current_rank in rank_counts:
-                break
-                
-            current_rank += 1
-        else:
-            goal_time['rank'] = current_rank - 1
-        
-        results.append(goal_time)
-    
-    return results
+
+    return rank_fastest(goal_times, 'time_seconds', limit=5)
 
 
 def get_fastest_hattrick():
@@ -156,19 +94,6 @@ def get_fastest_hattrick():
     
     all_hattricks = []
     
-    def parse_minute(minute_str):
-        if not minute_str:
-            return 999
-        match = re.match(r'(\d+):(\d+)', minute_str)
-        if match:
-            minutes = int(match.group(1))
-            seconds = int(match.group(2))
-            return minutes * 60 + seconds
-        try:
-            return int(minute_str) * 60
-        except:
-            return 999
-    
     def format_duration(duration_seconds):
         """Konvertiert Sekunden in Minuten:Sekunden Format"""
         minutes = duration_seconds // 60
@@ -177,10 +102,10 @@ def get_fastest_hattrick():
     
     for (player_id, game_id), game_goals in player_game_goals.items():
         if len(game_goals) >= 3:
-            game_goals.sort(key=lambda g: parse_minute(g.minute))
+            game_goals.sort(key=goal_seconds)
             
-            first_goal_time = parse_minute(game_goals[0].minute)
-            third_goal_time = parse_minute(game_goals[2].minute)
+            first_goal_time = goal_seconds(game_goals[0])
+            third_goal_time = goal_seconds(game_goals[2])
             duration = third_goal_time - first_goal_time
             
             try:
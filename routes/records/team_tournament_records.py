@@ -2,7 +2,7 @@ from collections import defaultdict
 from models import db, ChampionshipYear
 from utils import is_code_final
 from .utils import get_all_resolved_games
-from app.services.core.records_service import RecordsService
+from app.services.core.tournament_aggregates_service import TournamentAggregatesService
 
 
 def get_most_goals_team_tournament():
@@ -53,17 +53,8 @@ def get_most_goals_team_tournament():
 
 def get_fewest_goals_against_tournament():
     """Wenigste Gegentore eines Teams in einem Turnier - nur beendete Turniere"""
-    from .utils import get_tournament_statistics
-    
-    all_years = db.session.query(ChampionshipYear).all()
-    completed_years = []
-    
-    for year_obj in all_years:
-        tournament_stats = get_tournament_statistics(year_obj)
-        is_completed = (tournament_stats['total_games'] > 0 and 
-                       tournament_stats['completed_games'] == tournament_stats['total_games'])
-        if is_completed:
-            completed_years.append(year_obj)
+    completed_year_ids = TournamentAggregatesService().get_completed_year_ids()
+    completed_years = ChampionshipYear.query.filter(ChampionshipYear.id.in_(completed_year_ids)).all()
     
     if not completed_years:
         return []
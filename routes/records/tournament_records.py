@@ -1,11 +1,9 @@
 from collections import defaultdict
-from models import db, Game, ChampionshipYear, Penalty
-from sqlalchemy import func, case, desc, asc
+from models import ChampionshipYear
 from utils import is_code_final
-from utils.data_validation import calculate_tournament_penalty_minutes
 from constants import TOP_3_DISPLAY
 from .utils import get_all_resolved_games
-from app.services.core.records_service import RecordsService
+from app.services.core.tournament_aggregates_service import TournamentAggregatesService
 
 
 # Helper-Funktionen für Validierung
@@ -239,104 +237,51 @@ def get_record_champion():
 def get_tournament_metric_extremes(metric_type='goals', order='desc'):
     """Generische Funktion für Turnier-Metriken (meiste/wenigste)
     
+    Die Kennzahlen aller Turniere kommen aus einer gruppierten Query des
+    TournamentAggregatesService; berücksichtigt werden nur beendete Turniere.
+    
     Args:
         metric_type: 'goals' oder 'penalties'
         order: 'desc' für meiste, 'asc' für wenigste
     """
-    from .utils import get_tournament_statistics
-    
-    # Hole nur abgeschlossene Turniere
-    all_years = db.session.query(ChampionshipYear).all()
-    completed_years = []
-    
-    for year_obj in all_years:
-        tournament_stats = get_tournament_statistics(year_obj)
-        is_completed = (tournament_stats['total_games'] > 0 and 
-                       tournament_stats['completed_games'] == tournament_stats['total_games'])
-        if is_completed:
-            completed_years.append(year_obj)
+    if metric_type not in ('goals', 'penalties'):
+        raise ValueError(f"Unbekannter metric_type: {metric_type}")
     
-    if not completed_years:
+    aggregates_by_year = TournamentAggregatesService().get_year_aggregates()
+    completed = [aggregates for aggregates in aggregates_by_year.values()
+                 if aggregates.is_completed]
+    if not completed:
         return []
     
-    if metric_type == 'goals':
-        # Berechne Tore pro Turnier
-        tournament_data = db.session.query(
-            ChampionshipYear,
-            func.sum(Game.team1_score + Game.team2_score).label('total_value'),
-            func.count(Game.id).label('games_count')
-        ).join(Game, ChampionshipYear.id == Game.year_id).filter(
-            Game.team1_score.isnot(None),
-            Game.team2_score.isnot(None),
-            ChampionshipYear.id.in_([year.id for year in completed_years])
-        ).group_by(ChampionshipYear.id).order_by(
-            desc('total_value') if order == 'desc' else asc('total_value')
-        ).all()
-        
-        if not tournament_data:
-            return []
-        
-        # Bestimme Extremwert und erstelle Ergebnisse
-        extreme_value = tournament_data[0].total_value
-        results = []
-        
-        for year, total_value, games in tournament_data:
-            if total_value == extreme_value:
-                results.append({
-                    'tournament': year.name,
-                    'year': year.year,
-                    'total_goals': total_value,
-                    'games': games,
-                    'goals_per_game': round(total_value / games, 2) if games > 0 else 0
-                })
-            else:
-                break
-        
-        return results
+    years = {year_obj.id: year_obj for year_obj in
+             ChampionshipYear.query.filter(ChampionshipYear.id.in_([a.year_id for a in completed])).all()}
     
-    elif metric_type == 'penalties':
-        # Berechne Strafminuten pro Turnier
-        tournament_pim_data = []
-        
-        for year_obj in completed_years:
-            # Berechne Strafminuten mit zentraler Funktion
-            total_pim = calculate_tournament_penalty_minutes(year_obj.id, completed_games_only=True)
-            
-            # Anzahl der gespielten Spiele
-            games_count = db.session.query(func.count(Game.id)).filter(
-                Game.year_id == year_obj.id,
-                Game.team1_score.isnot(None),
-                Game.team2_score.isnot(None)
-            ).scalar() or 0
-            
-            if games_count > 0:
-                tournament_pim_data.append({
-                    'tournament': year_obj.name,
-                    'year': year_obj.year,
-                    'total_pim': total_pim,
-                    'games': games_count,
-                    'pim_per_game': round(total_pim / games_count, 2) if games_count > 0 else 0
-                })
-        
-        if not tournament_pim_data:
-            return []
-        
-        # Sortiere nach Extremwert
-        tournament_pim_data.sort(key=lambda x: x['total_pim'], reverse=(order == 'desc'))
-        extreme_value = tournament_pim_data[0]['total_pim']
-        
-        # Gib alle Turniere mit dem Extremwert zurück
-        results = []
-        for data in tournament_pim_data:
-            if data['total_pim'] == extreme_value:
-                results.append(data)
-            else:
-                break
-        
-        return results
+    tournament_data = []
+    for aggregates in completed:
+        year_obj = years[aggregates.year_id]
+        games = aggregates.completed_games
+        if metric_type == 'goals':
+            tournament_data.append({
+                'tournament': year_obj.name,
+                'year': year_obj.year,
+                'total_goals': aggregates.goals,
+                'games': games,
+                'goals_per_game': aggregates.avg_goals_per_game
+            })
+        else:
+            tournament_data.append({
+                'tournament': year_obj.name,
+                'year': year_obj.year,
+                'total_pim': aggregates.penalty_minutes,
+                'games': games,
+                'pim_per_game': aggregates.avg_penalties_per_game
+            })
     
-    else:
-        raise ValueError(f"Unbekannter metric_type: {metric_type}")
+    # Sortiere nach Extremwert und gib alle Turniere mit diesem Wert zurück
+    value_key = 'total_goals' if metric_type == 'goals' else 'total_pim'
+    tournament_data.sort(key=lambda x: x[value_key], reverse=(order == 'desc'))
+    extreme_value = tournament_data[0][value_key]
+    return [data for data in tournament_data if data[value_key] == extreme_value]
 
 
 def get_tournament_with_most_goals():
@@ -12,6 +12,7 @@ from constants import TEAM_ISO_CODES, PRELIM_ROUNDS, PLAYOFF_ROUNDS
 from app.services.core.tournament_service import TournamentService
 from app.services.core.standings_service import StandingsService
 from app.services.core.game_service import GameService
+from app.services.core.tournament_aggregates_service import TournamentAggregatesService
 from app.exceptions import ServiceError
 
 
@@ -31,18 +32,9 @@ def get_medal_tally_data():
         # Hole alle Jahre über Service (eine Query)
         all_years = tournament_service.get_all()
         
-        # Filtere nur abgeschlossene Jahre
-        completed_years = []
-        for year_obj in all_years:
-            try:
-                # Verwende Service für Tournament-Statistiken
-                tournament_stats = tournament_service.get_tournament_statistics(year_obj.id)
-                is_completed = (tournament_stats['total_games'] > 0 and 
-                               tournament_stats['completed_games'] == tournament_stats['total_games'])
-                if is_completed:
-                    completed_years.append(year_obj)
-            except:
-                continue
+        # Filtere nur abgeschlossene Jahre (Kennzahlen aller Jahre aus einer Query)
+        completed_year_ids = set(TournamentAggregatesService().get_completed_year_ids())
+        completed_years = [year_obj for year_obj in all_years if year_obj.id in completed_year_ids]
         
         current_app.logger.info(f"Berechne Medal Tally für {len(completed_years)} abgeschlossene Turniere")
         
@@ -4,6 +4,7 @@ import traceback
 from flask import render_template, request, redirect, url_for, flash, current_app
 from models import db, ChampionshipYear, Game, Penalty
 from utils.fixture_helpers import resolve_fixture_path
+from utils.fixture_registry import get_fixture_registry
 from .summary import calculate_overall_tournament_summary
 from utils import resolve_game_participants
 from constants import TEAM_ISO_CODES, PIM_MAP
@@ -12,6 +13,9 @@ from routes.blueprints import main_bp
 from routes.records.utils import get_tournament_statistics
 # Service Layer imports
 from app.services.core.tournament_service import TournamentService
+from app.services.core.game_service import GameService
+from app.services.core.tournament_aggregates_service import TournamentAggregatesService
+from app.services.utils.event_bus import FixtureReloaded, publish
 from app.exceptions import NotFoundError, ValidationError, BusinessRuleError
 # Import locally to avoid circular imports
 
@@ -115,17 +119,23 @@ def index():
                 game_service = GameService()
                 
                 # Zuerst alle bestehenden Spiele für dieses Turnier löschen
-                existing_games = game_service.get_by_tournament(target_year_obj.id)
+                existing_games = game_service.get_games_by_year(target_year_obj.id)
                 for game in existing_games:
                     game_service.delete(game.id)
                 try:
                     # Tournament-Update direkt (Service hat keine update Methode)
                     target_year_obj.fixture_path = relative_fixture_path
+                    # Neue Spiele und Fixture: Snapshot und Caches verwerfen
+                    publish(FixtureReloaded(year_id=target_year_obj.id))
                     
-                    with open(fixture_path_to_load, 'r', encoding='utf-8') as f:
-                        fixture_data = json.load(f)
-                    
-                    games_from_json = fixture_data.get("schedule", [])
+                    # Über die Registry laden, damit der Index für spätere Requests bereits vorliegt
+                    fixture_registry = get_fixture_registry()
+                    fixture_registry.invalidate(fixture_path_to_load)
+                    fixture_index = fixture_registry.get(fixture_path_to_load)
+                    if fixture_index is None:
+                        # Wie zuvor open(): fehlende Datei landet in der Fehlerbehandlung unten
+                        raise FileNotFoundError(f"Fixture file not found: {fixture_path_to_load}")
+                    games_from_json = fixture_index.schedule
                     games_data_list = []
                     
                     for game_data_item in games_from_json:
@@ -159,9 +169,15 @@ def index():
     # Direkte Datenbankabfrage für Tournament-Liste
     all_years_db = ChampionshipYear.query.order_by(ChampionshipYear.year.asc(), ChampionshipYear.name).all()
     
-    # Statistiken für jedes Tournament hinzufügen
+    # Statistiken für jedes Tournament hinzufügen (Kennzahlen aller Jahre aus einer Query,
+    # Spiele nur für beendete Turniere zur Siegerermittlung)
+    tournament_aggregates = TournamentAggregatesService().get_year_aggregates()
+    completed_year_ids = [year_id for year_id, aggregates in tournament_aggregates.items() if aggregates.is_completed]
+    games_by_year_id = {}
+    for game in Game.query.filter(Game.year_id.in_(completed_year_ids)).all():
+        games_by_year_id.setdefault(game.year_id, []).append(game)
     for year in all_years_db:
-        year.stats = get_tournament_statistics(year)
+        year.stats = get_tournament_statistics(year, tournament_aggregates.get(year.id), games_by_year_id.get(year.id, []))
     
     # Verfügbare Fixture-Dateien finden
     all_found_years = set()
@@ -193,6 +209,6 @@ def index():
     medal_data_by_year = {medal_entry['year_obj'].year: medal_entry for medal_entry in medal_data}
     
     # Gesamtstatistiken berechnen
-    overall_summary = calculate_overall_tournament_summary()
+    overall_summary = calculate_overall_tournament_summary(tournament_aggregates)
 
     return render_template('index.html', all_years=all_years_db, available_fixture_years=sorted_fixture_years, team_iso_codes=TEAM_ISO_CODES, medal_data_by_year=medal_data_by_year, overall_summary=overall_summary)
\ No newline at end of file
@@ -1,9 +1,10 @@
 from flask import request, jsonify, redirect, url_for, flash, current_app
 from models import db, Game, Goal, Player, ShotsOnGoal
 from constants import TEAM_ISO_CODES
-from utils import convert_time_to_seconds, check_game_data_consistency
+from utils import check_game_data_consistency
 from app.services.core.game_service import GameService
-from app.services.core.player_service import PlayerService
+from app.services.core.player_name_service import PlayerNameService
+from app.services.utils.event_bus import GoalAdded, GoalDeleted, publish
 from app.exceptions import NotFoundError, ValidationError, ServiceError
 
 # Import the blueprint from the parent package
@@ -31,15 +32,14 @@ def add_goal(year_id, game_id):
         if not all([new_goal.team_code, new_goal.minute, new_goal.goal_type, new_goal.scorer_id]):
             return jsonify({'success': False, 'message': 'Fehlende Daten für Toreingabe.'}), 400
         db.session.add(new_goal)
+        publish(GoalAdded(year_id=year_id, game_id=game_id, team_codes=(new_goal.team_code,)))
         db.session.commit()
 
-        # Service für Player verwenden
-        player_service = PlayerService()
-        all_players = player_service.get_all()
-        player_cache = {p.id: p for p in all_players} 
+        # Nur Torschütze und Assists auflösen (Namens-Cache wie in game_stats_view)
+        player_cache = PlayerNameService().resolve_for_events([new_goal])
         def get_pname_local(pid):
             p = player_cache.get(pid)
-            return f"{p.first_name} {p.last_name}" if p else "N/A"
+            return p.full_name if p else "N/A"
         
         sog_entries_for_game = ShotsOnGoal.query.filter_by(game_id=game_id).all()
         sog_data_for_check = {}
@@ -63,7 +63,7 @@ def add_goal(year_id, game_id):
             'assist1': get_pname_local(new_goal.assist1_id) if new_goal.assist1_id else None,
             'assist2': get_pname_local(new_goal.assist2_id) if new_goal.assist2_id else None,
             'team_iso': TEAM_ISO_CODES.get(new_goal.team_code.upper()),
-            'time_for_sort': convert_time_to_seconds(new_goal.minute),
+            'time_for_sort': new_goal.time_seconds or 0,
             'scores_fully_match_goals': scores_match
         }
         return jsonify({'success': True, 'message': 'Tor erfolgreich hinzugefügt!', 'goal': goal_data_for_js, 'game_id': game_id})
@@ -99,6 +99,7 @@ def delete_goal(year_id, goal_id):
     
     game_id_resp = game.id
     db.session.delete(goal)
+    publish(GoalDeleted(year_id=year_id, game_id=game_id_resp, team_codes=(goal.team_code,)))
     db.session.commit()
 
     sog_entries_for_game = ShotsOnGoal.query.filter_by(game_id=game_id_resp).all()
@@ -1,9 +1,9 @@
 from flask import request, jsonify, redirect, url_for, flash, current_app
 from models import db, Game, Player, Penalty
 from constants import TEAM_ISO_CODES
-from utils import convert_time_to_seconds
 from app.services.core.game_service import GameService
 from app.services.core.player_service import PlayerService
+from app.services.utils.event_bus import PenaltyAdded, PenaltyDeleted, publish
 from app.exceptions import NotFoundError, ValidationError, ServiceError
 
 # Import the blueprint from the parent package
@@ -30,6 +30,7 @@ def add_penalty(year_id, game_id):
         if not all([new_penalty.team_code, new_penalty.minute_of_game, new_penalty.penalty_type, new_penalty.reason]):
             return jsonify({'success': False, 'message': 'Fehlende Daten für Strafeneingabe.'}), 400
         db.session.add(new_penalty)
+        publish(PenaltyAdded(year_id=year_id, game_id=game_id, team_codes=(new_penalty.team_code,)))
         db.session.commit()
         
         # Service für Player verwenden
@@ -48,7 +49,7 @@ def add_penalty(year_id, game_id):
             'minute_of_game': new_penalty.minute_of_game,
             'penalty_type': new_penalty.penalty_type, 'reason': new_penalty.reason,
             'team_iso': TEAM_ISO_CODES.get(new_penalty.team_code.upper()),
-            'time_for_sort': convert_time_to_seconds(new_penalty.minute_of_game)
+            'time_for_sort': new_penalty.time_seconds or 0
         }
         return jsonify({'success': True, 'message': 'Strafe erfolgreich hinzugefügt!', 'penalty': penalty_data_for_js, 'game_id': game_id})
     except Exception as e:
@@ -83,6 +84,7 @@ def delete_penalty(year_id, penalty_id):
     
     game_id_resp = game.id
     db.session.delete(penalty)
+    publish(PenaltyDeleted(year_id=year_id, game_id=game_id_resp, team_codes=(penalty.team_code,)))
     db.session.commit()
     if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
         return jsonify({'success': True, 'message': 'Penalty deleted.', 'penalty_id': penalty_id, 'game_id': game_id_resp})
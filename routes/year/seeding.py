@@ -3,12 +3,14 @@ import os
 import re
 from flask import request, jsonify, current_app
 from models import db, ChampionshipYear, Game, TeamStats, GameOverrule
-from utils import _apply_head_to_head_tiebreaker, is_code_final
+from utils import _apply_head_to_head_tiebreaker, is_code_final, HeadToHeadIndex
 from utils.fixture_helpers import resolve_fixture_path
+from utils.fixture_registry import get_fixture_registry
 from utils.playoff_resolver import PlayoffResolver
 from app.services.core.tournament_service import TournamentService
 from app.services.core.game_service import GameService
 from app.services.core.standings_service import StandingsService
+from app.services.utils.event_bus import SeedingChanged, publish
 from app.exceptions import NotFoundError, ValidationError, ServiceError
 
 # Import the blueprint from the parent package
@@ -82,6 +84,7 @@ def save_custom_seeding_to_db(year_id, seeding, reason=None):
             )
             db.session.add(overrule)
         
+        publish(SeedingChanged(year_id=year_id, stage='semifinal'))
         db.session.commit()
     except Exception as e:
         current_app.logger.error(f"Error saving custom seeding: {str(e)}")
@@ -160,6 +163,7 @@ def save_custom_qf_seeding_to_db(year_id, seeding, reason=None):
             )
             db.session.add(overrule)
         
+        publish(SeedingChanged(year_id=year_id, stage='quarterfinal'))
         db.session.commit()
     except Exception as e:
         current_app.logger.error(f"Error saving custom QF seeding: {str(e)}")
@@ -227,13 +231,14 @@ def get_semifinal_seeding(year_id):
         standings_by_group = {}
         if teams_stats:
             group_full_names = sorted(list(set(s.group for s in teams_stats.values() if s.group))) 
+            head_to_head = HeadToHeadIndex(prelim_games)
             for full_group_name_key in group_full_names: 
                 current_group_teams = sorted(
                     [s for s in teams_stats.values() if s.group == full_group_name_key],
                     key=lambda x: (x.pts, x.gd, x.gf),
                     reverse=True
                 )
-                current_group_teams = _apply_head_to_head_tiebreaker(current_group_teams, prelim_games)
+                current_group_teams = _apply_head_to_head_tiebreaker(current_group_teams, head_to_head)
                 for i, team_stat_obj in enumerate(current_group_teams):
                     team_stat_obj.rank_in_group = i + 1 
                 
@@ -268,19 +273,10 @@ def get_semifinal_seeding(year_id):
 
         if year_obj.fixture_path and fixture_path_exists:
             try:
-                with open(absolute_fixture_path, 'r', encoding='utf-8') as f:
-                    loaded_fixture_data = json.load(f)
-                
-                schedule_data = loaded_fixture_data.get("schedule", [])
-                for game_data in schedule_data:
-                    round_name = game_data.get("round", "").lower()
-                    game_num = game_data.get("gameNumber")
-                    
-                    if "quarterfinal" in round_name: 
-                        qf_game_numbers.append(game_num)
-                    elif "semifinal" in round_name: 
-                        sf_game_numbers.append(game_num)
-                sf_game_numbers.sort()
+                fixture_index = get_fixture_registry().get(absolute_fixture_path)
+                if fixture_index:
+                    qf_game_numbers = list(fixture_index.qf_game_numbers)
+                    sf_game_numbers = list(fixture_index.sf_game_numbers)
             except Exception as e: 
                 current_app.logger.error(f"Could not parse fixture {year_obj.fixture_path}. Error: {e}") 
                 if year_obj.year == 2025: 
@@ -477,6 +473,7 @@ def reset_semifinal_seeding(year_id):
         overrule = GameOverrule.query.filter_by(game_id=special_game_id).first()
         if overrule:
             db.session.delete(overrule)
+            publish(SeedingChanged(year_id=year_id, stage='semifinal'))
             db.session.commit()
 
         return jsonify({
@@ -559,13 +556,14 @@ def get_quarterfinal_seeding(year_id):
         standings_by_group = {}
         if teams_stats:
             group_full_names = sorted(list(set(s.group for s in teams_stats.values() if s.group))) 
+            head_to_head = HeadToHeadIndex(prelim_games)
             for full_group_name_key in group_full_names: 
                 current_group_teams = sorted(
                     [s for s in teams_stats.values() if s.group == full_group_name_key],
                     key=lambda x: (x.pts, x.gd, x.gf),
                     reverse=True
                 )
-                current_group_teams = _apply_head_to_head_tiebreaker(current_group_teams, prelim_games)
+                current_group_teams = _apply_head_to_head_tiebreaker(current_group_teams, head_to_head)
                 for i, team_stat_obj in enumerate(current_group_teams):
                     team_stat_obj.rank_in_group = i + 1 
                 
@@ -724,6 +722,7 @@ def reset_quarterfinal_seeding(year_id):
         overrule = GameOverrule.query.filter_by(game_id=special_game_id).first()
         if overrule:
             db.session.delete(overrule)
+            publish(SeedingChanged(year_id=year_id, stage='quarterfinal'))
             db.session.commit()
 
         return jsonify({
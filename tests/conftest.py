@@ -2,12 +2,20 @@
 Shared test fixtures and configuration for PlayoffResolver tests.
 """
 
+import os
+
+# Vor dem ersten Import von app.*: das Modul-App-Objekt aus app.py nutzt sonst die mitgelieferte Datenbank
+os.environ.setdefault('IIHF_DATABASE_URI', 'sqlite://')
+
 import pytest
+from contextlib import contextmanager
+from types import SimpleNamespace
 from flask import Flask
+from sqlalchemy import event
 from models import db, ChampionshipYear, Game, TeamStats
 from unittest.mock import Mock
+from app.services.utils.cache_manager import invalidate_all_caches
 import tempfile
-import os
 from constants import (
     QUARTERFINAL_1, QUARTERFINAL_2, QUARTERFINAL_3, QUARTERFINAL_4,
     SEMIFINAL_1, SEMIFINAL_2, BRONZE_MEDAL, GOLD_MEDAL
@@ -28,11 +36,49 @@ def app():
     
     with app.app_context():
         db.create_all()
+        # Service-Caches (inkl. Spielernamen) dürfen keine Einträge aus vorherigen Tests enthalten
+        invalidate_all_caches()
         yield app
         db.session.remove()
         db.drop_all()
 
 
+@pytest.fixture
+def count_queries(app):
+    """Context manager collecting the SQL statements of its block: `with count_queries() as statements:`."""
+    @contextmanager
+    def counter():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db.engine
+        event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+    return counter
+
+
+@pytest.fixture
+def add_game(app):
+    """Factory adding a game to the session: add_game(year, number, round_name, team1, team2, score1, score2)."""
+    def factory(year, game_number, round_name, team1_code, team2_code, team1_score=None, team2_score=None,
+                result_type='REG', **fields):
+        fields.setdefault('date', '2024-05-10')
+        fields.setdefault('start_time', '16:20')
+        game = Game(year_id=year.id, game_number=game_number, round=round_name,
+                    **game_fields(team1_code, team2_code, team1_score, team2_score, result_type, **fields))
+        db.session.add(game)
+        db.session.flush()
+        return game
+
+    return factory
+
+
 @pytest.fixture
 def client(app):
     """Create a test client for the Flask application."""
@@ -216,6 +262,31 @@ def mock_flask_app_context():
 
 
 # Helper functions for tests
+# Points (winner, loser) per result type for played test games
+GAME_POINTS = {'REG': (3, 0), 'OT': (2, 1), 'SO': (2, 1)}
+
+
+def game_fields(team1_code, team2_code, team1_score=None, team2_score=None, result_type='REG', **fields):
+    """Attributes of a test game; result type and points are only set once it has been played."""
+    attributes = dict(team1_code=team1_code, team2_code=team2_code,
+                      team1_score=team1_score, team2_score=team2_score, result_type=None)
+    if team1_score is not None and team2_score is not None:
+        if team1_score == team2_score:
+            points = (1, 1)
+        else:
+            winner, loser = GAME_POINTS[result_type]
+            points = (winner, loser) if team1_score > team2_score else (loser, winner)
+        attributes.update(result_type=result_type, team1_points=points[0], team2_points=points[1])
+    attributes.update(fields)
+    return attributes
+
+
+def make_game(team1_code, team2_code, team1_score=None, team2_score=None, result_type='REG', **fields):
+    """Unsaved game stand-in (SimpleNamespace) for tests of pure functions."""
+    fields.setdefault('round', 'Preliminary Round')
+    return SimpleNamespace(**game_fields(team1_code, team2_code, team1_score, team2_score, result_type, **fields))
+
+
 def create_game(game_number, round_name, team1_code, team2_code, 
                 team1_score=None, team2_score=None, year_id=2024):
     """Helper to create a game object."""
@@ -0,0 +1,73 @@
+"""
+Tests für den AllTimeStandingsService (Single-Pass All-Time Standings)
+"""
+
+import pytest
+from unittest.mock import patch
+
+from models import db, ChampionshipYear
+from app.services.core import AllTimeStandingsService
+import utils.tournament_resolution as tournament_resolution
+
+
+@pytest.fixture
+def two_tournaments(app, add_game):
+    y1 = ChampionshipYear(name='IIHF 2023', year=2023)
+    y2 = ChampionshipYear(name='IIHF 2024', year=2024)
+    db.session.add_all([y1, y2])
+    db.session.flush()
+
+    add_game(y1, 1, 'Preliminary Round', 'CAN', 'USA', 3, 1, group='Group A')
+    add_game(y1, 2, 'Preliminary Round', 'CAN', 'GER', 2, 1, 'OT', group='Group A')
+    add_game(y1, 3, 'Preliminary Round', 'USA', 'GER', 4, 0, group='Group A')
+    add_game(y1, 57, 'Quarterfinals', 'USA', 'CAN', 1, 2, 'SO')
+
+    add_game(y2, 1, 'Preliminary Round', 'GER', 'USA', 5, 2, group='Group B')
+    add_game(y2, 2, 'Preliminary Round', 'CAN', 'USA', None, None, group='Group B')
+    add_game(y2, 64, 'Gold Medal Game', 'W(61)', 'W(62)')
+    db.session.commit()
+    return y1, y2
+
+
+class TestAllTimeStandingsService:
+    """Test suite for AllTimeStandingsService"""
+
+    def test_all_filter_aggregates_over_years(self, two_tournaments):
+        standings = AllTimeStandingsService().calculate_all_time_standings('all')
+        by_team = {s.team_code: s for s in standings}
+
+        assert set(by_team) == {'CAN', 'USA', 'GER'}
+        can = by_team['CAN']
+        assert (can.gp, can.w, can.otw, can.sow, can.gf, can.ga, can.pts) == (3, 1, 1, 1, 7, 3, 7)
+        assert can.years_participated == {2023}
+
+        usa = by_team['USA']
+        assert (usa.gp, usa.w, usa.l, usa.sol, usa.pts) == (4, 1, 2, 1, 4)
+        assert usa.years_participated == {2023, 2024}
+
+        assert [s.team_code for s in standings] == ['CAN', 'USA', 'GER']
+
+    def test_preliminary_and_playoff_filters(self, two_tournaments):
+        service = AllTimeStandingsService()
+        prelim = {s.team_code: s for s in service.calculate_all_time_standings('preliminary')}
+        playoffs = {s.team_code: s for s in service.calculate_all_time_standings('playoffs')}
+
+        assert prelim['CAN'].gp == 2
+        assert prelim['USA'].gp == 3
+        assert set(playoffs) == {'CAN', 'USA'}
+        assert playoffs['CAN'].sow == 1
+        assert playoffs['USA'].sol == 1
+
+    def test_invalid_filter_falls_back_to_all(self, two_tournaments):
+        service = AllTimeStandingsService()
+        invalid = service.calculate_all_time_standings('bogus')
+        assert [s.team_code for s in invalid] == [s.team_code for s in service.calculate_all_time_standings('all')]
+
+    def test_each_year_is_resolved_once_for_all_filters(self, two_tournaments):
+        service = AllTimeStandingsService()
+        with patch('app.services.core.tournament_snapshot_service.resolve_tournament',
+                   wraps=tournament_resolution.resolve_tournament) as resolve:
+            for game_type in ('all', 'preliminary', 'playoffs'):
+                service.calculate_all_time_standings(game_type)
+
+        assert resolve.call_count == 2
@@ -0,0 +1,47 @@
+"""
+Tests für die Migration beim App-Start (create_app) und das Modul-App-Objekt
+"""
+
+import hashlib
+import os
+import shutil
+
+from sqlalchemy import inspect
+
+from models import db, Goal, PenaltyTypePim
+from app import app as wsgi_app, create_app
+
+BUNDLED_DB = os.path.join(os.path.dirname(__file__), '..', 'data', 'iihf_data.db')
+
+
+def _sha1(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class TestAppStartup:
+    """Test suite for create_app and the module-level WSGI app"""
+
+    def test_start_migrates_an_old_database_once(self, tmp_path):
+        db_copy = tmp_path / 'iihf_data.db'
+        shutil.copyfile(BUNDLED_DB, db_copy)
+        config = {'SQLALCHEMY_DATABASE_URI': f'sqlite:///{db_copy}', 'UPLOAD_FOLDER': str(tmp_path / 'fixtures')}
+
+        app = create_app(config)
+        with app.app_context():
+            inspector = inspect(db.engine)
+            assert {'tournament_snapshot', 'penalty_type_pim', 'game_team_boxscore'} <= set(inspector.get_table_names())
+            assert 'time_seconds' in {column['name'] for column in inspector.get_columns('goal')}
+            assert PenaltyTypePim.query.count() > 0
+            assert Goal.query.filter(Goal.minute != '', Goal.time_seconds.is_(None)).count() == 0
+            db.engine.dispose()
+
+        # Ein zweiter Start ändert die bereits migrierte Datenbank nicht
+        migrated = _sha1(db_copy)
+        with create_app(config).app_context():
+            db.engine.dispose()
+        assert _sha1(db_copy) == migrated
+
+    def test_module_app_does_not_use_the_bundled_database(self):
+        assert wsgi_app.config['SQLALCHEMY_DATABASE_URI'] == os.environ['IIHF_DATABASE_URI']
+        assert 'iihf_data.db' not in wsgi_app.config['SQLALCHEMY_DATABASE_URI']
@@ -0,0 +1,195 @@
+"""
+Tests für den begrenzten LRU-CacheManager und den cached-Decorator
+"""
+
+import multiprocessing
+from unittest.mock import patch
+
+import pytest
+
+from models import ChampionshipYear
+from app.services.core import GameService, TournamentService
+from app.services.utils.cache_backends import MemoryCacheBackend, SQLiteCacheBackend
+from app.services.utils.cache_manager import (
+    ALL_YEARS_TAG, MISSING, CacheManager, CacheableService, cached, configure_cache, get_global_cache
+)
+
+
+class _Service(CacheableService):
+    def __init__(self):
+        super().__init__()
+        self.cache_manager = CacheManager()
+        self.calls = 0
+
+    @cached(ttl=60, key_prefix="standings:group")
+    def group_standings(self, year_id, group=None):
+        self.calls += 1
+        return None
+
+    @cached(ttl=60, key_prefix="team:all_time_stats")
+    def all_time_stats(self, team_code):
+        self.calls += 1
+        return {'team': team_code}
+
+
+class TestCacheManager:
+    """Test suite for CacheManager"""
+
+    def test_lru_eviction_by_entry_budget(self):
+        cache = CacheManager(max_entries=2)
+        cache.set('game:a', 1)
+        cache.set('game:b', 2)
+        assert cache.get('game:a') == 1  # a wird zuletzt genutzt
+        cache.set('game:c', 3)
+
+        assert cache.get('game:b') is None
+        assert cache.get('game:a') == 1
+        stats = cache.get_stats()
+        assert stats['entries'] == 2
+        assert stats['evictions'] == 1
+        assert stats['namespaces']['game']['evictions'] == 1
+
+    def test_byte_budget_is_enforced(self):
+        cache = CacheManager(max_bytes=2000)
+        for i in range(10):
+            cache.set(f'records:{i}', 'x' * 500)
+
+        assert cache.get_stats()['bytes'] <= 2000
+        assert cache.get('records:9') == 'x' * 500
+        assert cache.get('records:0') is None
+
+        cache.set('records:huge', 'x' * 5000)
+        assert cache.get('records:huge') is None
+
+    def test_none_is_cacheable_with_sentinel(self):
+        cache = CacheManager()
+        cache.set('player:none', None)
+        assert cache.get('player:none', MISSING) is None
+        assert cache.get('player:unknown', MISSING) is MISSING
+
+    def test_memory_backend_returns_copies(self, app):
+        cache = CacheManager()
+        year = ChampionshipYear(name='IIHF 2024', year=2024)
+        standings = {'CAN': {'pts': 3, 'games': [1]}, 'year': year}
+        cache.set('standings:a', standings)
+        standings['CAN']['pts'] = 6
+
+        cached_value = cache.get('standings:a')
+        cached_value['CAN']['games'].append(2)
+        assert cache.get('standings:a')['CAN'] == {'pts': 3, 'games': [1]}
+        # ORM-Instanzen bleiben an die Session gebunden und werden nicht kopiert
+        assert cache.get('standings:a')['year'] is year
+
+    def test_tag_invalidation_respects_namespaces(self):
+        cache = CacheManager()
+        cache.set('standings:group:1', 'a', tags=('year:1',))
+        cache.set('standings:group:2', 'b', tags=('year:2',))
+        cache.set('player:leaders:1', 'c', tags=('year:1',))
+        cache.set('records:all_time', 'd')
+
+        assert cache.invalidate_tags('year:1', namespaces=('standings',)) == 1
+        assert cache.get('standings:group:1') is None
+        assert cache.get('player:leaders:1') == 'c'
+        assert cache.get('standings:group:2') == 'b'
+
+        assert cache.invalidate_tags(ALL_YEARS_TAG) == 1
+        assert cache.get('records:all_time') is None
+
+    def test_expired_entries_are_swept(self):
+        with patch('app.services.utils.cache_manager.time.time', return_value=1000.0):
+            cache = CacheManager(sweep_interval=10)
+            cache.set('game:old', 1, ttl=5)
+        with patch('app.services.utils.cache_manager.time.time', return_value=1020.0):
+            cache.set('game:new', 2, ttl=5)
+            assert 'game:old' not in cache.backend.entries
+            assert cache.get_stats()['bytes'] == cache.backend.entries['game:new']['size']
+
+
+def _write_from_other_process(path):
+    CacheManager(backend=SQLiteCacheBackend(path)).set('records:from_child', {'pid': 'child'}, tags=('year:3',))
+
+
+class TestCacheBackends:
+    """Shared in-process and cross-process backends"""
+
+    def test_sqlite_backend_is_shared_between_processes(self, tmp_path):
+        path = str(tmp_path / 'cache.sqlite3')
+        cache = CacheManager(backend=SQLiteCacheBackend(path))
+
+        process = multiprocessing.get_context('fork').Process(target=_write_from_other_process, args=(path,))
+        process.start()
+        process.join(10)
+
+        assert cache.get('records:from_child') == {'pid': 'child'}
+        assert cache.invalidate_tags('year:3', namespaces=('records',)) == 1
+        assert CacheManager(backend=SQLiteCacheBackend(path)).get('records:from_child', MISSING) is MISSING
+
+    def test_sqlite_backend_lru_budget_and_pattern_invalidation(self, tmp_path):
+        cache = CacheManager(backend=SQLiteCacheBackend(str(tmp_path / 'cache.sqlite3'), max_entries=2))
+        cache.set('team:a', None)
+        cache.set('team:b', 2)
+        assert cache.get('team:a', MISSING) is None
+        cache.set('team:c', 3)
+
+        assert cache.get('team:b', MISSING) is MISSING
+        assert cache.get_stats()['namespaces']['team']['evictions'] == 1
+
+        cache.invalidate('team:')
+        assert cache.get_stats()['entries'] == 0
+
+    def test_shared_backends_skip_orm_instances(self, app):
+        year = ChampionshipYear(name='IIHF 2024', year=2024)
+        shared = CacheManager(backend=MemoryCacheBackend(shared=True))
+        private = CacheManager()
+
+        shared.set('tournament:year', {'year': year})
+        private.set('tournament:year', {'year': year})
+
+        assert shared.get('tournament:year', MISSING) is MISSING
+        assert private.get('tournament:year')['year'] is year
+
+    def test_memory_backend_gives_each_service_its_own_cache(self, app):
+        configure_cache('memory')
+        assert GameService().cache_manager is not get_global_cache()
+        assert TournamentService().cache_manager is not GameService().cache_manager
+
+    def test_configure_cache_swaps_global_backend(self, tmp_path, app):
+        original_backend = get_global_cache().backend
+        try:
+            cache = configure_cache('sqlite', str(tmp_path / 'cache.sqlite3'))
+            assert cache is get_global_cache()
+            assert isinstance(cache.backend, SQLiteCacheBackend)
+            # Nur das prozessübergreifende Backend wird zwischen Services (Requests) geteilt
+            assert GameService().cache_manager is cache
+            with pytest.raises(ValueError):
+                configure_cache('redis')
+        finally:
+            get_global_cache().backend = original_backend
+
+
+class TestCachedDecorator:
+    """Test suite for the cached decorator"""
+
+    def test_cached_none_results_are_hits(self):
+        service = _Service()
+        assert service.group_standings(1) is None
+        assert service.group_standings(1) is None
+        assert service.calls == 1
+        assert service.get_cache_stats()['namespaces']['standings'] == {'hits': 1, 'misses': 1, 'evictions': 0}
+
+    def test_scope_tags_are_derived_from_arguments(self):
+        service = _Service()
+        service.group_standings(1)
+        service.group_standings(year_id=2, group='Group A')
+        service.all_time_stats('CAN')
+
+        service.invalidate_cache_tags('year:1')
+        service.group_standings(1)
+        service.group_standings(year_id=2, group='Group A')
+        assert service.calls == 4
+
+        service.invalidate_cache_tags('team:CAN')
+        service.all_time_stats('CAN')
+        assert service.calls == 5
+        entry = next(e for k, e in service.cache_manager.backend.entries.items() if k.startswith('team:'))
+        assert entry['tags'] == {'team:CAN', ALL_YEARS_TAG}
@@ -0,0 +1,105 @@
+"""
+Tests für die Batch-Prüfung der Datenkonsistenz (DataAuditService, Tabelle game_data_audit)
+"""
+
+import json
+
+import pytest
+
+from models import db, ChampionshipYear, Game, GameDataAudit, Goal, Player, ShotsOnGoal
+from app.services.core import DataAuditService
+
+
+@pytest.fixture
+def audited_year(app):
+    """Turnier mit einem vollständig erfassten und einem inkonsistenten Spiel"""
+    year = ChampionshipYear(name='IIHF 2024', year=2024)
+    player = Player(team_code='CAN', first_name='Connor', last_name='McDavid')
+    db.session.add_all([year, player])
+    db.session.flush()
+    complete = Game(year_id=year.id, date='2024-05-10', round='Preliminary Round', group='A', game_number=1,
+                    team1_code='CAN', team2_code='FIN', team1_score=1, team2_score=0, result_type='REG',
+                    team1_points=3, team2_points=0)
+    # Ergebnis 2:0, aber nur ein Tor erfasst
+    incomplete = Game(year_id=year.id, date='2024-05-11', round='Preliminary Round', group='A', game_number=2,
+                      team1_code='SWE', team2_code='USA', team1_score=2, team2_score=0, result_type='REG',
+                      team1_points=3, team2_points=0)
+    db.session.add_all([complete, incomplete])
+    db.session.flush()
+    db.session.add_all([Goal(game_id=game.id, team_code=game.team1_code, minute='12:00', goal_type='REG',
+                             scorer_id=player.id) for game in (complete, incomplete)])
+    db.session.add_all([ShotsOnGoal(game_id=complete.id, team_code=team_code, period=period, shots=10)
+                        for team_code in ('CAN', 'FIN') for period in (1, 2, 3)])
+    db.session.commit()
+    return year, complete, incomplete, player
+
+
+class TestDataAuditService:
+    """Test suite for DataAuditService"""
+
+    def test_audit_year_stores_findings_and_skips_unchanged_games(self, audited_year):
+        year, complete, incomplete, _ = audited_year
+        service = DataAuditService()
+
+        year_audit = service.audit_year(year)
+        assert (year_audit.games, year_audit.checked) == (2, 2)
+        assert [finding['game_id'] for finding in year_audit.findings] == [incomplete.id]
+        assert year_audit.findings[0]['warnings'] == [
+            f"Game {incomplete.id}: Recorded goals (1-0) don't match scores (2-0)"]
+        stored = GameDataAudit.query.filter_by(game_id=incomplete.id).one()
+        assert not stored.scores_fully_match_data and json.loads(stored.warnings) == year_audit.findings[0]['warnings']
+
+        year_audit = service.audit_year(year)
+        assert (year_audit.checked, year_audit.skipped, len(year_audit.findings)) == (0, 2, 1)
+        assert service.audit_year(year, force=True).checked == 2
+
+    def test_changed_game_is_checked_again(self, audited_year):
+        year, complete, incomplete, player = audited_year
+        service = DataAuditService()
+        service.audit_year(year)
+
+        db.session.add(Goal(game_id=incomplete.id, team_code='SWE', minute='45:00', goal_type='REG',
+                            scorer_id=player.id))
+        db.session.commit()
+
+        year_audit = service.audit_year(year)
+        assert (year_audit.checked, year_audit.findings) == (1, [])
+        assert GameDataAudit.query.filter_by(game_id=incomplete.id).one().scores_fully_match_data
+
+        # Unveränderte Spiele liefern den gespeicherten Befund ohne erneute Prüfung
+        audit = GameDataAudit.query.filter_by(game_id=complete.id).one()
+        audit.warnings = json.dumps(['stored'])
+        db.session.commit()
+        assert service.audit_year(year).findings[0]['warnings'] == ['stored']
+
+    def test_report_and_removed_games(self, audited_year):
+        year, complete, incomplete, _ = audited_year
+        service = DataAuditService()
+
+        report = service.build_report(service.audit_all(year=2024))
+        assert (report['games'], report['games_with_warnings']) == (2, 1)
+        assert report['years'][0]['findings'][0]['team1_code'] == 'SWE'
+        assert service.audit_all(year=1990) == []
+
+        db.session.delete(incomplete)
+        db.session.commit()
+        service.audit_year(year)
+        assert [audit.game_id for audit in GameDataAudit.query.all()] == [complete.id]
+
+    def test_read_paths_do_not_store_findings(self, audited_year):
+        year, complete, incomplete, player = audited_year
+        service = DataAuditService()
+
+        stored_audit = service.get_stored_audit(year)
+        assert (stored_audit.games, stored_audit.unaudited, stored_audit.findings) == (2, 2, [])
+
+        service.audit_year(year)
+        db.session.add(Goal(game_id=incomplete.id, team_code='SWE', minute='45:00', goal_type='REG',
+                            scorer_id=player.id))
+        db.session.commit()
+
+        # Der Bericht zeigt den Stand des letzten Prüflaufs, ohne neu zu prüfen oder zu speichern
+        stored_audit = service.get_stored_audit(year)
+        assert stored_audit.unaudited == 0
+        assert [finding['game_id'] for finding in stored_audit.findings] == [incomplete.id]
+        assert not GameDataAudit.query.filter_by(game_id=incomplete.id).one().scores_fully_match_data
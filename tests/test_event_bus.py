@@ -0,0 +1,142 @@
+"""
+Tests für den EventBus und die Event-basierte Cache-/Snapshot-Invalidierung
+"""
+
+import pytest
+
+from models import db, ChampionshipYear, Game, TournamentSnapshot
+from app.services.core import AllTimeStandingsService, GameService, TournamentSnapshotService
+from app.services.utils.cache_manager import CacheManager, get_global_cache
+from app.services.utils.event_bus import (
+    EventBus, DomainEvent, GameScoreChanged, GoalAdded, SeedingChanged, get_event_bus
+)
+
+
+@pytest.fixture
+def year_with_game(app):
+    year = ChampionshipYear(name='IIHF 2024', year=2024)
+    db.session.add(year)
+    db.session.flush()
+    game = Game(year_id=year.id, date='2024-05-10', start_time='16:20', round='Preliminary Round',
+                group='Group A', game_number=1, team1_code='CAN', team2_code='USA')
+    db.session.add(game)
+    db.session.commit()
+    return year, game
+
+
+class TestEventBus:
+    """Test suite for EventBus"""
+
+    def test_handlers_receive_subscribed_and_derived_events(self):
+        bus = EventBus()
+        specific, generic = [], []
+        bus.subscribe(GameScoreChanged, specific.append)
+        bus.subscribe(DomainEvent, generic.append)
+
+        score_event = GameScoreChanged(year_id=1, game_id=7, team_codes=('CAN', 'USA'))
+        goal_event = GoalAdded(year_id=1, game_id=7, team_codes=('CAN',))
+        bus.publish(score_event)
+        bus.publish(goal_event)
+
+        assert specific == [score_event]
+        assert generic == [score_event, goal_event]
+        assert bus.published_count == 2
+
+    def test_handler_is_called_once_and_can_unsubscribe(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe((GameScoreChanged, DomainEvent), received.append)
+        bus.subscribe(GameScoreChanged, received.append)
+
+        bus.publish(GameScoreChanged(year_id=1))
+        assert len(received) == 1
+
+        bus.unsubscribe((GameScoreChanged, DomainEvent), received.append)
+        bus.publish(GameScoreChanged(year_id=1))
+        assert len(received) == 1
+
+    def test_handler_errors_propagate_to_publisher(self):
+        bus = EventBus()
+
+        def failing_handler(event):
+            raise RuntimeError('boom')
+
+        bus.subscribe(SeedingChanged, failing_handler)
+        with pytest.raises(RuntimeError):
+            bus.publish(SeedingChanged(year_id=1, stage='quarterfinal'))
+
+    def test_after_commit_handlers_wait_for_commit(self, app):
+        bus = EventBus()
+        received = []
+        bus.subscribe(GameScoreChanged, received.append, after_commit=True)
+
+        committed_event = GameScoreChanged(year_id=1)
+        bus.publish(committed_event)
+        assert received == []
+        db.session.commit()
+        assert received == [committed_event]
+
+        # Zurückgerollte Schreibvorgänge invalidieren nichts
+        bus.publish(GameScoreChanged(year_id=2))
+        db.session.rollback()
+        db.session.commit()
+        assert received == [committed_event]
+
+
+class TestEventDrivenInvalidation:
+    """Write paths publish events that clear caches and snapshots"""
+
+    def test_score_update_clears_service_caches(self, year_with_game):
+        year, game = year_with_game
+        standings_service = AllTimeStandingsService()
+        standings_service.calculate_all_filters()
+        other_cache = CacheManager()
+        other_cache.set('records:tournament:abc', 'stale')
+        other_cache.set('player:career_totals:abc', 'kept')
+
+        GameService().update_game_score(game.id, 3, 1, 'REG')
+
+        assert standings_service.cache_manager.get_stats()['entries'] == 0
+        assert other_cache.get('records:tournament:abc') is None
+        assert other_cache.get('player:career_totals:abc') == 'kept'
+        assert standings_service.calculate_all_time_standings()[0].team_code == 'CAN'
+
+    def test_shared_cache_refilled_before_commit_is_cleared(self, year_with_game):
+        year, _ = year_with_game
+        shared_cache = get_global_cache()
+
+        get_event_bus().publish(GameScoreChanged(year_id=year.id))
+        # Ein anderer Worker liest vor dem Commit noch die alten Zeilen
+        shared_cache.set('records:tournament:abc', 'stale')
+        db.session.commit()
+        assert shared_cache.get('records:tournament:abc') is None
+
+        shared_cache.set('records:tournament:abc', 'current')
+        get_event_bus().publish(GameScoreChanged(year_id=year.id))
+        db.session.rollback()
+        assert shared_cache.get('records:tournament:abc') == 'current'
+
+    def test_seeding_event_drops_only_that_years_snapshot(self, year_with_game):
+        year, _ = year_with_game
+        other_year = ChampionshipYear(name='IIHF 2025', year=2025)
+        db.session.add(other_year)
+        db.session.commit()
+
+        snapshot_service = TournamentSnapshotService()
+        snapshot_service.get_resolved_tournament(year)
+        snapshot_service.get_resolved_tournament(other_year)
+
+        get_event_bus().publish(SeedingChanged(year_id=year.id))
+        db.session.commit()
+
+        assert TournamentSnapshot.query.filter_by(year_id=year.id).count() == 0
+        assert TournamentSnapshot.query.filter_by(year_id=other_year.id).count() == 1
+
+    def test_goal_event_keeps_snapshot(self, year_with_game):
+        year, game = year_with_game
+        TournamentSnapshotService().get_resolved_tournament(year)
+
+        get_event_bus().publish(GoalAdded(year_id=year.id, game_id=game.id, team_codes=('CAN',)))
+        db.session.commit()
+
+        assert TournamentSnapshot.query.filter_by(year_id=year.id).count() == 1
@@ -0,0 +1,86 @@
+"""
+Tests für die FixtureRegistry (einmal geparste Fixture-Dateien mit Spielplan-Index)
+"""
+
+import json
+import os
+
+import pytest
+
+from models import db, ChampionshipYear
+from app.services.core import GameService
+from utils.fixture_registry import FixtureRegistry, get_fixture_registry
+from utils.tournament_resolution import parse_fixture_playoff_numbers
+
+FIXTURE = {
+    'hosts': ['CZE'],
+    'schedule': [
+        {'gameNumber': 1, 'round': 'Preliminary Round', 'team1': 'CAN', 'team2': 'FIN'},
+        {'gameNumber': 57, 'round': 'Quarterfinals', 'team1': 'A1', 'team2': 'B4'},
+        {'gameNumber': 58, 'round': 'Quarterfinals', 'team1': 'B2', 'team2': 'A3'},
+        {'gameNumber': 62, 'round': 'Semifinals', 'team1': 'seed2', 'team2': 'seed3'},
+        {'gameNumber': 61, 'round': 'Semifinals', 'team1': 'seed1', 'team2': 'seed4'},
+        {'gameNumber': 63, 'round': 'Bronze Medal Game', 'team1': 'L(SF1)', 'team2': 'L(SF2)'},
+        {'gameNumber': 64, 'round': 'Gold Medal Game', 'team1': 'W(SF1)', 'team2': 'W(SF2)'},
+    ],
+}
+
+
+@pytest.fixture
+def fixture_file(tmp_path):
+    path = tmp_path / '2024.json'
+    path.write_text(json.dumps(FIXTURE), encoding='utf-8')
+    return path
+
+
+class TestFixtureRegistry:
+    """Test suite for FixtureRegistry"""
+
+    def test_index_is_precomputed(self, fixture_file):
+        index = FixtureRegistry().get(str(fixture_file))
+
+        assert index.hosts == ['CZE']
+        assert index.qf_game_numbers == [57, 58]
+        assert index.sf_game_numbers == [61, 62]
+        assert (index.bronze_game_number, index.gold_game_number) == (63, 64)
+        assert [g['gameNumber'] for g in index.games_by_round['Semifinals']] == [62, 61]
+        assert 'W(SF1)' in index.placeholders and 'CAN' not in index.placeholders
+
+    def test_parsed_once_until_file_changes(self, fixture_file):
+        registry = FixtureRegistry()
+        first = registry.get(str(fixture_file))
+        assert registry.get(str(fixture_file)) is first
+        assert registry.parse_count == 1
+
+        fixture_file.write_text(json.dumps(dict(FIXTURE, hosts=['LAT', 'FIN'])), encoding='utf-8')
+        mtime = os.path.getmtime(fixture_file)
+        os.utime(fixture_file, (mtime + 10, mtime + 10))
+
+        assert registry.get(str(fixture_file)).hosts == ['LAT', 'FIN']
+        assert registry.parse_count == 2
+
+    def test_parse_errors_are_cached_and_reraised(self, tmp_path):
+        broken = tmp_path / 'broken.json'
+        broken.write_text('{not json', encoding='utf-8')
+        registry = FixtureRegistry()
+
+        for _ in range(2):
+            with pytest.raises(json.JSONDecodeError):
+                registry.get(str(broken))
+        assert registry.parse_count == 1
+        assert registry.get(str(tmp_path / 'missing.json')) is None
+
+    def test_year_lookups_share_the_global_registry(self, app, fixture_file):
+        app.config['UPLOAD_FOLDER'] = str(fixture_file.parent)
+        year = ChampionshipYear(name='IIHF 2024', year=2024, fixture_path='2024.json')
+        db.session.add(year)
+        db.session.commit()
+
+        registry = get_fixture_registry()
+        registry.invalidate()
+        parse_count = registry.parse_count
+
+        assert parse_fixture_playoff_numbers(year)['qf_game_numbers'] == [57, 58]
+        assert GameService().get_fixture_info(year)['semifinal_games'] == [61, 62]
+        assert registry.preload([year]) == 1
+        assert registry.parse_count == parse_count + 1
@@ -0,0 +1,193 @@
+"""
+Tests für die Box-Scores pro Spiel und Team (GameBoxscoreService, game_team_boxscore)
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from models import db, ChampionshipYear, Game, GameTeamBoxscore, Goal, Penalty, Player, ShotsOnGoal
+from app.repositories.core import TeamRepository
+from app.services.core import GameBoxscoreService, TeamService
+from app.services.utils.event_bus import GoalAdded, GoalDeleted, PenaltyAdded, ShotsOnGoalChanged, publish
+
+
+def _goal(game, team_code, player, minute, goal_type='REG', empty_net=False):
+    return Goal(game_id=game.id, team_code=team_code, minute=minute, goal_type=goal_type,
+                is_empty_net=empty_net, scorer_id=player.id)
+
+
+def _penalty(game, team_code, penalty_type, minute='10:00'):
+    return Penalty(game_id=game.id, team_code=team_code, minute_of_game=minute,
+                   penalty_type=penalty_type, reason='Hooking')
+
+
+@pytest.fixture
+def game(app):
+    """Gespieltes Vorrundenspiel CAN - FIN ohne Ereignisse"""
+    year = ChampionshipYear(name='IIHF 2024', year=2024)
+    player = Player(team_code='CAN', first_name='Connor', last_name='McDavid')
+    db.session.add_all([year, player])
+    db.session.flush()
+    game = Game(year_id=year.id, date='2024-05-10', round='Preliminary Round', group='Group A',
+                game_number=1, team1_code='CAN', team2_code='FIN', team1_score=3, team2_score=1,
+                result_type='REG')
+    db.session.add(game)
+    db.session.commit()
+    game.player = player
+    return game
+
+
+def _boxscores(game):
+    return {row.team_code: row for row in GameTeamBoxscore.query.filter_by(game_id=game.id)}
+
+
+class TestGameBoxscoreMaintenance:
+    """Test suite for the event-driven box score maintenance"""
+
+    def test_events_update_boxscore_in_same_transaction(self, game):
+        db.session.add_all([_goal(game, 'CAN', game.player, '05:00', 'PP'),
+                            _goal(game, 'CAN', game.player, '59:10', empty_net=True)])
+        publish(GoalAdded(year_id=game.year_id, game_id=game.id, team_codes=('CAN',)))
+        db.session.add_all([_penalty(game, 'FIN', '2 Min'), _penalty(game, 'FIN', '10 Min Disziplinar')])
+        publish(PenaltyAdded(year_id=game.year_id, game_id=game.id, team_codes=('FIN',)))
+        db.session.add(ShotsOnGoal(game_id=game.id, team_code='FIN', period=1, shots=7))
+        publish(ShotsOnGoalChanged(year_id=game.year_id, game_id=game.id, team_codes=('CAN', 'FIN')))
+
+        rows = _boxscores(game)
+        assert (rows['CAN'].goals, rows['CAN'].ppg, rows['CAN'].eng, rows['CAN'].pim) == (2, 1, 1, 0)
+        assert (rows['FIN'].goals, rows['FIN'].sog, rows['FIN'].pim) == (0, 7, 12)
+        assert (rows['FIN'].penalties, rows['FIN'].pp_penalties) == (2, 1)
+
+        # Rollback verwirft Ereignisse und Box-Score gemeinsam
+        db.session.rollback()
+        assert GameTeamBoxscore.query.count() == 0
+
+    def test_deleted_goal_is_removed(self, game):
+        goal = _goal(game, 'CAN', game.player, '05:00')
+        db.session.add(goal)
+        publish(GoalAdded(year_id=game.year_id, game_id=game.id, team_codes=('CAN',)))
+        db.session.commit()
+        assert _boxscores(game)['CAN'].goals == 1
+
+        db.session.delete(goal)
+        publish(GoalDeleted(year_id=game.year_id, game_id=game.id, team_codes=('CAN',)))
+        db.session.commit()
+        assert _boxscores(game) == {}
+
+    def test_backfill_and_cascade(self, game):
+        # Ereignisse ohne Event, z.B. aus einer Datenbank vor game_team_boxscore
+        db.session.add_all([_goal(game, 'FIN', game.player, '12:00', 'SH'),
+                            ShotsOnGoal(game_id=game.id, team_code='CAN', period=2, shots=11)])
+        db.session.commit()
+
+        service = GameBoxscoreService()
+        assert service.backfill() == 1
+        assert service.backfill() == 0
+        rows = _boxscores(game)
+        assert (rows['FIN'].shg, rows['CAN'].sog) == (1, 11)
+
+        db.session.delete(game)
+        db.session.commit()
+        assert GameTeamBoxscore.query.count() == 0
+
+
+class TestTeamStatsFromBoxscores:
+    """Test suite for TeamService.calculate_team_stats_for_year on top of box scores"""
+
+    def test_for_and_against_values(self, game):
+        db.session.add_all([
+            _goal(game, 'CAN', game.player, '05:00', 'PP'),
+            _goal(game, 'FIN', game.player, '08:00', 'PP'),
+            _goal(game, 'CAN', game.player, '59:30', empty_net=True),
+            _penalty(game, 'FIN', '2 Min'), _penalty(game, 'FIN', '2+2 Min'),
+            _penalty(game, 'CAN', '10 Min Disziplinar'),
+            ShotsOnGoal(game_id=game.id, team_code='CAN', period=1, shots=30),
+            ShotsOnGoal(game_id=game.id, team_code='FIN', period=1, shots=20),
+        ])
+        GameBoxscoreService().refresh_games([game.id])
+        db.session.commit()
+
+        games_processed = [SimpleNamespace(id=game.id, team1_code='CAN', team2_code='FIN')]
+        can, fin = TeamService().calculate_team_stats_for_year(
+            game.year_id, ['CAN', 'FIN'], games_processed, {game.id: game})
+
+        assert (can.gp, can.gf, can.ga, can.sog, can.soga) == (1, 3, 1, 30, 20)
+        assert (can.ppgf, can.ppga, can.ppf, can.ppa, can.pim, can.eng) == (1, 1, 2, 0, 10, 1)
+        assert (fin.ppgf, fin.ppga, fin.ppf, fin.ppa, fin.pim, fin.eng) == (1, 1, 0, 2, 6, 0)
+
+
+class TestYearTeamStats:
+    """Test suite for TeamRepository.get_year_team_stats"""
+
+    def test_all_teams_from_two_queries(self, game, count_queries):
+        second = Game(year_id=game.year_id, date='2024-05-11', round='Preliminary Round', group='Group A',
+                      game_number=2, team1_code='FIN', team2_code='SWE', team1_score=0, team2_score=2,
+                      result_type='REG', team2_points=3)
+        final = Game(year_id=game.year_id, date='2024-05-26', round='Gold Medal Game', game_number=64,
+                     team1_code='W(SF1)', team2_code='W(SF2)', team1_score=1, team2_score=2, result_type='OT')
+        db.session.add_all([second, final])
+        db.session.flush()
+        db.session.add_all([
+            _goal(game, 'CAN', game.player, '05:00', 'PP'),
+            _penalty(game, 'FIN', '2 Min'),
+            ShotsOnGoal(game_id=game.id, team_code='FIN', period=1, shots=9),
+            ShotsOnGoal(game_id=final.id, team_code='SWE', period=1, shots=12),
+        ])
+        GameBoxscoreService().refresh_games([game.id, final.id])
+        db.session.commit()
+
+        year_id = game.year_id
+        with count_queries() as statements:
+            stats = TeamRepository().get_year_team_stats(year_id)
+
+        assert len(statements) == 2
+        # Platzhalter des ungelösten Finales werden ausgelassen
+        assert sorted(stats) == ['CAN', 'FIN', 'SWE']
+        can, fin, swe = stats['CAN'], stats['FIN'], stats['SWE']
+        assert (can['wins'], can['powerplay_goals'], can['powerplay_opportunities'], can['shots_against']) == (1, 1, 1, 9)
+        assert (fin['games_played'], fin['losses'], fin['penalty_minutes'], fin['times_shorthanded']) == (2, 2, 2, 1)
+        assert (fin['powerplay_goals_against'], swe['shutouts'], swe['points']) == (1, 1, 3)
+
+        resolved = TeamRepository().get_year_team_stats(
+            year_id, ['SWE'], resolved_codes={final.id: ('CAN', 'SWE')})
+        assert list(resolved) == ['SWE']
+        assert (resolved['SWE']['games_played'], resolved['SWE']['ot_wins'], resolved['SWE']['shots_for']) == (2, 1, 12)
+        assert TeamRepository().get_team_stats('CAN', year_id, 'Gold Medal Game')['games_played'] == 0
+
+
+class TestTeamYearlyStatsRoute:
+    """Test suite for /api/team-yearly-stats on top of box scores"""
+
+    def test_sog_and_powerplay_from_boxscores(self, app, game):
+        from routes.api.team_stats import get_team_yearly_stats
+
+        second = Game(year_id=game.year_id, date='2024-05-11', round='Preliminary Round', group='Group A',
+                      game_number=2, team1_code='SWE', team2_code='CAN', team1_score=2, team2_score=1,
+                      result_type='REG', team1_points=3)
+        db.session.add(second)
+        db.session.flush()
+        db.session.add_all([
+            _goal(game, 'CAN', game.player, '05:00', 'PP'),
+            _penalty(game, 'FIN', '2 Min'), _penalty(game, 'CAN', '2 Min'),
+            _penalty(second, 'SWE', '2 Min'),
+            ShotsOnGoal(game_id=game.id, team_code='CAN', period=1, shots=30),
+            ShotsOnGoal(game_id=game.id, team_code='FIN', period=1, shots=20),
+            ShotsOnGoal(game_id=second.id, team_code='CAN', period=1, shots=10),
+            ShotsOnGoal(game_id=second.id, team_code='SWE', period=1, shots=25),
+        ])
+        GameBoxscoreService().refresh_games([game.id, second.id])
+        db.session.commit()
+
+        # Keine Einzelabfrage pro Spiel mehr
+        with patch('app.services.core.game_service.GameService.get_game_advanced_stats') as advanced_stats, \
+                app.test_request_context('/api/team-yearly-stats/CAN'):
+            response = get_team_yearly_stats('CAN')
+
+        assert advanced_stats.call_count == 0
+        stats = response.get_json()['yearly_stats'][0]['stats']
+        assert (stats['gp'], stats['w'], stats['l'], stats['gf'], stats['ga']) == (2, 1, 1, 4, 3)
+        assert (stats['sog'], stats['soga'], stats['sg_pct'], stats['svs_pct']) == (40, 45, 10.0, 93.3)
+        assert (stats['ppgf'], stats['ppga'], stats['ppf'], stats['ppa']) == (1, 0, 2, 1)
+        assert (stats['pp_pct'], stats['pk_pct']) == (50.0, 100.0)
@@ -0,0 +1,110 @@
+"""
+Tests für die Zeitleiste eines Spiels (GameTimeline, GameService.get_timelines)
+"""
+
+from types import SimpleNamespace
+
+from models import db, ChampionshipYear, Game, Goal, Penalty, Player, ShotsOnGoal
+from app.services.core import GameService
+from utils.data_validation import check_powerplay_penalty_consistency
+from utils.game_timeline import GameTimeline, count_powerplay_opportunities
+
+
+def _goal(time_seconds, goal_id, team_code, minute, goal_type='REG'):
+    return (time_seconds, goal_id, team_code, minute, goal_type, False, None, None, None)
+
+
+def _penalty(time_seconds, penalty_id, team_code, minute, penalty_type='2 Min'):
+    return (time_seconds, penalty_id, team_code, minute, penalty_type, 'Hooking', None)
+
+
+class TestGameTimeline:
+    """Test suite for GameTimeline.build"""
+
+    def test_events_are_sorted_with_goals_first(self):
+        timeline = GameTimeline.build(
+            1, 'CAN', 'FIN',
+            goal_rows=[_goal(None, 5, 'CAN', ''), _goal(300, 1, 'CAN', '05:00'), _goal(3700, 2, 'FIN', '61:40')],
+            penalty_rows=[_penalty(300, 3, 'FIN', '05:00'), _penalty(600, 4, 'CAN', '10:00')])
+
+        assert [(event.kind, event.id) for event in timeline.events] == [
+            ('goal', 5), ('goal', 1), ('penalty', 3), ('penalty', 4), ('goal', 2)]
+        assert timeline.goals[0].time_seconds == 0
+        assert timeline.goals_by_period == {'CAN': {1: 2, 2: 0, 3: 0, 4: 0}, 'FIN': {1: 0, 2: 0, 3: 0, 4: 1}}
+
+    def test_team_counters(self):
+        timeline = GameTimeline.build(
+            1, 'CAN', 'FIN',
+            goal_rows=[_goal(400, 1, 'CAN', '06:40', 'PP'), _goal(900, 2, 'FIN', '15:00', 'SH')],
+            penalty_rows=[_penalty(300, 3, 'FIN', '05:00'), _penalty(800, 4, 'CAN', '13:20'),
+                          _penalty(800, 5, 'FIN', '13:20', '2+2 Min'), _penalty(1500, 6, 'FIN', '25:00', '10 Min Disziplinar')],
+            sog_rows=[('CAN', 1, 12), ('CAN', 2, 9), ('FIN', 1, 7), ('SWE', 1, 3)])
+
+        assert timeline.pp_goals == {'CAN': 1, 'FIN': 0}
+        assert timeline.pim == {'CAN': 2, 'FIN': 16}
+        # Gleichzeitige Strafen um 13:20 heben sich auf, die 10-Minuten-Strafe ist keine PP-Gelegenheit
+        assert timeline.pp_opportunities == {'CAN': 1, 'FIN': 0}
+        assert timeline.sog == {'CAN': {1: 12, 2: 9, 3: 0, 4: 0}, 'FIN': {1: 7, 2: 0, 3: 0, 4: 0}}
+        assert timeline.sog_totals == {'CAN': 21, 'FIN': 7}
+        assert timeline.sog_recorded['SWE'] == {1: 3}
+
+    def test_powerplay_opportunities_accept_penalty_objects(self):
+        penalties = [SimpleNamespace(team_code='CAN', penalty_type='2 Min', minute_of_game='10:00'),
+                     SimpleNamespace(team_code='USA', penalty_type='2 Min', minute_of_game='10:00'),
+                     SimpleNamespace(team_code='CAN', penalty_type='5 Min + Spieldauer', minute_of_game='15:00')]
+        assert count_powerplay_opportunities(penalties, 'CAN', 'USA') == {'CAN': 0, 'USA': 1}
+
+
+class TestGetTimelines:
+    """Test suite for GameService.get_timelines"""
+
+    def test_batched_queries_and_powerplay_check(self, app, count_queries):
+        year = ChampionshipYear(name='IIHF 2024', year=2024)
+        player = Player(team_code='CAN', first_name='Connor', last_name='McDavid')
+        db.session.add_all([year, player])
+        db.session.flush()
+        games = [Game(year_id=year.id, date='2024-05-10', round='Preliminary Round', game_number=number,
+                      team1_code='CAN', team2_code='FIN') for number in (1, 2)]
+        db.session.add_all(games)
+        db.session.flush()
+        db.session.add_all([
+            Penalty(game_id=games[0].id, team_code='FIN', minute_of_game='05:00', penalty_type='2 Min',
+                    reason='Hooking'),
+            Goal(game_id=games[0].id, team_code='CAN', minute='06:00', goal_type='REG', scorer_id=player.id),
+            ShotsOnGoal(game_id=games[1].id, team_code='FIN', period=2, shots=11),
+        ])
+        db.session.commit()
+        game_ids = [game.id for game in games]
+
+        with count_queries() as statements:
+            timelines = GameService().get_timelines([(game_id, 'CAN', 'FIN') for game_id in game_ids])
+
+        assert len(statements) == 3
+        first, second = timelines[game_ids[0]], timelines[game_ids[1]]
+        assert [event.kind for event in first.events] == ['penalty', 'goal']
+        assert (first.pp_opportunities['CAN'], second.events, second.sog_totals['FIN']) == (1, [], 11)
+
+        # Tor während der Strafe des Gegners ist als REG erfasst
+        display = SimpleNamespace(id=game_ids[0], team1_code='CAN', team2_code='FIN', timeline=first)
+        assert len(check_powerplay_penalty_consistency(display)) == 1
+
+    def test_same_time_events_ordered_by_team_code(self, app):
+        year = ChampionshipYear(name='IIHF 2024', year=2024)
+        db.session.add(year)
+        db.session.flush()
+        game = Game(year_id=year.id, date='2024-05-10', round='Preliminary Round', game_number=1,
+                    team1_code='USA', team2_code='GER')
+        db.session.add(game)
+        db.session.flush()
+        # Reihenfolge wie zuvor über den Index (game_id, team_code): GER vor USA trotz kleinerer ID
+        db.session.add_all([
+            Penalty(game_id=game.id, team_code='USA', minute_of_game='56:23', penalty_type='5 Min + Spieldauer',
+                    reason='Checking'),
+            Penalty(game_id=game.id, team_code='GER', minute_of_game='56:23', penalty_type='5 Min + Spieldauer',
+                    reason='Checking'),
+        ])
+        db.session.commit()
+
+        timeline = GameService().get_timelines([(game.id, 'USA', 'GER')])[game.id]
+        assert [event.team_code for event in timeline.events] == ['GER', 'USA']
+        assert timeline.events[0].id > timeline.events[1].id
@@ -0,0 +1,60 @@
+"""
+Tests für die vorindizierte Head-to-Head Tiebreaker-Engine
+"""
+
+from models import TeamStats
+from utils.head_to_head import HeadToHeadIndex
+from utils.standings import _apply_head_to_head_tiebreaker
+from app.services.core.standings_service import StandingsService
+from tests.conftest import make_game
+
+
+def _team(name, pts=10, gd=0, gf=20, gp=7):
+    return TeamStats(name=name, group='Group A', gp=gp, pts=pts, gf=gf, ga=gf - gd)
+
+
+# A gewinnt alle direkten Spiele, D verliert alle. B und C sind in der
+# Mini-Tabelle gleichauf (5 Pkt, +1, 5 Tore); B hat das direkte Spiel in OT gewonnen.
+FOUR_WAY_TIE = [
+    make_game('A', 'B', 1, 0),
+    make_game('A', 'C', 2, 1, 'OT'),
+    make_game('A', 'D', 3, 0),
+    make_game('B', 'C', 2, 1, 'OT'),
+    make_game('B', 'D', 3, 2),
+    make_game('C', 'D', 3, 0),
+]
+
+
+class TestHeadToHeadIndex:
+    """Test suite for HeadToHeadIndex"""
+
+    def test_pairwise_records_are_mirrored(self):
+        index = HeadToHeadIndex(FOUR_WAY_TIE + [make_game('A', 'B', 0, 5, round='Quarterfinals'),
+                                               make_game('C', 'E', None, None)])
+
+        assert (index.record('A', 'C').pts, index.record('A', 'C').gf, index.record('A', 'C').ga) == (2, 2, 1)
+        assert (index.record('C', 'A').pts, index.record('C', 'A').gf, index.record('C', 'A').ga) == (1, 1, 2)
+        assert index.record('A', 'B').games == 1
+        assert not index.has_played('C', 'E')
+
+    def test_sub_tie_is_resolved_recursively(self):
+        teams = [_team('D'), _team('C', gd=5), _team('B', gd=1), _team('A')]
+        index = HeadToHeadIndex(FOUR_WAY_TIE)
+
+        assert index.mini_table(teams)['B'] == index.mini_table(teams)['C'] == (5, 1, 5)
+        assert [t.name for t in index.sort_tied(teams)] == ['A', 'B', 'C', 'D']
+
+    def test_two_teams_without_direct_game_use_overall_stats(self):
+        teams = [_team('B', gd=1), _team('E', gd=3)]
+        assert [t.name for t in HeadToHeadIndex(FOUR_WAY_TIE).sort_tied(teams)] == ['E', 'B']
+
+    def test_incomplete_groups_use_overall_stats(self):
+        teams = [_team('A', gp=3), _team('B', gp=3, gd=2), _team('C', gp=3, gd=1)]
+        assert [t.name for t in HeadToHeadIndex(FOUR_WAY_TIE).sort_tied(teams)] == ['B', 'C', 'A']
+
+    def test_call_sites_accept_prebuilt_index(self):
+        index = HeadToHeadIndex(FOUR_WAY_TIE)
+        teams = [_team('C', gd=5), _team('B', gd=1), _team('X', pts=12)]
+
+        assert [t.name for t in _apply_head_to_head_tiebreaker(teams, index)] == ['X', 'B', 'C']
+        assert [t.name for t in StandingsService().apply_head_to_head_tiebreaker(teams[:2], FOUR_WAY_TIE)] == ['B', 'C']
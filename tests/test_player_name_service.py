@@ -0,0 +1,103 @@
+"""
+Tests für die Namensauflösung von Spielern (PlayerNameService, Namens-Cache im globalen Cache)
+"""
+
+import pytest
+
+from models import db, ChampionshipYear, Game, Goal, Penalty, Player
+from app.services.core import PlayerNameService, PlayerService
+from app.services.utils.cache_manager import PLAYER_NAMES_TAG, get_global_cache
+from app.services.utils.event_bus import PlayerChanged, publish
+
+
+@pytest.fixture
+def players(app):
+    """Drei Spieler von CAN, ein Spieler von FIN"""
+    players = [Player(team_code='CAN', first_name='Connor', last_name='McDavid', jersey_number=97),
+               Player(team_code='CAN', first_name='Nathan', last_name='MacKinnon', jersey_number=29),
+               Player(team_code='CAN', first_name='Sidney', last_name='Crosby'),
+               Player(team_code='FIN', first_name='Mikko', last_name='Rantanen', jersey_number=96)]
+    db.session.add_all(players)
+    db.session.commit()
+    return players
+
+
+class TestPlayerNameService:
+    """Test suite for PlayerNameService"""
+
+    def test_resolves_only_referenced_players_in_one_query(self, players, count_queries):
+        mcdavid, mackinnon, crosby, rantanen = players
+        year = ChampionshipYear(name='IIHF 2024', year=2024)
+        db.session.add(year)
+        db.session.flush()
+        game = Game(year_id=year.id, date='2024-05-10', round='Preliminary Round', game_number=1,
+                    team1_code='CAN', team2_code='FIN')
+        db.session.add(game)
+        db.session.flush()
+        goal = Goal(game_id=game.id, team_code='CAN', minute='05:00', goal_type='REG',
+                    scorer_id=mcdavid.id, assist1_id=mackinnon.id)
+        penalty = Penalty(game_id=game.id, team_code='FIN', minute_of_game='07:00',
+                          penalty_type='2 Min', reason='Hooking', player_id=rantanen.id)
+        db.session.add_all([goal, penalty])
+        db.session.commit()
+        db.session.refresh(goal)
+        db.session.refresh(penalty)
+
+        with count_queries() as statements:
+            names = PlayerNameService().resolve_for_events([goal], [penalty])
+
+        assert len(statements) == 1 and ' IN ' in statements[0]
+        assert sorted(names) == sorted([mcdavid.id, mackinnon.id, rantanen.id])
+        assert names[mcdavid.id].full_name == 'Connor McDavid'
+        assert tuple(names[rantanen.id]) == ('Mikko', 'Rantanen', 'FIN', 96)
+
+    def test_cached_names_need_no_query(self, players, count_queries):
+        service = PlayerNameService()
+        ids = [player.id for player in players]
+        service.resolve(ids[:2])
+
+        with count_queries() as statements:
+            names = service.resolve(ids[:2] + [None])
+        assert statements == []
+        assert [names[player_id].last_name for player_id in ids[:2]] == ['McDavid', 'MacKinnon']
+
+        # Nur die fehlenden IDs werden nachgeladen, unbekannte IDs fehlen im Ergebnis
+        with count_queries() as statements:
+            names = service.resolve(ids + [9999])
+        assert len(statements) == 1
+        assert sorted(names) == sorted(ids)
+
+    def test_player_changes_invalidate_cache(self, players):
+        mcdavid, mackinnon, crosby, _ = players
+        service = PlayerNameService()
+        service.resolve([mcdavid.id, mackinnon.id, crosby.id])
+
+        crosby.jersey_number = 87
+        publish(PlayerChanged(team_codes=('CAN',), player_ids=(crosby.id,)))
+        db.session.commit()
+        assert service.resolve([crosby.id])[crosby.id] == ('Sidney', 'Crosby', 'CAN', 87)
+
+        # Zusammengeführte Spieler verschwinden aus dem Cache
+        PlayerService().merge_players(mcdavid.id, mackinnon.id)
+        db.session.commit()
+        assert list(service.resolve([mackinnon.id])) == []
+
+    def test_player_changes_reach_shared_caches_after_commit(self, players):
+        mcdavid = players[0]
+        PlayerNameService().resolve([mcdavid.id])
+        shared_cache = get_global_cache()
+        # Namen liegen im globalen Cache, den mit dem Backend 'sqlite' alle Worker teilen
+        assert shared_cache.get(f"player_name:{mcdavid.id}").last_name == 'McDavid'
+        shared_cache.set('player:career_totals:abc', 'stale', tags=(f"player:{mcdavid.id}",))
+        shared_cache.set('player:tournament_leaders:abc', 'stale', tags=('year:5', PLAYER_NAMES_TAG))
+        shared_cache.set('standings:group:abc', 'kept', tags=('year:5',))
+
+        mcdavid.jersey_number = 98
+        publish(PlayerChanged(team_codes=('CAN',), player_ids=(mcdavid.id,)))
+        assert shared_cache.get(f"player_name:{mcdavid.id}") is not None
+        db.session.commit()
+
+        assert shared_cache.get(f"player_name:{mcdavid.id}") is None
+        assert shared_cache.get('player:career_totals:abc') is None
+        assert shared_cache.get('player:tournament_leaders:abc') is None
+        assert shared_cache.get('standings:group:abc') == 'kept'
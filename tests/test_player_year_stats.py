@@ -0,0 +1,84 @@
+"""
+Tests für die gebündelten Jahres-Spielerstatistiken (Tore/Assists/Strafminuten per SQL)
+"""
+
+from models import db, ChampionshipYear, Game, Player, Goal, Penalty
+from app.services.core.player_service import PlayerService
+
+
+def _setup_year(goals_per_game):
+    year = ChampionshipYear(name='IIHF 2024', year=2024)
+    other_year = ChampionshipYear(name='IIHF 2023', year=2023)
+    db.session.add_all([year, other_year])
+    db.session.flush()
+
+    players = {
+        code: [Player(team_code=code, first_name=f'{code}{i}', last_name=f'{code}{i}') for i in range(3)]
+        for code in ('CAN', 'FIN')
+    }
+    db.session.add_all(players['CAN'] + players['FIN'])
+
+    games = [Game(year_id=year.id, round='Preliminary Round', game_number=n,
+                  team1_code='CAN', team2_code='FIN', team1_score=3, team2_score=2) for n in (1, 2)]
+    old_game = Game(year_id=other_year.id, round='Preliminary Round', game_number=1,
+                    team1_code='CAN', team2_code='FIN', team1_score=1, team2_score=0)
+    db.session.add_all(games + [old_game])
+    db.session.flush()
+
+    can, fin = players['CAN'], players['FIN']
+    for game in games:
+        for _ in range(goals_per_game):
+            db.session.add(Goal(game_id=game.id, team_code='CAN', minute='10:00', goal_type='REG',
+                                scorer_id=can[0].id, assist1_id=can[1].id, assist2_id=can[2].id))
+            db.session.add(Goal(game_id=game.id, team_code='FIN', minute='12:00', goal_type='PP1',
+                                scorer_id=fin[0].id, assist1_id=fin[1].id))
+        db.session.add(Penalty(game_id=game.id, team_code='CAN', player_id=can[1].id,
+                               minute_of_game='05:00', penalty_type='2 Min', reason='Hooking'))
+        db.session.add(Penalty(game_id=game.id, team_code='FIN', player_id=fin[2].id,
+                               minute_of_game='06:00', penalty_type='5 Min + Spieldauer', reason='Boarding'))
+    db.session.add(Goal(game_id=old_game.id, team_code='CAN', minute='01:00', goal_type='REG',
+                        scorer_id=can[0].id))
+    db.session.commit()
+    return year, games, can, fin
+
+
+class TestPlayerYearStats:
+    """get_player_stats_for_year / get_player_penalty_stats_for_year"""
+
+    def test_scoring_totals_and_filters(self, app):
+        year, games, can, fin = _setup_year(goals_per_game=2)
+        service = PlayerService()
+
+        stats = service.get_player_stats_for_year(year.id)
+        assert {pid: (s['g'], s['a'], s['p']) for pid, s in stats.items()} == {
+            can[0].id: (4, 0, 4), can[1].id: (0, 4, 4), can[2].id: (0, 4, 4),
+            fin[0].id: (4, 0, 4), fin[1].id: (0, 4, 4),
+        }
+        assert stats[fin[0].id]['obj'] is db.session.get(Player, fin[0].id)
+
+        assert set(service.get_player_stats_for_year(year.id, team_filter='FIN')) == {fin[0].id, fin[1].id}
+        assert service.get_player_stats_for_year(year.id, game_ids=[games[0].id])[can[0].id]['g'] == 2
+
+    def test_penalty_minutes(self, app):
+        year, _, can, fin = _setup_year(goals_per_game=1)
+        service = PlayerService()
+
+        pims = service.get_player_penalty_stats_for_year(year.id)
+        assert {pid: s['pim'] for pid, s in pims.items()} == {can[1].id: 4, fin[2].id: 10}
+        assert list(service.get_player_penalty_stats_for_year(year.id, team_filter='CAN')) == [can[1].id]
+
+    def test_query_count_does_not_grow_with_goals(self, app, count_queries):
+        service = PlayerService()
+        query_counts = []
+        for goals_per_game in (1, 10):
+            db.session.remove()
+            db.drop_all()
+            db.create_all()
+            year_id = _setup_year(goals_per_game)[0].id
+            db.session.expire_all()
+            with count_queries() as statements:
+                service.get_player_stats_for_year(year_id, team_filter='CAN')
+                service.get_player_penalty_stats_for_year(year_id, team_filter='CAN')
+            query_counts.append(len(statements))
+
+        assert query_counts[0] == query_counts[1] == 2
@@ -0,0 +1,73 @@
+"""
+Tests für den Platzhalter-Abhängigkeitsgraphen des PlayoffResolvers
+"""
+
+from functools import partial
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from utils.playoff_resolver import PlayoffDependencyGraph, PlayoffResolver
+from tests.conftest import make_game
+
+_game = partial(make_game, round='Quarterfinals', group=None)
+
+
+GAMES = [
+    _game('A1', 'B2', 3, 2, id=1, game_number=57),
+    _game('B1', 'A2', 1, 4, id=2, game_number=58),
+    _game('W(57)', 'W(58)', 2, 1, id=3, game_number=61, round='Semifinals'),
+    _game('W(SF1)', 'seed2', id=4, game_number=64, round='Gold Medal Game'),
+    _game('L(SF1)', 'L(62)', id=5, game_number=63, round='Bronze Medal Game'),
+]
+PLAYOFF_MAP = {'A1': 'CAN', 'A2': 'FIN', 'B1': 'USA', 'B2': 'CZE', 'SF1': '61'}
+
+
+def _graph(extra_map=None):
+    playoff_map = dict(PLAYOFF_MAP, **(extra_map or {}))
+    return PlayoffDependencyGraph(playoff_map, {g.game_number: g for g in GAMES})
+
+
+class TestPlayoffDependencyGraph:
+    """Test suite for PlayoffDependencyGraph"""
+
+    def test_chained_placeholders_resolve_in_one_pass(self):
+        graph = _graph()
+        with patch.object(graph, '_evaluate', wraps=graph._evaluate) as evaluate:
+            graph.resolve_many(['W(SF1)', 'L(SF1)', 'W(61)', 'A1'])
+            assert graph.resolve('W(SF1)') == 'CAN'
+            assert graph.resolve('L(SF1)') == 'FIN'
+
+        evaluated = [call.args[0] for call in evaluate.call_args_list]
+        assert len(evaluated) == len(set(evaluated))
+        assert evaluated.index('A1') < evaluated.index('W(57)') < evaluated.index('W(SF1)')
+        assert evaluated.index('W(58)') < evaluated.index('W(61)')
+        assert graph.dependencies('W(61)') == ('W(57)', 'W(58)')
+
+    def test_unresolvable_placeholders_are_returned_unchanged(self):
+        graph = _graph()
+        assert graph.resolve('L(62)') == 'L(62)'
+        assert graph.resolve('seed2') == 'seed2'
+        assert graph.resolve('W(64)') == 'W(64)'
+        assert graph.resolve('') == ''
+
+    def test_cycles_stay_unresolved(self):
+        graph = _graph({'X1': 'X2', 'X2': 'X1', 'H1': 'H1'})
+        assert graph.resolve('X1') == 'X1'
+        assert graph.resolve('H1') == 'H1'
+
+
+class TestPlayoffResolverResolveAll:
+    """PlayoffResolver uses the graph and exposes resolve_all()"""
+
+    def test_resolve_all_and_mapping_updates(self):
+        resolver = PlayoffResolver(SimpleNamespace(id=1, year=2024, fixture_path=None), GAMES)
+        with patch('utils.standings._calculate_basic_prelim_standings', return_value={}), \
+                patch('utils.playoff_mapping._build_playoff_team_map_for_year', return_value=dict(PLAYOFF_MAP)):
+            resolved = resolver.resolve_all()
+
+        assert resolved[3] == ('CAN', 'FIN')
+        assert resolved[4] == ('CAN', 'seed2')
+        assert resolver.get_dependency_graph()['W(SF1)'] == ('W(57)', 'W(58)')
+
+        resolver.update_mappings({'seed2': 'SWE'})
+        assert resolver.resolve_all()[4] == ('CAN', 'SWE')
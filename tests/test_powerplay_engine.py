@@ -0,0 +1,62 @@
+"""
+Tests für die Strafbank-Verwaltung der Powerplay-Prüfung (PowerplayEngine)
+"""
+
+from types import SimpleNamespace
+
+from utils.data_validation import check_powerplay_penalty_consistency, get_penalty_duration_minutes
+from utils.powerplay_engine import PowerplayEngine
+
+
+def _penalties(*entries):
+    return [{'time_seconds': time_seconds, 'team': team, 'penalty_type': penalty_type,
+             'duration_minutes': get_penalty_duration_minutes(penalty_type), 'id': penalty_id}
+            for penalty_id, (time_seconds, team, penalty_type) in enumerate(entries, 1)]
+
+
+class TestPowerplayEngine:
+    """Test suite for PowerplayEngine"""
+
+    def test_third_penalty_waits_for_earliest_end(self):
+        engine = PowerplayEngine(_penalties((0, 'CAN', '2 Min'), (10, 'CAN', '2 Min'), (20, 'CAN', '2 Min')))
+
+        assert [penalty['id'] for penalty in engine.active_penalties(100)] == [1, 2]
+        # Die dritte Strafe beginnt erst mit dem Ende der ersten (120-240)
+        assert [penalty['id'] for penalty in engine.active_penalties(130)] == [3]
+        assert engine.manpower(119) == {'CAN': 3}
+        assert engine.active_penalties(240) == []
+
+    def test_pp_goal_releases_oldest_minor_and_reschedules(self):
+        engine = PowerplayEngine(_penalties((0, 'CAN', '2 Min'), (10, 'CAN', '2 Min'), (20, 'CAN', '2 Min'),
+                                            (30, 'FIN', '2 Min')))
+
+        assert engine.release_for_pp_goal(60, 'FIN')['id'] == 1
+        # Ohne die erste Strafe muss die dritte nicht mehr warten (20-140)
+        assert engine.manpower(130) == {'CAN': 4, 'FIN': 4}
+        assert engine.manpower(60) == {'CAN': 3, 'FIN': 4}
+        # Ein Tor beendet nur Strafen des Gegners, auch wenn eigene Strafen älter sind
+        assert engine.release_for_pp_goal(100, 'CAN')['id'] == 4
+        assert engine.manpower(100) == {'CAN': 3, 'FIN': 5}
+
+    def test_double_minor_and_major_penalties(self):
+        engine = PowerplayEngine(_penalties((0, 'CAN', '2+2 Min'), (0, 'FIN', '5 Min + Spieldauer')))
+
+        double_minor = engine.release_for_pp_goal(60, 'FIN')
+        assert double_minor['cleared_segments'] == 1
+        assert len(engine.active_penalties(200)) == 2
+        assert engine.release_for_pp_goal(200, 'FIN') is double_minor
+        assert engine.manpower(210) == {'CAN': 5, 'FIN': 4}
+        # Majors laufen trotz PP-Tor weiter
+        assert engine.release_for_pp_goal(100, 'CAN') is None
+
+    def test_consistency_check_uses_delayed_penalties(self):
+        events = [{'type': 'penalty', 'time_for_sort': time_seconds,
+                   'data': {'minute_of_game': minute, 'team_code': 'FIN', 'penalty_type': '2 Min', 'id': penalty_id}}
+                  for penalty_id, (time_seconds, minute) in enumerate([(0, '00:00'), (10, '00:10'), (20, '00:20')], 1)]
+        events.append({'type': 'goal', 'time_for_sort': 230,
+                       'data': {'minute': '03:50', 'team_code': 'CAN', 'goal_type_display': 'REG', 'id': 1}})
+        display = SimpleNamespace(id=7, team1_code='CAN', team2_code='FIN', sorted_events=events)
+
+        assert check_powerplay_penalty_consistency(display) == [
+            "Spiel 7: Tor von CAN um 03:50 ist als 'REG' markiert, aber bei aktiver Strafe des Gegners "
+            "(Powerplay, 1 Strafe) sollte es 'PP' sein"]
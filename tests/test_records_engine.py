@@ -0,0 +1,164 @@
+"""
+Tests für die Records-Engine (alle Rekorde der Rekorde-Seite in einem Durchlauf)
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from models import db, ChampionshipYear, Game, Goal, Penalty, PenaltyTypePim, Player, StreakRecordState
+import routes.records as records
+from routes.records.engine import compute_records_page, iter_record_games, rank_fastest, record_game_order
+from app.repositories.core.records_repository import RecordsRepository
+from utils.streak_tracker import StreakTracker
+
+
+@pytest.fixture
+def history(app, add_game):
+    """Zwei Turniere mit Gold-Medal-Games, Toren (inkl. Hattrick) und Strafen"""
+    players = {}
+    for code, first, last in (('CAN', 'Connor', 'McDavid'), ('CAN', 'Sidney', 'Crosby'),
+                              ('FIN', 'Mikko', 'Rantanen'), ('SWE', 'Elias', 'Pettersson')):
+        players[last] = Player(team_code=code, first_name=first, last_name=last)
+    db.session.add_all(players.values())
+
+    # Jahr 2024 wird zuerst angelegt, die Auswertung muss trotzdem chronologisch laufen
+    year_2024 = ChampionshipYear(name='IIHF 2024', year=2024)
+    year_2023 = ChampionshipYear(name='IIHF 2023', year=2023)
+    db.session.add_all([year_2024, year_2023])
+    db.session.flush()
+
+    results_2023 = [('CAN', 'FIN', 4, 0), ('CAN', 'SWE', 3, 1), ('FIN', 'SWE', 0, 2)]
+    for number, (t1, t2, s1, s2) in enumerate(results_2023, start=1):
+        add_game(year_2023, number, 'Preliminary Round', t1, t2, s1, s2, date=f'2023-05-1{number}', group='Group A')
+    add_game(year_2023, 10, 'Gold Medal Game', 'CAN', 'SWE', 2, 1, date='2023-05-28')
+
+    hattrick_game = add_game(year_2024, 1, 'Preliminary Round', 'CAN', 'FIN', 9, 1, date='2024-05-10', group='Group A')
+    add_game(year_2024, 2, 'Preliminary Round', 'FIN', 'SWE', 3, 3, date='2024-05-11', group='Group A')
+    add_game(year_2024, 10, 'Gold Medal Game', 'CAN', 'FIN', 5, 2, date='2024-05-26')
+    add_game(year_2024, 11, 'Preliminary Round', 'SWE', 'CAN', date='2024-05-27', group='Group A')
+
+    for minute, assist in (('02:10', players['Crosby']), ('05:00', None), ('07:30', players['Crosby'])):
+        db.session.add(Goal(game_id=hattrick_game.id, team_code='CAN', minute=minute, goal_type='REG',
+                            scorer_id=players['McDavid'].id, assist1_id=assist.id if assist else None))
+    db.session.add(Goal(game_id=hattrick_game.id, team_code='FIN', minute='00:45', goal_type='REG',
+                        scorer_id=players['Rantanen'].id))
+    db.session.add(Penalty(game_id=hattrick_game.id, team_code='FIN', player_id=players['Rantanen'].id,
+                           minute_of_game='10:00', penalty_type='2+2 Min', reason='Hooking'))
+    db.session.commit()
+    return players
+
+
+class TestRecordsEngine:
+    """Test suite for compute_records_page"""
+
+    def test_matches_individual_record_functions(self, history):
+        page = compute_records_page()
+        records_data = records.utils.get_records_data()
+
+        assert page.longest_win_streak == records.get_longest_win_streak(records_data)
+        assert page.longest_scoring_streak == records.get_longest_scoring_streak(records_data)
+        assert page.longest_goalless_streak == records.get_longest_goalless_streak(records_data)
+        assert page.highest_victory == records.get_highest_victory(records_data)
+        assert page.most_frequent_matchup == records.get_most_frequent_matchup(records_data)
+        assert page.fastest_goal == records.get_fastest_goal()
+        assert page.fastest_hattrick == records.get_fastest_hattrick()
+        assert page.most_consecutive_tournament_wins == records.get_most_consecutive_tournament_wins()
+        assert page.record_champion == records.get_record_champion()
+        assert page.most_goals_team_tournament == records.get_most_goals_team_tournament()
+        assert page.most_penalty_minutes_tournament == records.get_most_penalty_minutes_tournament()
+
+    def test_records_content(self, history):
+        page = compute_records_page()
+
+        assert page.longest_win_streak[0]['team'] == 'CAN'
+        assert page.longest_win_streak[0]['streak'] == 5
+        assert page.most_consecutive_tournament_wins == [{'team': 'CAN', 'streak': 2, 'years': [2023, 2024]}]
+        assert page.fastest_goal[0]['player'] == 'Mikko Rantanen'
+        assert page.fastest_hattrick[0]['duration_formatted'] == '5:20'
+        assert page.fastest_hattrick[0]['vs_team'] == 'FIN'
+        # Nur 2023 ist vollständig gespielt
+        assert [t['year'] for t in page.tournament_most_goals] == [2023]
+        assert page.most_scorers_tournament[0]['points'] == 3
+        assert page.most_assists_player_tournament[0]['player'] == 'Sidney Crosby'
+        assert page.most_penalty_minutes_tournament[0]['pim'] == 4
+
+    def test_constant_number_of_queries(self, history, count_queries):
+        compute_records_page()
+        with count_queries() as statements:
+            compute_records_page()
+        # 7 Queries der Engine + 3 für den gespeicherten Serien-Zustand (Zustand, Prüfsumme, neue Spiele)
+        assert len(statements) == 10
+
+    def test_new_result_is_appended_to_stored_streaks(self, history, add_game):
+        compute_records_page()
+        year_2024 = ChampionshipYear.query.filter_by(year=2024).one()
+        add_game(year_2024, 12, 'Preliminary Round', 'CAN', 'SWE', 4, 1, date='2024-05-28', group='Group A')
+        db.session.commit()
+
+        with patch.object(StreakTracker, 'add_game', autospec=True, side_effect=StreakTracker.add_game) as add:
+            page = compute_records_page()
+        # Nur das neue Spiel wird eingespielt, keine vollständige Neuberechnung
+        assert add.call_count == 1
+        assert page.longest_win_streak[0]['streak'] == 6
+        assert StreakRecordState.query.one().games_processed == 8
+
+    def test_penalty_minutes_from_penalty_type_table(self, history):
+        PenaltyTypePim.query.filter_by(penalty_type='2+2 Min').one().pim = 5
+        db.session.commit()
+
+        page = compute_records_page()
+        assert page.most_penalty_minutes_tournament[0]['pim'] == 5
+
+    def test_stream_is_chronological_with_events_per_game(self, history):
+        order = record_game_order()
+        games = Game.query.join(ChampionshipYear).order_by(*order).all()
+        goals = Goal.query.join(Game).join(ChampionshipYear).order_by(*order, Goal.id).yield_per(2)
+        penalties = Penalty.query.join(Game).join(ChampionshipYear).order_by(*order, Penalty.id)
+
+        stream = list(iter_record_games(ChampionshipYear.query.all(), games, goals, penalties))
+
+        # 2024 hat die kleineren IDs, läuft aber nach 2023
+        assert [(rg.year, rg.game.game_number) for rg in stream] == [
+            (2023, 1), (2023, 2), (2023, 3), (2023, 10), (2024, 1), (2024, 2), (2024, 10), (2024, 11)]
+        assert [(len(rg.goals), len(rg.penalties)) for rg in stream if rg.goals or rg.penalties] == [(4, 1)]
+        assert [goal.minute for goal in stream[4].goals] == ['02:10', '05:00', '07:30', '00:45']
+
+    def test_rank_fastest_keeps_started_ties(self):
+        entries = [{'t': value} for value in (1, 2, 2, 3, 4, 5, 5, 5, 6)]
+        ranked = rank_fastest(entries, 't', limit=5)
+        assert [e['t'] for e in ranked] == [1, 2, 2, 3, 4]
+        assert [e['rank'] for e in rank_fastest(entries, 't', limit=6)] == [1, 2, 2, 3, 4, 5, 5, 5]
+
+
+class TestFastestGoals:
+    """Test suite for RecordsRepository.get_fastest_goals / get_fastest_goal"""
+
+    def test_seconds_computed_in_sql(self, history):
+        repository = RecordsRepository()
+        goals = repository.get_fastest_goals(limit=10)
+        assert [(g['minute'], g['time_seconds']) for g in goals] == [
+            ('00:45', 45), ('02:10', 130), ('05:00', 300), ('07:30', 450)]
+        assert goals[0]['championship'].year == 2024
+        assert goals[0]['game'].team1_code == 'CAN'
+
+    def test_ties_on_last_rank_are_kept(self, history):
+        game = Game.query.filter_by(game_number=2).join(ChampionshipYear).filter(ChampionshipYear.year == 2024).one()
+        for minute in ('01:00', '01:00', '3'):
+            db.session.add(Goal(game_id=game.id, team_code='SWE', minute=minute, goal_type='REG',
+                                scorer_id=history['Pettersson'].id))
+        db.session.commit()
+
+        ranked = records.get_fastest_goal()
+        assert [(g['time_seconds'], g['rank']) for g in ranked] == [
+            (45, 1), (60, 2), (60, 2), (130, 3), (180, 4)]
+        assert ranked[1]['vs_team'] == 'FIN'
+        assert len(RecordsRepository().get_fastest_goals(limit=2)) == 3
+
+    def test_single_statement_for_goals(self, history, count_queries):
+        records.get_fastest_goal()
+        db.session.expire_all()
+        with count_queries() as statements:
+            records.get_fastest_goal()
+        # Tore mit Spiel und Turnier + Snapshots der betroffenen Jahre
+        assert len(statements) == 2
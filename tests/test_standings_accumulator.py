@@ -0,0 +1,69 @@
+"""
+Tests für den inkrementellen StandingsAccumulator und _calculate_basic_prelim_standings
+"""
+
+from functools import partial
+from unittest.mock import patch
+
+from utils.standings import StandingsAccumulator, accumulate_standings, _calculate_basic_prelim_standings
+from app.services.core.standings_service import StandingsService
+from tests.conftest import make_game
+
+_game = partial(make_game, group='Group A')
+
+
+GAMES = [
+    _game('CAN', 'USA', 3, 1),
+    _game('CAN', 'GER', 2, 1, 'OT'),
+    _game('USA', 'GER', 4, 0),
+    _game('GER', 'CAN', 3, 2, 'SO'),
+    _game('USA', 'CAN', None, None),
+]
+
+
+class TestStandingsAccumulator:
+    """Test suite for StandingsAccumulator"""
+
+    def test_accumulates_all_games(self):
+        standings = accumulate_standings(GAMES)
+
+        can = standings['CAN']
+        assert (can.gp, can.w, can.otw, can.sol, can.gf, can.ga, can.pts) == (3, 1, 1, 1, 7, 5, 6)
+        ger = standings['GER']
+        assert (ger.gp, ger.l, ger.otl, ger.sow, ger.pts) == (3, 1, 1, 1, 3)
+        assert standings['USA'].pts == 3
+
+    def test_incremental_updates_keep_team_objects(self):
+        accumulator = StandingsAccumulator()
+        accumulator.add_game(GAMES[0])
+        can = accumulator.standings['CAN']
+        assert accumulator.add_game(GAMES[4]) is False
+        accumulator.add_games(GAMES[1:4])
+
+        assert accumulator.standings['CAN'] is can
+        assert can.gp == 3
+
+    def test_group_is_filled_from_later_game(self):
+        standings = accumulate_standings([_game('CAN', 'USA', 1, 0, group=None),
+                                          _game('CAN', 'GER', 1, 0, group='Group B')])
+        assert standings['CAN'].group == 'Group B'
+        assert standings['USA'].group == 'N/A'
+
+    def test_matches_standings_service(self):
+        service_standings = StandingsService().calculate_standings_from_games(GAMES)
+        assert service_standings == accumulate_standings(GAMES)
+
+
+class TestBasicPrelimStandings:
+    """_calculate_basic_prelim_standings counts every game, not only the last one per team"""
+
+    def test_ranks_use_full_prelim_record(self):
+        games = GAMES + [_game('CAN', 'USA', 5, 0, round='Quarterfinals'),
+                         _game('A1', 'B4', 1, 0)]
+        with patch.object(StandingsService, 'calculate_standings_from_games') as service_call:
+            standings = _calculate_basic_prelim_standings(games)
+
+        service_call.assert_not_called()
+        assert {code: ts.gp for code, ts in standings.items()} == {'CAN': 3, 'USA': 2, 'GER': 3}
+        assert standings['CAN'].rank_in_group == 1
+        assert standings['GER'].rank_in_group == 3
@@ -0,0 +1,150 @@
+"""
+Tests für den StreakTracker und den StreakRecordService (inkrementelle Serien-Rekorde)
+"""
+
+import json
+import random
+from unittest.mock import patch
+
+import pytest
+
+from models import db, ChampionshipYear, Game, StreakRecordState
+from app.services.core import GameService, StreakRecordService
+from routes.records.engine import rank_top_3
+from utils.streak_tracker import STREAK_KINDS, StreakTracker
+
+TEAMS = ['CAN', 'FIN', 'SWE', 'USA', 'CZE']
+
+
+def _naive_streaks(games, kind):
+    """Referenz: alle Serien pro (Team, Start) sammeln und danach ranken"""
+    current, start, records = {}, {}, {}
+
+    def extend(team, date):
+        if not current.get(team):
+            start[team] = date
+        current[team] = current.get(team, 0) + 1
+        key = (team, start[team])
+        if key not in records or current[team] > records[key]['streak']:
+            records[key] = {'team': team, 'streak': current[team], 'start_date': start[team],
+                            'end_date': date, 'rank': 0}
+
+    for team1, team2, score1, score2, date in games:
+        if kind in ('win', 'loss'):
+            if score1 == score2:
+                continue
+            winner, loser = (team1, team2) if score1 > score2 else (team2, team1)
+            extended, broken = (winner, loser) if kind == 'win' else (loser, winner)
+            current[broken] = 0
+            extend(extended, date)
+            continue
+        for team, goals_for, goals_against in ((team1, score1, score2), (team2, score2, score1)):
+            continues = {'scoring': goals_for > 0, 'shutout': goals_against == 0, 'goalless': goals_for == 0}[kind]
+            if continues:
+                extend(team, date)
+            else:
+                current[team] = 0
+    return rank_top_3(list(records.values()), 'streak')
+
+
+def _random_games(seed, count=300):
+    rng = random.Random(seed)
+    games = []
+    for n in range(count):
+        team1, team2 = rng.sample(TEAMS, 2)
+        games.append((team1, team2, rng.randint(0, 3), rng.randint(0, 3), f'2024-{n // 28 + 1:02d}-{n % 28 + 1:02d}'))
+    return games
+
+
+class TestStreakTracker:
+    """Test suite for StreakTracker"""
+
+    @pytest.mark.parametrize('seed', range(5))
+    def test_matches_full_recompute(self, seed):
+        games = _random_games(seed)
+        tracker = StreakTracker()
+        for game in games:
+            tracker.add_game(*game)
+
+        for kind in STREAK_KINDS:
+            assert tracker.ranked(kind) == _naive_streaks(games, kind)
+
+    def test_state_roundtrip_continues_incrementally(self):
+        games = _random_games(42)
+        tracker = StreakTracker()
+        for game in games[:150]:
+            tracker.add_game(*game)
+
+        restored = StreakTracker.from_dict(json.loads(json.dumps(tracker.to_dict())))
+        for game in games[150:]:
+            restored.add_game(*game)
+
+        assert restored.games_processed == len(games)
+        for kind in STREAK_KINDS:
+            assert restored.ranked(kind) == _naive_streaks(games, kind)
+
+    def test_only_top_lengths_are_kept(self):
+        tracker = StreakTracker()
+        for game in _random_games(7, count=2000):
+            tracker.add_game(*game)
+
+        state = tracker.to_dict()
+        for kind in STREAK_KINDS:
+            lengths = {record[3] for record in state['leaderboards'][kind]}
+            assert len(lengths) <= 3
+
+
+@pytest.fixture
+def season(app):
+    """Ein Turnier mit drei gespielten Vorrundenspielen und einem offenen Spiel"""
+    year = ChampionshipYear(name='IIHF 2024', year=2024)
+    db.session.add(year)
+    db.session.flush()
+    games = []
+    for number, (t1, t2, s1, s2) in enumerate([('CAN', 'FIN', 3, 1), ('CAN', 'SWE', 2, 0),
+                                               ('FIN', 'SWE', 1, 4), ('CAN', 'USA', None, None)], start=1):
+        game = Game(year_id=year.id, date=f'2024-05-1{number}', start_time='16:20', round='Preliminary Round',
+                    group='Group A', game_number=number, team1_code=t1, team2_code=t2,
+                    team1_score=s1, team2_score=s2, result_type='REG' if s1 is not None else None)
+        db.session.add(game)
+        games.append(game)
+    db.session.commit()
+    return games
+
+
+class TestStreakRecordService:
+    """Test suite for StreakRecordService"""
+
+    def test_state_is_stored_and_reused(self, season):
+        records = StreakRecordService().get_streak_records()
+        assert records['win'][0] == {'team': 'CAN', 'streak': 2, 'start_date': '2024-05-11',
+                                     'end_date': '2024-05-12', 'rank': 1}
+        state = StreakRecordState.query.one()
+        assert state.games_processed == 3
+
+        with patch.object(StreakTracker, 'add_game') as add_game:
+            assert StreakRecordService().get_streak_records() == records
+        add_game.assert_not_called()
+
+    def test_new_result_is_appended(self, season):
+        StreakRecordService().get_streak_records()
+
+        GameService().update_game_score(season[3].id, 5, 0, 'REG')
+        assert StreakRecordState.query.count() == 1
+
+        with patch.object(StreakTracker, 'add_game', autospec=True, side_effect=StreakTracker.add_game) as add_game:
+            records = StreakRecordService().get_streak_records()
+        assert add_game.call_count == 1
+        assert records['win'][0]['streak'] == 3
+        assert StreakRecordState.query.one().games_processed == 4
+
+    def test_earlier_result_change_rebuilds(self, season):
+        StreakRecordService().get_streak_records()
+
+        GameService().update_game_score(season[1].id, 0, 2, 'REG')
+        assert StreakRecordState.query.count() == 0
+
+        records = StreakRecordService().get_streak_records()
+        assert records['win'][0]['team'] == 'SWE'
+        assert records['win'][0]['streak'] == 2
+        assert StreakRecordState.query.one().games_processed == 3
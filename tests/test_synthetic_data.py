@@ -0,0 +1,69 @@
+"""
+Tests für den SyntheticHistoryGenerator (synthetische Turnierhistorie für Skalierungstests)
+"""
+
+import json
+
+import pytest
+
+from models import db, ChampionshipYear, Game, GameTeamBoxscore, Goal, ShotsOnGoal
+from utils.synthetic_data import SyntheticHistoryGenerator
+from utils.tournament_resolution import resolve_tournament
+
+
+@pytest.fixture
+def generate(app, tmp_path):
+    app.config['BASE_DIR'] = str(tmp_path)
+    app.config['UPLOAD_FOLDER'] = str(tmp_path / 'fixtures')
+
+    def _generate(**options):
+        return SyntheticHistoryGenerator(str(tmp_path / 'fixtures'), **options).generate()
+    return _generate
+
+
+class TestSyntheticHistoryGenerator:
+    """Test suite for SyntheticHistoryGenerator"""
+
+    def test_fixture_format_and_counts(self, generate, tmp_path):
+        counts = generate(years=2, last_year=2031, divisions=2, seed=3)
+
+        assert counts['years'] == 4 and counts['games'] == 4 * 64
+        assert Goal.query.count() == counts['goals'] and ShotsOnGoal.query.count() == counts['shots_on_goal']
+        assert sorted(p.name for p in (tmp_path / 'fixtures').iterdir()) == [
+            '2030.json', '2031.json', 'div2_2030.json', 'div2_2031.json']
+
+        fixture = json.loads((tmp_path / 'fixtures' / '2031.json').read_text(encoding='utf-8'))
+        assert set(fixture) == {'championship', 'year', 'hosts', 'reportGenerated', 'schedule', 'notes'}
+        assert [g['gameNumber'] for g in fixture['schedule']] == list(range(1, 65))
+        assert fixture['schedule'][60]['team1'] == 'seed1'
+        assert ChampionshipYear.query.filter_by(year=2031).count() == 2
+
+    def test_events_match_results_and_resolution(self, generate):
+        generate(years=1, seed=5)
+        year_obj = ChampionshipYear.query.one()
+        games = Game.query.filter_by(year_id=year_obj.id).all()
+        resolution = resolve_tournament(year_obj, games, custom_seeding={})
+
+        assert len(resolution.final_ranking) == 16
+        for game in games:
+            team1, team2 = resolution.get_resolved(game)
+            goals = Goal.query.filter_by(game_id=game.id).all()
+            # Penalty-Schießen: Siegtreffer ohne Goal-Eintrag
+            shootout_bonus = 1 if game.result_type == 'SO' else 0
+            assert len(goals) + shootout_bonus == game.team1_score + game.team2_score
+            assert {goal.team_code for goal in goals} <= {team1, team2}
+            assert all(goal.time_seconds is not None for goal in goals)
+            assert game.team1_points + game.team2_points == 3
+        assert GameTeamBoxscore.query.count() > 0
+
+    def test_same_seed_same_history(self, generate):
+        def snapshot():
+            return [(g.game_number, g.team1_score, g.team2_score, g.result_type)
+                    for g in Game.query.order_by(Game.id)], Goal.query.count()
+
+        generate(years=1, seed=11)
+        first = snapshot()
+        db.drop_all()
+        db.create_all()
+        generate(years=1, seed=11)
+        assert snapshot() == first
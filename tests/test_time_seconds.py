@@ -0,0 +1,98 @@
+"""
+Tests für die gespeicherten Spielzeiten in Sekunden (Goal.time_seconds, Penalty.time_seconds)
+"""
+
+import os
+import sqlite3
+
+import pytest
+
+from models import db, ChampionshipYear, Game, Goal, Penalty, Player, parse_time_seconds
+from app.services.core.game_service import GameService
+
+MIGRATION = os.path.join(os.path.dirname(__file__), '..', 'database', 'migrations',
+                         'add_time_seconds_columns.sql')
+
+TIMES = ['00:45', '12:34', '1:12', '65:00', '3', '007', '', '12:3a', ':30', '30:', '1:2:3', ' 5']
+
+
+@pytest.fixture
+def game(app):
+    year = ChampionshipYear(name='IIHF 2024', year=2024)
+    player = Player(team_code='CAN', first_name='Connor', last_name='McDavid')
+    db.session.add_all([year, player])
+    db.session.flush()
+    game = Game(year_id=year.id, date='2024-05-10', round='Preliminary Round', game_number=1,
+                team1_code='CAN', team2_code='FIN', team1_score=2, team2_score=1)
+    db.session.add(game)
+    db.session.commit()
+    return game, player
+
+
+class TestParseTimeSeconds:
+    """Test suite for parse_time_seconds"""
+
+    def test_valid_times(self):
+        assert parse_time_seconds('00:45') == 45
+        assert parse_time_seconds('1:12') == 72
+        assert parse_time_seconds('65:00') == 3900
+        # Reine Minutenangabe
+        assert parse_time_seconds('3') == 180
+
+    @pytest.mark.parametrize('value', [None, '', '12:3a', ':30', '30:', '1:2:3', ' 5'])
+    def test_invalid_times(self, value):
+        assert parse_time_seconds(value) is None
+
+
+class TestTimeSecondsColumns:
+    """Test suite for the time_seconds columns on Goal and Penalty"""
+
+    def test_set_on_insert_and_update(self, game):
+        game, player = game
+        goal = Goal(game_id=game.id, team_code='CAN', minute='12:34', goal_type='REG', scorer_id=player.id)
+        penalty = Penalty(game_id=game.id, team_code='FIN', minute_of_game='05:10',
+                          penalty_type='2 Min', reason='Hooking')
+        db.session.add_all([goal, penalty])
+        db.session.commit()
+        assert (goal.time_seconds, penalty.time_seconds) == (754, 310)
+
+        goal.minute = '02:00'
+        penalty.minute_of_game = 'xx'
+        db.session.commit()
+        db.session.expire_all()
+        assert (Goal.query.one().time_seconds, Penalty.query.one().time_seconds) == (120, None)
+
+    def test_events_ordered_by_game_time(self, game):
+        game, player = game
+        for minute in ('45:00', '03:15', '10:00'):
+            db.session.add(Goal(game_id=game.id, team_code='CAN', minute=minute, goal_type='REG',
+                                scorer_id=player.id))
+        db.session.commit()
+
+        goals = GameService().get_goals_by_games([game.id])[game.id]
+        assert [g.minute for g in goals] == ['03:15', '10:00', '45:00']
+
+
+class TestTimeSecondsMigration:
+    """Test suite for database/migrations/add_time_seconds_columns.sql"""
+
+    def test_backfill_matches_model(self):
+        connection = sqlite3.connect(':memory:')
+        connection.executescript(
+            'CREATE TABLE goal (id INTEGER PRIMARY KEY, game_id INTEGER, minute VARCHAR(5));'
+            'CREATE TABLE penalty (id INTEGER PRIMARY KEY, game_id INTEGER, minute_of_game VARCHAR(5));'
+        )
+        connection.executemany('INSERT INTO goal (game_id, minute) VALUES (1, ?)', [(t,) for t in TIMES])
+        connection.executemany('INSERT INTO penalty (game_id, minute_of_game) VALUES (1, ?)', [(t,) for t in TIMES])
+
+        with open(MIGRATION, encoding='utf-8') as f:
+            connection.executescript(f.read())
+
+        expected = [(t, parse_time_seconds(t)) for t in TIMES]
+        assert connection.execute('SELECT minute, time_seconds FROM goal ORDER BY id').fetchall() == expected
+        assert connection.execute(
+            'SELECT minute_of_game, time_seconds FROM penalty ORDER BY id').fetchall() == expected
+        indexes = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {'ix_goal_game_time', 'ix_penalty_game_time'} <= indexes
+        assert connection.execute('SELECT migration_name FROM migration_log').fetchall() == [
+            ('003_add_time_seconds_columns',)]
@@ -0,0 +1,101 @@
+"""
+Tests für den TournamentAggregatesService (Kennzahlen aller Turniere aus einer gruppierten Query)
+"""
+
+import pytest
+
+from constants import PIM_MAP
+from models import db, ChampionshipYear, Goal, Penalty, PenaltyTypePim, Player
+from app.repositories.core import PenaltyTypePimRepository
+from app.services.core import TournamentAggregatesService
+from routes.records.tournament_records import (
+    get_tournament_with_least_penalty_minutes, get_tournament_with_most_goals
+)
+from routes.records.utils import get_tournament_statistics
+from routes.tournament.summary import calculate_overall_tournament_summary
+
+
+@pytest.fixture
+def tournaments(app, add_game):
+    """2023 beendet, 2024 läuft noch, 2025 ohne Spiele"""
+    player = Player(team_code='CAN', first_name='Connor', last_name='McDavid')
+    years = {y: ChampionshipYear(name=f'IIHF {y}', year=y) for y in (2023, 2024, 2025)}
+    db.session.add_all([player] + list(years.values()))
+    db.session.flush()
+
+    game = add_game(years[2023], 1, 'Preliminary Round', 'CAN', 'FIN', 3, 1)
+    add_game(years[2023], 64, 'Gold Medal Game', 'CAN', 'FIN', 2, 1)
+    for minute in ('05:00', '12:00'):
+        db.session.add(Goal(game_id=game.id, team_code='CAN', minute=minute, goal_type='REG', scorer_id=player.id))
+    for penalty_type in ('2 Min', '10 Min Disziplinar', 'Unbekannt'):
+        db.session.add(Penalty(game_id=game.id, team_code='FIN', minute_of_game='10:00',
+                               penalty_type=penalty_type, reason='Hooking'))
+
+    played = add_game(years[2024], 1, 'Preliminary Round', 'CAN', 'FIN', 4, 4)
+    open_game = add_game(years[2024], 2, 'Preliminary Round', 'CAN', 'FIN')
+    db.session.add(Penalty(game_id=played.id, team_code='CAN', minute_of_game='01:00',
+                           penalty_type='2 Min', reason='Tripping'))
+    db.session.add(Penalty(game_id=open_game.id, team_code='CAN', minute_of_game='01:00',
+                           penalty_type='2 Min', reason='Tripping'))
+    db.session.commit()
+    return years
+
+
+class TestTournamentAggregates:
+    """Test suite for TournamentAggregatesService"""
+
+    def test_year_aggregates(self, tournaments):
+        aggregates = TournamentAggregatesService().get_year_aggregates()
+
+        finished = aggregates[tournaments[2023].id]
+        assert (finished.total_games, finished.completed_games, finished.goals, finished.goal_entries) == (2, 2, 7, 2)
+        # 2 + 10 + 0 (unbekannter Straftyp)
+        assert (finished.penalty_minutes, finished.penalty_count) == (12, 3)
+        assert finished.is_completed and finished.avg_goals_per_game == 3.5
+
+        running = aggregates[tournaments[2024].id]
+        assert (running.total_games, running.completed_games, running.goals) == (2, 1, 8)
+        assert (running.penalty_minutes, running.penalty_count) == (2, 1)
+        assert not running.is_completed
+
+        empty = aggregates[tournaments[2025].id]
+        assert (empty.total_games, empty.goals, empty.avg_goals_per_game) == (0, 0, 0.0)
+        assert TournamentAggregatesService().get_completed_year_ids() == [tournaments[2023].id]
+
+    def test_single_query_for_all_years(self, tournaments, count_queries):
+        with count_queries() as statements:
+            summary = calculate_overall_tournament_summary()
+
+        assert len(statements) == 1
+        assert summary == {
+            'total_tournaments': 3, 'total_games': 4, 'completed_games': 3, 'total_goals': 2,
+            'total_penalties': 14, 'total_penalty_count': 4, 'completion_percentage': 75.0
+        }
+
+    def test_callers_share_the_aggregates(self, tournaments):
+        stats = get_tournament_statistics(tournaments[2023])
+        assert (stats['goals'], stats['penalties'], stats['penalty_count']) == (7, 12, 3)
+        assert stats['winner'] == 'CAN'
+        assert get_tournament_statistics(tournaments[2024])['winner'] is None
+
+        assert get_tournament_with_most_goals() == [
+            {'tournament': 'IIHF 2023', 'year': 2023, 'total_goals': 7, 'games': 2, 'goals_per_game': 3.5}]
+        assert get_tournament_with_least_penalty_minutes()[0]['total_pim'] == 12
+
+
+class TestPenaltyTypePim:
+    """Test suite for the penalty_type_pim reference table"""
+
+    def test_seeded_from_pim_map(self, app):
+        assert PenaltyTypePimRepository().get_map() == PIM_MAP
+        assert PenaltyTypePimRepository().sync(PIM_MAP) == 0
+
+    def test_penalty_minutes_follow_the_table(self, tournaments):
+        db.session.add(PenaltyTypePim(penalty_type='Unbekannt', pim=3))
+        changed = dict(PIM_MAP, **{'2 Min': 4})
+        assert PenaltyTypePimRepository().sync(changed) == 2
+        db.session.commit()
+
+        assert PenaltyTypePimRepository().get_map() == changed
+        # 4 + 10, 'Unbekannt' wurde von sync() wieder entfernt
+        assert TournamentAggregatesService().get_year_aggregates()[tournaments[2023].id].penalty_minutes == 14
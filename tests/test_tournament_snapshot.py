@@ -0,0 +1,182 @@
+"""
+Tests für den TournamentSnapshotService (materialisierte Turnier-Auflösung)
+"""
+
+import json
+import os
+import pytest
+from unittest.mock import patch
+
+from models import db, ChampionshipYear, Game, TeamMatchup, TournamentSnapshot
+from app.services.core import GameService, MatchupIndexService, TournamentSnapshotService
+from utils.tournament_resolution import ResolvedTournament
+import utils.tournament_resolution as tournament_resolution
+
+RESOLVE_TARGET = 'app.services.core.tournament_snapshot_service.resolve_tournament'
+
+GROUP_A = ['CAN', 'FIN', 'CZE', 'USA']
+GROUP_B = ['SWE', 'SUI', 'GER', 'LAT']
+
+
+@pytest.fixture
+def tournament(app, tmp_path, add_game):
+    """Turnier mit 8 Teams, komplett gespielt; die Gruppen-Reihenfolge entspricht der Listenreihenfolge"""
+    app.config['UPLOAD_FOLDER'] = str(tmp_path)
+    app.config['BASE_DIR'] = str(tmp_path)
+    fixture = {
+        'hosts': ['CZE'],
+        'schedule': (
+            [{'gameNumber': n, 'round': 'Quarterfinals'} for n in (57, 58, 59, 60)] +
+            [{'gameNumber': n, 'round': 'Semifinals'} for n in (61, 62)] +
+            [{'gameNumber': 63, 'round': 'Bronze Medal Game'},
+             {'gameNumber': 64, 'round': 'Gold Medal Game'}]
+        ),
+    }
+    (tmp_path / '2024.json').write_text(json.dumps(fixture), encoding='utf-8')
+
+    year = ChampionshipYear(name='IIHF 2024', year=2024, fixture_path='2024.json')
+    db.session.add(year)
+    db.session.flush()
+
+    number = 1
+    for group_name, teams in (('Group A', GROUP_A), ('Group B', GROUP_B)):
+        for i, t1 in enumerate(teams):
+            for t2 in teams[i + 1:]:
+                add_game(year, number, 'Preliminary Round', t1, t2, 3, 1, group=group_name)
+                number += 1
+
+    # QF-Sieger: CAN, SUI, SWE, FIN
+    add_game(year, 57, 'Quarterfinals', 'A1', 'B4', 4, 0)
+    add_game(year, 58, 'Quarterfinals', 'B2', 'A3', 2, 1)
+    add_game(year, 59, 'Quarterfinals', 'B1', 'A4', 5, 2)
+    add_game(year, 60, 'Quarterfinals', 'A2', 'B3', 3, 2)
+    add_game(year, 61, 'Semifinals', 'seed1', 'seed4', 3, 1)
+    add_game(year, 62, 'Semifinals', 'seed2', 'seed3', 1, 2)
+    add_game(year, 63, 'Bronze Medal Game', 'L(SF1)', 'L(SF2)', 2, 1)
+    add_game(year, 64, 'Gold Medal Game', 'W(SF1)', 'W(SF2)', 4, 3)
+    db.session.commit()
+    return year
+
+
+def _game(year, number):
+    return Game.query.filter_by(year_id=year.id, game_number=number).first()
+
+
+class TestTournamentSnapshotService:
+    """Test suite for TournamentSnapshotService"""
+
+    def test_snapshot_is_built_once_and_reused(self, tournament):
+        service = TournamentSnapshotService()
+        with patch(RESOLVE_TARGET, wraps=tournament_resolution.resolve_tournament) as resolve:
+            first = service.get_resolved_tournament(tournament)
+            second = service.get_resolved_tournament(tournament)
+
+        assert resolve.call_count == 1
+        assert TournamentSnapshot.query.filter_by(year_id=tournament.id).count() == 1
+        assert first.to_dict() == second.to_dict()
+
+    def test_semifinals_and_final_ranking_are_resolved(self, tournament):
+        resolution = TournamentSnapshotService().get_resolved_tournament(tournament)
+
+        assert resolution.get_resolved(_game(tournament, 61)) == ('CAN', 'FIN')
+        assert resolution.get_resolved(_game(tournament, 62)) == ('SWE', 'SUI')
+        assert resolution.get_resolved(_game(tournament, 64)) == ('CAN', 'SUI')
+        assert [resolution.final_ranking[p] for p in (1, 2, 3, 4)] == ['CAN', 'SUI', 'FIN', 'SWE']
+        assert set(resolution.final_ranking) == set(range(1, 9))
+
+    def test_score_update_invalidates_snapshot(self, tournament):
+        service = TournamentSnapshotService()
+        service.get_resolved_tournament(tournament)
+
+        GameService().update_game_score(_game(tournament, 64).id, 1, 4, 'REG')
+        assert TournamentSnapshot.query.filter_by(year_id=tournament.id).count() == 0
+
+        resolution = service.get_resolved_tournament(tournament)
+        assert resolution.final_ranking[1] == 'SUI'
+        assert resolution.final_ranking[2] == 'CAN'
+
+    def test_custom_seeding_invalidates_snapshot(self, tournament):
+        from routes.year.seeding import save_custom_seeding_to_db
+
+        service = TournamentSnapshotService()
+        service.get_resolved_tournament(tournament)
+
+        save_custom_seeding_to_db(tournament.id, {'seed1': 'SUI', 'seed2': 'CAN',
+                                                  'seed3': 'FIN', 'seed4': 'SWE'})
+        assert TournamentSnapshot.query.filter_by(year_id=tournament.id).count() == 0
+
+        resolution = service.get_resolved_tournament(tournament)
+        assert resolution.get_resolved(_game(tournament, 61)) == ('SUI', 'SWE')
+        assert resolution.get_resolved(_game(tournament, 62)) == ('CAN', 'FIN')
+
+    def test_changed_fixture_file_triggers_rebuild(self, app, tournament):
+        service = TournamentSnapshotService()
+        service.get_resolved_tournament(tournament)
+
+        fixture_file = os.path.join(app.config['UPLOAD_FOLDER'], '2024.json')
+        mtime = os.path.getmtime(fixture_file)
+        os.utime(fixture_file, (mtime + 10, mtime + 10))
+
+        with patch(RESOLVE_TARGET, wraps=tournament_resolution.resolve_tournament) as resolve:
+            service.get_resolved_tournament(tournament)
+            service.get_resolved_tournament(tournament)
+        assert resolve.call_count == 1
+
+    def test_rebuild_never_commits_the_callers_session(self, tournament):
+        service = TournamentSnapshotService()
+        game = _game(tournament, 64)
+
+        # Offene Änderungen: der Snapshot gehört zur Transaktion des Aufrufers
+        game.team1_score = 5
+        service.get_resolved_tournament(tournament)
+        db.session.rollback()
+        assert TournamentSnapshot.query.filter_by(year_id=tournament.id).count() == 0
+
+        # Lesender Aufrufer: eigene Session, geladene Spiele bleiben unverändert
+        game = _game(tournament, 64)
+        service.get_resolved_tournament(tournament)
+        assert 'team1_score' in game.__dict__
+        db.session.rollback()
+        assert TournamentSnapshot.query.filter_by(year_id=tournament.id).count() == 1
+
+    def test_payload_round_trip(self, tournament):
+        resolution = TournamentSnapshotService().get_resolved_tournament(tournament)
+        restored = ResolvedTournament.from_dict(json.loads(json.dumps(resolution.to_dict())))
+
+        assert restored.to_dict() == resolution.to_dict()
+        assert restored.final_ranking[1] == 'CAN'
+        group_a = restored.standings_by_group['Group A']
+        assert [ts.name for ts in group_a] == GROUP_A
+        assert group_a[0] is restored.teams_stats['CAN']
+
+
+class TestMatchupIndex:
+    """Der Paarungs-Index wird mit dem Snapshot eines Jahres geschrieben und verworfen"""
+
+    def test_playoff_matchups_use_resolved_codes(self, tournament):
+        service = MatchupIndexService()
+        combinations = service.get_team_combinations()
+
+        assert 'CAN_vs_FIN' in combinations and 'CAN_vs_SUI' in combinations
+        assert not any('seed' in key or '(' in key for key in combinations)
+        # Vorrunde und Halbfinale (seed1 CAN gegen seed4 FIN)
+        assert service.get_games_per_year('FIN', 'CAN') == {tournament.id: 2}
+        assert TeamMatchup.query.filter_by(year_id=tournament.id).count() == len(combinations)
+
+    def test_score_update_reindexes_only_its_year(self, tournament, add_game):
+        other_year = ChampionshipYear(name='IIHF 2023', year=2023)
+        db.session.add(other_year)
+        db.session.flush()
+        add_game(other_year, 1, 'Preliminary Round', 'NOR', 'AUT', 2, 1, group='Group A')
+        db.session.commit()
+
+        service = MatchupIndexService()
+        assert 'AUT_vs_NOR' in service.get_team_combinations()
+
+        GameService().update_game_score(_game(tournament, 64).id, 1, 4, 'REG')
+        assert TeamMatchup.query.filter_by(year_id=tournament.id).count() == 0
+
+        with patch(RESOLVE_TARGET, wraps=tournament_resolution.resolve_tournament) as resolve:
+            assert 'CAN_vs_SUI' in service.get_team_combinations()
+            assert service.get_team_combinations() == service.get_team_combinations()
+        assert [call.args[0].id for call in resolve.call_args_list] == [tournament.id]
@@ -9,6 +9,8 @@ from .team_resolution import (
 )
 
 from .standings import (
+    StandingsAccumulator,
+    accumulate_standings,
     _calculate_basic_prelim_standings,
     _apply_head_to_head_tiebreaker,
     _sort_teams_by_head_to_head,
@@ -17,6 +19,10 @@ from .standings import (
     calculate_complete_final_ranking
 )
 
+from .head_to_head import (
+    HeadToHeadIndex,
+)
+
 from .playoff_mapping import (
     _build_playoff_team_map_for_year,
 )
@@ -223,12 +229,15 @@ __all__ = [
     'resolve_fixture_path_local',
     
     # Standings
+    'StandingsAccumulator',
+    'accumulate_standings',
     '_calculate_basic_prelim_standings',
     '_apply_head_to_head_tiebreaker', 
     '_sort_teams_by_head_to_head',
     '_sort_two_teams_by_head_to_head',
     '_sort_multiple_teams_by_head_to_head',
     'calculate_complete_final_ranking',
+    'HeadToHeadIndex',
     
     # Playoff mapping
     '_build_playoff_team_map_for_year',
@@ -1,8 +1,9 @@
 from typing import Tuple
 from constants import PIM_MAP, GOAL_TYPE_DISPLAY_MAP, PERIOD_3_END
 from .time_helpers import convert_time_to_seconds
-from models import db, Game, Penalty
-from sqlalchemy import func, case
+from .powerplay_engine import PowerplayEngine
+from models import db, Game, Penalty, PenaltyTypePim
+from sqlalchemy import func
 
 
 def calculate_tournament_penalty_minutes(year_id, completed_games_only=True):
@@ -17,13 +18,10 @@ def calculate_tournament_penalty_minutes(year_id, completed_games_only=True):
         Total penalty minutes for the tournament
     """
     query = db.session.query(
-        func.sum(
-            case(
-                *[(Penalty.penalty_type == penalty_type, pim_value) for penalty_type, pim_value in PIM_MAP.items()],
-                else_=2  # Default for unknown penalty types
-            )
-        )
-    ).join(Game, Penalty.game_id == Game.id).filter(
+        func.sum(PenaltyTypePim.minutes())
+    ).join(Game, Penalty.game_id == Game.id).outerjoin(
+        PenaltyTypePim, PenaltyTypePim.penalty_type == Penalty.penalty_type
+    ).filter(
         Game.year_id == year_id
     )
     
@@ -242,123 +240,32 @@ def check_powerplay_penalty_consistency(game_display):
     - Bei 2+2 Min: PP-Tor in den ersten 2 Minuten reduziert die Strafe auf 2 Min
     - Bei gleichzeitigen Strafen beider Teams ist es kein Powerplay (4-on-4)
     
+    Die Strafbank wird von der PowerplayEngine verwaltet: effektive Strafzeiten werden
+    pro Team einmal berechnet, die Situation je Tor per binärer Suche bestimmt.
+    
     Args:
-        game_display: GameDisplay Objekt mit sorted_events
+        game_display: GameDisplay Objekt mit timeline (GameTimeline) oder sorted_events
         
     Returns:
         List von Warnungen als Strings
     """
     warnings = []
-    
-    # Sammle alle Tore und Strafen mit Zeiten in Sekunden
-    goals = []
-    penalties = []
-    
-    for event in game_display.sorted_events:
-        if event.get('type') == 'goal':
-            goal_data = event.get('data', {})
-            goals.append({
-                'time_seconds': event.get('time_for_sort', 0),
-                'time_str': goal_data.get('minute', ''),
-                'team': goal_data.get('team_code', ''),
-                'goal_type': goal_data.get('goal_type_display', ''),
-                'scorer': goal_data.get('scorer', ''),
-                'id': goal_data.get('id', 0)
-            })
-        elif event.get('type') == 'penalty':
-            penalty_data = event.get('data', {})
-            penalty_duration = get_penalty_duration_minutes(penalty_data.get('penalty_type', ''))
-            penalties.append({
-                'time_seconds': event.get('time_for_sort', 0),
-                'time_str': penalty_data.get('minute_of_game', ''),
-                'team': penalty_data.get('team_code', ''),
-                'penalty_type': penalty_data.get('penalty_type', ''),
-                'duration_minutes': penalty_duration,
-                'original_duration_minutes': penalty_duration,  # Originale Dauer für 2+2 Strafen
-                'player': penalty_data.get('player_name', ''),
-                'id': penalty_data.get('id', 0),
-                'is_active': True,  # Wird bei PP-Toren modifiziert
-                'cleared_segments': 0  # For tracking 2+2 penalties
-            })
-    
-    # Sortiere nach Zeit
-    goals.sort(key=lambda x: x['time_seconds'])
-    penalties.sort(key=lambda x: x['time_seconds'])
-    
-    # Überprüfe jedes Tor auf Powerplay-Konsistenz
-    # WICHTIG: Sequenzielle Verarbeitung um PP-Tor-Regeln korrekt zu handhaben
-    for goal in goals:
-        goal_time = goal['time_seconds']
-        goal_team = goal['team']
-        goal_type = goal['goal_type']
-        
-        # Finde aktive Strafen zum Zeitpunkt des Tors
-        # Berücksichtige die Regel: Max 2 Spieler gleichzeitig in der Strafbank
-        active_penalties_at_goal = []
-        
-        # Gruppiere Strafen nach Teams
-        penalties_by_team = {}
-        for penalty in penalties:
-            if not penalty['is_active']:
-                continue
-            team = penalty['team']
-            if team not in penalties_by_team:
-                penalties_by_team[team] = []
-            penalties_by_team[team].append(penalty)
-        
-        # Berechne für jedes Team die effektiven Strafzeiten
-        for team, team_penalties in penalties_by_team.items():
-            # Sortiere Strafen nach Startzeit
-            team_penalties.sort(key=lambda x: x['time_seconds'])
-            
-            # Verfolge die aktiven Strafen für dieses Team
-            active_team_penalties = []
-            
-            for penalty in team_penalties:
-                penalty_start = penalty['time_seconds']
-                penalty_duration = penalty['duration_minutes'] * 60
-                
-                # Special handling for 2+2 penalties that have been partially cleared
-                if penalty['penalty_type'] == '2+2 Min' and penalty.get('cleared_segments', 0) == 1:
-                    # Only 2 minutes remain active after first segment was cleared
-                    # But we keep the full 4-minute window for checking
-                    penalty_duration = 240  # Keep full 4 minutes for checking
-                
-                # Finde die effektive Startzeit dieser Strafe
-                effective_start = penalty_start
-                
-                # Wenn bereits 2 Strafen aktiv sind, muss diese Strafe warten
-                if len(active_team_penalties) >= 2:
-                    # Finde die früheste Endzeit der aktiven Strafen
-                    earliest_end = min(p['effective_end'] for p in active_team_penalties)
-                    if penalty_start < earliest_end:
-                        effective_start = earliest_end
-                
-                effective_end = effective_start + penalty_duration
-                
-                # Prüfe, ob diese Strafe zum Zeitpunkt des Tors aktiv ist
-                if effective_start <= goal_time < effective_end:  # Changed <= to < for end time
-                    penalty_copy = penalty.copy()
-                    penalty_copy['effective_start'] = effective_start
-                    penalty_copy['effective_end'] = effective_end
-                    active_penalties_at_goal.append(penalty_copy)
-                
-                # Aktualisiere die Liste der aktiven Strafen
-                # Entferne abgelaufene Strafen
-                active_team_penalties = [p for p in active_team_penalties if p['effective_end'] > effective_start]
-                
-                # Füge die neue Strafe hinzu
-                active_team_penalties.append({
-                    'effective_start': effective_start,
-                    'effective_end': effective_end,
-                    'penalty': penalty
-                })
-                
-                # Beschränke auf max 2 gleichzeitige Strafen
-                if len(active_team_penalties) > 2:
-                    active_team_penalties = active_team_penalties[:2]
-        
-        # Analysiere die Powerplay-Situation
+    goal_events, penalty_events = _powerplay_check_events(game_display)
+    
+    penalties = [{
+        'time_seconds': time_seconds,
+        'time_str': time_str,
+        'team': team,
+        'penalty_type': penalty_type,
+        'duration_minutes': get_penalty_duration_minutes(penalty_type),
+        'id': penalty_id
+    } for time_seconds, time_str, team, penalty_type, penalty_id in sorted(penalty_events, key=lambda e: e[0])]
+    engine = PowerplayEngine(penalties)
+    
+    # Tore in Spielzeit-Reihenfolge: PP-Tore verändern die Strafbank für alle späteren Tore
+    for goal_time, time_str, goal_team, goal_type, _ in sorted(goal_events, key=lambda e: e[0]):
+        # Aktive Strafen zum Zeitpunkt des Tors (max. 2 Spieler gleichzeitig in der Strafbank)
+        active_penalties_at_goal = engine.active_penalties(goal_time)
         pp_situation = analyze_powerplay_situation(active_penalties_at_goal, goal_team, game_display.team1_code, game_display.team2_code)
         
         # Überprüfe, ob der Tortyp zur Situation passt
@@ -373,76 +280,41 @@ def check_powerplay_penalty_consistency(game_display):
         
         if expected_goal_types and goal_type_for_validation not in expected_goal_types:
             situation_desc = describe_powerplay_situation(pp_situation, active_penalties_at_goal)
-            warnings.append(f"Spiel {game_display.id}: Tor von {goal_team} um {goal['time_str']} ist als '{goal_type}' markiert, aber bei {situation_desc} sollte es '{'/'.join(expected_goal_types)}' sein")
+            warnings.append(f"Spiel {game_display.id}: Tor von {goal_team} um {time_str} ist als '{goal_type}' markiert, aber bei {situation_desc} sollte es '{'/'.join(expected_goal_types)}' sein")
         
-        # KRITISCH: Spezielle Behandlung von Strafen bei PP-Toren
-        # Diese Änderungen müssen PERSISTENT sein für nachfolgende Tore!
+        # PP-Tor beendet die älteste laufende Minor-Strafe des Gegners (persistent für nachfolgende Tore)
         if goal_type == 'PP':
-            # Finde die älteste aktive Strafe des Gegners, die durch ein PP-Tor beendet werden kann
-            clearable_penalties = []
-            
-            for penalty in penalties:
-                if not penalty['is_active']:
-                    continue
-                if penalty['team'] != goal_team:  # Strafe des Gegners
-                    penalty_type = penalty['penalty_type']
-                    penalty_start = penalty['time_seconds']
-                    penalty_duration = penalty['duration_minutes'] * 60
-                    penalty_end = penalty_start + penalty_duration
-                    
-                    # Prüfe, ob diese Strafe zum Zeitpunkt des PP-Tors aktiv war
-                    if penalty_start <= goal_time <= penalty_end:
-                        # Prüfe, ob diese Strafe durch ein PP-Tor beendet werden kann
-                        if penalty_type == '5 Min + Spieldauer':
-                            # Bei 5+Spieldauer: PP-Tor beendet die Strafe NICHT (Major Penalty)
-                            pass
-                        elif penalty_type == '5 Min':
-                            # Regular 5 Min penalties: NEVER cleared by goals, always run full time
-                            pass
-                        elif penalty_type == '2+2 Min':
-                            # 2+2 Min penalties können teilweise oder ganz beendet werden
-                            clearable_penalties.append(penalty)
-                        elif penalty['duration_minutes'] < 5:
-                            # Minor Penalties (< 5 Min): Können durch PP-Tor beendet werden
-                            clearable_penalties.append(penalty)
-            
-            # Beende nur die älteste clearable Strafe (earliest start time)
-            if clearable_penalties:
-                oldest_penalty = min(clearable_penalties, key=lambda p: p['time_seconds'])
-                penalty_type = oldest_penalty['penalty_type']
-                penalty_start = oldest_penalty['time_seconds']
-                
-                if penalty_type == '2+2 Min':
-                    # Bei 2+2 Min: Spezielle Regel für PP-Tore
-                    time_since_penalty_start = goal_time - penalty_start
-                    
-                    # Check if this penalty has already been partially cleared
-                    if 'cleared_segments' not in oldest_penalty:
-                        oldest_penalty['cleared_segments'] = 0
-                    
-                    if oldest_penalty['cleared_segments'] == 0:
-                        # First PP goal handling
-                        if time_since_penalty_start <= 120:  # Within first 2 minutes
-                            # Goal in first 2 minutes: clears first segment only
-                            oldest_penalty['cleared_segments'] = 1
-                            # Penalty continues for second 2-minute segment
-                        elif time_since_penalty_start <= 240:  # Between 2-4 minutes
-                            # Goal after 2 minutes: clears entire penalty
-                            oldest_penalty['is_active'] = False
-                        else:
-                            # Goal after 4 minutes - penalty already expired
-                            oldest_penalty['is_active'] = False
-                    elif oldest_penalty['cleared_segments'] == 1:
-                        # Second PP goal (only possible if first goal was in first 2 minutes)
-                        # This clears the remaining 2-minute segment
-                        oldest_penalty['is_active'] = False
-                elif oldest_penalty['duration_minutes'] < 5:
-                    # Minor Penalties (< 5 Min): Strafe endet bei PP-Tor
-                    oldest_penalty['is_active'] = False
+            engine.release_for_pp_goal(goal_time, goal_team)
     
     return warnings
 
 
+def _powerplay_check_events(game_display):
+    """
+    Tore und Strafen eines Spiels für die Powerplay-Prüfung, bevorzugt aus dessen GameTimeline
+    
+    Returns:
+        Tuple (Tore, Strafen) mit Einträgen (Sekunden, Zeit, Team, Tor-/Straftyp, ID)
+    """
+    timeline = getattr(game_display, 'timeline', None)
+    if timeline is not None:
+        return ([(goal.time_seconds, goal.minute, goal.team_code, goal.goal_type, goal.id)
+                 for goal in timeline.goals],
+                [(penalty.time_seconds, penalty.minute_of_game, penalty.team_code, penalty.penalty_type, penalty.id)
+                 for penalty in timeline.penalties])
+    
+    goal_events, penalty_events = [], []
+    for event in game_display.sorted_events:
+        data = event.get('data', {})
+        if event.get('type') == 'goal':
+            goal_events.append((event.get('time_for_sort', 0), data.get('minute', ''), data.get('team_code', ''),
+                                data.get('goal_type_display', ''), data.get('id', 0)))
+        elif event.get('type') == 'penalty':
+            penalty_events.append((event.get('time_for_sort', 0), data.get('minute_of_game', ''),
+                                   data.get('team_code', ''), data.get('penalty_type', ''), data.get('id', 0)))
+    return goal_events, penalty_events
+
+
 def get_penalty_duration_minutes(penalty_type):
     """Gibt die Dauer einer Strafe in Minuten zurück."""
     # Hauptmapping aus constants.py
@@ -470,8 +342,8 @@ def analyze_powerplay_situation(active_penalties, goal_team, team1_code, team2_c
     """
     Analysiert die Powerplay-Situation basierend auf aktiven Strafen.
     
-    WICHTIG: Die aktiven Strafen wurden bereits korrekt gefiltert unter Berücksichtigung der Regel,
-    dass ein Team maximal 2 Spieler gleichzeitig in der Strafbank haben kann.
+    WICHTIG: Die aktiven Strafen (PowerplayEngine.active_penalties) wurden bereits korrekt gefiltert
+    unter Berücksichtigung der Regel, dass ein Team maximal 2 Spieler gleichzeitig in der Strafbank haben kann.
     
     Returns:
         dict mit 'type' ('pp', 'sh', '4on4', 'even') und Details
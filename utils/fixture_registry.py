@@ -0,0 +1,192 @@
+"""
+Fixture registry: parses each fixture JSON file once and keeps a compact schedule index.
+
+Entries are keyed by absolute path and validated against (mtime, size) of the file,
+so a replaced fixture is re-parsed automatically on its next lookup.
+"""
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .fixture_helpers import resolve_fixture_path
+from .team_resolution import is_code_final
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FixtureIndex:
+    """Precomputed view of one fixture file"""
+    path: str
+    mtime: float
+    size: int
+    data: Dict = field(default_factory=dict)
+    hosts: List[str] = field(default_factory=list)
+    schedule: List[Dict] = field(default_factory=list)
+    games_by_round: Dict[str, List[Dict]] = field(default_factory=dict)
+    qf_game_numbers: List[int] = field(default_factory=list)
+    sf_game_numbers: List[int] = field(default_factory=list)
+    bronze_game_number: Optional[int] = None
+    gold_game_number: Optional[int] = None
+    placeholders: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_data(cls, path: str, mtime: float, size: int, data: Dict) -> 'FixtureIndex':
+        """
+        Builds the index from loaded fixture JSON
+
+        Args:
+            path: Absolute fixture path
+            mtime: Modification time the data was read at
+            size: File size the data was read at
+            data: Parsed fixture JSON
+
+        Returns:
+            FixtureIndex
+        """
+        index = cls(path=path, mtime=mtime, size=size, data=data,
+                    hosts=data.get("hosts", []), schedule=data.get("schedule", []))
+        placeholders = set()
+
+        for game_data in index.schedule:
+            index.games_by_round.setdefault(game_data.get("round", ""), []).append(game_data)
+
+            round_name = game_data.get("round", "").lower()
+            game_num = game_data.get("gameNumber")
+            if "quarterfinal" in round_name:
+                index.qf_game_numbers.append(game_num)
+            elif "semifinal" in round_name:
+                index.sf_game_numbers.append(game_num)
+            elif "bronze" in round_name or "3rd place" in round_name:
+                index.bronze_game_number = game_num
+            elif "final" in round_name or "gold" in round_name:
+                index.gold_game_number = game_num
+
+            for key in ("team1", "team2"):
+                code = game_data.get(key)
+                if code and not is_code_final(code):
+                    placeholders.add(code)
+
+        index.sf_game_numbers.sort()
+        index.placeholders = sorted(placeholders)
+        return index
+
+
+class FixtureRegistry:
+    """
+    Process-wide cache of parsed fixtures
+
+    A lookup costs one os.stat(); the JSON is parsed only when the file is new or
+    its (mtime, size) changed. Parse errors are cached as well and re-raised to the
+    caller, so a broken file is not re-read on every request.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Tuple[float, int], object]] = {}
+        self._lock = threading.Lock()
+        self.parse_count = 0
+
+    def get(self, absolute_path: Optional[str]) -> Optional[FixtureIndex]:
+        """
+        Returns the index for a fixture file
+
+        Args:
+            absolute_path: Absolute path of the fixture JSON
+
+        Returns:
+            FixtureIndex, or None if the path is empty or the file does not exist
+
+        Raises:
+            json.JSONDecodeError, OSError: If the file cannot be parsed
+        """
+        if not absolute_path:
+            return None
+        try:
+            stat = os.stat(absolute_path)
+        except OSError:
+            return None
+
+        key = (stat.st_mtime, stat.st_size)
+        cached_entry = self._entries.get(absolute_path)
+        if cached_entry is None or cached_entry[0] != key:
+            with self._lock:
+                cached_entry = self._entries.get(absolute_path)
+                if cached_entry is None or cached_entry[0] != key:
+                    cached_entry = (key, self._parse(absolute_path, *key))
+                    self._entries[absolute_path] = cached_entry
+
+        result = cached_entry[1]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def get_for_year(self, year_obj) -> Optional[FixtureIndex]:
+        """
+        Returns the index for a championship year's fixture
+
+        Args:
+            year_obj: ChampionshipYear with fixture_path
+
+        Returns:
+            FixtureIndex or None (no fixture_path or missing file)
+        """
+        if not year_obj.fixture_path:
+            return None
+        return self.get(resolve_fixture_path(year_obj.fixture_path))
+
+    def preload(self, years) -> int:
+        """
+        Parses the fixtures of the given years ahead of the first request
+
+        Args:
+            years: Iterable of ChampionshipYear objects
+
+        Returns:
+            Number of fixtures available in the registry
+        """
+        loaded = 0
+        for year_obj in years:
+            try:
+                if self.get_for_year(year_obj) is not None:
+                    loaded += 1
+            except (ValueError, OSError, AttributeError) as e:
+                logger.warning(f"Could not parse fixture {year_obj.fixture_path}: {e}")
+        return loaded
+
+    def invalidate(self, absolute_path: Optional[str] = None) -> None:
+        """
+        Drops one cached fixture or the whole registry
+
+        Args:
+            absolute_path: Path to drop (None = all)
+        """
+        with self._lock:
+            if absolute_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(absolute_path, None)
+
+    def _parse(self, absolute_path: str, mtime: float, size: int):
+        self.parse_count += 1
+        try:
+            with open(absolute_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return FixtureIndex.from_data(absolute_path, mtime, size, data)
+        except (ValueError, OSError, AttributeError) as e:
+            return e
+
+
+_fixture_registry = FixtureRegistry()
+
+
+def get_fixture_registry() -> FixtureRegistry:
+    """Returns the process-wide FixtureRegistry"""
+    return _fixture_registry
+
+
+def get_fixture_index(year_obj) -> Optional[FixtureIndex]:
+    """Shortcut for get_fixture_registry().get_for_year(year_obj)"""
+    return _fixture_registry.get_for_year(year_obj)
@@ -0,0 +1,171 @@
+"""
+Zeitleiste eines Spiels: Tore, Strafen und Torschüsse mit abgeleiteten Kennzahlen.
+
+GameTimeline.build() bekommt die kompakten Zeilen eines Spiels (Spaltentupel
+statt ORM-Objekte) und erzeugt in einem Durchlauf die typisierten, nach
+Spielzeit sortierten Ereignisse sowie die Zähler pro Team: Tore pro Drittel,
+PP-Tore, Strafminuten, PP-Gelegenheiten (gleichzeitige Strafen heben sich auf)
+und die auf vier Drittel aufgefüllten Torschüsse.
+
+GameService.get_timelines() lädt die Zeilen beliebig vieler Spiele mit drei
+Abfragen. Jahresansicht, Spielstatistik, GameService und
+check_powerplay_penalty_consistency arbeiten auf denselben Zeitleisten.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Union
+
+from constants import PIM_MAP, POWERPLAY_PENALTY_TYPES, PERIOD_1_END, PERIOD_2_END, PERIOD_3_END
+
+PERIODS = (1, 2, 3, 4)  # 4 = Verlängerung
+
+
+class GoalEvent(NamedTuple):
+    """Tor; time_seconds ist 0, wenn keine gültige Spielzeit erfasst ist"""
+    time_seconds: int
+    id: int
+    team_code: str
+    minute: str
+    goal_type: str
+    is_empty_net: bool
+    scorer_id: Optional[int]
+    assist1_id: Optional[int]
+    assist2_id: Optional[int]
+
+    kind = 'goal'
+
+
+class PenaltyEvent(NamedTuple):
+    """Strafe; time_seconds ist 0, wenn keine gültige Spielzeit erfasst ist"""
+    time_seconds: int
+    id: int
+    team_code: str
+    minute_of_game: str
+    penalty_type: str
+    reason: Optional[str]
+    player_id: Optional[int]
+
+    kind = 'penalty'
+
+
+TimelineEvent = Union[GoalEvent, PenaltyEvent]
+
+
+def period_of(time_seconds: int) -> int:
+    """Drittel (1-3) oder 4 für die Verlängerung"""
+    if time_seconds <= PERIOD_1_END:
+        return 1
+    if time_seconds <= PERIOD_2_END:
+        return 2
+    if time_seconds <= PERIOD_3_END:
+        return 3
+    return 4
+
+
+def count_powerplay_opportunities(penalties: Iterable, team1_code: str, team2_code: str) -> Dict[str, int]:
+    """
+    PP-Gelegenheiten beider Teams
+
+    Jede Strafe aus POWERPLAY_PENALTY_TYPES ist eine Gelegenheit des Gegners.
+    Zur selben Spielzeit ausgesprochene Strafen beider Teams heben sich paarweise auf.
+
+    Args:
+        penalties: Objekte mit team_code, penalty_type und minute_of_game
+        team1_code: Team 1
+        team2_code: Team 2
+
+    Returns:
+        Dictionary {team_code: Anzahl}
+    """
+    # Pro Spielzeit: [Gelegenheiten Team 1, Gelegenheiten Team 2]
+    slots: Dict[object, List[int]] = {}
+    for penalty in penalties:
+        if penalty.penalty_type not in POWERPLAY_PENALTY_TYPES:
+            continue
+        if penalty.team_code == team1_code:
+            slots.setdefault(penalty.minute_of_game, [0, 0])[1] += 1
+        elif penalty.team_code == team2_code:
+            slots.setdefault(penalty.minute_of_game, [0, 0])[0] += 1
+
+    opportunities = {team1_code: 0, team2_code: 0}
+    for team1_slots, team2_slots in slots.values():
+        cancelled = min(team1_slots, team2_slots)
+        opportunities[team1_code] += team1_slots - cancelled
+        opportunities[team2_code] += team2_slots - cancelled
+    return opportunities
+
+
+@dataclass
+class GameTimeline:
+    """
+    Ereignisse und Kennzahlen eines Spiels aus Sicht der aufgelösten Team-Codes
+
+    events ist nach Spielzeit sortiert; bei gleicher Zeit stehen Tore vor Strafen,
+    innerhalb einer Art gilt die Erfassungsreihenfolge. Zähler sind für beide
+    Teams vorhanden, auch ohne Ereignisse.
+    """
+    game_id: int
+    team1_code: str
+    team2_code: str
+    events: List[TimelineEvent] = field(default_factory=list)
+    goals: List[GoalEvent] = field(default_factory=list)
+    penalties: List[PenaltyEvent] = field(default_factory=list)
+    sog_recorded: Dict[str, Dict[int, int]] = field(default_factory=dict)  # erfasste Werte, alle Team-Codes
+    sog: Dict[str, Dict[int, int]] = field(default_factory=dict)  # beide Teams, Drittel 1-4 aufgefüllt
+    sog_totals: Dict[str, int] = field(default_factory=dict)
+    goals_by_period: Dict[str, Dict[int, int]] = field(default_factory=dict)
+    pp_goals: Dict[str, int] = field(default_factory=dict)
+    pim: Dict[str, int] = field(default_factory=dict)
+    pp_opportunities: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, game_id: int, team1_code: str, team2_code: str,
+              goal_rows: Sequence[tuple] = (), penalty_rows: Sequence[tuple] = (),
+              sog_rows: Sequence[tuple] = ()) -> 'GameTimeline':
+        """
+        Erzeugt die Zeitleiste in einem Durchlauf über die Zeilen des Spiels
+
+        Args:
+            game_id: Spiel-ID
+            team1_code: Aufgelöster Code von Team 1
+            team2_code: Aufgelöster Code von Team 2
+            goal_rows: Tupel (time_seconds, id, team_code, minute, goal_type, is_empty_net,
+                       scorer_id, assist1_id, assist2_id), nach Spielzeit, Team-Code und ID sortiert
+            penalty_rows: Tupel (time_seconds, id, team_code, minute_of_game, penalty_type,
+                          reason, player_id), nach Spielzeit, Team-Code und ID sortiert
+            sog_rows: Tupel (team_code, period, shots)
+
+        Returns:
+            GameTimeline
+        """
+        timeline = cls(game_id, team1_code, team2_code)
+        teams = (team1_code, team2_code)
+        timeline.goals_by_period = {team: dict.fromkeys(PERIODS, 0) for team in teams}
+        timeline.pp_goals = dict.fromkeys(teams, 0)
+        timeline.pim = dict.fromkeys(teams, 0)
+
+        for row in goal_rows:
+            goal = GoalEvent(row[0] or 0, *row[1:])
+            timeline.goals.append(goal)
+            if goal.team_code in timeline.pp_goals:
+                timeline.goals_by_period[goal.team_code][period_of(goal.time_seconds)] += 1
+                if goal.goal_type == 'PP':
+                    timeline.pp_goals[goal.team_code] += 1
+
+        for row in penalty_rows:
+            penalty = PenaltyEvent(row[0] or 0, *row[1:])
+            timeline.penalties.append(penalty)
+            if penalty.team_code in timeline.pim:
+                timeline.pim[penalty.team_code] += PIM_MAP.get(penalty.penalty_type, 0)
+        timeline.pp_opportunities = count_powerplay_opportunities(timeline.penalties, team1_code, team2_code)
+
+        # Beide Listen sind bereits sortiert; stabile Sortierung hält Tore vor Strafen gleicher Zeit
+        timeline.events = sorted(timeline.goals + timeline.penalties, key=lambda event: event.time_seconds)
+
+        for team_code, period, shots in sog_rows:
+            timeline.sog_recorded.setdefault(team_code, {})[period] = shots
+        for team in teams:
+            recorded = timeline.sog_recorded.get(team, {})
+            timeline.sog[team] = {period: recorded.get(period, 0) for period in PERIODS}
+            timeline.sog_totals[team] = sum(timeline.sog[team].values())
+        return timeline
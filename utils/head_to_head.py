@@ -0,0 +1,169 @@
+"""
+Head-to-Head Tiebreaker-Engine
+
+Baut einmal pro Jahr (bzw. pro Spielliste) eine paarweise Ergebnis-Matrix auf,
+sodass der direkte Vergleich zweier Teams in O(1) nachgeschlagen werden kann,
+statt für jede Punktgleichheit alle Spiele erneut zu durchsuchen.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from models import Game, TeamStats
+from constants import PRELIM_ROUNDS, MAX_PRELIM_GAMES_PER_TEAM
+
+
+@dataclass
+class HeadToHeadRecord:
+    """Direkter Vergleich aus Sicht eines Teams gegen genau einen Gegner"""
+    games: int = 0
+    pts: int = 0
+    gf: int = 0
+    ga: int = 0
+
+
+class HeadToHeadIndex:
+    """
+    Paarweise Ergebnis-Matrix, Schlüssel (team_a, team_b)
+
+    Jedes gewertete Spiel wird genau einmal eingetragen, der Eintrag (b, a) ist
+    die gespiegelte Sicht von (a, b). Die Sortierung folgt der IIHF-Kaskade:
+    H2H-Punkte, H2H-Tordifferenz, H2H-Tore, rekursiv auf verbleibende
+    Teil-Gleichstände angewendet, danach Gesamt-Tordifferenz und Gesamt-Tore.
+    """
+
+    def __init__(self, games: Iterable[Game], rounds: Optional[Iterable[str]] = PRELIM_ROUNDS):
+        """
+        Args:
+            games: Spiele, aus denen der direkte Vergleich berechnet wird
+            rounds: Nur Spiele dieser Runden berücksichtigen (None = alle Spiele)
+        """
+        self._pairs: Dict[Tuple[str, str], HeadToHeadRecord] = {}
+        allowed_rounds = set(rounds) if rounds is not None else None
+        for game in games:
+            if game.team1_score is None or game.team2_score is None:
+                continue
+            if allowed_rounds is not None and game.round not in allowed_rounds:
+                continue
+            self._add_game(game)
+
+    @classmethod
+    def of(cls, games_or_index: Union['HeadToHeadIndex', Iterable[Game]],
+           rounds: Optional[Iterable[str]] = PRELIM_ROUNDS) -> 'HeadToHeadIndex':
+        """Gibt einen bestehenden Index unverändert zurück oder baut ihn aus einer Spielliste"""
+        if isinstance(games_or_index, cls):
+            return games_or_index
+        return cls(games_or_index, rounds)
+
+    def _add_game(self, game: Game) -> None:
+        team1_points, team2_points = 0, 0
+        if game.result_type == 'REG':
+            team1_points, team2_points = (3, 0) if game.team1_score > game.team2_score else (0, 3)
+        elif game.result_type in ['OT', 'SO']:
+            team1_points, team2_points = (2, 1) if game.team1_score > game.team2_score else (1, 2)
+
+        for code, opponent, gf, ga, pts in (
+            (game.team1_code, game.team2_code, game.team1_score, game.team2_score, team1_points),
+            (game.team2_code, game.team1_code, game.team2_score, game.team1_score, team2_points),
+        ):
+            record = self._pairs.get((code, opponent))
+            if record is None:
+                record = self._pairs[(code, opponent)] = HeadToHeadRecord()
+            record.games += 1
+            record.pts += pts
+            record.gf += gf
+            record.ga += ga
+
+    def record(self, team_a: str, team_b: str) -> Optional[HeadToHeadRecord]:
+        """Direkter Vergleich von team_a gegen team_b (None, falls nicht gespielt)"""
+        return self._pairs.get((team_a, team_b))
+
+    def has_played(self, team_a: str, team_b: str) -> bool:
+        """Prüft, ob ein gewertetes direktes Spiel existiert"""
+        return (team_a, team_b) in self._pairs
+
+    def mini_table(self, teams: List[TeamStats]) -> Dict[str, Tuple[int, int, int]]:
+        """
+        Mini-Tabelle der Spiele untereinander
+
+        Returns:
+            Dictionary Team-Code -> (H2H Punkte, H2H Tordifferenz, H2H Tore erzielt)
+        """
+        table = {}
+        for team in teams:
+            pts = gf = ga = 0
+            for opponent in teams:
+                if opponent is team:
+                    continue
+                record = self._pairs.get((team.name, opponent.name))
+                if record is not None:
+                    pts += record.pts
+                    gf += record.gf
+                    ga += record.ga
+            table[team.name] = (pts, gf - ga, gf)
+        return table
+
+    def rank(self, teams_list: List[TeamStats]) -> List[TeamStats]:
+        """
+        Sortiert Teams nach Punkten und löst Punktgleichheiten per direktem Vergleich auf
+
+        Args:
+            teams_list: TeamStats einer Gruppe (Reihenfolge bei vollständigem Gleichstand bleibt erhalten)
+
+        Returns:
+            Sortierte Liste
+        """
+        if len(teams_list) <= 1:
+            return teams_list
+
+        teams_by_points: Dict[int, List[TeamStats]] = {}
+        for team in teams_list:
+            teams_by_points.setdefault(team.pts, []).append(team)
+
+        result = []
+        for points in sorted(teams_by_points.keys(), reverse=True):
+            result.extend(self.sort_tied(teams_by_points[points]))
+        return result
+
+    def sort_tied(self, tied_teams: List[TeamStats]) -> List[TeamStats]:
+        """
+        Sortiert punktgleiche Teams nach IIHF-Regeln
+
+        - 2 Teams: Direktes Spiel entscheidet, falls es gespielt wurde
+        - 3+ Teams: Mini-Tabelle nur, wenn alle Teams alle Vorrundenspiele absolviert haben
+        - Bleibt innerhalb der Mini-Tabelle ein kleinerer Gleichstand, wird die
+          Kaskade auf diese Teams erneut angewendet
+        - Sonst: Gesamt-Tordifferenz, dann Gesamt-Tore
+        """
+        if len(tied_teams) <= 1:
+            return tied_teams
+
+        if len(tied_teams) == 2:
+            use_head_to_head = self.has_played(tied_teams[0].name, tied_teams[1].name)
+        else:
+            use_head_to_head = all(team.gp >= MAX_PRELIM_GAMES_PER_TEAM for team in tied_teams)
+
+        if not use_head_to_head:
+            return _sort_by_overall(tied_teams)
+
+        table = self.mini_table(tied_teams)
+        ordered = sorted(tied_teams, key=lambda team: table[team.name], reverse=True)
+
+        result = []
+        start = 0
+        while start < len(ordered):
+            end = start + 1
+            while end < len(ordered) and table[ordered[end].name] == table[ordered[start].name]:
+                end += 1
+            sub_tie = ordered[start:end]
+            if len(sub_tie) == len(tied_teams):
+                # Direkter Vergleich trennt niemanden
+                result.extend(_sort_by_overall(sub_tie))
+            else:
+                result.extend(self.sort_tied(sub_tie))
+            start = end
+        return result
+
+
+def _sort_by_overall(teams: List[TeamStats]) -> List[TeamStats]:
+    return sorted(teams, key=lambda x: (x.gd, x.gf), reverse=True)
@@ -5,7 +5,9 @@ from typing import Dict, List
 
 from models import Game, ChampionshipYear, TeamStats
 from constants import PLAYOFF_ROUNDS, QUARTERFINAL_1, QUARTERFINAL_2, QUARTERFINAL_3, QUARTERFINAL_4, SEMIFINAL_1, SEMIFINAL_2
-from .team_resolution import is_code_final, get_resolved_team_code, resolve_fixture_path_local
+from .team_resolution import is_code_final, resolve_fixture_path_local
+from .playoff_resolver import PlayoffDependencyGraph
+from .fixture_registry import get_fixture_registry
 
 
 def _build_playoff_team_map_for_year(
@@ -30,8 +32,9 @@ def _build_playoff_team_map_for_year(
         absolute_fixture_path = resolve_fixture_path_local(year_obj.fixture_path, current_app)
         if absolute_fixture_path and os.path.exists(absolute_fixture_path):
             try:
-                with open(absolute_fixture_path, 'r', encoding='utf-8') as f:
-                    fixture_data = json.load(f)
+                # Parsed once per file version by the fixture registry
+                fixture_index = get_fixture_registry().get(absolute_fixture_path)
+                fixture_data = fixture_index.data if fixture_index else {}
                 # Use .get for game numbers list, falling back to constants if key missing or empty
                 qf_game_numbers = fixture_data.get("qf_game_numbers") or [QUARTERFINAL_1, QUARTERFINAL_2, QUARTERFINAL_3, QUARTERFINAL_4]
                 sf_game_numbers = fixture_data.get("sf_game_numbers") or [SEMIFINAL_1, SEMIFINAL_2]
@@ -74,51 +77,39 @@ def _build_playoff_team_map_for_year(
         pass
 
 
-    # 2. Iteratively resolve W(game_num) and L(game_num)
-    max_passes = 10 
-    passes = 0
-    changed_in_pass = True
-
-    while changed_in_pass and passes < max_passes:
-        changed_in_pass = False
-        passes += 1
-
-        # First, try to resolve existing non-final values in the map
-        for placeholder_key, mapped_code in list(playoff_team_map.items()):
-            if not is_code_final(mapped_code):
-                # get_resolved_team_code is still a placeholder itself, this won't do much yet
-                resolved_code = get_resolved_team_code(mapped_code, playoff_team_map, all_games_map_by_number)
-                if resolved_code != mapped_code and is_code_final(resolved_code):
-                    playoff_team_map[placeholder_key] = resolved_code
-                    changed_in_pass = True
-        
-        # Then, determine W/L for playoff games and update map
-        for game in all_games_for_year:
-            if game.round in PLAYOFF_ROUNDS and game.game_number is not None and \
-               game.team1_score is not None and game.team2_score is not None:
-                
-                # Resolve game participants first. Critical for W(QF1) vs W(QF2) type games.
-                # Again, this relies on get_resolved_team_code.
-                r_team1 = get_resolved_team_code(game.team1_code, playoff_team_map, all_games_map_by_number)
-                r_team2 = get_resolved_team_code(game.team2_code, playoff_team_map, all_games_map_by_number)
-
-                if not is_code_final(r_team1) or not is_code_final(r_team2):
-                    # If participants of this game aren't resolved yet, can't determine W/L for map.
-                    continue 
-
-                winner_actual_code = r_team1 if game.team1_score > game.team2_score else r_team2
-                loser_actual_code = r_team2 if game.team1_score > game.team2_score else r_team1
-                
-                w_placeholder = f"W({game.game_number})"
-                l_placeholder = f"L({game.game_number})"
-
-                if playoff_team_map.get(w_placeholder) != winner_actual_code:
-                    playoff_team_map[w_placeholder] = winner_actual_code
-                    changed_in_pass = True
-                
-                if playoff_team_map.get(l_placeholder) != loser_actual_code:
-                    playoff_team_map[l_placeholder] = loser_actual_code
-                    changed_in_pass = True
+    # 2. Resolve W(game_num) and L(game_num) in one topological pass over the
+    #    placeholder dependency graph (A1 -> W(57) -> W(61) -> ...)
+    graph = PlayoffDependencyGraph(playoff_team_map, all_games_map_by_number)
+
+    # First, resolve existing non-final values in the map
+    unresolved_entries = {key: code for key, code in playoff_team_map.items() if not is_code_final(code)}
+    if unresolved_entries:
+        for placeholder_key, mapped_code in unresolved_entries.items():
+            resolved_code = graph.resolve(mapped_code)
+            if is_code_final(resolved_code):
+                playoff_team_map[placeholder_key] = resolved_code
+        graph.reset()
+
+    # Then, determine W/L for playoff games. Adding W(X)/L(X) entries does not change
+    # any resolution (they equal the game-derived result), so the graph stays valid.
+    played_playoff_games = [
+        game for game in all_games_for_year
+        if game.round in PLAYOFF_ROUNDS and game.game_number is not None and
+           game.team1_score is not None and game.team2_score is not None
+    ]
+    graph.resolve_many([code for game in played_playoff_games for code in (game.team1_code, game.team2_code)])
+    for game in played_playoff_games:
+        r_team1 = graph.resolve(game.team1_code)
+        r_team2 = graph.resolve(game.team2_code)
+
+        if not is_code_final(r_team1) or not is_code_final(r_team2):
+            # If participants of this game aren't resolved, can't determine W/L for map.
+            continue
+
+        winner_actual_code = r_team1 if game.team1_score > game.team2_score else r_team2
+        loser_actual_code = r_team2 if game.team1_score > game.team2_score else r_team1
+        playoff_team_map[f"W({game.game_number})"] = winner_actual_code
+        playoff_team_map[f"L({game.game_number})"] = loser_actual_code
     
     # 2.5 SF Mapping für Medal Games
     # Die Bronze/Gold Medal Games verwenden L(SF1), L(SF2), W(SF1), W(SF2) Platzhalter
@@ -160,17 +151,12 @@ def _build_playoff_team_map_for_year(
         # This is highly dependent on game data placeholders. The W(X) system is more common.
         # Also, host team adjustments for SF pairings would be applied here.
 
-    # Final cleanup pass
-    final_passes = 3 
-    for _ in range(final_passes):
-        map_changed_in_final_pass = False
-        for placeholder_key, mapped_code in list(playoff_team_map.items()):
-            if not is_code_final(mapped_code):
-                resolved_code = get_resolved_team_code(mapped_code, playoff_team_map, all_games_map_by_number)
-                if resolved_code != mapped_code and is_code_final(resolved_code):
-                    playoff_team_map[placeholder_key] = resolved_code
-                    map_changed_in_final_pass = True
-        if not map_changed_in_final_pass:
-            break
+    # Final cleanup pass (SF1/SF2 entries were added after the W/L pass)
+    graph.reset()
+    for placeholder_key, mapped_code in list(playoff_team_map.items()):
+        if not is_code_final(mapped_code):
+            resolved_code = graph.resolve(mapped_code)
+            if is_code_final(resolved_code):
+                playoff_team_map[placeholder_key] = resolved_code
             
     return playoff_team_map
\ No newline at end of file
@@ -15,6 +15,151 @@ from models import Game, ChampionshipYear, TeamStats
 from constants import PLAYOFF_ROUNDS, PRELIM_ROUNDS
 
 
+# Vorkompilierte Muster für W(57)/L(57) bzw. W(SF1)
+_WIN_LOSS_PATTERN = re.compile(r"^([WL])\((.+)\)$")
+
+_UNRESOLVED = ('unresolved',)
+
+
+def _is_final(team_code: Optional[str]) -> bool:
+    """Prüft, ob ein Team-Code ein definitiver 3-Buchstaben-Ländercode ist."""
+    if not team_code:
+        return False
+    return len(team_code) == 3 and team_code.isalpha() and team_code.isupper()
+
+
+class PlayoffDependencyGraph:
+    """
+    Expliziter Abhängigkeitsgraph (DAG) der Team-Platzhalter eines Jahres.
+
+    Jeder Platzhalter hängt entweder von einem Map-Eintrag ab (A1 -> CAN,
+    SF1 -> 61) oder von den beiden Teilnehmern eines gespielten Spiels
+    (W(61) -> W(57), W(58)). Die Auflösung erfolgt in einem topologischen
+    Durchlauf; Ergebnisse werden memoisiert, sodass jeder Knoten genau einmal
+    ausgewertet wird. Zyklen bleiben unaufgelöst.
+    """
+
+    def __init__(self, playoff_team_map: Dict[str, str], games_by_number: Dict[int, Game]):
+        """
+        Args:
+            playoff_team_map: Zuordnung Platzhalter -> Code (wird nicht kopiert, nach Änderungen reset() aufrufen)
+            games_by_number: Spiele des Jahres nach Spielnummer
+        """
+        self.playoff_team_map = playoff_team_map
+        self.games_by_number = games_by_number
+        self._rules: Dict[str, tuple] = {}
+        self._resolved: Dict[str, str] = {}
+
+    def reset(self) -> None:
+        """Verwirft Graph und Ergebnisse, z.B. nach Änderungen an der Playoff-Map."""
+        self._rules.clear()
+        self._resolved.clear()
+
+    def dependencies(self, code: str) -> Tuple[str, ...]:
+        """Gibt die direkten Vorgänger eines Platzhalters im Graphen zurück."""
+        rule = self._rule(code)
+        if rule[0] == 'map':
+            return (rule[1],)
+        if rule[0] == 'game':
+            return (rule[2].team1_code or "", rule[2].team2_code or "")
+        return ()
+
+    def edges(self) -> Dict[str, Tuple[str, ...]]:
+        """Alle bisher aufgebauten Kanten (Platzhalter -> Vorgänger)."""
+        return {code: self.dependencies(code) for code in self._rules}
+
+    def resolve(self, code: Optional[str]) -> str:
+        """Löst einen einzelnen Platzhalter auf (Original-Platzhalter, falls nicht möglich)."""
+        if not code:
+            return ""
+        if code not in self._resolved:
+            self.resolve_many((code,))
+        return self._resolved[code]
+
+    def resolve_many(self, codes) -> None:
+        """Löst alle übergebenen Platzhalter samt Vorgängern in einem topologischen Durchlauf auf."""
+        for code in self._topological_order(codes):
+            self._resolved[code] = self._evaluate(code)
+
+    def _topological_order(self, roots) -> List[str]:
+        order: List[str] = []
+        visited = set()
+        for root in roots:
+            if not root or root in self._resolved or root in visited:
+                continue
+            visited.add(root)
+            stack = [(root, iter(self.dependencies(root)))]
+            while stack:
+                node, pending = stack[-1]
+                for dep in pending:
+                    if dep and dep not in self._resolved and dep not in visited:
+                        visited.add(dep)
+                        stack.append((dep, iter(self.dependencies(dep))))
+                        break
+                else:
+                    stack.pop()
+                    order.append(node)
+        return order
+
+    def _rule(self, code: str) -> tuple:
+        rule = self._rules.get(code)
+        if rule is None:
+            rule = self._rules[code] = self._build_rule(code)
+        return rule
+
+    def _build_rule(self, code: str) -> tuple:
+        if _is_final(code):
+            return ('final',)
+
+        target = self.playoff_team_map.get(code)
+        if target is not None:
+            if target == code:
+                return _UNRESOLVED
+            return ('map', target)
+
+        match = _WIN_LOSS_PATTERN.match(code)
+        if not match:
+            return _UNRESOLVED
+
+        prefix, inner_code = match.groups()
+        if inner_code.isdigit():
+            game_num = int(inner_code)
+        else:
+            # inner_code könnte SF1, SF2, etc. sein
+            resolved_inner = self.playoff_team_map.get(inner_code)
+            if not (resolved_inner and resolved_inner.isdigit()):
+                return _UNRESOLVED
+            game_num = int(resolved_inner)
+
+        game = self.games_by_number.get(game_num)
+        if not game or game.team1_score is None or game.team2_score is None:
+            return _UNRESOLVED
+        # Verhindere direkte Rekursion
+        if game.team1_code == code or game.team2_code == code:
+            return _UNRESOLVED
+        return ('game', prefix, game)
+
+    def _evaluate(self, code: str) -> str:
+        rule = self._rule(code)
+        kind = rule[0]
+        if kind == 'final':
+            return code
+        if kind == 'map':
+            resolved_target = rule[1] if _is_final(rule[1]) else self._resolved.get(rule[1])
+            return resolved_target if _is_final(resolved_target) else code
+        if kind == 'game':
+            prefix, game = rule[1], rule[2]
+            team1_resolved = self._resolved.get(game.team1_code or "")
+            team2_resolved = self._resolved.get(game.team2_code or "")
+            if not (_is_final(team1_resolved) and _is_final(team2_resolved)):
+                return code
+            team1_won = game.team1_score > game.team2_score
+            if prefix == 'W':
+                return team1_resolved if team1_won else team2_resolved
+            return team2_resolved if team1_won else team1_resolved
+        return code
+
+
 class PlayoffResolver:
     """
     Zentrale Klasse zur Auflösung von Playoff-Team-Codes.
@@ -34,6 +179,7 @@ class PlayoffResolver:
         self.year_obj = year_obj
         self.all_games = all_games
         self._playoff_team_map = None
+        self._graph: Optional[PlayoffDependencyGraph] = None
         self._games_by_number = {g.game_number: g for g in all_games if g.game_number is not None}
         
     def get_resolved_code(self, placeholder_code: str) -> str:
@@ -99,13 +245,14 @@ class PlayoffResolver:
             self.all_games,
             prelim_standings_by_group
         )
+        self._graph = PlayoffDependencyGraph(self._playoff_team_map, self._games_by_number)
     
     def _resolve_team_code(self, placeholder_code: str) -> str:
         """
         Interne Methode zur Auflösung eines Team-Codes.
         
-        Diese Methode implementiert die Auflösungslogik mit Zyklenerkennung
-        und iterativer Auflösung von verketteten Platzhaltern.
+        Die Auflösung läuft über den memoisierten Abhängigkeitsgraphen, verkettete
+        Platzhalter werden also pro Resolver-Instanz nur einmal ausgewertet.
         
         Args:
             placeholder_code: Der aufzulösende Platzhalter
@@ -115,79 +262,34 @@ class PlayoffResolver:
         """
         if not placeholder_code:
             return ""
-            
-        if self._is_code_final(placeholder_code):
-            return placeholder_code
+        return self._graph.resolve(placeholder_code)
+    
+    def resolve_all(self) -> Dict[int, Tuple[str, str]]:
+        """
+        Löst die Teilnehmer aller Spiele des Jahres in einem Durchlauf auf.
         
-        current_code = placeholder_code
-        visited_codes = {current_code}  # Zur Zyklenerkennung
+        Returns:
+            Dictionary Spiel-ID -> (aufgelöster_team1_code, aufgelöster_team2_code)
+        """
+        if self._playoff_team_map is None:
+            self._initialize_playoff_map()
         
-        # Maximal 10 Iterationen zur Auflösung
-        for _ in range(10):
-            if self._is_code_final(current_code):
-                return current_code
-            
-            # Versuche direkte Auflösung über die Map
-            resolved_from_map = self._playoff_team_map.get(current_code)
-            
-            if resolved_from_map is not None:
-                if self._is_code_final(resolved_from_map):
-                    return resolved_from_map
-                
-                # Prüfe auf Selbstreferenz
-                if resolved_from_map == current_code and not re.match(r"^[WL]\((\d+)\)$", current_code):
-                    break
-                
-                current_code = resolved_from_map
-            
-            # Versuche Auflösung über Spielergebnis für W(X) oder L(X)
-            elif re.match(r"^[WL]\(.+\)$", current_code):
-                match = re.match(r"^([WL])\((.+)\)$", current_code)
-                prefix = match.group(1)  # W oder L
-                inner_code = match.group(2)
-                
-                # Prüfe ob inner_code eine Zahl ist
-                if inner_code.isdigit():
-                    game_num = int(inner_code)
-                else:
-                    # inner_code könnte SF1, SF2, etc. sein - versuche es aufzulösen
-                    resolved_inner = self._playoff_team_map.get(inner_code)
-                    if resolved_inner and resolved_inner.isdigit():
-                        game_num = int(resolved_inner)
-                    else:
-                        # Kann nicht aufgelöst werden
-                        break
-                
-                game = self._games_by_number.get(game_num)
-                if game and game.team1_score is not None and game.team2_score is not None:
-                    # Verhindere direkte Rekursion
-                    if game.team1_code == current_code or game.team2_code == current_code:
-                        break
-                    
-                    # Löse Spielteilnehmer auf
-                    team1_resolved = self._resolve_team_code(game.team1_code)
-                    team2_resolved = self._resolve_team_code(game.team2_code)
-                    
-                    if self._is_code_final(team1_resolved) and self._is_code_final(team2_resolved):
-                        winner_code = team1_resolved if game.team1_score > game.team2_score else team2_resolved
-                        loser_code = team2_resolved if game.team1_score > game.team2_score else team1_resolved
-                        
-                        current_code = winner_code if prefix == 'W' else loser_code
-                    else:
-                        break
-                else:
-                    break
-            else:
-                # Unbekanntes Format oder nicht auflösbarer Platzhalter
-                break
-            
-            # Zyklenerkennung
-            if current_code in visited_codes:
-                return placeholder_code
-            visited_codes.add(current_code)
+        codes = [code for game in self.all_games for code in (game.team1_code, game.team2_code)]
+        self._graph.resolve_many(codes)
+        return {
+            game.id: (self._graph.resolve(game.team1_code), self._graph.resolve(game.team2_code))
+            for game in self.all_games
+        }
+    
+    def get_dependency_graph(self) -> Dict[str, Tuple[str, ...]]:
+        """
+        Gibt den Abhängigkeitsgraphen aller Spiel-Platzhalter zurück (Debugging).
         
-        # Rückgabe des finalen Codes oder des ursprünglichen Platzhalters
-        return current_code if self._is_code_final(current_code) else placeholder_code
+        Returns:
+            Dictionary Platzhalter -> direkte Vorgänger (z.B. 'W(61)' -> ('W(57)', 'W(58)'))
+        """
+        self.resolve_all()
+        return self._graph.edges()
     
     def _is_code_final(self, team_code: Optional[str]) -> bool:
         """
@@ -217,6 +319,21 @@ class PlayoffResolver:
             self._initialize_playoff_map()
         return self._playoff_team_map.copy()
     
+    def update_mappings(self, mappings: Dict[str, str]) -> None:
+        """
+        Ergänzt die interne Playoff-Map um zusätzliche Zuordnungen.
+        
+        Wird z.B. für SF1/SF2-Spielnummern und seed1-seed4 verwendet, die
+        erst nach der Auflösung der Viertelfinals feststehen.
+        
+        Args:
+            mappings: Dictionary mit Platzhalter-zu-Code-Zuordnungen
+        """
+        if self._playoff_team_map is None:
+            self._initialize_playoff_map()
+        self._playoff_team_map.update(mappings)
+        self._graph.reset()
+    
     def resolve_game_participants(self, game: Game) -> Tuple[str, str]:
         """
         Löst beide Teilnehmer eines Spiels auf.
@@ -0,0 +1,180 @@
+"""
+Strafbank-Zustand eines Spiels für die Powerplay-Prüfung.
+
+Die PowerplayEngine legt pro Team eine PenaltyBox an. Diese berechnet einmal die
+effektiven Strafzeiten aller Strafen: Höchstens zwei Strafen laufen gleichzeitig,
+weitere warten auf das früheste Ende. Daraus entsteht eine Stufenfunktion der
+Strafbank; die aktiven Strafen zu einem Zeitpunkt liefert eine binäre Suche in
+O(log n).
+
+Die Tore werden in Spielzeit-Reihenfolge durchlaufen. Ein PP-Tor beendet die
+älteste laufende Minor-Strafe des Gegners (2+2: in den ersten zwei Minuten nur
+das erste Segment). Die Kandidaten liegen pro Team in einem Heap nach
+Startzeit. Nur die Strafbank des betroffenen Teams wird ab der beendeten Strafe
+neu berechnet; Majors (5 Min, 5 Min + Spieldauer) laufen immer voll.
+"""
+
+import heapq
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+MAX_SERVED_PENALTIES = 2
+SKATERS = 5
+
+# Strafen, die ein PP-Tor nie vorzeitig beendet
+MAJOR_PENALTY_TYPES = ('5 Min', '5 Min + Spieldauer')
+DOUBLE_MINOR_TYPE = '2+2 Min'
+DOUBLE_MINOR_SEGMENT_SECONDS = 120
+
+
+def is_releasable(penalty: Dict) -> bool:
+    """Kann ein PP-Tor diese Strafe (oder ein Segment davon) beenden?"""
+    if penalty['penalty_type'] == DOUBLE_MINOR_TYPE:
+        return True
+    return penalty['penalty_type'] not in MAJOR_PENALTY_TYPES and penalty['duration_minutes'] < 5
+
+
+class PenaltyBox:
+    """
+    Strafen eines Teams mit effektiven Strafzeiten und Stufenfunktion der aktiven Strafen
+
+    Eine Strafe wartet, solange bereits zwei Strafen laufen, bis zum frühesten
+    Ende der laufenden Strafen. Der Zustand vor jeder Strafe wird gespeichert,
+    damit nach einer vorzeitig beendeten Strafe nur die folgenden Strafen neu
+    eingeplant werden.
+    """
+
+    def __init__(self):
+        self.penalties: List[Dict] = []  # nach Startzeit sortiert
+        self._states: List[Tuple[Tuple[int, int], ...]] = []  # laufende Strafen (Start, Ende) vor Strafe i
+        self._intervals: List[Tuple[int, int]] = []  # effektive Strafzeit von Strafe i
+        self._times: List[int] = []
+        self._segments: List[Tuple[Dict, ...]] = []  # aktive Strafen ab _times[i]
+
+    def schedule(self, index: int = 0) -> None:
+        """
+        Plant die Strafen ab Position index (neu) ein und baut die Stufenfunktion auf
+
+        Args:
+            index: Erste neu einzuplanende Strafe
+        """
+        running = list(self._states[index]) if index else []
+        del self._states[index:]
+        del self._intervals[index:]
+
+        for penalty in self.penalties[index:]:
+            self._states.append(tuple(running))
+            start = penalty['time_seconds']
+            effective_start = start
+            if len(running) >= MAX_SERVED_PENALTIES:
+                earliest_end = min(end for _, end in running)
+                if start < earliest_end:
+                    effective_start = earliest_end
+            effective_end = effective_start + penalty['duration_minutes'] * 60
+            self._intervals.append((effective_start, effective_end))
+
+            running = [interval for interval in running if interval[1] > effective_start]
+            running.append((effective_start, effective_end))
+            del running[MAX_SERVED_PENALTIES:]
+
+        self._build_segments()
+
+    def _build_segments(self) -> None:
+        starts: Dict[int, List[int]] = {}
+        ends: Dict[int, List[int]] = {}
+        for position, (start, end) in enumerate(self._intervals):
+            if end > start:
+                starts.setdefault(start, []).append(position)
+                ends.setdefault(end, []).append(position)
+
+        self._times = sorted(starts.keys() | ends.keys())
+        self._segments = []
+        active: Dict[int, Dict] = {}
+        for time in self._times:
+            for position in ends.get(time, ()):
+                del active[position]
+            for position in starts.get(time, ()):
+                active[position] = self.penalties[position]
+            self._segments.append(tuple(active.values()))
+
+    def active_at(self, time_seconds: int) -> Tuple[Dict, ...]:
+        """Strafen, deren effektive Strafzeit time_seconds enthält (Start inklusive, Ende exklusive)"""
+        position = bisect_right(self._times, time_seconds) - 1
+        return self._segments[position] if position >= 0 else ()
+
+    def release(self, penalty: Dict) -> None:
+        """Beendet eine Strafe vorzeitig und plant die folgenden Strafen neu ein"""
+        index = next(i for i, candidate in enumerate(self.penalties) if candidate is penalty)
+        del self.penalties[index]
+        self.schedule(index)
+
+
+class PowerplayEngine:
+    """
+    Manpower-Situation eines Spiels zu beliebigen Zeitpunkten
+
+    Die Tore müssen in Spielzeit-Reihenfolge abgefragt und per release_for_pp_goal
+    gemeldet werden, da PP-Tore den Zustand späterer Zeitpunkte verändern.
+    """
+
+    def __init__(self, penalties: List[Dict]):
+        """
+        Args:
+            penalties: Strafen als Dictionaries mit time_seconds, team, penalty_type und
+                       duration_minutes, nach Startzeit sortiert
+        """
+        self.boxes: Dict[str, PenaltyBox] = {}
+        self._releasable: Dict[str, List[Tuple[int, int, Dict]]] = {}
+        for order, penalty in enumerate(penalties):
+            penalty.setdefault('cleared_segments', 0)
+            self.boxes.setdefault(penalty['team'], PenaltyBox()).penalties.append(penalty)
+            if is_releasable(penalty):
+                self._releasable.setdefault(penalty['team'], []).append(
+                    (penalty['time_seconds'], order, penalty))
+        for box in self.boxes.values():
+            box.schedule()
+
+    def active_penalties(self, time_seconds: int) -> List[Dict]:
+        """Aktive Strafen aller Teams zum Zeitpunkt time_seconds"""
+        return [penalty for box in self.boxes.values() for penalty in box.active_at(time_seconds)]
+
+    def manpower(self, time_seconds: int) -> Dict[str, int]:
+        """Feldspieler pro Team mit Strafen zum Zeitpunkt time_seconds"""
+        return {team: SKATERS - len(box.active_at(time_seconds)) for team, box in self.boxes.items()}
+
+    def release_for_pp_goal(self, time_seconds: int, goal_team: str) -> Optional[Dict]:
+        """
+        Wendet ein PP-Tor an: beendet die älteste laufende Minor-Strafe des Gegners
+
+        Kandidaten sind Strafen anderer Teams, deren nominelle Strafzeit das Tor
+        einschließt. Bei 2+2 beendet ein Tor in den ersten zwei Minuten nur das
+        erste Segment, ein weiteres Tor die ganze Strafe.
+
+        Args:
+            time_seconds: Spielzeit des PP-Tors
+            goal_team: Team, das das Tor erzielt hat
+
+        Returns:
+            Die betroffene Strafe oder None
+        """
+        oldest = None
+        for team, heap in self._releasable.items():
+            if team == goal_team:
+                continue
+            # Nominell abgelaufene Strafen kommen für spätere Tore nicht mehr in Frage
+            while heap and heap[0][0] + heap[0][2]['duration_minutes'] * 60 < time_seconds:
+                heapq.heappop(heap)
+            if heap and heap[0][0] <= time_seconds and (oldest is None or heap[0][:2] < oldest[:2]):
+                oldest = heap[0]
+        if oldest is None:
+            return None
+
+        penalty = oldest[2]
+        if (penalty['penalty_type'] == DOUBLE_MINOR_TYPE and penalty['cleared_segments'] == 0
+                and time_seconds - penalty['time_seconds'] <= DOUBLE_MINOR_SEGMENT_SECONDS):
+            penalty['cleared_segments'] = 1
+            return penalty
+
+        heapq.heappop(self._releasable[penalty['team']])
+        self.boxes[penalty['team']].release(penalty)
+        return penalty
@@ -1,9 +1,92 @@
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Union
 from collections import defaultdict
 
 from models import Game, TeamStats
-from constants import PRELIM_ROUNDS, MAX_PRELIM_GAMES_PER_TEAM
+from constants import PRELIM_ROUNDS
 from .team_resolution import is_code_final
+from .head_to_head import HeadToHeadIndex
+
+
+class StandingsAccumulator:
+    """
+    Incremental standings: every game updates the TeamStats of both teams in place.
+    One pass over the games, O(1) per game. Used by PlayoffResolver (via
+    _calculate_basic_prelim_standings) and StandingsService.
+    """
+
+    def __init__(self):
+        self.standings: Dict[str, TeamStats] = {}
+
+    def add_game(self, game: Game) -> bool:
+        """
+        Adds a game to the standings. Games without a complete score are ignored.
+        Returns True if the game was counted.
+        """
+        if game.team1_score is None or game.team2_score is None:
+            return False
+        team1_stats = self._get_team(game.team1_code, game.group)
+        team2_stats = self._get_team(game.team2_code, game.group)
+        apply_game_to_stats(team1_stats, team2_stats, game)
+        return True
+
+    def add_games(self, games: Iterable[Game]) -> 'StandingsAccumulator':
+        """Adds all games and returns the accumulator for chaining."""
+        for game in games:
+            self.add_game(game)
+        return self
+
+    def _get_team(self, team_code: str, group: Optional[str]) -> TeamStats:
+        team_stats = self.standings.get(team_code)
+        if team_stats is None:
+            team_stats = TeamStats(name=team_code, group=group or "N/A")
+            self.standings[team_code] = team_stats
+        elif team_stats.group == "N/A" and group:
+            # Group only known from a later game
+            team_stats.group = group
+        return team_stats
+
+
+def apply_game_to_stats(team1_stats: TeamStats, team2_stats: TeamStats, game: Game) -> None:
+    """
+    Adds the result of a completed game to both teams' TeamStats
+    (REG win 3 pts, OT/SO win 2 pts, OT/SO loss 1 pt).
+    """
+    team1_stats.gp += 1
+    team2_stats.gp += 1
+    team1_stats.gf += game.team1_score
+    team1_stats.ga += game.team2_score
+    team2_stats.gf += game.team2_score
+    team2_stats.ga += game.team1_score
+
+    if game.result_type not in ('REG', 'OT', 'SO'):
+        return
+    if game.team1_score > game.team2_score:
+        winner, loser = team1_stats, team2_stats
+    else:
+        winner, loser = team2_stats, team1_stats
+
+    if game.result_type == 'REG':
+        winner.w += 1
+        winner.pts += 3
+        loser.l += 1
+    elif game.result_type == 'OT':
+        winner.otw += 1
+        winner.pts += 2
+        loser.otl += 1
+        loser.pts += 1
+    else:
+        winner.sow += 1
+        winner.pts += 2
+        loser.sol += 1
+        loser.pts += 1
+
+
+def accumulate_standings(games: Iterable[Game]) -> Dict[str, TeamStats]:
+    """
+    Calculates TeamStats for all teams from a list of games in a single pass.
+    Games without a complete score are ignored.
+    """
+    return StandingsAccumulator().add_games(games).standings
 
 
 def _calculate_basic_prelim_standings(prelim_games_for_year: List[Game]) -> Dict[str, TeamStats]:
@@ -12,42 +95,17 @@ def _calculate_basic_prelim_standings(prelim_games_for_year: List[Game]) -> Dict
     Focuses on points, goal difference, goals for, and rank_in_group for ranking.
     Returns a dictionary mapping team codes to their TeamStats objects.
     """
-    standings: Dict[str, TeamStats] = {}
+    accumulator = StandingsAccumulator()
 
     for game in prelim_games_for_year:
-        if game.round not in PRELIM_ROUNDS or game.team1_score is None or game.team2_score is None:
+        if game.round not in PRELIM_ROUNDS:
             continue
-
-        # Ensure teams are initialized with their group
         # Only process games where both participants are final team codes
         if not is_code_final(game.team1_code) or not is_code_final(game.team2_code):
             continue # Should not happen for prelim games used for standings
-            
-        current_game_group = game.group # Assuming game object has group info for prelims
-
-        if game.team1_code not in standings:
-            # Ensure group is a string, default if None for safety, though expected from fixture
-            standings[game.team1_code] = TeamStats(name=game.team1_code, group=current_game_group or "N/A")
-        # Update group if it was N/A and now we have one
-        elif standings[game.team1_code].group == "N/A" and current_game_group is not None:
-             standings[game.team1_code].group = current_game_group
-
+        accumulator.add_game(game)
 
-        if game.team2_code not in standings:
-            standings[game.team2_code] = TeamStats(name=game.team2_code, group=current_game_group or "N/A")
-        elif standings[game.team2_code].group == "N/A" and current_game_group is not None:
-            standings[game.team2_code].group = current_game_group
-
-
-        # Verwende StandingsService für die Berechnung der Statistiken
-        from app.services.core.standings_service import StandingsService
-        calculator = StandingsService()
-        # Berechne Standings für alle Spiele auf einmal (effizienter als pro Spiel)
-        game_standings = calculator.calculate_standings_from_games([game])
-        # Update die bestehenden Standings mit den berechneten Werten
-        for team_code, team_stats in game_standings.items():
-            if team_code in standings:
-                standings[team_code] = team_stats
+    standings = accumulator.standings
     
     # Calculate rank_in_group with head-to-head comparison
     grouped_standings_for_ranking: Dict[str, List[TeamStats]] = {}
@@ -58,12 +116,13 @@ def _calculate_basic_prelim_standings(prelim_games_for_year: List[Game]) -> Dict
             grouped_standings_for_ranking[group_key] = []
         grouped_standings_for_ranking[group_key].append(ts_obj)
 
+    head_to_head = HeadToHeadIndex(prelim_games_for_year)
     for group_name, group_list in grouped_standings_for_ranking.items():
         # Sort by pts (desc), head-to-head comparison, gd (desc), gf (desc)
         group_list.sort(key=lambda x: (x.pts, x.gd, x.gf), reverse=True)
         
         # Apply head-to-head tiebreaker for teams with equal points
-        group_list = _apply_head_to_head_tiebreaker(group_list, prelim_games_for_year)
+        group_list = _apply_head_to_head_tiebreaker(group_list, head_to_head)
         
         for i, ts_in_group in enumerate(group_list):
             ts_in_group.rank_in_group = i + 1
@@ -72,39 +131,20 @@ def _calculate_basic_prelim_standings(prelim_games_for_year: List[Game]) -> Dict
     return standings
 
 
-def _apply_head_to_head_tiebreaker(teams_list: List[TeamStats], all_games: List[Game]) -> List[TeamStats]:
+def _apply_head_to_head_tiebreaker(teams_list: List[TeamStats],
+                                   all_games: Union[HeadToHeadIndex, List[Game]]) -> List[TeamStats]:
     """
     Apply head-to-head tiebreaker for teams with equal points.
     Returns the sorted list with head-to-head results considered.
+
+    all_games may be a prebuilt HeadToHeadIndex; callers ranking several groups
+    of the same year should build it once and pass it in.
     """
-    if len(teams_list) <= 1:
-        return teams_list
-    
-    # Group teams by points
-    teams_by_points = {}
-    for team in teams_list:
-        points = team.pts
-        if points not in teams_by_points:
-            teams_by_points[points] = []
-        teams_by_points[points].append(team)
-    
-    result = []
-    
-    # Process each point group separately
-    for points in sorted(teams_by_points.keys(), reverse=True):
-        point_group = teams_by_points[points]
-        
-        if len(point_group) == 1:
-            result.extend(point_group)
-        else:
-            # Apply head-to-head tiebreaker within this point group
-            sorted_group = _sort_teams_by_head_to_head(point_group, all_games)
-            result.extend(sorted_group)
-    
-    return result
+    return HeadToHeadIndex.of(all_games).rank(teams_list)
 
 
-def _sort_teams_by_head_to_head(tied_teams: List[TeamStats], all_games: List[Game]) -> List[TeamStats]:
+def _sort_teams_by_head_to_head(tied_teams: List[TeamStats],
+                                all_games: Union[HeadToHeadIndex, List[Game]]) -> List[TeamStats]:
     """
     Sort teams that are tied on points by head-to-head results following updated IIHF rules.
     
@@ -114,154 +154,27 @@ def _sort_teams_by_head_to_head(tied_teams: List[TeamStats], all_games: List[Gam
     - For 3+ teams tied: 
       Head-to-head tiebreaker ONLY applies if ALL teams have played ALL their 7 preliminary games
       If not all games played: Use overall goal difference and goals for
+    - Remaining sub-ties within the head-to-head table are resolved recursively
     """
-    if len(tied_teams) <= 1:
-        return tied_teams
-    
-    # Check if we have exactly 2 teams or more than 2 teams
-    if len(tied_teams) == 2:
-        return _sort_two_teams_by_head_to_head(tied_teams, all_games)
-    else:
-        return _sort_multiple_teams_by_head_to_head(tied_teams, all_games)
+    return HeadToHeadIndex.of(all_games).sort_tied(tied_teams)
 
 
-def _sort_two_teams_by_head_to_head(tied_teams: List[TeamStats], all_games: List[Game]) -> List[TeamStats]:
+def _sort_two_teams_by_head_to_head(tied_teams: List[TeamStats],
+                                    all_games: Union[HeadToHeadIndex, List[Game]]) -> List[TeamStats]:
     """
     Sort exactly 2 teams that are tied on points.
     Uses head-to-head if the direct game has been played, otherwise overall stats.
     """
-    team1, team2 = tied_teams[0], tied_teams[1]
-    
-    # Find head-to-head games between these two teams
-    head_to_head_games = []
-    for game in all_games:
-        if (game.team1_code == team1.name and game.team2_code == team2.name) or \
-           (game.team1_code == team2.name and game.team2_code == team1.name):
-            if (game.team1_score is not None and game.team2_score is not None and
-                game.round in PRELIM_ROUNDS):
-                head_to_head_games.append(game)
-    
-    # If direct game has been played, use head-to-head result
-    if head_to_head_games:
-        # Calculate head-to-head stats
-        h2h_stats = {
-            team1.name: {'points': 0, 'gf': 0, 'ga': 0},
-            team2.name: {'points': 0, 'gf': 0, 'ga': 0}
-        }
-        
-        for game in head_to_head_games:
-            team1_h2h = h2h_stats[game.team1_code] if game.team1_code in h2h_stats else h2h_stats[game.team2_code]
-            team2_h2h = h2h_stats[game.team2_code] if game.team2_code in h2h_stats else h2h_stats[game.team1_code]
-            
-            # Determine which team is which in the game
-            if game.team1_code == team1.name:
-                t1_score, t2_score = game.team1_score, game.team2_score
-                t1_h2h, t2_h2h = h2h_stats[team1.name], h2h_stats[team2.name]
-            else:
-                t1_score, t2_score = game.team2_score, game.team1_score
-                t1_h2h, t2_h2h = h2h_stats[team1.name], h2h_stats[team2.name]
-            
-            t1_h2h['gf'] += t1_score
-            t1_h2h['ga'] += t2_score
-            t2_h2h['gf'] += t2_score
-            t2_h2h['ga'] += t1_score
-            
-            # Award points based on result
-            if game.result_type == 'REG':
-                if t1_score > t2_score:
-                    t1_h2h['points'] += 3
-                else:
-                    t2_h2h['points'] += 3
-            elif game.result_type in ['OT', 'SO']:
-                if t1_score > t2_score:
-                    t1_h2h['points'] += 2
-                    t2_h2h['points'] += 1
-                else:
-                    t2_h2h['points'] += 2
-                    t1_h2h['points'] += 1
-        
-        # Sort by head-to-head results
-        team_list = [(team1, h2h_stats[team1.name]), (team2, h2h_stats[team2.name])]
-        team_list.sort(key=lambda x: (
-            x[1]['points'],                    # H2H points
-            x[1]['gf'] - x[1]['ga'],          # H2H goal difference
-            x[1]['gf'],                       # H2H goals for
-            x[0].gd,                          # Overall goal difference
-            x[0].gf                           # Overall goals for
-        ), reverse=True)
-        
-        return [team_obj for team_obj, _ in team_list]
-    
-    # No direct game played, use overall stats
-    return sorted(tied_teams, key=lambda x: (x.gd, x.gf), reverse=True)
+    return HeadToHeadIndex.of(all_games).sort_tied(tied_teams)
 
 
-def _sort_multiple_teams_by_head_to_head(tied_teams: List[TeamStats], all_games: List[Game]) -> List[TeamStats]:
+def _sort_multiple_teams_by_head_to_head(tied_teams: List[TeamStats],
+                                         all_games: Union[HeadToHeadIndex, List[Game]]) -> List[TeamStats]:
     """
     Sort 3+ teams that are tied on points.
     Uses head-to-head only if ALL teams have played ALL their 7 preliminary games.
     """
-    # Check if all teams have played all their preliminary games
-    all_games_completed = all(team.gp >= MAX_PRELIM_GAMES_PER_TEAM for team in tied_teams)
-    
-    if not all_games_completed:
-        # Not all games played, use overall stats
-        return sorted(tied_teams, key=lambda x: (x.gd, x.gf), reverse=True)
-    
-    # All games completed, use head-to-head tiebreaker
-    team_names = {team.name for team in tied_teams}
-    head_to_head_games = []
-    
-    for game in all_games:
-        if (game.team1_code in team_names and game.team2_code in team_names and 
-            game.team1_score is not None and game.team2_score is not None and
-            game.round in PRELIM_ROUNDS):
-            head_to_head_games.append(game)
-    
-    # Calculate head-to-head records
-    h2h_stats = {}
-    for team in tied_teams:
-        h2h_stats[team.name] = {
-            'points': 0,
-            'gf': 0,
-            'ga': 0,
-            'team_obj': team
-        }
-    
-    for game in head_to_head_games:
-        team1_h2h = h2h_stats[game.team1_code]
-        team2_h2h = h2h_stats[game.team2_code]
-        
-        team1_h2h['gf'] += game.team1_score
-        team1_h2h['ga'] += game.team2_score
-        team2_h2h['gf'] += game.team2_score
-        team2_h2h['ga'] += game.team1_score
-        
-        # Award points based on result (IIHF 3-point system)
-        if game.result_type == 'REG':
-            if game.team1_score > game.team2_score:
-                team1_h2h['points'] += 3
-            else:
-                team2_h2h['points'] += 3
-        elif game.result_type in ['OT', 'SO']:
-            if game.team1_score > game.team2_score:
-                team1_h2h['points'] += 2
-                team2_h2h['points'] += 1
-            else:
-                team2_h2h['points'] += 2
-                team1_h2h['points'] += 1
-    
-    # Sort by head-to-head criteria
-    h2h_list = list(h2h_stats.values())
-    h2h_list.sort(key=lambda x: (
-        x['points'],                # Head-to-head points
-        x['gf'] - x['ga'],         # Head-to-head goal difference
-        x['gf'],                   # Head-to-head goals for
-        x['team_obj'].gd,          # Overall goal difference
-        x['team_obj'].gf           # Overall goals for
-    ), reverse=True)
-    
-    return [h2h['team_obj'] for h2h in h2h_list]
+    return HeadToHeadIndex.of(all_games).sort_tied(tied_teams)
 
 
 def calculate_complete_final_ranking(year_obj, games_this_year, playoff_map, year_obj_for_map):
@@ -383,9 +296,10 @@ def calculate_complete_final_ranking(year_obj, games_this_year, playoff_map, yea
                 group_standings[group].append(team_stats)
         
         # Sortiere und berechne Ränge für jede Gruppe
+        head_to_head = HeadToHeadIndex(prelim_games)
         for group, team_stats_list in group_standings.items():
             team_stats_list.sort(key=lambda x: (x.pts, x.gd, x.gf), reverse=True)
-            team_stats_list = _apply_head_to_head_tiebreaker(team_stats_list, prelim_games)
+            team_stats_list = _apply_head_to_head_tiebreaker(team_stats_list, head_to_head)
             
             group_letter = group.replace("Group ", "") if group.startswith("Group ") else group
             for i, team_stat in enumerate(team_stats_list, 1):
@@ -528,38 +442,17 @@ def calculate_complete_final_ranking(year_obj, games_this_year, playoff_map, yea
                         prelim_games = [g for g in games_this_year if g.round in PRELIM_ROUNDS and is_code_final(g.team1_code) and is_code_final(g.team2_code) and g.team1_score is not None]
                         group_standings = {"Group A": [], "Group B": []}
                         
-                        # Build proper group standings using same logic as codebase
-                        prelim_stats_map = {}
-                        
-                        # Build stats using same method as existing codebase
-                        for game_prelim in prelim_games:
-                            current_game_group = game_prelim.group or "N/A"
-                            for team_code_val in [game_prelim.team1_code, game_prelim.team2_code]:
-                                if team_code_val not in prelim_stats_map:
-                                    prelim_stats_map[team_code_val] = TeamStats(name=team_code_val, group=current_game_group)
-                                elif prelim_stats_map[team_code_val].group == "N/A" and current_game_group != "N/A":
-                                    prelim_stats_map[team_code_val].group = current_game_group
-                            
-                            # Verwende StandingsService für die Berechnung der Statistiken
-                            from app.services.core.standings_service import StandingsService
-                            calculator = StandingsService()
-                            # Berechne Standings für dieses Spiel
-                            game_standings = calculator.calculate_standings_from_games([game_prelim])
-                            # Update die bestehenden Standings
-                            for team_code, team_stats in game_standings.items():
-                                if team_code in prelim_stats_map:
-                                    # Übertrage die Gruppeneinteilung
-                                    team_stats.group = prelim_stats_map[team_code].group
-                                    prelim_stats_map[team_code] = team_stats
+                        # Build proper group standings in a single pass over the games
+                        prelim_stats_map = accumulate_standings(prelim_games)
 
                         # Sort teams by group using proper tiebreaker
+                        head_to_head = HeadToHeadIndex(prelim_games)
                         for group_name in group_standings:
                             group_teams = [ts for ts in prelim_stats_map.values() if ts.group == group_name]
                             group_teams.sort(key=lambda x: (x.pts, x.gd, x.gf), reverse=True)
                             
                             # Apply head-to-head tiebreaker (critical for correct standings!)
-                            group_games = [g for g in prelim_games if g.group == group_name]
-                            group_teams = _apply_head_to_head_tiebreaker(group_teams, group_games)
+                            group_teams = _apply_head_to_head_tiebreaker(group_teams, head_to_head)
                             
                             # Set ranks and convert to tuple format
                             for i, ts in enumerate(group_teams):
@@ -719,7 +612,6 @@ def calculate_complete_final_ranking(year_obj, games_this_year, playoff_map, yea
     final_ranking = calculate_medals_simple(games_this_year, enhanced_playoff_map)
     
     # Berechne die restlichen Plätze (5-16)
-    prelim_stats_map = {}
     prelim_games = [
         g for g in games_this_year
         if g.round in PRELIM_ROUNDS and \
@@ -728,34 +620,17 @@ def calculate_complete_final_ranking(year_obj, games_this_year, playoff_map, yea
            g.team1_score is not None and g.team2_score is not None
     ]
     
-    for game in prelim_games:
-        current_game_group = game.group or "N/A"
-        for team_code in [game.team1_code, game.team2_code]:
-            if team_code not in prelim_stats_map:
-                prelim_stats_map[team_code] = TeamStats(name=team_code, group=current_game_group)
-            elif prelim_stats_map[team_code].group == "N/A" and current_game_group != "N/A":
-                prelim_stats_map[team_code].group = current_game_group
-        
-        # Verwende StandingsService für die Berechnung der Statistiken
-        from app.services.core.standings_service import StandingsService
-        calculator = StandingsService()
-        # Berechne Standings für dieses Spiel
-        game_standings = calculator.calculate_standings_from_games([game])
-        # Update die bestehenden Standings
-        for team_code, team_stats in game_standings.items():
-            if team_code in prelim_stats_map:
-                # Übertrage die Gruppeneinteilung
-                team_stats.group = prelim_stats_map[team_code].group
-                prelim_stats_map[team_code] = team_stats
+    prelim_stats_map = accumulate_standings(prelim_games)
     
     standings_by_group = {}
     for ts in prelim_stats_map.values():
         group_key = ts.group if ts.group else "UnknownGroup"
         standings_by_group.setdefault(group_key, []).append(ts)
     
+    head_to_head = HeadToHeadIndex(prelim_games)
     for group_list in standings_by_group.values():
         group_list.sort(key=lambda x: (x.pts, x.gd, x.gf), reverse=True)
-        group_list = _apply_head_to_head_tiebreaker(group_list, prelim_games)
+        group_list = _apply_head_to_head_tiebreaker(group_list, head_to_head)
         for i, ts in enumerate(group_list):
             ts.rank_in_group = i + 1
     
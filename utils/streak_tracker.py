@@ -0,0 +1,207 @@
+"""
+Inkrementelle Serien-Rekorde (Siege, Niederlagen, Spiele mit Tor, ohne Gegentor, ohne Tor).
+
+Der StreakTracker bekommt die abgeschlossenen Spiele in chronologischer
+Reihenfolge und führt pro Team die laufenden Serien aller fünf Arten in einem
+Durchlauf. Jede Serie ist über (Team, Startdatum) identifiziert. Die Rekorde
+jeder Art hält ein StreakLeaderboard, das nur die Serien der besten k
+unterschiedlichen Längen behält; kürzere abgeschlossene Serien können nie mehr
+aufsteigen und werden über einen Min-Heap verworfen.
+
+Der Zustand ist über to_dict()/from_dict() serialisierbar. Der
+StreakRecordService speichert ihn und spielt danach nur neu hinzugekommene
+Spiele ein, statt alle Spiele erneut zu durchlaufen.
+"""
+
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+from constants import TOP_3_DISPLAY
+
+STREAK_KINDS = ('win', 'loss', 'scoring', 'shutout', 'goalless')
+
+StreakKey = Tuple[str, Optional[str]]  # (Team, Startdatum)
+
+
+class StreakLeaderboard:
+    """
+    Serien-Rekorde einer Art, begrenzt auf die besten k unterschiedlichen Längen
+
+    Jede Aktualisierung ist O(log n) über den Heap; die Anzahl gehaltener
+    Serien bleibt durch k (plus Gleichstände) begrenzt.
+    """
+
+    def __init__(self, top_k: int = TOP_3_DISPLAY):
+        self.top_k = top_k
+        self._records: Dict[StreakKey, Dict] = {}
+        self._value_counts: Dict[int, int] = {}
+        self._heap: List[Tuple[int, int, StreakKey]] = []  # (Länge, Reihenfolge, Schlüssel), veraltete Einträge werden übersprungen
+
+    def offer(self, team: str, start_date: Optional[str], end_date: Optional[str], streak: int, seq: int) -> None:
+        """
+        Meldet den aktuellen Stand einer Serie
+
+        Args:
+            team: Team-Code
+            start_date: Datum des ersten Spiels der Serie
+            end_date: Datum des letzten Spiels der Serie
+            streak: Aktuelle Länge der Serie
+            seq: Reihenfolge des Serienstarts (Tiebreaker bei gleicher Länge)
+        """
+        key = (team, start_date)
+        existing = self._records.get(key)
+        if existing is not None:
+            if streak <= existing['streak']:
+                return
+            seq = existing['seq']
+            self._decrement(existing['streak'])
+        elif len(self._value_counts) >= self.top_k and streak < min(self._value_counts):
+            return
+
+        self._records[key] = {'team': team, 'streak': streak, 'start_date': start_date,
+                              'end_date': end_date, 'seq': seq}
+        self._value_counts[streak] = self._value_counts.get(streak, 0) + 1
+        heapq.heappush(self._heap, (streak, seq, key))
+        self._prune()
+
+    def ranked(self) -> List[Dict]:
+        """
+        Rekorde absteigend nach Länge mit dichten Rängen
+
+        Es werden mindestens k Einträge geliefert; ein begonnener Gleichstand
+        wird vollständig übernommen.
+
+        Returns:
+            Liste von Dictionaries (team, streak, start_date, end_date, rank)
+        """
+        results = []
+        current_rank = 0
+        last_streak = None
+        for record in sorted(self._records.values(), key=lambda r: (-r['streak'], r['seq'])):
+            if record['streak'] != last_streak:
+                if len(results) >= self.top_k:
+                    break
+                current_rank += 1
+                last_streak = record['streak']
+            results.append({
+                'team': record['team'],
+                'streak': record['streak'],
+                'start_date': record['start_date'],
+                'end_date': record['end_date'],
+                'rank': current_rank
+            })
+        return results
+
+    def _decrement(self, streak: int) -> None:
+        self._value_counts[streak] -= 1
+        if not self._value_counts[streak]:
+            del self._value_counts[streak]
+
+    def _prune(self) -> None:
+        """Verwirft die Serien der kürzesten Länge, solange mehr als k Längen gehalten werden"""
+        while len(self._value_counts) > self.top_k:
+            streak, _, key = heapq.heappop(self._heap)
+            record = self._records.get(key)
+            if record is None or record['streak'] != streak:
+                continue
+            del self._records[key]
+            self._decrement(streak)
+        if len(self._heap) > 2 * len(self._records) + 16:
+            self._heap = [(r['streak'], r['seq'], key) for key, r in self._records.items()]
+            heapq.heapify(self._heap)
+
+    def to_dict(self) -> List[List]:
+        return [[r['team'], r['start_date'], r['end_date'], r['streak'], r['seq']]
+                for r in self._records.values()]
+
+    @classmethod
+    def from_dict(cls, data: List[List], top_k: int = TOP_3_DISPLAY) -> 'StreakLeaderboard':
+        leaderboard = cls(top_k)
+        for team, start_date, end_date, streak, seq in data:
+            leaderboard.offer(team, start_date, end_date, streak, seq)
+        return leaderboard
+
+
+class StreakTracker:
+    """Laufende Serien aller Teams und die Rekorde aller fünf Serienarten"""
+
+    def __init__(self, top_k: int = TOP_3_DISPLAY):
+        self.top_k = top_k
+        self.games_processed = 0
+        self._seq = 0
+        # Art -> Team -> [Länge, Startdatum, Reihenfolge des Starts]; beendete Serien werden entfernt
+        self._running: Dict[str, Dict[str, List]] = {kind: {} for kind in STREAK_KINDS}
+        self._leaderboards = {kind: StreakLeaderboard(top_k) for kind in STREAK_KINDS}
+
+    def add_game(self, team1: str, team2: str, team1_score: int, team2_score: int,
+                 date: Optional[str]) -> None:
+        """
+        Spielt ein abgeschlossenes Spiel ein (chronologische Reihenfolge vorausgesetzt)
+
+        Args:
+            team1: Aufgelöster Code von Team 1
+            team2: Aufgelöster Code von Team 2
+            team1_score: Tore von Team 1
+            team2_score: Tore von Team 2
+            date: Spieldatum
+        """
+        self.games_processed += 1
+
+        if team1_score != team2_score:
+            winner, loser = (team1, team2) if team1_score > team2_score else (team2, team1)
+            for kind, extended, broken in (('win', winner, loser), ('loss', loser, winner)):
+                self._extend(kind, extended, date)
+                self._running[kind].pop(broken, None)
+                self._record(kind, extended, date)
+
+        for kind in ('scoring', 'shutout', 'goalless'):
+            for team, goals_for, goals_against in ((team1, team1_score, team2_score),
+                                                   (team2, team2_score, team1_score)):
+                if kind == 'scoring':
+                    continues = goals_for > 0
+                elif kind == 'shutout':
+                    continues = goals_against == 0
+                else:
+                    continues = goals_for == 0
+                if continues:
+                    self._extend(kind, team, date)
+                else:
+                    self._running[kind].pop(team, None)
+            for team in (team1, team2):
+                if team in self._running[kind]:
+                    self._record(kind, team, date)
+
+    def ranked(self, kind: str) -> List[Dict]:
+        """Top-Serien einer Art mit Rängen (siehe StreakLeaderboard.ranked)"""
+        return self._leaderboards[kind].ranked()
+
+    def _extend(self, kind: str, team: str, date: Optional[str]) -> None:
+        running = self._running[kind].get(team)
+        if running is None:
+            self._seq += 1
+            self._running[kind][team] = [1, date, self._seq]
+        else:
+            running[0] += 1
+
+    def _record(self, kind: str, team: str, end_date: Optional[str]) -> None:
+        streak, start_date, seq = self._running[kind][team]
+        self._leaderboards[kind].offer(team, start_date, end_date, streak, seq)
+
+    def to_dict(self) -> Dict:
+        return {
+            'top_k': self.top_k,
+            'games_processed': self.games_processed,
+            'seq': self._seq,
+            'running': self._running,
+            'leaderboards': {kind: leaderboard.to_dict() for kind, leaderboard in self._leaderboards.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'StreakTracker':
+        tracker = cls(data['top_k'])
+        tracker.games_processed = data['games_processed']
+        tracker._seq = data['seq']
+        tracker._running = {kind: dict(data['running'].get(kind, {})) for kind in STREAK_KINDS}
+        tracker._leaderboards = {kind: StreakLeaderboard.from_dict(data['leaderboards'].get(kind, []), tracker.top_k)
+                                 for kind in STREAK_KINDS}
+        return tracker
@@ -0,0 +1,353 @@
+"""
+Synthetische Turnierhistorie für Skalierungstests.
+
+Der SyntheticHistoryGenerator erzeugt für N Jahre (optional mit mehreren
+Divisionen) Fixture-Dateien im Format von fixtures/YYYY.json und spielt die
+Turniere über die Modelle in die aktuelle Datenbank ein: Spielplan mit zwei
+Achtergruppen und Playoffs (Spiele 57-64), Ergebnisse inklusive OT/SO, Tore
+mit Vorlagen, Strafen und Torschüsse pro Drittel. Die Playoff-Teilnehmer
+werden nach jeder Runde über resolve_tournament() aufgelöst, die Ereignisse
+tragen also dieselben Team-Codes, die auch die Jahresansicht ermittelt.
+
+Alle Zufallswerte kommen aus einem random.Random mit festem Seed; gleiche
+Parameter ergeben dieselbe Datenbank. Abgeleitete Tabellen (Box-Scores)
+werden am Ende neu aufgebaut, Snapshots und Serien-Rekorde entstehen wie
+gewohnt beim ersten Zugriff.
+"""
+
+import json
+import logging
+import math
+import os
+import random
+from datetime import date, timedelta
+from itertools import islice, product
+from string import ascii_uppercase
+from typing import Dict, List, Optional, Tuple
+
+from constants import PENALTY_REASONS_CHOICES, TEAM_ISO_CODES
+from models import db, ChampionshipYear, Game, Goal, Penalty, Player, ShotsOnGoal, parse_time_seconds
+from .team_resolution import is_code_final
+from .tournament_resolution import resolve_tournament
+
+logger = logging.getLogger(__name__)
+
+TEAMS_PER_DIVISION = 16
+GROUPS = ('Group A', 'Group B')
+QUARTERFINAL_PAIRS = [('A1', 'B4'), ('A2', 'B3'), ('B1', 'A4'), ('B2', 'A3')]
+START_TIMES = ('12:20', '16:20', '20:20')
+DIVISION_SUFFIXES = ['', ' Division I', ' Division II', ' Division III', ' Division IV']
+
+# Gewichte der Straftypen, angelehnt an die Verteilung der echten Datenbank
+PENALTY_TYPE_WEIGHTS = {
+    '2 Min': 90,
+    '2+2 Min': 2,
+    '5 Min + Spieldauer': 4,
+    '5 Min Disziplinar': 1,
+    '10 Min Disziplinar': 3,
+}
+
+FIRST_NAMES = ['Anton', 'Ben', 'Carl', 'David', 'Elias', 'Felix', 'Gustav', 'Henrik', 'Ivan', 'Jonas',
+               'Kasper', 'Lukas', 'Mikko', 'Nils', 'Oskar', 'Patrik', 'Rasmus', 'Samuel', 'Tomas', 'Viktor',
+               'Aleksi', 'Jakub', 'Connor', 'Dominik', 'Erik', 'Filip', 'Juho', 'Leon', 'Marek', 'Roman']
+LAST_NAMES = ['Andersson', 'Bauer', 'Coleman', 'Dvorak', 'Eriksson', 'Fischer', 'Granlund', 'Hansen',
+              'Ivanov', 'Jensen', 'Koivu', 'Lindholm', 'Meier', 'Novak', 'Olsen', 'Peterka', 'Quinn',
+              'Rantanen', 'Schneider', 'Tkachuk', 'Urbanek', 'Virtanen', 'Weber', 'Zadina', 'Berglund',
+              'Hischier', 'Kopitar', 'Larsson', 'Moser', 'Strome']
+
+
+def _synthetic_team_codes(count: int, reserved) -> List[str]:
+    """Eindeutige 3-Buchstaben-Codes für untere Divisionen, ohne echte Team-Codes"""
+    codes = (''.join(letters) for letters in product(ascii_uppercase, repeat=3))
+    return list(islice((code for code in codes if code not in reserved), count))
+
+
+def _format_time(seconds: int) -> str:
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+class SyntheticHistoryGenerator:
+    """Erzeugt eine deterministische, plausible Turnierhistorie in der aktuellen Datenbank"""
+
+    def __init__(self, fixtures_dir: str, years: int = 50, last_year: int = 2025, divisions: int = 1,
+                 seed: int = 0, roster_size: int = 25, roster_turnover: int = 5,
+                 name: str = 'Synthetic WM'):
+        """
+        Args:
+            fixtures_dir: Zielverzeichnis der Fixture-Dateien (muss dem UPLOAD_FOLDER der App entsprechen)
+            years: Anzahl Turnierjahre, endend mit last_year
+            last_year: Letztes Turnierjahr
+            divisions: Anzahl Divisionen pro Jahr (je 16 Teams, eigenes ChampionshipYear)
+            seed: Seed des Zufallsgenerators
+            roster_size: Spieler pro Team
+            roster_turnover: Pro Jahr ersetzte Spieler pro Team
+            name: Turniername (Divisionen erhalten einen Zusatz)
+        """
+        if divisions < 1 or divisions > len(DIVISION_SUFFIXES):
+            raise ValueError(f"divisions must be between 1 and {len(DIVISION_SUFFIXES)}")
+        self.fixtures_dir = fixtures_dir
+        self.years = years
+        self.last_year = last_year
+        self.divisions = divisions
+        self.roster_size = roster_size
+        self.roster_turnover = roster_turnover
+        self.name = name
+        self.rng = random.Random(seed)
+        self.counts = {'years': 0, 'games': 0, 'goals': 0, 'penalties': 0, 'shots_on_goal': 0, 'players': 0}
+
+        # Division 1 spielt mit den echten Nationen, darunter liegende Divisionen mit synthetischen Codes
+        real_codes = [code for code, iso in TEAM_ISO_CODES.items() if iso]
+        synthetic = _synthetic_team_codes((divisions - 1) * 24, set(TEAM_ISO_CODES))
+        self.pools = [real_codes] + [synthetic[i * 24:(i + 1) * 24] for i in range(divisions - 1)]
+        self.strength = {code: self.rng.gauss(-0.4 * division, 0.5)
+                         for division, pool in enumerate(self.pools) for code in pool}
+        self.rosters: Dict[str, List[Player]] = {}
+
+    def generate(self) -> Dict[str, int]:
+        """
+        Erzeugt alle Jahre und Divisionen (ein Commit pro Turnier)
+
+        Returns:
+            Anzahl der erzeugten Jahre, Spiele, Tore, Strafen, SOG-Einträge und Spieler
+        """
+        from app.services.core.game_boxscore_service import GameBoxscoreService
+
+        os.makedirs(self.fixtures_dir, exist_ok=True)
+        for year in range(self.last_year - self.years + 1, self.last_year + 1):
+            for division in range(self.divisions):
+                self._generate_tournament(year, division)
+                db.session.commit()
+            logger.info(f"Generated synthetic tournament year {year}")
+
+        GameBoxscoreService().rebuild_all()
+        db.session.commit()
+        return dict(self.counts)
+
+    def build_fixture(self, year: int, teams: List[str], division: int = 0) -> Dict:
+        """
+        Baut den Spielplan eines Turniers im Format von fixtures/YYYY.json
+
+        Args:
+            year: Turnierjahr
+            teams: 16 Team-Codes, nach Stärke sortiert (werden per Schlange auf die Gruppen verteilt)
+            division: Index der Division (0 = Top-Division)
+
+        Returns:
+            Fixture-Dictionary mit championship, year, hosts, reportGenerated, schedule und notes
+        """
+        groups = {group: [] for group in GROUPS}
+        for index, code in enumerate(teams):
+            row, position = divmod(index, len(GROUPS))
+            groups[GROUPS[position if row % 2 == 0 else len(GROUPS) - 1 - position]].append(code)
+
+        # Jeder gegen jeden pro Gruppe (Kreisverfahren), beide Gruppen abwechselnd
+        rounds_by_group = {group: self._round_robin(codes) for group, codes in groups.items()}
+        prelim = []
+        for matchday in range(len(teams) // len(GROUPS) - 1):
+            for pairing in range(len(teams) // (2 * len(GROUPS))):
+                for group in GROUPS:
+                    team1, team2 = rounds_by_group[group][matchday][pairing]
+                    prelim.append((group, team1, team2))
+
+        first_day = date(year, 5, 9)
+        venues = {group: (f'Arena {group[-1]}', f'City {group[-1]}') for group in GROUPS}
+        hosts = [teams[self.rng.randrange(len(teams))]]
+        schedule = []
+        for index, (group, team1, team2) in enumerate(prelim):
+            venue, location = venues[group]
+            schedule.append(self._fixture_game(first_day + timedelta(days=index // 6), START_TIMES[index // 2 % 3],
+                                               'Preliminary Round', group, index + 1, team1, team2, location, venue))
+
+        playoff_day = first_day + timedelta(days=len(prelim) // 6 + 2)
+        playoffs = [('Quarterfinals', team1, team2, 0) for team1, team2 in QUARTERFINAL_PAIRS]
+        playoffs += [('Semifinals', 'seed1', 'seed4', 2), ('Semifinals', 'seed2', 'seed3', 2),
+                     ('Bronze Medal Game', 'L(SF1)', 'L(SF2)', 3), ('Gold Medal Game', 'W(SF1)', 'W(SF2)', 3)]
+        for offset, (round_name, team1, team2, day) in enumerate(playoffs):
+            venue, location = venues[GROUPS[offset % 2]]
+            schedule.append(self._fixture_game(playoff_day + timedelta(days=day), START_TIMES[1 + offset % 2],
+                                               round_name, None, len(prelim) + offset + 1, team1, team2,
+                                               location, venue))
+
+        return {
+            'championship': f'{self.name.upper()}{DIVISION_SUFFIXES[division].upper()}',
+            'year': year,
+            'hosts': hosts,
+            'reportGenerated': f'{first_day.isoformat()} (synthetic)',
+            'schedule': schedule,
+            'notes': [],
+        }
+
+    def _generate_tournament(self, year: int, division: int) -> None:
+        pool = self.pools[division]
+        for code in pool:
+            self.strength[code] += self.rng.gauss(0, 0.1)
+        teams = sorted(pool, key=lambda code: self.strength[code] + self.rng.gauss(0, 0.3),
+                       reverse=True)[:TEAMS_PER_DIVISION]
+        for code in teams:
+            self._refresh_roster(code)
+
+        fixture = self.build_fixture(year, teams, division)
+        filename = f"{year}.json" if division == 0 else f"div{division + 1}_{year}.json"
+        with open(os.path.join(self.fixtures_dir, filename), 'w', encoding='utf-8') as f:
+            json.dump(fixture, f, indent=2)
+
+        year_obj = ChampionshipYear(name=f'{self.name}{DIVISION_SUFFIXES[division]}', year=year,
+                                    fixture_path=filename)
+        db.session.add(year_obj)
+        db.session.flush()
+        games = [Game(year_id=year_obj.id, date=item['date'], start_time=item['startTime'],
+                      round=item['round'], group=item['group'], game_number=item['gameNumber'],
+                      team1_code=item['team1'], team2_code=item['team2'], location=item['location'],
+                      venue=item['venue'])
+                 for item in fixture['schedule']]
+        db.session.add_all(games)
+        db.session.flush()
+        self.counts['years'] += 1
+        self.counts['games'] += len(games)
+
+        # Vorrunde, danach jede Playoff-Runde mit den bis dahin aufgelösten Teilnehmern
+        stages = [('Preliminary Round',), ('Quarterfinals',), ('Semifinals',), ('Bronze Medal Game', 'Gold Medal Game')]
+        for stage in stages:
+            resolution = resolve_tournament(year_obj, games, custom_seeding={}) if stage[0] != 'Preliminary Round' else None
+            for game in games:
+                if game.round not in stage:
+                    continue
+                codes = resolution.get_resolved(game) if resolution else (game.team1_code, game.team2_code)
+                if not all(is_code_final(code) for code in codes):
+                    raise ValueError(f"Could not resolve participants of game {game.game_number} ({year}): {codes}")
+                self._play_game(game, *codes)
+            db.session.flush()
+
+    @staticmethod
+    def _round_robin(codes: List[str]) -> List[List[Tuple[str, str]]]:
+        codes = list(codes)
+        rounds = []
+        for matchday in range(len(codes) - 1):
+            half = len(codes) // 2
+            pairs = [(codes[i], codes[-1 - i]) for i in range(half)]
+            rounds.append([(b, a) if matchday % 2 else (a, b) for a, b in pairs])
+            codes = [codes[0], codes[-1]] + codes[1:-1]
+        return rounds
+
+    @staticmethod
+    def _fixture_game(day: date, start_time: str, round_name: str, group: Optional[str], number: int,
+                      team1: str, team2: str, location: str, venue: str) -> Dict:
+        description = f'{round_name} - {group}, Game {number} {team1} vs {team2}' if group \
+            else f'{round_name}, Game {number} {team1} vs {team2}'
+        return {'date': day.isoformat(), 'startTime': f'{start_time} GMT+2', 'round': round_name,
+                'group': group, 'gameNumber': number, 'team1': team1, 'team2': team2,
+                'location': location, 'venue': venue, 'fullGameDescription': description}
+
+    def _refresh_roster(self, code: str) -> None:
+        """Legt den Kader an bzw. ersetzt roster_turnover zufällige Spieler"""
+        roster = self.rosters.setdefault(code, [])
+        if roster:
+            for index in self.rng.sample(range(len(roster)), min(self.roster_turnover, len(roster))):
+                roster[index] = self._new_player(code, roster, roster[index].jersey_number)
+        while len(roster) < self.roster_size:
+            taken = {player.jersey_number for player in roster}
+            roster.append(self._new_player(code, roster, self.rng.choice([n for n in range(1, 99) if n not in taken])))
+        db.session.flush()
+
+    def _new_player(self, code: str, roster: List[Player], jersey_number: int) -> Player:
+        names = {(player.first_name, player.last_name) for player in roster}
+        while True:
+            first_name, last_name = self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+            if (first_name, last_name) not in names:
+                break
+        player = Player(team_code=code, first_name=first_name, last_name=last_name, jersey_number=jersey_number)
+        db.session.add(player)
+        self.counts['players'] += 1
+        return player
+
+    def _poisson(self, mean: float) -> int:
+        limit, count, product_ = math.exp(-mean), 0, self.rng.random()
+        while product_ > limit:
+            count += 1
+            product_ *= self.rng.random()
+        return count
+
+    def _play_game(self, game: Game, team1: str, team2: str) -> None:
+        """Setzt das Ergebnis eines Spiels und erzeugt Tore, Strafen und Torschüsse"""
+        rng = self.rng
+        diff = self.strength[team1] - self.strength[team2]
+        goals = [self._poisson(2.8 * math.exp(0.45 * diff)), self._poisson(2.8 * math.exp(-0.45 * diff))]
+        result_type = 'REG'
+        overtime_winner = None
+        if goals[0] == goals[1]:
+            result_type = 'OT' if rng.random() < 0.55 else 'SO'
+            overtime_winner = 0 if rng.random() < 1 / (1 + math.exp(-0.45 * diff)) else 1
+
+        goal_rows, penalty_rows = [], []
+        for side, code in enumerate((team1, team2)):
+            times = sorted(rng.randrange(3600) for _ in range(goals[side]))
+            empty_net = (result_type == 'REG' and goals[side] > goals[1 - side] and times
+                         and goals[side] - goals[1 - side] <= 2 and rng.random() < 0.3)
+            if empty_net:
+                times[-1] = max(times[-1], 3480 + rng.randrange(120))
+            if overtime_winner == side and result_type == 'OT':
+                times.append(3600 + rng.randrange(300))
+            for index, seconds in enumerate(times):
+                is_empty_net = bool(empty_net and index == len(times) - 1 and seconds < 3600)
+                goal_rows.append(self._goal_row(game, code, seconds, is_empty_net))
+            for _ in range(self._poisson(3.3)):
+                seconds = rng.randrange(3900 if result_type != 'REG' else 3600)
+                penalty_rows.append(self._penalty_row(game, code, seconds))
+
+        if overtime_winner is not None:
+            goals[overtime_winner] += 1
+        game.team1_score, game.team2_score = goals
+        game.result_type = result_type
+        winner_points, loser_points = (3, 0) if result_type == 'REG' else (2, 1)
+        team1_won = goals[0] > goals[1]
+        game.team1_points = winner_points if team1_won else loser_points
+        game.team2_points = loser_points if team1_won else winner_points
+
+        shot_rows = []
+        periods = 4 if result_type != 'REG' else 3
+        for code in (team1, team2):
+            goals_by_period = [0] * periods
+            for row in goal_rows:
+                if row['team_code'] == code:
+                    goals_by_period[min(row['time_seconds'] // 1200, periods - 1)] += 1
+            for period in range(1, periods + 1):
+                shots = rng.randint(0, 5) if period == 4 else rng.randint(6, 16)
+                shot_rows.append({'game_id': game.id, 'team_code': code, 'period': period,
+                                  'shots': max(shots, goals_by_period[period - 1])})
+
+        db.session.bulk_insert_mappings(Goal, goal_rows)
+        db.session.bulk_insert_mappings(Penalty, penalty_rows)
+        db.session.bulk_insert_mappings(ShotsOnGoal, shot_rows)
+        self.counts['goals'] += len(goal_rows)
+        self.counts['penalties'] += len(penalty_rows)
+        self.counts['shots_on_goal'] += len(shot_rows)
+
+    def _goal_row(self, game: Game, code: str, seconds: int, is_empty_net: bool) -> Dict:
+        rng = self.rng
+        roster = self.rosters[code]
+        # Die ersten zwölf Kaderplätze (Stürmer) treffen und assistieren häufiger
+        weights = [3 if index < 12 else 1 for index in range(len(roster))]
+        scorer = rng.choices(roster, weights)[0]
+        assist_count = rng.choices((0, 1, 2), (10, 30, 60))[0]
+        assists = []
+        while len(assists) < assist_count:
+            candidate = rng.choices(roster, weights)[0]
+            if candidate is not scorer and candidate not in assists:
+                assists.append(candidate)
+        assists += [None] * (2 - len(assists))
+
+        roll = rng.random()
+        goal_type = 'PP' if roll < 0.11 else 'SH' if roll < 0.125 else 'REG'
+        minute = _format_time(seconds)
+        # bulk_insert_mappings umgeht @validates, time_seconds daher direkt setzen
+        return {'game_id': game.id, 'team_code': code, 'minute': minute, 'time_seconds': parse_time_seconds(minute),
+                'goal_type': goal_type, 'is_empty_net': is_empty_net, 'scorer_id': scorer.id,
+                'assist1_id': assists[0].id if assists[0] else None,
+                'assist2_id': assists[1].id if assists[1] else None}
+
+    def _penalty_row(self, game: Game, code: str, seconds: int) -> Dict:
+        penalty_type = self.rng.choices(list(PENALTY_TYPE_WEIGHTS), list(PENALTY_TYPE_WEIGHTS.values()))[0]
+        minute = _format_time(seconds)
+        return {'game_id': game.id, 'team_code': code, 'player_id': self.rng.choice(self.rosters[code]).id,
+                'minute_of_game': minute, 'time_seconds': parse_time_seconds(minute),
+                'penalty_type': penalty_type, 'reason': self.rng.choice(PENALTY_REASONS_CHOICES)}
@@ -5,6 +5,8 @@ from typing import Dict, List, Tuple, Set, Optional
 from models import Game, ChampionshipYear
 from constants import PLAYOFF_ROUNDS
 
+_WIN_LOSS_GAME_PATTERN = re.compile(r"^[WL]\((\d+)\)$")
+
 
 def is_code_final(team_code: Optional[str]) -> bool:
     """Checks if a team code is a definitive 3-letter country code."""
@@ -46,7 +48,7 @@ def get_resolved_team_code(
             
             # If map points to itself (e.g. W(X) -> W(X) and W(X) is not yet resolved)
             # or to another placeholder, update current_code and continue loop.
-            if resolved_from_map == current_code and not re.match(r"^[WL]\((\d+)\)$", current_code):
+            if resolved_from_map == current_code and not _WIN_LOSS_GAME_PATTERN.match(current_code):
                  # If it's a simple placeholder like "A1" mapping to "A1", it's unresolvable by map.
                  # If it's W(X) mapping to W(X), we might try game lookup next.
                 break # Stuck on a simple placeholder, exit loop for this path
@@ -55,8 +57,8 @@ def get_resolved_team_code(
         
         # Attempt 2: If current_code is W(X) or L(X) (either original or from map), try game result
         # This is only tried if direct map lookup didn't yield a *final* code.
-        elif re.match(r"^[WL]\((\d+)\)$", current_code): # current_code could be like "W(57)"
-            match = re.match(r"^[WL]\((\d+)\)$", current_code)
+        elif _WIN_LOSS_GAME_PATTERN.match(current_code): # current_code could be like "W(57)"
+            match = _WIN_LOSS_GAME_PATTERN.match(current_code)
             prefix = match.group(0)[0] # W or L
             game_num = int(match.group(1))
 
@@ -0,0 +1,244 @@
+"""
+Zentrale Auflösung eines kompletten Turnierjahres.
+
+Bündelt die Logik, die year_view bisher inline ausführt: Vorrunden-Standings,
+Fixture-Spielnummern, SF1/SF2- und seed1-seed4-Zuordnung und die finale
+Auflösung aller Spielteilnehmer über den PlayoffResolver. Andere Aufrufer
+(z.B. All-Time Standings) bekommen so für jedes Jahr dieselben Team-Codes
+wie die Jahresansicht.
+
+Das Ergebnis ist über to_dict()/from_dict() serialisierbar und wird vom
+TournamentSnapshotService als Snapshot pro Jahr gespeichert.
+"""
+
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from flask import current_app
+
+from constants import TEAM_ISO_CODES
+from models import ChampionshipYear, Game, TeamStats
+from .fixture_registry import get_fixture_index
+from .playoff_resolver import PlayoffResolver
+from .team_resolution import is_code_final
+
+
+@dataclass
+class ResolvedTournament:
+    """Ergebnis der Auflösung eines Turnierjahres"""
+    year_id: int
+    resolved_codes: Dict[int, Tuple[str, str]] = field(default_factory=dict)  # game_id -> (team1, team2)
+    teams_stats: Dict[str, TeamStats] = field(default_factory=dict)  # Vorrunden-Stats
+    standings_by_group: Dict[str, List[TeamStats]] = field(default_factory=dict)
+    seeds: Dict[str, str] = field(default_factory=dict)  # seed1-seed4 -> Team-Code
+    qf_game_numbers: List[int] = field(default_factory=list)
+    sf_game_numbers: List[int] = field(default_factory=list)
+    bronze_game_number: Optional[int] = None
+    gold_game_number: Optional[int] = None
+    hosts: List[str] = field(default_factory=list)
+    playoff_team_map: Dict[str, str] = field(default_factory=dict)  # Platzhalter -> Code/Spielnummer
+    final_ranking: Dict[int, str] = field(default_factory=dict)  # Platzierung -> Team-Code
+
+    def get_resolved(self, game: Game) -> Tuple[str, str]:
+        """Gibt die aufgelösten Team-Codes eines Spiels zurück (Fallback: Rohcodes)"""
+        return self.resolved_codes.get(game.id, (game.team1_code or "", game.team2_code or ""))
+
+    def matchup_counts(self, games: List[Game]) -> Dict[Tuple[str, str], int]:
+        """
+        Zählt die gespielten Spiele pro Team-Paarung anhand der aufgelösten Codes.
+
+        Nur Spiele mit Ergebnis, deren beide Teilnehmer echte Teams sind
+        (keine Platzhalter), werden gezählt.
+
+        Args:
+            games: Spiele des Jahres
+
+        Returns:
+            Dictionary {(team_a, team_b): Anzahl Spiele} mit team_a < team_b
+        """
+        counts: Dict[Tuple[str, str], int] = {}
+        for game in games:
+            if game.team1_score is None or game.team2_score is None:
+                continue
+            team1, team2 = self.get_resolved(game)
+            if not (TEAM_ISO_CODES.get(team1.upper()) and TEAM_ISO_CODES.get(team2.upper())):
+                continue
+            pair = tuple(sorted((team1, team2)))
+            counts[pair] = counts.get(pair, 0) + 1
+        return counts
+
+    def to_dict(self) -> Dict:
+        """Serialisiert die Auflösung in ein JSON-kompatibles Dictionary"""
+        return {
+            'year_id': self.year_id,
+            'resolved_codes': {str(game_id): list(codes) for game_id, codes in self.resolved_codes.items()},
+            'teams_stats': {code: asdict(stats) for code, stats in self.teams_stats.items()},
+            'standings_by_group': {group: [stats.name for stats in teams]
+                                   for group, teams in self.standings_by_group.items()},
+            'seeds': self.seeds,
+            'qf_game_numbers': self.qf_game_numbers,
+            'sf_game_numbers': self.sf_game_numbers,
+            'bronze_game_number': self.bronze_game_number,
+            'gold_game_number': self.gold_game_number,
+            'hosts': self.hosts,
+            'playoff_team_map': self.playoff_team_map,
+            'final_ranking': {str(position): code for position, code in self.final_ranking.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ResolvedTournament':
+        """
+        Baut eine Auflösung aus einem mit to_dict() erzeugten Dictionary wieder auf.
+
+        JSON-Schlüssel werden wieder zu int (Spiel-IDs, Platzierungen); die
+        Gruppentabellen verweisen auf dieselben TeamStats-Objekte wie teams_stats.
+        """
+        teams_stats = {code: TeamStats(**stats) for code, stats in data.get('teams_stats', {}).items()}
+        return cls(
+            year_id=data['year_id'],
+            resolved_codes={int(game_id): tuple(codes) for game_id, codes in data.get('resolved_codes', {}).items()},
+            teams_stats=teams_stats,
+            standings_by_group={group: [teams_stats[code] for code in codes if code in teams_stats]
+                                for group, codes in data.get('standings_by_group', {}).items()},
+            seeds=data.get('seeds', {}),
+            qf_game_numbers=data.get('qf_game_numbers', []),
+            sf_game_numbers=data.get('sf_game_numbers', []),
+            bronze_game_number=data.get('bronze_game_number'),
+            gold_game_number=data.get('gold_game_number'),
+            hosts=data.get('hosts', []),
+            playoff_team_map=data.get('playoff_team_map', {}),
+            final_ranking={int(position): code for position, code in data.get('final_ranking', {}).items()},
+        )
+
+
+def parse_fixture_playoff_numbers(year_obj: ChampionshipYear) -> Dict:
+    """
+    Liest Playoff-Spielnummern und Gastgeber aus dem Fixture-Index eines Jahres
+    (die Datei wird von der FixtureRegistry nur einmal geparst).
+
+    Args:
+        year_obj: ChampionshipYear-Objekt
+
+    Returns:
+        Dictionary mit qf_game_numbers, sf_game_numbers, bronze_game_number,
+        gold_game_number und hosts
+    """
+    info = {'qf_game_numbers': [], 'sf_game_numbers': [], 'bronze_game_number': None,
+            'gold_game_number': None, 'hosts': []}
+
+    try:
+        fixture_index = get_fixture_index(year_obj)
+        if fixture_index is None:
+            return info
+        info = {'qf_game_numbers': list(fixture_index.qf_game_numbers),
+                'sf_game_numbers': list(fixture_index.sf_game_numbers),
+                'bronze_game_number': fixture_index.bronze_game_number,
+                'gold_game_number': fixture_index.gold_game_number,
+                'hosts': fixture_index.hosts}
+    except Exception as e:
+        current_app.logger.error(f"Could not parse fixture {year_obj.fixture_path} for playoff game numbers. Error: {e}")
+        if year_obj.year == 2025:
+            info = {'qf_game_numbers': [57, 58, 59, 60], 'sf_game_numbers': [61, 62],
+                    'bronze_game_number': 63, 'gold_game_number': 64, 'hosts': ["SWE", "DEN"]}
+    return info
+
+
+def _calculate_prelim_standings(games_raw: List[Game]) -> Tuple[Dict[str, TeamStats], Dict[str, List[TeamStats]]]:
+    """Berechnet die Vorrunden-Standings wie in year_view (inkl. Direktvergleich)"""
+    from app.services.core.standings_service import StandingsService
+    from .standings import _apply_head_to_head_tiebreaker
+    from .head_to_head import HeadToHeadIndex
+
+    prelim_games = [g for g in games_raw if g.round == 'Preliminary Round' and g.group]
+    teams_stats = StandingsService().calculate_standings_from_games(
+        [pg for pg in prelim_games if pg.team1_score is not None]
+    )
+
+    standings_by_group: Dict[str, List[TeamStats]] = {}
+    head_to_head = HeadToHeadIndex(prelim_games)
+    for group_name in sorted(set(s.group for s in teams_stats.values() if s.group)):
+        group_teams = sorted(
+            [s for s in teams_stats.values() if s.group == group_name],
+            key=lambda x: (x.pts, x.gd, x.gf),
+            reverse=True
+        )
+        group_teams = _apply_head_to_head_tiebreaker(group_teams, head_to_head)
+        for i, team_stat_obj in enumerate(group_teams):
+            team_stat_obj.rank_in_group = i + 1
+        standings_by_group[group_name] = group_teams
+
+    return teams_stats, standings_by_group
+
+
+def _determine_seeds(resolver: PlayoffResolver, resolution: ResolvedTournament,
+                     games_by_number: Dict[int, Game], custom_seeding: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """
+    Bestimmt seed1-seed4 für die Halbfinals.
+
+    Benutzerdefiniertes Seeding hat Vorrang; sonst werden die vier
+    Viertelfinalsieger nach Vorrunden-Punkten, Tordifferenz und Toren sortiert.
+    """
+    qf_numbers = resolution.qf_game_numbers
+    sf_numbers = resolution.sf_game_numbers
+    if not (qf_numbers and sf_numbers and len(sf_numbers) == 2):
+        return {}
+    if not (games_by_number.get(sf_numbers[0]) and games_by_number.get(sf_numbers[1])):
+        return {}
+
+    qf_winners = [resolver.get_resolved_code(f'W({qf_game_num})') for qf_game_num in qf_numbers]
+    if len(qf_winners) != 4 or not all(is_code_final(code) for code in qf_winners):
+        return {}
+    if not all(code in resolution.teams_stats for code in qf_winners):
+        return {}
+
+    if custom_seeding:
+        return {f'seed{i}': custom_seeding[f'seed{i}'] for i in range(1, 5)}
+
+    qf_winners_stats = sorted((resolution.teams_stats[code] for code in qf_winners),
+                              key=lambda x: (-x.pts, -x.gd, -x.gf))
+    return {f'seed{i + 1}': ts.name for i, ts in enumerate(qf_winners_stats)}
+
+
+def resolve_tournament(year_obj: ChampionshipYear, games_raw: List[Game],
+                       custom_seeding: Optional[Dict[str, str]] = None) -> ResolvedTournament:
+    """
+    Löst alle Spielteilnehmer eines Turnierjahres auf.
+
+    Args:
+        year_obj: ChampionshipYear-Objekt
+        games_raw: Alle Spiele des Jahres
+        custom_seeding: Bereits geladenes Halbfinal-Seeding (optional, sonst aus der DB)
+
+    Returns:
+        ResolvedTournament mit aufgelösten Codes pro Spiel-ID
+    """
+    resolution = ResolvedTournament(year_id=year_obj.id)
+    resolution.teams_stats, resolution.standings_by_group = _calculate_prelim_standings(games_raw)
+
+    fixture_info = parse_fixture_playoff_numbers(year_obj)
+    resolution.qf_game_numbers = fixture_info['qf_game_numbers']
+    resolution.sf_game_numbers = fixture_info['sf_game_numbers']
+    resolution.bronze_game_number = fixture_info['bronze_game_number']
+    resolution.gold_game_number = fixture_info['gold_game_number']
+    resolution.hosts = fixture_info['hosts']
+
+    resolver = PlayoffResolver(year_obj, games_raw)
+    sf_numbers = resolution.sf_game_numbers
+    if sf_numbers and len(sf_numbers) >= 2 and all(isinstance(item, int) for item in sf_numbers):
+        resolver.update_mappings({'SF1': str(sf_numbers[0]), 'SF2': str(sf_numbers[1])})
+
+    if custom_seeding is None:
+        from .seeding_helpers import get_custom_seeding_from_db
+        custom_seeding = get_custom_seeding_from_db(year_obj.id)
+
+    games_by_number = {g.game_number: g for g in games_raw}
+    resolution.seeds = _determine_seeds(resolver, resolution, games_by_number, custom_seeding)
+    if resolution.seeds:
+        resolver.update_mappings(resolution.seeds)
+
+    resolution.resolved_codes = resolver.resolve_all()
+    resolution.playoff_team_map = resolver.get_all_resolutions()
+    # Endplatzierung wie in der Medaillenübersicht, mit den hier bestimmten Seeds
+    from .standings import calculate_complete_final_ranking
+    resolution.final_ranking = calculate_complete_final_ranking(year_obj, games_raw, dict(resolution.seeds), year_obj)
+    return resolution